@@ -0,0 +1,2330 @@
+"""Names OpenGL.GL loads on demand from the core VERSION modules
+
+Generated by OpenGL.lazymodule, do not edit!
+"""
+MODULES = (
+    'OpenGL.GL.VERSION.GL_1_2',
+    'OpenGL.GL.VERSION.GL_1_3',
+    'OpenGL.GL.VERSION.GL_1_4',
+    'OpenGL.GL.VERSION.GL_1_5',
+    'OpenGL.GL.VERSION.GL_2_0',
+    'OpenGL.GL.VERSION.GL_2_1',
+    'OpenGL.GL.VERSION.GL_3_0',
+    'OpenGL.GL.VERSION.GL_3_1',
+    'OpenGL.GL.VERSION.GL_3_2',
+    'OpenGL.GL.VERSION.GL_3_3',
+    'OpenGL.GL.VERSION.GL_4_0',
+    'OpenGL.GL.VERSION.GL_4_1',
+    'OpenGL.GL.VERSION.GL_4_2',
+    'OpenGL.GL.VERSION.GL_4_3',
+    'OpenGL.GL.VERSION.GL_4_4',
+    'OpenGL.GL.VERSION.GL_4_5',
+    'OpenGL.GL.VERSION.GL_4_6',
+)
+FUNCTIONS = {
+    'OpenGL.GL.VERSION.GL_1_2': (
+        'glColorSubTable',
+        'glColorTable',
+        'glColorTableParameterfv',
+        'glColorTableParameteriv',
+        'glConvolutionFilter1D',
+        'glConvolutionFilter2D',
+        'glConvolutionParameterf',
+        'glConvolutionParameterfv',
+        'glConvolutionParameteri',
+        'glConvolutionParameteriv',
+        'glCopyColorSubTable',
+        'glCopyColorTable',
+        'glCopyConvolutionFilter1D',
+        'glCopyConvolutionFilter2D',
+        'glCopyTexSubImage3D',
+        'glDrawRangeElements',
+        'glGetColorTable',
+        'glGetColorTableParameterfv',
+        'glGetColorTableParameteriv',
+        'glGetConvolutionFilter',
+        'glGetConvolutionParameterfv',
+        'glGetConvolutionParameteriv',
+        'glGetHistogram',
+        'glGetHistogramParameterfv',
+        'glGetHistogramParameteriv',
+        'glGetMinmax',
+        'glGetMinmaxParameterfv',
+        'glGetMinmaxParameteriv',
+        'glGetSeparableFilter',
+        'glHistogram',
+        'glInitGl12VERSION',
+        'glInitImagingARB',
+        'glMinmax',
+        'glResetHistogram',
+        'glResetMinmax',
+        'glSeparableFilter2D',
+        'glTexImage3D',
+        'glTexImage3Db',
+        'glTexImage3Df',
+        'glTexImage3Di',
+        'glTexImage3Ds',
+        'glTexImage3Dub',
+        'glTexImage3Dui',
+        'glTexImage3Dus',
+        'glTexSubImage3D',
+        'glTexSubImage3Db',
+        'glTexSubImage3Df',
+        'glTexSubImage3Di',
+        'glTexSubImage3Ds',
+        'glTexSubImage3Dub',
+        'glTexSubImage3Dui',
+        'glTexSubImage3Dus',
+    ),
+    'OpenGL.GL.VERSION.GL_1_3': (
+        'glActiveTexture',
+        'glClientActiveTexture',
+        'glCompressedTexImage1D',
+        'glCompressedTexImage2D',
+        'glCompressedTexImage3D',
+        'glCompressedTexSubImage1D',
+        'glCompressedTexSubImage2D',
+        'glCompressedTexSubImage3D',
+        'glGetCompressedTexImage',
+        'glInitGl13VERSION',
+        'glLoadTransposeMatrixd',
+        'glLoadTransposeMatrixf',
+        'glMultTransposeMatrixd',
+        'glMultTransposeMatrixf',
+        'glMultiTexCoord1d',
+        'glMultiTexCoord1dv',
+        'glMultiTexCoord1f',
+        'glMultiTexCoord1fv',
+        'glMultiTexCoord1i',
+        'glMultiTexCoord1iv',
+        'glMultiTexCoord1s',
+        'glMultiTexCoord1sv',
+        'glMultiTexCoord2d',
+        'glMultiTexCoord2dv',
+        'glMultiTexCoord2f',
+        'glMultiTexCoord2fv',
+        'glMultiTexCoord2i',
+        'glMultiTexCoord2iv',
+        'glMultiTexCoord2s',
+        'glMultiTexCoord2sv',
+        'glMultiTexCoord3d',
+        'glMultiTexCoord3dv',
+        'glMultiTexCoord3f',
+        'glMultiTexCoord3fv',
+        'glMultiTexCoord3i',
+        'glMultiTexCoord3iv',
+        'glMultiTexCoord3s',
+        'glMultiTexCoord3sv',
+        'glMultiTexCoord4d',
+        'glMultiTexCoord4dv',
+        'glMultiTexCoord4f',
+        'glMultiTexCoord4fv',
+        'glMultiTexCoord4i',
+        'glMultiTexCoord4iv',
+        'glMultiTexCoord4s',
+        'glMultiTexCoord4sv',
+        'glSampleCoverage',
+    ),
+    'OpenGL.GL.VERSION.GL_1_4': (
+        'glBlendColor',
+        'glBlendEquation',
+        'glBlendFuncSeparate',
+        'glFogCoordPointer',
+        'glFogCoordd',
+        'glFogCoorddv',
+        'glFogCoordf',
+        'glFogCoordfv',
+        'glInitGl14VERSION',
+        'glMultiDrawArrays',
+        'glMultiDrawElements',
+        'glPointParameterf',
+        'glPointParameterfv',
+        'glPointParameteri',
+        'glPointParameteriv',
+        'glSecondaryColor3b',
+        'glSecondaryColor3bv',
+        'glSecondaryColor3d',
+        'glSecondaryColor3dv',
+        'glSecondaryColor3f',
+        'glSecondaryColor3fv',
+        'glSecondaryColor3i',
+        'glSecondaryColor3iv',
+        'glSecondaryColor3s',
+        'glSecondaryColor3sv',
+        'glSecondaryColor3ub',
+        'glSecondaryColor3ubv',
+        'glSecondaryColor3ui',
+        'glSecondaryColor3uiv',
+        'glSecondaryColor3us',
+        'glSecondaryColor3usv',
+        'glSecondaryColorPointer',
+        'glWindowPos2d',
+        'glWindowPos2dv',
+        'glWindowPos2f',
+        'glWindowPos2fv',
+        'glWindowPos2i',
+        'glWindowPos2iv',
+        'glWindowPos2s',
+        'glWindowPos2sv',
+        'glWindowPos3d',
+        'glWindowPos3dv',
+        'glWindowPos3f',
+        'glWindowPos3fv',
+        'glWindowPos3i',
+        'glWindowPos3iv',
+        'glWindowPos3s',
+        'glWindowPos3sv',
+    ),
+    'OpenGL.GL.VERSION.GL_1_5': (
+        'glBeginQuery',
+        'glBindBuffer',
+        'glBufferData',
+        'glBufferSubData',
+        'glDeleteBuffers',
+        'glDeleteQueries',
+        'glEndQuery',
+        'glGenBuffers',
+        'glGenQueries',
+        'glGetBufferParameteriv',
+        'glGetBufferPointerv',
+        'glGetBufferSubData',
+        'glGetQueryObjectiv',
+        'glGetQueryObjectuiv',
+        'glGetQueryiv',
+        'glInitGl15VERSION',
+        'glIsBuffer',
+        'glIsQuery',
+        'glMapBuffer',
+        'glUnmapBuffer',
+    ),
+    'OpenGL.GL.VERSION.GL_2_0': (
+        'glAttachShader',
+        'glBindAttribLocation',
+        'glBlendEquationSeparate',
+        'glCompileShader',
+        'glCreateProgram',
+        'glCreateShader',
+        'glDeleteProgram',
+        'glDeleteShader',
+        'glDetachShader',
+        'glDisableVertexAttribArray',
+        'glDrawBuffers',
+        'glEnableVertexAttribArray',
+        'glGetActiveAttrib',
+        'glGetActiveUniform',
+        'glGetAttachedShaders',
+        'glGetAttribLocation',
+        'glGetProgramInfoLog',
+        'glGetProgramiv',
+        'glGetShaderInfoLog',
+        'glGetShaderSource',
+        'glGetShaderiv',
+        'glGetUniformLocation',
+        'glGetUniformfv',
+        'glGetUniformiv',
+        'glGetVertexAttribPointerv',
+        'glGetVertexAttribdv',
+        'glGetVertexAttribfv',
+        'glGetVertexAttribiv',
+        'glInitGl20VERSION',
+        'glIsProgram',
+        'glIsShader',
+        'glLinkProgram',
+        'glShaderSource',
+        'glStencilFuncSeparate',
+        'glStencilMaskSeparate',
+        'glStencilOpSeparate',
+        'glUniform1f',
+        'glUniform1fv',
+        'glUniform1i',
+        'glUniform1iv',
+        'glUniform2f',
+        'glUniform2fv',
+        'glUniform2i',
+        'glUniform2iv',
+        'glUniform3f',
+        'glUniform3fv',
+        'glUniform3i',
+        'glUniform3iv',
+        'glUniform4f',
+        'glUniform4fv',
+        'glUniform4i',
+        'glUniform4iv',
+        'glUniformMatrix2fv',
+        'glUniformMatrix3fv',
+        'glUniformMatrix4fv',
+        'glUseProgram',
+        'glValidateProgram',
+        'glVertexAttrib1d',
+        'glVertexAttrib1dv',
+        'glVertexAttrib1f',
+        'glVertexAttrib1fv',
+        'glVertexAttrib1s',
+        'glVertexAttrib1sv',
+        'glVertexAttrib2d',
+        'glVertexAttrib2dv',
+        'glVertexAttrib2f',
+        'glVertexAttrib2fv',
+        'glVertexAttrib2s',
+        'glVertexAttrib2sv',
+        'glVertexAttrib3d',
+        'glVertexAttrib3dv',
+        'glVertexAttrib3f',
+        'glVertexAttrib3fv',
+        'glVertexAttrib3s',
+        'glVertexAttrib3sv',
+        'glVertexAttrib4Nbv',
+        'glVertexAttrib4Niv',
+        'glVertexAttrib4Nsv',
+        'glVertexAttrib4Nub',
+        'glVertexAttrib4Nubv',
+        'glVertexAttrib4Nuiv',
+        'glVertexAttrib4Nusv',
+        'glVertexAttrib4bv',
+        'glVertexAttrib4d',
+        'glVertexAttrib4dv',
+        'glVertexAttrib4f',
+        'glVertexAttrib4fv',
+        'glVertexAttrib4iv',
+        'glVertexAttrib4s',
+        'glVertexAttrib4sv',
+        'glVertexAttrib4ubv',
+        'glVertexAttrib4uiv',
+        'glVertexAttrib4usv',
+        'glVertexAttribPointer',
+    ),
+    'OpenGL.GL.VERSION.GL_2_1': (
+        'glInitGl21VERSION',
+        'glUniformMatrix2x3fv',
+        'glUniformMatrix2x4fv',
+        'glUniformMatrix3x2fv',
+        'glUniformMatrix3x4fv',
+        'glUniformMatrix4x2fv',
+        'glUniformMatrix4x3fv',
+    ),
+    'OpenGL.GL.VERSION.GL_3_0': (
+        'glBeginConditionalRender',
+        'glBeginTransformFeedback',
+        'glBindFragDataLocation',
+        'glBindFramebuffer',
+        'glBindRenderbuffer',
+        'glBindVertexArray',
+        'glBlitFramebuffer',
+        'glCheckFramebufferStatus',
+        'glClampColor',
+        'glClearBufferfi',
+        'glClearBufferfv',
+        'glClearBufferiv',
+        'glClearBufferuiv',
+        'glColorMaski',
+        'glDeleteFramebuffers',
+        'glDeleteRenderbuffers',
+        'glDeleteVertexArrays',
+        'glDisablei',
+        'glEnablei',
+        'glEndConditionalRender',
+        'glEndTransformFeedback',
+        'glFlushMappedBufferRange',
+        'glFramebufferRenderbuffer',
+        'glFramebufferTexture1D',
+        'glFramebufferTexture2D',
+        'glFramebufferTexture3D',
+        'glFramebufferTextureLayer',
+        'glGenFramebuffers',
+        'glGenRenderbuffers',
+        'glGenVertexArrays',
+        'glGenerateMipmap',
+        'glGetBooleani_v',
+        'glGetFragDataLocation',
+        'glGetFramebufferAttachmentParameteriv',
+        'glGetRenderbufferParameteriv',
+        'glGetStringi',
+        'glGetTexParameterIiv',
+        'glGetTexParameterIuiv',
+        'glGetTransformFeedbackVarying',
+        'glGetUniformuiv',
+        'glGetVertexAttribIiv',
+        'glGetVertexAttribIuiv',
+        'glInitGl30VERSION',
+        'glIsEnabledi',
+        'glIsFramebuffer',
+        'glIsRenderbuffer',
+        'glIsVertexArray',
+        'glMapBufferRange',
+        'glRenderbufferStorage',
+        'glRenderbufferStorageMultisample',
+        'glTexParameterIiv',
+        'glTexParameterIuiv',
+        'glTransformFeedbackVaryings',
+        'glUniform1ui',
+        'glUniform1uiv',
+        'glUniform2ui',
+        'glUniform2uiv',
+        'glUniform3ui',
+        'glUniform3uiv',
+        'glUniform4ui',
+        'glUniform4uiv',
+        'glVertexAttribI1i',
+        'glVertexAttribI1iv',
+        'glVertexAttribI1ui',
+        'glVertexAttribI1uiv',
+        'glVertexAttribI2i',
+        'glVertexAttribI2iv',
+        'glVertexAttribI2ui',
+        'glVertexAttribI2uiv',
+        'glVertexAttribI3i',
+        'glVertexAttribI3iv',
+        'glVertexAttribI3ui',
+        'glVertexAttribI3uiv',
+        'glVertexAttribI4bv',
+        'glVertexAttribI4i',
+        'glVertexAttribI4iv',
+        'glVertexAttribI4sv',
+        'glVertexAttribI4ubv',
+        'glVertexAttribI4ui',
+        'glVertexAttribI4uiv',
+        'glVertexAttribI4usv',
+        'glVertexAttribIPointer',
+    ),
+    'OpenGL.GL.VERSION.GL_3_1': (
+        'glBindBufferBase',
+        'glBindBufferRange',
+        'glCopyBufferSubData',
+        'glDrawArraysInstanced',
+        'glDrawElementsInstanced',
+        'glGetActiveUniformBlockName',
+        'glGetActiveUniformBlockiv',
+        'glGetActiveUniformName',
+        'glGetActiveUniformsiv',
+        'glGetIntegeri_v',
+        'glGetUniformBlockIndex',
+        'glGetUniformIndices',
+        'glInitGl31VERSION',
+        'glPrimitiveRestartIndex',
+        'glTexBuffer',
+        'glUniformBlockBinding',
+    ),
+    'OpenGL.GL.VERSION.GL_3_2': (
+        'glClientWaitSync',
+        'glDeleteSync',
+        'glDrawElementsBaseVertex',
+        'glDrawElementsInstancedBaseVertex',
+        'glDrawRangeElementsBaseVertex',
+        'glFenceSync',
+        'glFramebufferTexture',
+        'glGetBufferParameteri64v',
+        'glGetInteger64i_v',
+        'glGetInteger64v',
+        'glGetMultisamplefv',
+        'glGetSynciv',
+        'glInitGl32VERSION',
+        'glIsSync',
+        'glMultiDrawElementsBaseVertex',
+        'glProvokingVertex',
+        'glSampleMaski',
+        'glTexImage2DMultisample',
+        'glTexImage3DMultisample',
+        'glWaitSync',
+    ),
+    'OpenGL.GL.VERSION.GL_3_3': (
+        'glBindFragDataLocationIndexed',
+        'glBindSampler',
+        'glColorP3ui',
+        'glColorP3uiv',
+        'glColorP4ui',
+        'glColorP4uiv',
+        'glDeleteSamplers',
+        'glGenSamplers',
+        'glGetFragDataIndex',
+        'glGetQueryObjecti64v',
+        'glGetQueryObjectui64v',
+        'glGetSamplerParameterIiv',
+        'glGetSamplerParameterIuiv',
+        'glGetSamplerParameterfv',
+        'glGetSamplerParameteriv',
+        'glInitGl33VERSION',
+        'glIsSampler',
+        'glMultiTexCoordP1ui',
+        'glMultiTexCoordP1uiv',
+        'glMultiTexCoordP2ui',
+        'glMultiTexCoordP2uiv',
+        'glMultiTexCoordP3ui',
+        'glMultiTexCoordP3uiv',
+        'glMultiTexCoordP4ui',
+        'glMultiTexCoordP4uiv',
+        'glNormalP3ui',
+        'glNormalP3uiv',
+        'glQueryCounter',
+        'glSamplerParameterIiv',
+        'glSamplerParameterIuiv',
+        'glSamplerParameterf',
+        'glSamplerParameterfv',
+        'glSamplerParameteri',
+        'glSamplerParameteriv',
+        'glSecondaryColorP3ui',
+        'glSecondaryColorP3uiv',
+        'glTexCoordP1ui',
+        'glTexCoordP1uiv',
+        'glTexCoordP2ui',
+        'glTexCoordP2uiv',
+        'glTexCoordP3ui',
+        'glTexCoordP3uiv',
+        'glTexCoordP4ui',
+        'glTexCoordP4uiv',
+        'glVertexAttribDivisor',
+        'glVertexAttribP1ui',
+        'glVertexAttribP1uiv',
+        'glVertexAttribP2ui',
+        'glVertexAttribP2uiv',
+        'glVertexAttribP3ui',
+        'glVertexAttribP3uiv',
+        'glVertexAttribP4ui',
+        'glVertexAttribP4uiv',
+        'glVertexP2ui',
+        'glVertexP2uiv',
+        'glVertexP3ui',
+        'glVertexP3uiv',
+        'glVertexP4ui',
+        'glVertexP4uiv',
+    ),
+    'OpenGL.GL.VERSION.GL_4_0': (
+        'glBeginQueryIndexed',
+        'glBindTransformFeedback',
+        'glBlendEquationSeparatei',
+        'glBlendEquationi',
+        'glBlendFuncSeparatei',
+        'glBlendFunci',
+        'glDeleteTransformFeedbacks',
+        'glDrawArraysIndirect',
+        'glDrawElementsIndirect',
+        'glDrawTransformFeedback',
+        'glDrawTransformFeedbackStream',
+        'glEndQueryIndexed',
+        'glGenTransformFeedbacks',
+        'glGetActiveSubroutineName',
+        'glGetActiveSubroutineUniformName',
+        'glGetActiveSubroutineUniformiv',
+        'glGetProgramStageiv',
+        'glGetQueryIndexediv',
+        'glGetSubroutineIndex',
+        'glGetSubroutineUniformLocation',
+        'glGetUniformSubroutineuiv',
+        'glGetUniformdv',
+        'glInitGl40VERSION',
+        'glIsTransformFeedback',
+        'glMinSampleShading',
+        'glPatchParameterfv',
+        'glPatchParameteri',
+        'glPauseTransformFeedback',
+        'glResumeTransformFeedback',
+        'glUniform1d',
+        'glUniform1dv',
+        'glUniform2d',
+        'glUniform2dv',
+        'glUniform3d',
+        'glUniform3dv',
+        'glUniform4d',
+        'glUniform4dv',
+        'glUniformMatrix2dv',
+        'glUniformMatrix2x3dv',
+        'glUniformMatrix2x4dv',
+        'glUniformMatrix3dv',
+        'glUniformMatrix3x2dv',
+        'glUniformMatrix3x4dv',
+        'glUniformMatrix4dv',
+        'glUniformMatrix4x2dv',
+        'glUniformMatrix4x3dv',
+        'glUniformSubroutinesuiv',
+    ),
+    'OpenGL.GL.VERSION.GL_4_1': (
+        'glActiveShaderProgram',
+        'glBindProgramPipeline',
+        'glClearDepthf',
+        'glCreateShaderProgramv',
+        'glDeleteProgramPipelines',
+        'glDepthRangeArrayv',
+        'glDepthRangeIndexed',
+        'glDepthRangef',
+        'glGenProgramPipelines',
+        'glGetDoublei_v',
+        'glGetFloati_v',
+        'glGetProgramBinary',
+        'glGetProgramPipelineInfoLog',
+        'glGetProgramPipelineiv',
+        'glGetShaderPrecisionFormat',
+        'glGetVertexAttribLdv',
+        'glInitEs2CompatibilityARB',
+        'glInitGetProgramBinaryARB',
+        'glInitGl41VERSION',
+        'glInitSeparateShaderObjectsARB',
+        'glInitShaderPrecisionARB',
+        'glInitVertexAttrib64BitARB',
+        'glInitViewportArrayARB',
+        'glIsProgramPipeline',
+        'glProgramBinary',
+        'glProgramParameteri',
+        'glProgramUniform1d',
+        'glProgramUniform1dv',
+        'glProgramUniform1f',
+        'glProgramUniform1fv',
+        'glProgramUniform1i',
+        'glProgramUniform1iv',
+        'glProgramUniform1ui',
+        'glProgramUniform1uiv',
+        'glProgramUniform2d',
+        'glProgramUniform2dv',
+        'glProgramUniform2f',
+        'glProgramUniform2fv',
+        'glProgramUniform2i',
+        'glProgramUniform2iv',
+        'glProgramUniform2ui',
+        'glProgramUniform2uiv',
+        'glProgramUniform3d',
+        'glProgramUniform3dv',
+        'glProgramUniform3f',
+        'glProgramUniform3fv',
+        'glProgramUniform3i',
+        'glProgramUniform3iv',
+        'glProgramUniform3ui',
+        'glProgramUniform3uiv',
+        'glProgramUniform4d',
+        'glProgramUniform4dv',
+        'glProgramUniform4f',
+        'glProgramUniform4fv',
+        'glProgramUniform4i',
+        'glProgramUniform4iv',
+        'glProgramUniform4ui',
+        'glProgramUniform4uiv',
+        'glProgramUniformMatrix2dv',
+        'glProgramUniformMatrix2fv',
+        'glProgramUniformMatrix2x3dv',
+        'glProgramUniformMatrix2x3fv',
+        'glProgramUniformMatrix2x4dv',
+        'glProgramUniformMatrix2x4fv',
+        'glProgramUniformMatrix3dv',
+        'glProgramUniformMatrix3fv',
+        'glProgramUniformMatrix3x2dv',
+        'glProgramUniformMatrix3x2fv',
+        'glProgramUniformMatrix3x4dv',
+        'glProgramUniformMatrix3x4fv',
+        'glProgramUniformMatrix4dv',
+        'glProgramUniformMatrix4fv',
+        'glProgramUniformMatrix4x2dv',
+        'glProgramUniformMatrix4x2fv',
+        'glProgramUniformMatrix4x3dv',
+        'glProgramUniformMatrix4x3fv',
+        'glReleaseShaderCompiler',
+        'glScissorArrayv',
+        'glScissorIndexed',
+        'glScissorIndexedv',
+        'glShaderBinary',
+        'glUseProgramStages',
+        'glValidateProgramPipeline',
+        'glVertexAttribL1d',
+        'glVertexAttribL1dv',
+        'glVertexAttribL2d',
+        'glVertexAttribL2dv',
+        'glVertexAttribL3d',
+        'glVertexAttribL3dv',
+        'glVertexAttribL4d',
+        'glVertexAttribL4dv',
+        'glVertexAttribLPointer',
+        'glViewportArrayv',
+        'glViewportIndexedf',
+        'glViewportIndexedfv',
+    ),
+    'OpenGL.GL.VERSION.GL_4_2': (
+        'glBindImageTexture',
+        'glDrawArraysInstancedBaseInstance',
+        'glDrawElementsInstancedBaseInstance',
+        'glDrawElementsInstancedBaseVertexBaseInstance',
+        'glDrawTransformFeedbackInstanced',
+        'glDrawTransformFeedbackStreamInstanced',
+        'glGetActiveAtomicCounterBufferiv',
+        'glGetInternalformativ',
+        'glInitBaseInstanceARB',
+        'glInitCompressedTexturePixelStorageARB',
+        'glInitConservativeDepthARB',
+        'glInitGl42VERSION',
+        'glInitInternalformatQueryARB',
+        'glInitMapBufferAlignmentARB',
+        'glInitShaderAtomicCountersARB',
+        'glInitShaderImageLoadStoreARB',
+        'glInitShadingLanguage420PackARB',
+        'glInitShadingLanguagePackingARB',
+        'glInitTextureStorageARB',
+        'glInitTransformFeedbackInstancedARB',
+        'glMemoryBarrier',
+        'glTexStorage1D',
+        'glTexStorage2D',
+        'glTexStorage3D',
+    ),
+    'OpenGL.GL.VERSION.GL_4_3': (
+        'glBindVertexBuffer',
+        'glClearBufferData',
+        'glClearBufferSubData',
+        'glCopyImageSubData',
+        'glDebugMessageCallback',
+        'glDebugMessageCallbackKHR',
+        'glDebugMessageControl',
+        'glDebugMessageControlKHR',
+        'glDebugMessageInsert',
+        'glDebugMessageInsertKHR',
+        'glDispatchCompute',
+        'glDispatchComputeIndirect',
+        'glFramebufferParameteri',
+        'glGetDebugMessageLog',
+        'glGetDebugMessageLogKHR',
+        'glGetFramebufferParameteriv',
+        'glGetInternalformati64v',
+        'glGetObjectLabel',
+        'glGetObjectLabelKHR',
+        'glGetObjectPtrLabel',
+        'glGetObjectPtrLabelKHR',
+        'glGetPointerv',
+        'glGetPointervKHR',
+        'glGetProgramInterfaceiv',
+        'glGetProgramResourceIndex',
+        'glGetProgramResourceLocation',
+        'glGetProgramResourceLocationIndex',
+        'glGetProgramResourceName',
+        'glGetProgramResourceiv',
+        'glInitArraysOfArraysARB',
+        'glInitClearBufferObjectARB',
+        'glInitComputeShaderARB',
+        'glInitCopyImageARB',
+        'glInitDebugKHR',
+        'glInitEs3CompatibilityARB',
+        'glInitExplicitUniformLocationARB',
+        'glInitFragmentLayerViewportARB',
+        'glInitFramebufferNoAttachmentsARB',
+        'glInitGl43VERSION',
+        'glInitInternalformatQuery2ARB',
+        'glInitInvalidateSubdataARB',
+        'glInitMultiDrawIndirectARB',
+        'glInitProgramInterfaceQueryARB',
+        'glInitRobustBufferAccessBehaviorARB',
+        'glInitShaderImageSizeARB',
+        'glInitShaderStorageBufferObjectARB',
+        'glInitStencilTexturingARB',
+        'glInitTextureBufferRangeARB',
+        'glInitTextureQueryLevelsARB',
+        'glInitTextureStorageMultisampleARB',
+        'glInitTextureViewARB',
+        'glInitVertexAttribBindingARB',
+        'glInvalidateBufferData',
+        'glInvalidateBufferSubData',
+        'glInvalidateFramebuffer',
+        'glInvalidateSubFramebuffer',
+        'glInvalidateTexImage',
+        'glInvalidateTexSubImage',
+        'glMultiDrawArraysIndirect',
+        'glMultiDrawElementsIndirect',
+        'glObjectLabel',
+        'glObjectLabelKHR',
+        'glObjectPtrLabel',
+        'glObjectPtrLabelKHR',
+        'glPopDebugGroup',
+        'glPopDebugGroupKHR',
+        'glPushDebugGroup',
+        'glPushDebugGroupKHR',
+        'glShaderStorageBlockBinding',
+        'glTexBufferRange',
+        'glTexStorage2DMultisample',
+        'glTexStorage3DMultisample',
+        'glTextureView',
+        'glVertexAttribBinding',
+        'glVertexAttribFormat',
+        'glVertexAttribIFormat',
+        'glVertexAttribLFormat',
+        'glVertexBindingDivisor',
+    ),
+    'OpenGL.GL.VERSION.GL_4_4': (
+        'glBindBuffersBase',
+        'glBindBuffersRange',
+        'glBindImageTextures',
+        'glBindSamplers',
+        'glBindTextures',
+        'glBindVertexBuffers',
+        'glBufferStorage',
+        'glClearTexImage',
+        'glClearTexSubImage',
+        'glInitGl44VERSION',
+    ),
+    'OpenGL.GL.VERSION.GL_4_5': (
+        'glBindTextureUnit',
+        'glBlitNamedFramebuffer',
+        'glCheckNamedFramebufferStatus',
+        'glClearNamedBufferData',
+        'glClearNamedBufferSubData',
+        'glClearNamedFramebufferfi',
+        'glClearNamedFramebufferfv',
+        'glClearNamedFramebufferiv',
+        'glClearNamedFramebufferuiv',
+        'glClipControl',
+        'glCompressedTextureSubImage1D',
+        'glCompressedTextureSubImage2D',
+        'glCompressedTextureSubImage3D',
+        'glCopyNamedBufferSubData',
+        'glCopyTextureSubImage1D',
+        'glCopyTextureSubImage2D',
+        'glCopyTextureSubImage3D',
+        'glCreateBuffers',
+        'glCreateFramebuffers',
+        'glCreateProgramPipelines',
+        'glCreateQueries',
+        'glCreateRenderbuffers',
+        'glCreateSamplers',
+        'glCreateTextures',
+        'glCreateTransformFeedbacks',
+        'glCreateVertexArrays',
+        'glDisableVertexArrayAttrib',
+        'glEnableVertexArrayAttrib',
+        'glFlushMappedNamedBufferRange',
+        'glGenerateTextureMipmap',
+        'glGetCompressedTextureImage',
+        'glGetCompressedTextureSubImage',
+        'glGetGraphicsResetStatus',
+        'glGetNamedBufferParameteri64v',
+        'glGetNamedBufferParameteriv',
+        'glGetNamedBufferPointerv',
+        'glGetNamedBufferSubData',
+        'glGetNamedFramebufferAttachmentParameteriv',
+        'glGetNamedFramebufferParameteriv',
+        'glGetNamedRenderbufferParameteriv',
+        'glGetQueryBufferObjecti64v',
+        'glGetQueryBufferObjectiv',
+        'glGetQueryBufferObjectui64v',
+        'glGetQueryBufferObjectuiv',
+        'glGetTextureImage',
+        'glGetTextureLevelParameterfv',
+        'glGetTextureLevelParameteriv',
+        'glGetTextureParameterIiv',
+        'glGetTextureParameterIuiv',
+        'glGetTextureParameterfv',
+        'glGetTextureParameteriv',
+        'glGetTextureSubImage',
+        'glGetTransformFeedbacki64_v',
+        'glGetTransformFeedbacki_v',
+        'glGetTransformFeedbackiv',
+        'glGetVertexArrayIndexed64iv',
+        'glGetVertexArrayIndexediv',
+        'glGetVertexArrayiv',
+        'glGetnColorTable',
+        'glGetnCompressedTexImage',
+        'glGetnConvolutionFilter',
+        'glGetnHistogram',
+        'glGetnMapdv',
+        'glGetnMapfv',
+        'glGetnMapiv',
+        'glGetnMinmax',
+        'glGetnPixelMapfv',
+        'glGetnPixelMapuiv',
+        'glGetnPixelMapusv',
+        'glGetnPolygonStipple',
+        'glGetnSeparableFilter',
+        'glGetnTexImage',
+        'glGetnUniformdv',
+        'glGetnUniformfv',
+        'glGetnUniformiv',
+        'glGetnUniformuiv',
+        'glInitGl45VERSION',
+        'glInvalidateNamedFramebufferData',
+        'glInvalidateNamedFramebufferSubData',
+        'glMapNamedBuffer',
+        'glMapNamedBufferRange',
+        'glMemoryBarrierByRegion',
+        'glNamedBufferData',
+        'glNamedBufferStorage',
+        'glNamedBufferSubData',
+        'glNamedFramebufferDrawBuffer',
+        'glNamedFramebufferDrawBuffers',
+        'glNamedFramebufferParameteri',
+        'glNamedFramebufferReadBuffer',
+        'glNamedFramebufferRenderbuffer',
+        'glNamedFramebufferTexture',
+        'glNamedFramebufferTextureLayer',
+        'glNamedRenderbufferStorage',
+        'glNamedRenderbufferStorageMultisample',
+        'glReadnPixels',
+        'glTextureBarrier',
+        'glTextureBuffer',
+        'glTextureBufferRange',
+        'glTextureParameterIiv',
+        'glTextureParameterIuiv',
+        'glTextureParameterf',
+        'glTextureParameterfv',
+        'glTextureParameteri',
+        'glTextureParameteriv',
+        'glTextureStorage1D',
+        'glTextureStorage2D',
+        'glTextureStorage2DMultisample',
+        'glTextureStorage3D',
+        'glTextureStorage3DMultisample',
+        'glTextureSubImage1D',
+        'glTextureSubImage2D',
+        'glTextureSubImage3D',
+        'glTransformFeedbackBufferBase',
+        'glTransformFeedbackBufferRange',
+        'glUnmapNamedBuffer',
+        'glVertexArrayAttribBinding',
+        'glVertexArrayAttribFormat',
+        'glVertexArrayAttribIFormat',
+        'glVertexArrayAttribLFormat',
+        'glVertexArrayBindingDivisor',
+        'glVertexArrayElementBuffer',
+        'glVertexArrayVertexBuffer',
+        'glVertexArrayVertexBuffers',
+    ),
+    'OpenGL.GL.VERSION.GL_4_6': (
+        'glInitGl46VERSION',
+        'glMultiDrawArraysIndirectCount',
+        'glMultiDrawElementsIndirectCount',
+        'glPolygonOffsetClamp',
+        'glSpecializeShader',
+    ),
+}
+CONSTANTS = {
+    'OpenGL.GL.VERSION.GL_1_2': (
+        ('GL_ALIASED_LINE_WIDTH_RANGE',0x846E),
+        ('GL_ALIASED_POINT_SIZE_RANGE',0x846D),
+        ('GL_BGR',0x80E0),
+        ('GL_BGRA',0x80E1),
+        ('GL_CLAMP_TO_EDGE',0x812F),
+        ('GL_COLOR_MATRIX',0x80B1),
+        ('GL_COLOR_MATRIX_STACK_DEPTH',0x80B2),
+        ('GL_COLOR_TABLE',0x80D0),
+        ('GL_COLOR_TABLE_ALPHA_SIZE',0x80DD),
+        ('GL_COLOR_TABLE_BIAS',0x80D7),
+        ('GL_COLOR_TABLE_BLUE_SIZE',0x80DC),
+        ('GL_COLOR_TABLE_FORMAT',0x80D8),
+        ('GL_COLOR_TABLE_GREEN_SIZE',0x80DB),
+        ('GL_COLOR_TABLE_INTENSITY_SIZE',0x80DF),
+        ('GL_COLOR_TABLE_LUMINANCE_SIZE',0x80DE),
+        ('GL_COLOR_TABLE_RED_SIZE',0x80DA),
+        ('GL_COLOR_TABLE_SCALE',0x80D6),
+        ('GL_COLOR_TABLE_WIDTH',0x80D9),
+        ('GL_CONSTANT_BORDER',0x8151),
+        ('GL_CONVOLUTION_1D',0x8010),
+        ('GL_CONVOLUTION_2D',0x8011),
+        ('GL_CONVOLUTION_BORDER_COLOR',0x8154),
+        ('GL_CONVOLUTION_BORDER_MODE',0x8013),
+        ('GL_CONVOLUTION_FILTER_BIAS',0x8015),
+        ('GL_CONVOLUTION_FILTER_SCALE',0x8014),
+        ('GL_CONVOLUTION_FORMAT',0x8017),
+        ('GL_CONVOLUTION_HEIGHT',0x8019),
+        ('GL_CONVOLUTION_WIDTH',0x8018),
+        ('GL_HISTOGRAM',0x8024),
+        ('GL_HISTOGRAM_ALPHA_SIZE',0x802B),
+        ('GL_HISTOGRAM_BLUE_SIZE',0x802A),
+        ('GL_HISTOGRAM_FORMAT',0x8027),
+        ('GL_HISTOGRAM_GREEN_SIZE',0x8029),
+        ('GL_HISTOGRAM_LUMINANCE_SIZE',0x802C),
+        ('GL_HISTOGRAM_RED_SIZE',0x8028),
+        ('GL_HISTOGRAM_SINK',0x802D),
+        ('GL_HISTOGRAM_WIDTH',0x8026),
+        ('GL_LIGHT_MODEL_COLOR_CONTROL',0x81F8),
+        ('GL_MAX_3D_TEXTURE_SIZE',0x8073),
+        ('GL_MAX_COLOR_MATRIX_STACK_DEPTH',0x80B3),
+        ('GL_MAX_CONVOLUTION_HEIGHT',0x801B),
+        ('GL_MAX_CONVOLUTION_WIDTH',0x801A),
+        ('GL_MAX_ELEMENTS_INDICES',0x80E9),
+        ('GL_MAX_ELEMENTS_VERTICES',0x80E8),
+        ('GL_MINMAX',0x802E),
+        ('GL_MINMAX_FORMAT',0x802F),
+        ('GL_MINMAX_SINK',0x8030),
+        ('GL_PACK_IMAGE_HEIGHT',0x806C),
+        ('GL_PACK_SKIP_IMAGES',0x806B),
+        ('GL_POST_COLOR_MATRIX_ALPHA_BIAS',0x80BB),
+        ('GL_POST_COLOR_MATRIX_ALPHA_SCALE',0x80B7),
+        ('GL_POST_COLOR_MATRIX_BLUE_BIAS',0x80BA),
+        ('GL_POST_COLOR_MATRIX_BLUE_SCALE',0x80B6),
+        ('GL_POST_COLOR_MATRIX_COLOR_TABLE',0x80D2),
+        ('GL_POST_COLOR_MATRIX_GREEN_BIAS',0x80B9),
+        ('GL_POST_COLOR_MATRIX_GREEN_SCALE',0x80B5),
+        ('GL_POST_COLOR_MATRIX_RED_BIAS',0x80B8),
+        ('GL_POST_COLOR_MATRIX_RED_SCALE',0x80B4),
+        ('GL_POST_CONVOLUTION_ALPHA_BIAS',0x8023),
+        ('GL_POST_CONVOLUTION_ALPHA_SCALE',0x801F),
+        ('GL_POST_CONVOLUTION_BLUE_BIAS',0x8022),
+        ('GL_POST_CONVOLUTION_BLUE_SCALE',0x801E),
+        ('GL_POST_CONVOLUTION_COLOR_TABLE',0x80D1),
+        ('GL_POST_CONVOLUTION_GREEN_BIAS',0x8021),
+        ('GL_POST_CONVOLUTION_GREEN_SCALE',0x801D),
+        ('GL_POST_CONVOLUTION_RED_BIAS',0x8020),
+        ('GL_POST_CONVOLUTION_RED_SCALE',0x801C),
+        ('GL_PROXY_COLOR_TABLE',0x80D3),
+        ('GL_PROXY_HISTOGRAM',0x8025),
+        ('GL_PROXY_POST_COLOR_MATRIX_COLOR_TABLE',0x80D5),
+        ('GL_PROXY_POST_CONVOLUTION_COLOR_TABLE',0x80D4),
+        ('GL_PROXY_TEXTURE_3D',0x8070),
+        ('GL_REDUCE',0x8016),
+        ('GL_REPLICATE_BORDER',0x8153),
+        ('GL_RESCALE_NORMAL',0x803A),
+        ('GL_SEPARABLE_2D',0x8012),
+        ('GL_SEPARATE_SPECULAR_COLOR',0x81FA),
+        ('GL_SINGLE_COLOR',0x81F9),
+        ('GL_SMOOTH_LINE_WIDTH_GRANULARITY',0xB23),
+        ('GL_SMOOTH_LINE_WIDTH_RANGE',0xB22),
+        ('GL_SMOOTH_POINT_SIZE_GRANULARITY',0xB13),
+        ('GL_SMOOTH_POINT_SIZE_RANGE',0xB12),
+        ('GL_TABLE_TOO_LARGE',0x8031),
+        ('GL_TEXTURE_BASE_LEVEL',0x813C),
+        ('GL_TEXTURE_DEPTH',0x8071),
+        ('GL_TEXTURE_MAX_LEVEL',0x813D),
+        ('GL_TEXTURE_MAX_LOD',0x813B),
+        ('GL_TEXTURE_MIN_LOD',0x813A),
+        ('GL_TEXTURE_WRAP_R',0x8072),
+        ('GL_UNPACK_IMAGE_HEIGHT',0x806E),
+        ('GL_UNPACK_SKIP_IMAGES',0x806D),
+        ('GL_UNSIGNED_BYTE_2_3_3_REV',0x8362),
+        ('GL_UNSIGNED_BYTE_3_3_2',0x8032),
+        ('GL_UNSIGNED_INT_10_10_10_2',0x8036),
+        ('GL_UNSIGNED_INT_2_10_10_10_REV',0x8368),
+        ('GL_UNSIGNED_INT_8_8_8_8',0x8035),
+        ('GL_UNSIGNED_INT_8_8_8_8_REV',0x8367),
+        ('GL_UNSIGNED_SHORT_1_5_5_5_REV',0x8366),
+        ('GL_UNSIGNED_SHORT_4_4_4_4',0x8033),
+        ('GL_UNSIGNED_SHORT_4_4_4_4_REV',0x8365),
+        ('GL_UNSIGNED_SHORT_5_5_5_1',0x8034),
+        ('GL_UNSIGNED_SHORT_5_6_5',0x8363),
+        ('GL_UNSIGNED_SHORT_5_6_5_REV',0x8364),
+    ),
+    'OpenGL.GL.VERSION.GL_1_3': (
+        ('GL_ACTIVE_TEXTURE',0x84E0),
+        ('GL_ADD_SIGNED',0x8574),
+        ('GL_CLAMP_TO_BORDER',0x812D),
+        ('GL_CLIENT_ACTIVE_TEXTURE',0x84E1),
+        ('GL_COMBINE',0x8570),
+        ('GL_COMBINE_ALPHA',0x8572),
+        ('GL_COMBINE_RGB',0x8571),
+        ('GL_COMPRESSED_ALPHA',0x84E9),
+        ('GL_COMPRESSED_INTENSITY',0x84EC),
+        ('GL_COMPRESSED_LUMINANCE',0x84EA),
+        ('GL_COMPRESSED_LUMINANCE_ALPHA',0x84EB),
+        ('GL_COMPRESSED_RGB',0x84ED),
+        ('GL_COMPRESSED_RGBA',0x84EE),
+        ('GL_COMPRESSED_TEXTURE_FORMATS',0x86A3),
+        ('GL_CONSTANT',0x8576),
+        ('GL_DOT3_RGB',0x86AE),
+        ('GL_DOT3_RGBA',0x86AF),
+        ('GL_INTERPOLATE',0x8575),
+        ('GL_MAX_CUBE_MAP_TEXTURE_SIZE',0x851C),
+        ('GL_MAX_TEXTURE_UNITS',0x84E2),
+        ('GL_MULTISAMPLE',0x809D),
+        ('GL_MULTISAMPLE_BIT',0x20000000),
+        ('GL_NORMAL_MAP',0x8511),
+        ('GL_NUM_COMPRESSED_TEXTURE_FORMATS',0x86A2),
+        ('GL_OPERAND0_ALPHA',0x8598),
+        ('GL_OPERAND0_RGB',0x8590),
+        ('GL_OPERAND1_ALPHA',0x8599),
+        ('GL_OPERAND1_RGB',0x8591),
+        ('GL_OPERAND2_ALPHA',0x859A),
+        ('GL_OPERAND2_RGB',0x8592),
+        ('GL_PREVIOUS',0x8578),
+        ('GL_PRIMARY_COLOR',0x8577),
+        ('GL_PROXY_TEXTURE_CUBE_MAP',0x851B),
+        ('GL_REFLECTION_MAP',0x8512),
+        ('GL_RGB_SCALE',0x8573),
+        ('GL_SAMPLE_ALPHA_TO_COVERAGE',0x809E),
+        ('GL_SAMPLE_ALPHA_TO_ONE',0x809F),
+        ('GL_SAMPLE_BUFFERS',0x80A8),
+        ('GL_SAMPLE_COVERAGE',0x80A0),
+        ('GL_SAMPLE_COVERAGE_INVERT',0x80AB),
+        ('GL_SAMPLE_COVERAGE_VALUE',0x80AA),
+        ('GL_SOURCE0_ALPHA',0x8588),
+        ('GL_SOURCE0_RGB',0x8580),
+        ('GL_SOURCE1_ALPHA',0x8589),
+        ('GL_SOURCE1_RGB',0x8581),
+        ('GL_SOURCE2_ALPHA',0x858A),
+        ('GL_SOURCE2_RGB',0x8582),
+        ('GL_SUBTRACT',0x84E7),
+        ('GL_TEXTURE0',0x84C0),
+        ('GL_TEXTURE1',0x84C1),
+        ('GL_TEXTURE10',0x84CA),
+        ('GL_TEXTURE11',0x84CB),
+        ('GL_TEXTURE12',0x84CC),
+        ('GL_TEXTURE13',0x84CD),
+        ('GL_TEXTURE14',0x84CE),
+        ('GL_TEXTURE15',0x84CF),
+        ('GL_TEXTURE16',0x84D0),
+        ('GL_TEXTURE17',0x84D1),
+        ('GL_TEXTURE18',0x84D2),
+        ('GL_TEXTURE19',0x84D3),
+        ('GL_TEXTURE2',0x84C2),
+        ('GL_TEXTURE20',0x84D4),
+        ('GL_TEXTURE21',0x84D5),
+        ('GL_TEXTURE22',0x84D6),
+        ('GL_TEXTURE23',0x84D7),
+        ('GL_TEXTURE24',0x84D8),
+        ('GL_TEXTURE25',0x84D9),
+        ('GL_TEXTURE26',0x84DA),
+        ('GL_TEXTURE27',0x84DB),
+        ('GL_TEXTURE28',0x84DC),
+        ('GL_TEXTURE29',0x84DD),
+        ('GL_TEXTURE3',0x84C3),
+        ('GL_TEXTURE30',0x84DE),
+        ('GL_TEXTURE31',0x84DF),
+        ('GL_TEXTURE4',0x84C4),
+        ('GL_TEXTURE5',0x84C5),
+        ('GL_TEXTURE6',0x84C6),
+        ('GL_TEXTURE7',0x84C7),
+        ('GL_TEXTURE8',0x84C8),
+        ('GL_TEXTURE9',0x84C9),
+        ('GL_TEXTURE_COMPRESSED_IMAGE_SIZE',0x86A0),
+        ('GL_TEXTURE_COMPRESSION_HINT',0x84EF),
+        ('GL_TEXTURE_CUBE_MAP_NEGATIVE_X',0x8516),
+        ('GL_TEXTURE_CUBE_MAP_NEGATIVE_Y',0x8518),
+        ('GL_TEXTURE_CUBE_MAP_NEGATIVE_Z',0x851A),
+        ('GL_TEXTURE_CUBE_MAP_POSITIVE_X',0x8515),
+        ('GL_TEXTURE_CUBE_MAP_POSITIVE_Y',0x8517),
+        ('GL_TEXTURE_CUBE_MAP_POSITIVE_Z',0x8519),
+        ('GL_TRANSPOSE_COLOR_MATRIX',0x84E6),
+        ('GL_TRANSPOSE_MODELVIEW_MATRIX',0x84E3),
+        ('GL_TRANSPOSE_PROJECTION_MATRIX',0x84E4),
+        ('GL_TRANSPOSE_TEXTURE_MATRIX',0x84E5),
+    ),
+    'OpenGL.GL.VERSION.GL_1_4': (
+        ('GL_BLEND_COLOR',0x8005),
+        ('GL_BLEND_DST_ALPHA',0x80CA),
+        ('GL_BLEND_DST_RGB',0x80C8),
+        ('GL_BLEND_EQUATION',0x8009),
+        ('GL_BLEND_SRC_ALPHA',0x80CB),
+        ('GL_BLEND_SRC_RGB',0x80C9),
+        ('GL_COLOR_SUM',0x8458),
+        ('GL_COMPARE_R_TO_TEXTURE',0x884E),
+        ('GL_CONSTANT_ALPHA',0x8003),
+        ('GL_CONSTANT_COLOR',0x8001),
+        ('GL_CURRENT_FOG_COORDINATE',0x8453),
+        ('GL_CURRENT_SECONDARY_COLOR',0x8459),
+        ('GL_DECR_WRAP',0x8508),
+        ('GL_DEPTH_COMPONENT16',0x81A5),
+        ('GL_DEPTH_COMPONENT24',0x81A6),
+        ('GL_DEPTH_COMPONENT32',0x81A7),
+        ('GL_DEPTH_TEXTURE_MODE',0x884B),
+        ('GL_FOG_COORDINATE',0x8451),
+        ('GL_FOG_COORDINATE_ARRAY',0x8457),
+        ('GL_FOG_COORDINATE_ARRAY_POINTER',0x8456),
+        ('GL_FOG_COORDINATE_ARRAY_STRIDE',0x8455),
+        ('GL_FOG_COORDINATE_ARRAY_TYPE',0x8454),
+        ('GL_FOG_COORDINATE_SOURCE',0x8450),
+        ('GL_FRAGMENT_DEPTH',0x8452),
+        ('GL_FUNC_ADD',0x8006),
+        ('GL_FUNC_REVERSE_SUBTRACT',0x800B),
+        ('GL_FUNC_SUBTRACT',0x800A),
+        ('GL_GENERATE_MIPMAP',0x8191),
+        ('GL_GENERATE_MIPMAP_HINT',0x8192),
+        ('GL_INCR_WRAP',0x8507),
+        ('GL_MAX',0x8008),
+        ('GL_MAX_TEXTURE_LOD_BIAS',0x84FD),
+        ('GL_MIN',0x8007),
+        ('GL_MIRRORED_REPEAT',0x8370),
+        ('GL_ONE_MINUS_CONSTANT_ALPHA',0x8004),
+        ('GL_ONE_MINUS_CONSTANT_COLOR',0x8002),
+        ('GL_POINT_DISTANCE_ATTENUATION',0x8129),
+        ('GL_POINT_FADE_THRESHOLD_SIZE',0x8128),
+        ('GL_POINT_SIZE_MAX',0x8127),
+        ('GL_POINT_SIZE_MIN',0x8126),
+        ('GL_SECONDARY_COLOR_ARRAY',0x845E),
+        ('GL_SECONDARY_COLOR_ARRAY_POINTER',0x845D),
+        ('GL_SECONDARY_COLOR_ARRAY_SIZE',0x845A),
+        ('GL_SECONDARY_COLOR_ARRAY_STRIDE',0x845C),
+        ('GL_SECONDARY_COLOR_ARRAY_TYPE',0x845B),
+        ('GL_TEXTURE_COMPARE_FUNC',0x884D),
+        ('GL_TEXTURE_COMPARE_MODE',0x884C),
+        ('GL_TEXTURE_DEPTH_SIZE',0x884A),
+        ('GL_TEXTURE_FILTER_CONTROL',0x8500),
+        ('GL_TEXTURE_LOD_BIAS',0x8501),
+    ),
+    'OpenGL.GL.VERSION.GL_1_5': (
+        ('GL_ARRAY_BUFFER',0x8892),
+        ('GL_ARRAY_BUFFER_BINDING',0x8894),
+        ('GL_BUFFER_ACCESS',0x88BB),
+        ('GL_BUFFER_MAPPED',0x88BC),
+        ('GL_BUFFER_MAP_POINTER',0x88BD),
+        ('GL_BUFFER_SIZE',0x8764),
+        ('GL_BUFFER_USAGE',0x8765),
+        ('GL_COLOR_ARRAY_BUFFER_BINDING',0x8898),
+        ('GL_CURRENT_FOG_COORD',0x8453),
+        ('GL_CURRENT_QUERY',0x8865),
+        ('GL_DYNAMIC_COPY',0x88EA),
+        ('GL_DYNAMIC_DRAW',0x88E8),
+        ('GL_DYNAMIC_READ',0x88E9),
+        ('GL_EDGE_FLAG_ARRAY_BUFFER_BINDING',0x889B),
+        ('GL_ELEMENT_ARRAY_BUFFER',0x8893),
+        ('GL_ELEMENT_ARRAY_BUFFER_BINDING',0x8895),
+        ('GL_FOG_COORD',0x8451),
+        ('GL_FOG_COORDINATE_ARRAY_BUFFER_BINDING',0x889D),
+        ('GL_FOG_COORD_ARRAY',0x8457),
+        ('GL_FOG_COORD_ARRAY_BUFFER_BINDING',0x889D),
+        ('GL_FOG_COORD_ARRAY_POINTER',0x8456),
+        ('GL_FOG_COORD_ARRAY_STRIDE',0x8455),
+        ('GL_FOG_COORD_ARRAY_TYPE',0x8454),
+        ('GL_FOG_COORD_SRC',0x8450),
+        ('GL_INDEX_ARRAY_BUFFER_BINDING',0x8899),
+        ('GL_NORMAL_ARRAY_BUFFER_BINDING',0x8897),
+        ('GL_QUERY_COUNTER_BITS',0x8864),
+        ('GL_QUERY_RESULT',0x8866),
+        ('GL_QUERY_RESULT_AVAILABLE',0x8867),
+        ('GL_READ_ONLY',0x88B8),
+        ('GL_READ_WRITE',0x88BA),
+        ('GL_SAMPLES_PASSED',0x8914),
+        ('GL_SECONDARY_COLOR_ARRAY_BUFFER_BINDING',0x889C),
+        ('GL_SRC0_ALPHA',0x8588),
+        ('GL_SRC0_RGB',0x8580),
+        ('GL_SRC1_ALPHA',0x8589),
+        ('GL_SRC1_RGB',0x8581),
+        ('GL_SRC2_ALPHA',0x858A),
+        ('GL_SRC2_RGB',0x8582),
+        ('GL_STATIC_COPY',0x88E6),
+        ('GL_STATIC_DRAW',0x88E4),
+        ('GL_STATIC_READ',0x88E5),
+        ('GL_STREAM_COPY',0x88E2),
+        ('GL_STREAM_DRAW',0x88E0),
+        ('GL_STREAM_READ',0x88E1),
+        ('GL_TEXTURE_COORD_ARRAY_BUFFER_BINDING',0x889A),
+        ('GL_VERTEX_ARRAY_BUFFER_BINDING',0x8896),
+        ('GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING',0x889F),
+        ('GL_WEIGHT_ARRAY_BUFFER_BINDING',0x889E),
+        ('GL_WRITE_ONLY',0x88B9),
+    ),
+    'OpenGL.GL.VERSION.GL_2_0': (
+        ('GL_ACTIVE_ATTRIBUTES',0x8B89),
+        ('GL_ACTIVE_ATTRIBUTE_MAX_LENGTH',0x8B8A),
+        ('GL_ACTIVE_UNIFORMS',0x8B86),
+        ('GL_ACTIVE_UNIFORM_MAX_LENGTH',0x8B87),
+        ('GL_ATTACHED_SHADERS',0x8B85),
+        ('GL_BLEND_EQUATION_ALPHA',0x883D),
+        ('GL_BLEND_EQUATION_RGB',0x8009),
+        ('GL_BOOL',0x8B56),
+        ('GL_BOOL_VEC2',0x8B57),
+        ('GL_BOOL_VEC3',0x8B58),
+        ('GL_BOOL_VEC4',0x8B59),
+        ('GL_COMPILE_STATUS',0x8B81),
+        ('GL_COORD_REPLACE',0x8862),
+        ('GL_CURRENT_PROGRAM',0x8B8D),
+        ('GL_CURRENT_VERTEX_ATTRIB',0x8626),
+        ('GL_DELETE_STATUS',0x8B80),
+        ('GL_DRAW_BUFFER0',0x8825),
+        ('GL_DRAW_BUFFER1',0x8826),
+        ('GL_DRAW_BUFFER10',0x882F),
+        ('GL_DRAW_BUFFER11',0x8830),
+        ('GL_DRAW_BUFFER12',0x8831),
+        ('GL_DRAW_BUFFER13',0x8832),
+        ('GL_DRAW_BUFFER14',0x8833),
+        ('GL_DRAW_BUFFER15',0x8834),
+        ('GL_DRAW_BUFFER2',0x8827),
+        ('GL_DRAW_BUFFER3',0x8828),
+        ('GL_DRAW_BUFFER4',0x8829),
+        ('GL_DRAW_BUFFER5',0x882A),
+        ('GL_DRAW_BUFFER6',0x882B),
+        ('GL_DRAW_BUFFER7',0x882C),
+        ('GL_DRAW_BUFFER8',0x882D),
+        ('GL_DRAW_BUFFER9',0x882E),
+        ('GL_FLOAT_MAT2',0x8B5A),
+        ('GL_FLOAT_MAT3',0x8B5B),
+        ('GL_FLOAT_MAT4',0x8B5C),
+        ('GL_FLOAT_VEC2',0x8B50),
+        ('GL_FLOAT_VEC3',0x8B51),
+        ('GL_FLOAT_VEC4',0x8B52),
+        ('GL_FRAGMENT_SHADER',0x8B30),
+        ('GL_FRAGMENT_SHADER_DERIVATIVE_HINT',0x8B8B),
+        ('GL_INFO_LOG_LENGTH',0x8B84),
+        ('GL_INT_VEC2',0x8B53),
+        ('GL_INT_VEC3',0x8B54),
+        ('GL_INT_VEC4',0x8B55),
+        ('GL_LINK_STATUS',0x8B82),
+        ('GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS',0x8B4D),
+        ('GL_MAX_DRAW_BUFFERS',0x8824),
+        ('GL_MAX_FRAGMENT_UNIFORM_COMPONENTS',0x8B49),
+        ('GL_MAX_TEXTURE_COORDS',0x8871),
+        ('GL_MAX_TEXTURE_IMAGE_UNITS',0x8872),
+        ('GL_MAX_VARYING_FLOATS',0x8B4B),
+        ('GL_MAX_VERTEX_ATTRIBS',0x8869),
+        ('GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS',0x8B4C),
+        ('GL_MAX_VERTEX_UNIFORM_COMPONENTS',0x8B4A),
+        ('GL_OBJECT_ACTIVE_UNIFORMS',0x8B86),
+        ('GL_OBJECT_ACTIVE_UNIFORM_MAX_LENGTH',0x8B87),
+        ('GL_OBJECT_COMPILE_STATUS',0x8B81),
+        ('GL_OBJECT_LINK_STATUS',0x8B82),
+        ('GL_POINT_SPRITE',0x8861),
+        ('GL_POINT_SPRITE_COORD_ORIGIN',0x8CA0),
+        ('GL_SAMPLER_1D',0x8B5D),
+        ('GL_SAMPLER_1D_SHADOW',0x8B61),
+        ('GL_SAMPLER_2D',0x8B5E),
+        ('GL_SAMPLER_2D_SHADOW',0x8B62),
+        ('GL_SAMPLER_3D',0x8B5F),
+        ('GL_SAMPLER_CUBE',0x8B60),
+        ('GL_SHADER_SOURCE_LENGTH',0x8B88),
+        ('GL_SHADER_TYPE',0x8B4F),
+        ('GL_SHADING_LANGUAGE_VERSION',0x8B8C),
+        ('GL_STENCIL_BACK_FAIL',0x8801),
+        ('GL_STENCIL_BACK_FUNC',0x8800),
+        ('GL_STENCIL_BACK_PASS_DEPTH_FAIL',0x8802),
+        ('GL_STENCIL_BACK_PASS_DEPTH_PASS',0x8803),
+        ('GL_STENCIL_BACK_REF',0x8CA3),
+        ('GL_STENCIL_BACK_VALUE_MASK',0x8CA4),
+        ('GL_STENCIL_BACK_WRITEMASK',0x8CA5),
+        ('GL_VALIDATE_STATUS',0x8B83),
+        ('GL_VERTEX_ATTRIB_ARRAY_ENABLED',0x8622),
+        ('GL_VERTEX_ATTRIB_ARRAY_NORMALIZED',0x886A),
+        ('GL_VERTEX_ATTRIB_ARRAY_POINTER',0x8645),
+        ('GL_VERTEX_ATTRIB_ARRAY_SIZE',0x8623),
+        ('GL_VERTEX_ATTRIB_ARRAY_STRIDE',0x8624),
+        ('GL_VERTEX_ATTRIB_ARRAY_TYPE',0x8625),
+        ('GL_VERTEX_PROGRAM_POINT_SIZE',0x8642),
+        ('GL_VERTEX_PROGRAM_TWO_SIDE',0x8643),
+        ('GL_VERTEX_SHADER',0x8B31),
+    ),
+    'OpenGL.GL.VERSION.GL_2_1': (
+        ('GL_COMPRESSED_SLUMINANCE',0x8C4A),
+        ('GL_COMPRESSED_SLUMINANCE_ALPHA',0x8C4B),
+        ('GL_COMPRESSED_SRGB',0x8C48),
+        ('GL_COMPRESSED_SRGB_ALPHA',0x8C49),
+        ('GL_CURRENT_RASTER_SECONDARY_COLOR',0x845F),
+        ('GL_FLOAT_MAT2x3',0x8B65),
+        ('GL_FLOAT_MAT2x4',0x8B66),
+        ('GL_FLOAT_MAT3x2',0x8B67),
+        ('GL_FLOAT_MAT3x4',0x8B68),
+        ('GL_FLOAT_MAT4x2',0x8B69),
+        ('GL_FLOAT_MAT4x3',0x8B6A),
+        ('GL_PIXEL_PACK_BUFFER',0x88EB),
+        ('GL_PIXEL_PACK_BUFFER_BINDING',0x88ED),
+        ('GL_PIXEL_UNPACK_BUFFER',0x88EC),
+        ('GL_PIXEL_UNPACK_BUFFER_BINDING',0x88EF),
+        ('GL_SLUMINANCE',0x8C46),
+        ('GL_SLUMINANCE8',0x8C47),
+        ('GL_SLUMINANCE8_ALPHA8',0x8C45),
+        ('GL_SLUMINANCE_ALPHA',0x8C44),
+        ('GL_SRGB',0x8C40),
+        ('GL_SRGB8',0x8C41),
+        ('GL_SRGB8_ALPHA8',0x8C43),
+        ('GL_SRGB_ALPHA',0x8C42),
+    ),
+    'OpenGL.GL.VERSION.GL_3_0': (
+        ('GL_ALPHA_INTEGER',0x8D97),
+        ('GL_BGRA_INTEGER',0x8D9B),
+        ('GL_BGR_INTEGER',0x8D9A),
+        ('GL_BLUE_INTEGER',0x8D96),
+        ('GL_BUFFER_ACCESS_FLAGS',0x911F),
+        ('GL_BUFFER_MAP_LENGTH',0x9120),
+        ('GL_BUFFER_MAP_OFFSET',0x9121),
+        ('GL_CLAMP_FRAGMENT_COLOR',0x891B),
+        ('GL_CLAMP_READ_COLOR',0x891C),
+        ('GL_CLAMP_VERTEX_COLOR',0x891A),
+        ('GL_CLIP_DISTANCE0',0x3000),
+        ('GL_CLIP_DISTANCE1',0x3001),
+        ('GL_CLIP_DISTANCE2',0x3002),
+        ('GL_CLIP_DISTANCE3',0x3003),
+        ('GL_CLIP_DISTANCE4',0x3004),
+        ('GL_CLIP_DISTANCE5',0x3005),
+        ('GL_CLIP_DISTANCE6',0x3006),
+        ('GL_CLIP_DISTANCE7',0x3007),
+        ('GL_COLOR_ATTACHMENT0',0x8CE0),
+        ('GL_COLOR_ATTACHMENT1',0x8CE1),
+        ('GL_COLOR_ATTACHMENT10',0x8CEA),
+        ('GL_COLOR_ATTACHMENT11',0x8CEB),
+        ('GL_COLOR_ATTACHMENT12',0x8CEC),
+        ('GL_COLOR_ATTACHMENT13',0x8CED),
+        ('GL_COLOR_ATTACHMENT14',0x8CEE),
+        ('GL_COLOR_ATTACHMENT15',0x8CEF),
+        ('GL_COLOR_ATTACHMENT16',0x8CF0),
+        ('GL_COLOR_ATTACHMENT17',0x8CF1),
+        ('GL_COLOR_ATTACHMENT18',0x8CF2),
+        ('GL_COLOR_ATTACHMENT19',0x8CF3),
+        ('GL_COLOR_ATTACHMENT2',0x8CE2),
+        ('GL_COLOR_ATTACHMENT20',0x8CF4),
+        ('GL_COLOR_ATTACHMENT21',0x8CF5),
+        ('GL_COLOR_ATTACHMENT22',0x8CF6),
+        ('GL_COLOR_ATTACHMENT23',0x8CF7),
+        ('GL_COLOR_ATTACHMENT24',0x8CF8),
+        ('GL_COLOR_ATTACHMENT25',0x8CF9),
+        ('GL_COLOR_ATTACHMENT26',0x8CFA),
+        ('GL_COLOR_ATTACHMENT27',0x8CFB),
+        ('GL_COLOR_ATTACHMENT28',0x8CFC),
+        ('GL_COLOR_ATTACHMENT29',0x8CFD),
+        ('GL_COLOR_ATTACHMENT3',0x8CE3),
+        ('GL_COLOR_ATTACHMENT30',0x8CFE),
+        ('GL_COLOR_ATTACHMENT31',0x8CFF),
+        ('GL_COLOR_ATTACHMENT4',0x8CE4),
+        ('GL_COLOR_ATTACHMENT5',0x8CE5),
+        ('GL_COLOR_ATTACHMENT6',0x8CE6),
+        ('GL_COLOR_ATTACHMENT7',0x8CE7),
+        ('GL_COLOR_ATTACHMENT8',0x8CE8),
+        ('GL_COLOR_ATTACHMENT9',0x8CE9),
+        ('GL_COMPARE_REF_TO_TEXTURE',0x884E),
+        ('GL_COMPRESSED_RED',0x8225),
+        ('GL_COMPRESSED_RED_RGTC1',0x8DBB),
+        ('GL_COMPRESSED_RG',0x8226),
+        ('GL_COMPRESSED_RG_RGTC2',0x8DBD),
+        ('GL_COMPRESSED_SIGNED_RED_RGTC1',0x8DBC),
+        ('GL_COMPRESSED_SIGNED_RG_RGTC2',0x8DBE),
+        ('GL_CONTEXT_FLAGS',0x821E),
+        ('GL_CONTEXT_FLAG_FORWARD_COMPATIBLE_BIT',0x1),
+        ('GL_DEPTH24_STENCIL8',0x88F0),
+        ('GL_DEPTH32F_STENCIL8',0x8CAD),
+        ('GL_DEPTH_ATTACHMENT',0x8D00),
+        ('GL_DEPTH_COMPONENT32F',0x8CAC),
+        ('GL_DEPTH_STENCIL',0x84F9),
+        ('GL_DEPTH_STENCIL_ATTACHMENT',0x821A),
+        ('GL_DRAW_FRAMEBUFFER',0x8CA9),
+        ('GL_DRAW_FRAMEBUFFER_BINDING',0x8CA6),
+        ('GL_FIXED_ONLY',0x891D),
+        ('GL_FLOAT_32_UNSIGNED_INT_24_8_REV',0x8DAD),
+        ('GL_FRAMEBUFFER',0x8D40),
+        ('GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE',0x8215),
+        ('GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE',0x8214),
+        ('GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING',0x8210),
+        ('GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE',0x8211),
+        ('GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE',0x8216),
+        ('GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE',0x8213),
+        ('GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME',0x8CD1),
+        ('GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE',0x8CD0),
+        ('GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE',0x8212),
+        ('GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE',0x8217),
+        ('GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE',0x8CD3),
+        ('GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER',0x8CD4),
+        ('GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL',0x8CD2),
+        ('GL_FRAMEBUFFER_BINDING',0x8CA6),
+        ('GL_FRAMEBUFFER_COMPLETE',0x8CD5),
+        ('GL_FRAMEBUFFER_DEFAULT',0x8218),
+        ('GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT',0x8CD6),
+        ('GL_FRAMEBUFFER_INCOMPLETE_DRAW_BUFFER',0x8CDB),
+        ('GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT',0x8CD7),
+        ('GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE',0x8D56),
+        ('GL_FRAMEBUFFER_INCOMPLETE_READ_BUFFER',0x8CDC),
+        ('GL_FRAMEBUFFER_SRGB',0x8DB9),
+        ('GL_FRAMEBUFFER_UNDEFINED',0x8219),
+        ('GL_FRAMEBUFFER_UNSUPPORTED',0x8CDD),
+        ('GL_GREEN_INTEGER',0x8D95),
+        ('GL_INDEX',0x8222),
+        ('GL_INTERLEAVED_ATTRIBS',0x8C8C),
+        ('GL_INT_SAMPLER_1D',0x8DC9),
+        ('GL_INT_SAMPLER_1D_ARRAY',0x8DCE),
+        ('GL_INT_SAMPLER_2D',0x8DCA),
+        ('GL_INT_SAMPLER_2D_ARRAY',0x8DCF),
+        ('GL_INT_SAMPLER_3D',0x8DCB),
+        ('GL_INT_SAMPLER_CUBE',0x8DCC),
+        ('GL_INVALID_FRAMEBUFFER_OPERATION',0x506),
+        ('GL_MAJOR_VERSION',0x821B),
+        ('GL_MAP_FLUSH_EXPLICIT_BIT',0x10),
+        ('GL_MAP_INVALIDATE_BUFFER_BIT',0x8),
+        ('GL_MAP_INVALIDATE_RANGE_BIT',0x4),
+        ('GL_MAP_UNSYNCHRONIZED_BIT',0x20),
+        ('GL_MAX_ARRAY_TEXTURE_LAYERS',0x88FF),
+        ('GL_MAX_CLIP_DISTANCES',0xD32),
+        ('GL_MAX_COLOR_ATTACHMENTS',0x8CDF),
+        ('GL_MAX_PROGRAM_TEXEL_OFFSET',0x8905),
+        ('GL_MAX_RENDERBUFFER_SIZE',0x84E8),
+        ('GL_MAX_SAMPLES',0x8D57),
+        ('GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS',0x8C8A),
+        ('GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS',0x8C8B),
+        ('GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS',0x8C80),
+        ('GL_MAX_VARYING_COMPONENTS',0x8B4B),
+        ('GL_MINOR_VERSION',0x821C),
+        ('GL_MIN_PROGRAM_TEXEL_OFFSET',0x8904),
+        ('GL_NUM_EXTENSIONS',0x821D),
+        ('GL_PRIMITIVES_GENERATED',0x8C87),
+        ('GL_PROXY_TEXTURE_1D_ARRAY',0x8C19),
+        ('GL_PROXY_TEXTURE_2D_ARRAY',0x8C1B),
+        ('GL_QUERY_BY_REGION_NO_WAIT',0x8E16),
+        ('GL_QUERY_BY_REGION_WAIT',0x8E15),
+        ('GL_QUERY_NO_WAIT',0x8E14),
+        ('GL_QUERY_WAIT',0x8E13),
+        ('GL_R11F_G11F_B10F',0x8C3A),
+        ('GL_R16',0x822A),
+        ('GL_R16F',0x822D),
+        ('GL_R16I',0x8233),
+        ('GL_R16UI',0x8234),
+        ('GL_R32F',0x822E),
+        ('GL_R32I',0x8235),
+        ('GL_R32UI',0x8236),
+        ('GL_R8',0x8229),
+        ('GL_R8I',0x8231),
+        ('GL_R8UI',0x8232),
+        ('GL_RASTERIZER_DISCARD',0x8C89),
+        ('GL_READ_FRAMEBUFFER',0x8CA8),
+        ('GL_READ_FRAMEBUFFER_BINDING',0x8CAA),
+        ('GL_RED_INTEGER',0x8D94),
+        ('GL_RENDERBUFFER_ALPHA_SIZE',0x8D53),
+        ('GL_RENDERBUFFER_BINDING',0x8CA7),
+        ('GL_RENDERBUFFER_BLUE_SIZE',0x8D52),
+        ('GL_RENDERBUFFER_DEPTH_SIZE',0x8D54),
+        ('GL_RENDERBUFFER_GREEN_SIZE',0x8D51),
+        ('GL_RENDERBUFFER_HEIGHT',0x8D43),
+        ('GL_RENDERBUFFER_INTERNAL_FORMAT',0x8D44),
+        ('GL_RENDERBUFFER_RED_SIZE',0x8D50),
+        ('GL_RENDERBUFFER_SAMPLES',0x8CAB),
+        ('GL_RENDERBUFFER_STENCIL_SIZE',0x8D55),
+        ('GL_RENDERBUFFER_WIDTH',0x8D42),
+        ('GL_RG',0x8227),
+        ('GL_RG16',0x822C),
+        ('GL_RG16F',0x822F),
+        ('GL_RG16I',0x8239),
+        ('GL_RG16UI',0x823A),
+        ('GL_RG32F',0x8230),
+        ('GL_RG32I',0x823B),
+        ('GL_RG32UI',0x823C),
+        ('GL_RG8',0x822B),
+        ('GL_RG8I',0x8237),
+        ('GL_RG8UI',0x8238),
+        ('GL_RGB16F',0x881B),
+        ('GL_RGB16I',0x8D89),
+        ('GL_RGB16UI',0x8D77),
+        ('GL_RGB32F',0x8815),
+        ('GL_RGB32UI',0x8D71),
+        ('GL_RGB8I',0x8D8F),
+        ('GL_RGB8UI',0x8D7D),
+        ('GL_RGB9_E5',0x8C3D),
+        ('GL_RGBA16F',0x881A),
+        ('GL_RGBA16I',0x8D88),
+        ('GL_RGBA16UI',0x8D76),
+        ('GL_RGBA32F',0x8814),
+        ('GL_RGBA32I',0x8D82),
+        ('GL_RGBA32UI',0x8D70),
+        ('GL_RGBA8I',0x8D8E),
+        ('GL_RGBA8UI',0x8D7C),
+        ('GL_RGBA_INTEGER',0x8D99),
+        ('GL_RGB_INTEGER',0x8D98),
+        ('GL_RG_INTEGER',0x8228),
+        ('GL_SAMPLER_1D_ARRAY',0x8DC0),
+        ('GL_SAMPLER_1D_ARRAY_SHADOW',0x8DC3),
+        ('GL_SAMPLER_2D_ARRAY',0x8DC1),
+        ('GL_SAMPLER_2D_ARRAY_SHADOW',0x8DC4),
+        ('GL_SAMPLER_CUBE_SHADOW',0x8DC5),
+        ('GL_SEPARATE_ATTRIBS',0x8C8D),
+        ('GL_STENCIL_ATTACHMENT',0x8D20),
+        ('GL_STENCIL_INDEX1',0x8D46),
+        ('GL_STENCIL_INDEX16',0x8D49),
+        ('GL_STENCIL_INDEX4',0x8D47),
+        ('GL_TEXTURE_ALPHA_TYPE',0x8C13),
+        ('GL_TEXTURE_BLUE_TYPE',0x8C12),
+        ('GL_TEXTURE_DEPTH_TYPE',0x8C16),
+        ('GL_TEXTURE_GREEN_TYPE',0x8C11),
+        ('GL_TEXTURE_INTENSITY_TYPE',0x8C15),
+        ('GL_TEXTURE_LUMINANCE_TYPE',0x8C14),
+        ('GL_TEXTURE_RED_TYPE',0x8C10),
+        ('GL_TEXTURE_SHARED_SIZE',0x8C3F),
+        ('GL_TEXTURE_STENCIL_SIZE',0x88F1),
+        ('GL_TRANSFORM_FEEDBACK_BUFFER_BINDING',0x8C8F),
+        ('GL_TRANSFORM_FEEDBACK_BUFFER_MODE',0x8C7F),
+        ('GL_TRANSFORM_FEEDBACK_BUFFER_SIZE',0x8C85),
+        ('GL_TRANSFORM_FEEDBACK_BUFFER_START',0x8C84),
+        ('GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN',0x8C88),
+        ('GL_TRANSFORM_FEEDBACK_VARYINGS',0x8C83),
+        ('GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH',0x8C76),
+        ('GL_UNSIGNED_INT_24_8',0x84FA),
+        ('GL_UNSIGNED_INT_5_9_9_9_REV',0x8C3E),
+        ('GL_UNSIGNED_INT_SAMPLER_1D',0x8DD1),
+        ('GL_UNSIGNED_INT_SAMPLER_1D_ARRAY',0x8DD6),
+        ('GL_UNSIGNED_INT_SAMPLER_2D',0x8DD2),
+        ('GL_UNSIGNED_INT_SAMPLER_2D_ARRAY',0x8DD7),
+        ('GL_UNSIGNED_INT_SAMPLER_3D',0x8DD3),
+        ('GL_UNSIGNED_INT_SAMPLER_CUBE',0x8DD4),
+        ('GL_UNSIGNED_INT_VEC2',0x8DC6),
+        ('GL_UNSIGNED_INT_VEC3',0x8DC7),
+        ('GL_UNSIGNED_INT_VEC4',0x8DC8),
+        ('GL_UNSIGNED_NORMALIZED',0x8C17),
+        ('GL_VERTEX_ARRAY_BINDING',0x85B5),
+        ('GL_VERTEX_ATTRIB_ARRAY_INTEGER',0x88FD),
+    ),
+    'OpenGL.GL.VERSION.GL_3_1': (
+        ('GL_ACTIVE_UNIFORM_BLOCKS',0x8A36),
+        ('GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH',0x8A35),
+        ('GL_COPY_READ_BUFFER',0x8F36),
+        ('GL_COPY_WRITE_BUFFER',0x8F37),
+        ('GL_INT_SAMPLER_2D_RECT',0x8DCD),
+        ('GL_INT_SAMPLER_BUFFER',0x8DD0),
+        ('GL_INVALID_INDEX',0xFFFFFFFF),
+        ('GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS',0x8A33),
+        ('GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS',0x8A32),
+        ('GL_MAX_COMBINED_UNIFORM_BLOCKS',0x8A2E),
+        ('GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS',0x8A31),
+        ('GL_MAX_FRAGMENT_UNIFORM_BLOCKS',0x8A2D),
+        ('GL_MAX_GEOMETRY_UNIFORM_BLOCKS',0x8A2C),
+        ('GL_MAX_RECTANGLE_TEXTURE_SIZE',0x84F8),
+        ('GL_MAX_TEXTURE_BUFFER_SIZE',0x8C2B),
+        ('GL_MAX_UNIFORM_BLOCK_SIZE',0x8A30),
+        ('GL_MAX_UNIFORM_BUFFER_BINDINGS',0x8A2F),
+        ('GL_MAX_VERTEX_UNIFORM_BLOCKS',0x8A2B),
+        ('GL_PRIMITIVE_RESTART',0x8F9D),
+        ('GL_PRIMITIVE_RESTART_INDEX',0x8F9E),
+        ('GL_PROXY_TEXTURE_RECTANGLE',0x84F7),
+        ('GL_R16_SNORM',0x8F98),
+        ('GL_R8_SNORM',0x8F94),
+        ('GL_RG16_SNORM',0x8F99),
+        ('GL_RG8_SNORM',0x8F95),
+        ('GL_RGB16_SNORM',0x8F9A),
+        ('GL_RGB8_SNORM',0x8F96),
+        ('GL_RGBA16_SNORM',0x8F9B),
+        ('GL_RGBA8_SNORM',0x8F97),
+        ('GL_SAMPLER_2D_RECT',0x8B63),
+        ('GL_SAMPLER_2D_RECT_SHADOW',0x8B64),
+        ('GL_SAMPLER_BUFFER',0x8DC2),
+        ('GL_SIGNED_NORMALIZED',0x8F9C),
+        ('GL_TEXTURE_BUFFER_DATA_STORE_BINDING',0x8C2D),
+        ('GL_UNIFORM_ARRAY_STRIDE',0x8A3C),
+        ('GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS',0x8A42),
+        ('GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES',0x8A43),
+        ('GL_UNIFORM_BLOCK_BINDING',0x8A3F),
+        ('GL_UNIFORM_BLOCK_DATA_SIZE',0x8A40),
+        ('GL_UNIFORM_BLOCK_INDEX',0x8A3A),
+        ('GL_UNIFORM_BLOCK_NAME_LENGTH',0x8A41),
+        ('GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER',0x8A46),
+        ('GL_UNIFORM_BLOCK_REFERENCED_BY_GEOMETRY_SHADER',0x8A45),
+        ('GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER',0x8A44),
+        ('GL_UNIFORM_BUFFER',0x8A11),
+        ('GL_UNIFORM_BUFFER_BINDING',0x8A28),
+        ('GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT',0x8A34),
+        ('GL_UNIFORM_BUFFER_SIZE',0x8A2A),
+        ('GL_UNIFORM_BUFFER_START',0x8A29),
+        ('GL_UNIFORM_IS_ROW_MAJOR',0x8A3E),
+        ('GL_UNIFORM_MATRIX_STRIDE',0x8A3D),
+        ('GL_UNIFORM_NAME_LENGTH',0x8A39),
+        ('GL_UNIFORM_OFFSET',0x8A3B),
+        ('GL_UNIFORM_SIZE',0x8A38),
+        ('GL_UNIFORM_TYPE',0x8A37),
+        ('GL_UNSIGNED_INT_SAMPLER_2D_RECT',0x8DD5),
+        ('GL_UNSIGNED_INT_SAMPLER_BUFFER',0x8DD8),
+    ),
+    'OpenGL.GL.VERSION.GL_3_2': (
+        ('GL_ALREADY_SIGNALED',0x911A),
+        ('GL_CONDITION_SATISFIED',0x911C),
+        ('GL_CONTEXT_COMPATIBILITY_PROFILE_BIT',0x2),
+        ('GL_CONTEXT_CORE_PROFILE_BIT',0x1),
+        ('GL_CONTEXT_PROFILE_MASK',0x9126),
+        ('GL_DEPTH_CLAMP',0x864F),
+        ('GL_FRAMEBUFFER_ATTACHMENT_LAYERED',0x8DA7),
+        ('GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS',0x8DA8),
+        ('GL_GEOMETRY_INPUT_TYPE',0x8917),
+        ('GL_GEOMETRY_OUTPUT_TYPE',0x8918),
+        ('GL_GEOMETRY_SHADER',0x8DD9),
+        ('GL_GEOMETRY_VERTICES_OUT',0x8916),
+        ('GL_INT_SAMPLER_2D_MULTISAMPLE',0x9109),
+        ('GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',0x910C),
+        ('GL_LINES_ADJACENCY',0xA),
+        ('GL_LINE_STRIP_ADJACENCY',0xB),
+        ('GL_MAX_COLOR_TEXTURE_SAMPLES',0x910E),
+        ('GL_MAX_DEPTH_TEXTURE_SAMPLES',0x910F),
+        ('GL_MAX_FRAGMENT_INPUT_COMPONENTS',0x9125),
+        ('GL_MAX_GEOMETRY_INPUT_COMPONENTS',0x9123),
+        ('GL_MAX_GEOMETRY_OUTPUT_COMPONENTS',0x9124),
+        ('GL_MAX_GEOMETRY_OUTPUT_VERTICES',0x8DE0),
+        ('GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS',0x8C29),
+        ('GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS',0x8DE1),
+        ('GL_MAX_GEOMETRY_UNIFORM_COMPONENTS',0x8DDF),
+        ('GL_MAX_INTEGER_SAMPLES',0x9110),
+        ('GL_MAX_SAMPLE_MASK_WORDS',0x8E59),
+        ('GL_MAX_SERVER_WAIT_TIMEOUT',0x9111),
+        ('GL_MAX_VERTEX_OUTPUT_COMPONENTS',0x9122),
+        ('GL_OBJECT_TYPE',0x9112),
+        ('GL_PROGRAM_POINT_SIZE',0x8642),
+        ('GL_PROXY_TEXTURE_2D_MULTISAMPLE',0x9101),
+        ('GL_PROXY_TEXTURE_2D_MULTISAMPLE_ARRAY',0x9103),
+        ('GL_QUADS_FOLLOW_PROVOKING_VERTEX_CONVENTION',0x8E4C),
+        ('GL_SAMPLER_2D_MULTISAMPLE',0x9108),
+        ('GL_SAMPLER_2D_MULTISAMPLE_ARRAY',0x910B),
+        ('GL_SAMPLE_MASK',0x8E51),
+        ('GL_SAMPLE_MASK_VALUE',0x8E52),
+        ('GL_SAMPLE_POSITION',0x8E50),
+        ('GL_SIGNALED',0x9119),
+        ('GL_SYNC_CONDITION',0x9113),
+        ('GL_SYNC_FENCE',0x9116),
+        ('GL_SYNC_FLAGS',0x9115),
+        ('GL_SYNC_FLUSH_COMMANDS_BIT',0x1),
+        ('GL_SYNC_GPU_COMMANDS_COMPLETE',0x9117),
+        ('GL_SYNC_STATUS',0x9114),
+        ('GL_TEXTURE_CUBE_MAP_SEAMLESS',0x884F),
+        ('GL_TEXTURE_FIXED_SAMPLE_LOCATIONS',0x9107),
+        ('GL_TEXTURE_SAMPLES',0x9106),
+        ('GL_TIMEOUT_EXPIRED',0x911B),
+        ('GL_TIMEOUT_IGNORED',-0x7FFFFFFFFFFFFFFF),
+        ('GL_TRIANGLES_ADJACENCY',0xC),
+        ('GL_TRIANGLE_STRIP_ADJACENCY',0xD),
+        ('GL_UNSIGNALED',0x9118),
+        ('GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE',0x910A),
+        ('GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',0x910D),
+        ('GL_WAIT_FAILED',0x911D),
+    ),
+    'OpenGL.GL.VERSION.GL_3_3': (
+        ('GL_ANY_SAMPLES_PASSED',0x8C2F),
+        ('GL_INT_2_10_10_10_REV',0x8D9F),
+        ('GL_MAX_DUAL_SOURCE_DRAW_BUFFERS',0x88FC),
+        ('GL_ONE_MINUS_SRC1_ALPHA',0x88FB),
+        ('GL_ONE_MINUS_SRC1_COLOR',0x88FA),
+        ('GL_RGB10_A2UI',0x906F),
+        ('GL_SAMPLER_BINDING',0x8919),
+        ('GL_SRC1_COLOR',0x88F9),
+        ('GL_TEXTURE_SWIZZLE_A',0x8E45),
+        ('GL_TEXTURE_SWIZZLE_B',0x8E44),
+        ('GL_TEXTURE_SWIZZLE_G',0x8E43),
+        ('GL_TEXTURE_SWIZZLE_R',0x8E42),
+        ('GL_TEXTURE_SWIZZLE_RGBA',0x8E46),
+        ('GL_TIMESTAMP',0x8E28),
+        ('GL_TIME_ELAPSED',0x88BF),
+        ('GL_VERTEX_ATTRIB_ARRAY_DIVISOR',0x88FE),
+    ),
+    'OpenGL.GL.VERSION.GL_4_0': (
+        ('GL_ACTIVE_SUBROUTINES',0x8DE5),
+        ('GL_ACTIVE_SUBROUTINE_MAX_LENGTH',0x8E48),
+        ('GL_ACTIVE_SUBROUTINE_UNIFORMS',0x8DE6),
+        ('GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS',0x8E47),
+        ('GL_ACTIVE_SUBROUTINE_UNIFORM_MAX_LENGTH',0x8E49),
+        ('GL_DRAW_INDIRECT_BUFFER',0x8F3F),
+        ('GL_DRAW_INDIRECT_BUFFER_BINDING',0x8F43),
+        ('GL_FRACTIONAL_EVEN',0x8E7C),
+        ('GL_FRACTIONAL_ODD',0x8E7B),
+        ('GL_FRAGMENT_INTERPOLATION_OFFSET_BITS',0x8E5D),
+        ('GL_INT_SAMPLER_CUBE_MAP_ARRAY',0x900E),
+        ('GL_ISOLINES',0x8E7A),
+        ('GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS',0x8E1E),
+        ('GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS',0x8E1F),
+        ('GL_MAX_FRAGMENT_INTERPOLATION_OFFSET',0x8E5C),
+        ('GL_MAX_GEOMETRY_SHADER_INVOCATIONS',0x8E5A),
+        ('GL_MAX_PATCH_VERTICES',0x8E7D),
+        ('GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET',0x8E5F),
+        ('GL_MAX_SUBROUTINES',0x8DE7),
+        ('GL_MAX_SUBROUTINE_UNIFORM_LOCATIONS',0x8DE8),
+        ('GL_MAX_TESS_CONTROL_INPUT_COMPONENTS',0x886C),
+        ('GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS',0x8E83),
+        ('GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS',0x8E81),
+        ('GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS',0x8E85),
+        ('GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS',0x8E89),
+        ('GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS',0x8E7F),
+        ('GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS',0x886D),
+        ('GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS',0x8E86),
+        ('GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS',0x8E82),
+        ('GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS',0x8E8A),
+        ('GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS',0x8E80),
+        ('GL_MAX_TESS_GEN_LEVEL',0x8E7E),
+        ('GL_MAX_TESS_PATCH_COMPONENTS',0x8E84),
+        ('GL_MAX_TRANSFORM_FEEDBACK_BUFFERS',0x8E70),
+        ('GL_MAX_VERTEX_STREAMS',0x8E71),
+        ('GL_MIN_FRAGMENT_INTERPOLATION_OFFSET',0x8E5B),
+        ('GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET',0x8E5E),
+        ('GL_MIN_SAMPLE_SHADING_VALUE',0x8C37),
+        ('GL_PATCHES',0xE),
+        ('GL_PATCH_DEFAULT_INNER_LEVEL',0x8E73),
+        ('GL_PATCH_DEFAULT_OUTER_LEVEL',0x8E74),
+        ('GL_PATCH_VERTICES',0x8E72),
+        ('GL_PROXY_TEXTURE_CUBE_MAP_ARRAY',0x900B),
+        ('GL_SAMPLER_CUBE_MAP_ARRAY',0x900C),
+        ('GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW',0x900D),
+        ('GL_SAMPLE_SHADING',0x8C36),
+        ('GL_TESS_CONTROL_OUTPUT_VERTICES',0x8E75),
+        ('GL_TESS_CONTROL_SHADER',0x8E88),
+        ('GL_TESS_EVALUATION_SHADER',0x8E87),
+        ('GL_TESS_GEN_MODE',0x8E76),
+        ('GL_TESS_GEN_POINT_MODE',0x8E79),
+        ('GL_TESS_GEN_SPACING',0x8E77),
+        ('GL_TESS_GEN_VERTEX_ORDER',0x8E78),
+        ('GL_TRANSFORM_FEEDBACK',0x8E22),
+        ('GL_TRANSFORM_FEEDBACK_BINDING',0x8E25),
+        ('GL_TRANSFORM_FEEDBACK_BUFFER_ACTIVE',0x8E24),
+        ('GL_TRANSFORM_FEEDBACK_BUFFER_PAUSED',0x8E23),
+        ('GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_CONTROL_SHADER',0x84F0),
+        ('GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_EVALUATION_SHADER',0x84F1),
+        ('GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY',0x900F),
+    ),
+    'OpenGL.GL.VERSION.GL_4_1': (
+        ('GL_ACTIVE_PROGRAM',0x8259),
+        ('GL_ALL_SHADER_BITS',0xFFFFFFFF),
+        ('GL_DOUBLE_MAT2',0x8F46),
+        ('GL_DOUBLE_MAT2x3',0x8F49),
+        ('GL_DOUBLE_MAT2x4',0x8F4A),
+        ('GL_DOUBLE_MAT3',0x8F47),
+        ('GL_DOUBLE_MAT3x2',0x8F4B),
+        ('GL_DOUBLE_MAT3x4',0x8F4C),
+        ('GL_DOUBLE_MAT4',0x8F48),
+        ('GL_DOUBLE_MAT4x2',0x8F4D),
+        ('GL_DOUBLE_MAT4x3',0x8F4E),
+        ('GL_DOUBLE_VEC2',0x8FFC),
+        ('GL_DOUBLE_VEC3',0x8FFD),
+        ('GL_DOUBLE_VEC4',0x8FFE),
+        ('GL_FIRST_VERTEX_CONVENTION',0x8E4D),
+        ('GL_FRAGMENT_SHADER_BIT',0x2),
+        ('GL_GEOMETRY_SHADER_BIT',0x4),
+        ('GL_HIGH_FLOAT',0x8DF2),
+        ('GL_HIGH_INT',0x8DF5),
+        ('GL_IMPLEMENTATION_COLOR_READ_FORMAT',0x8B9B),
+        ('GL_IMPLEMENTATION_COLOR_READ_TYPE',0x8B9A),
+        ('GL_LAST_VERTEX_CONVENTION',0x8E4E),
+        ('GL_LAYER_PROVOKING_VERTEX',0x825E),
+        ('GL_LOW_FLOAT',0x8DF0),
+        ('GL_LOW_INT',0x8DF3),
+        ('GL_MAX_FRAGMENT_UNIFORM_VECTORS',0x8DFD),
+        ('GL_MAX_VARYING_VECTORS',0x8DFC),
+        ('GL_MAX_VERTEX_UNIFORM_VECTORS',0x8DFB),
+        ('GL_MAX_VIEWPORTS',0x825B),
+        ('GL_MEDIUM_FLOAT',0x8DF1),
+        ('GL_MEDIUM_INT',0x8DF4),
+        ('GL_NUM_PROGRAM_BINARY_FORMATS',0x87FE),
+        ('GL_NUM_SHADER_BINARY_FORMATS',0x8DF9),
+        ('GL_PROGRAM_BINARY_FORMATS',0x87FF),
+        ('GL_PROGRAM_BINARY_LENGTH',0x8741),
+        ('GL_PROGRAM_BINARY_RETRIEVABLE_HINT',0x8257),
+        ('GL_PROGRAM_PIPELINE_BINDING',0x825A),
+        ('GL_PROGRAM_SEPARABLE',0x8258),
+        ('GL_PROVOKING_VERTEX',0x8E4F),
+        ('GL_RGB32I',0x8D83),
+        ('GL_RGB565',0x8D62),
+        ('GL_SHADER_BINARY_FORMATS',0x8DF8),
+        ('GL_SHADER_COMPILER',0x8DFA),
+        ('GL_TESS_CONTROL_SHADER_BIT',0x8),
+        ('GL_TESS_EVALUATION_SHADER_BIT',0x10),
+        ('GL_UNDEFINED_VERTEX',0x8260),
+        ('GL_VERTEX_SHADER_BIT',0x1),
+        ('GL_VIEWPORT_BOUNDS_RANGE',0x825D),
+        ('GL_VIEWPORT_INDEX_PROVOKING_VERTEX',0x825F),
+        ('GL_VIEWPORT_SUBPIXEL_BITS',0x825C),
+    ),
+    'OpenGL.GL.VERSION.GL_4_2': (
+        ('GL_ACTIVE_ATOMIC_COUNTER_BUFFERS',0x92D9),
+        ('GL_ALL_BARRIER_BITS',0xFFFFFFFF),
+        ('GL_ATOMIC_COUNTER_BARRIER_BIT',0x1000),
+        ('GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTERS',0x92C5),
+        ('GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTER_INDICES',0x92C6),
+        ('GL_ATOMIC_COUNTER_BUFFER_BINDING',0x92C1),
+        ('GL_ATOMIC_COUNTER_BUFFER_DATA_SIZE',0x92C4),
+        ('GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_FRAGMENT_SHADER',0x92CB),
+        ('GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_GEOMETRY_SHADER',0x92CA),
+        ('GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_CONTROL_SHADER',0x92C8),
+        ('GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_EVALUATION_SHADER',0x92C9),
+        ('GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_VERTEX_SHADER',0x92C7),
+        ('GL_ATOMIC_COUNTER_BUFFER_SIZE',0x92C3),
+        ('GL_ATOMIC_COUNTER_BUFFER_START',0x92C2),
+        ('GL_BUFFER_UPDATE_BARRIER_BIT',0x200),
+        ('GL_COMMAND_BARRIER_BIT',0x40),
+        ('GL_COMPRESSED_RGBA_BPTC_UNORM',0x8E8C),
+        ('GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT',0x8E8E),
+        ('GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT',0x8E8F),
+        ('GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM',0x8E8D),
+        ('GL_COPY_READ_BUFFER_BINDING',0x8F36),
+        ('GL_COPY_WRITE_BUFFER_BINDING',0x8F37),
+        ('GL_ELEMENT_ARRAY_BARRIER_BIT',0x2),
+        ('GL_FRAMEBUFFER_BARRIER_BIT',0x400),
+        ('GL_IMAGE_1D',0x904C),
+        ('GL_IMAGE_1D_ARRAY',0x9052),
+        ('GL_IMAGE_2D',0x904D),
+        ('GL_IMAGE_2D_ARRAY',0x9053),
+        ('GL_IMAGE_2D_MULTISAMPLE',0x9055),
+        ('GL_IMAGE_2D_MULTISAMPLE_ARRAY',0x9056),
+        ('GL_IMAGE_2D_RECT',0x904F),
+        ('GL_IMAGE_3D',0x904E),
+        ('GL_IMAGE_BINDING_ACCESS',0x8F3E),
+        ('GL_IMAGE_BINDING_FORMAT',0x906E),
+        ('GL_IMAGE_BINDING_LAYER',0x8F3D),
+        ('GL_IMAGE_BINDING_LAYERED',0x8F3C),
+        ('GL_IMAGE_BINDING_LEVEL',0x8F3B),
+        ('GL_IMAGE_BINDING_NAME',0x8F3A),
+        ('GL_IMAGE_BUFFER',0x9051),
+        ('GL_IMAGE_CUBE',0x9050),
+        ('GL_IMAGE_CUBE_MAP_ARRAY',0x9054),
+        ('GL_IMAGE_FORMAT_COMPATIBILITY_BY_CLASS',0x90C9),
+        ('GL_IMAGE_FORMAT_COMPATIBILITY_BY_SIZE',0x90C8),
+        ('GL_INT_IMAGE_1D',0x9057),
+        ('GL_INT_IMAGE_1D_ARRAY',0x905D),
+        ('GL_INT_IMAGE_2D',0x9058),
+        ('GL_INT_IMAGE_2D_ARRAY',0x905E),
+        ('GL_INT_IMAGE_2D_MULTISAMPLE',0x9060),
+        ('GL_INT_IMAGE_2D_MULTISAMPLE_ARRAY',0x9061),
+        ('GL_INT_IMAGE_2D_RECT',0x905A),
+        ('GL_INT_IMAGE_3D',0x9059),
+        ('GL_INT_IMAGE_BUFFER',0x905C),
+        ('GL_INT_IMAGE_CUBE',0x905B),
+        ('GL_INT_IMAGE_CUBE_MAP_ARRAY',0x905F),
+        ('GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS',0x92DC),
+        ('GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE',0x92D8),
+        ('GL_MAX_COMBINED_ATOMIC_COUNTERS',0x92D7),
+        ('GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS',0x92D1),
+        ('GL_MAX_COMBINED_IMAGE_UNIFORMS',0x90CF),
+        ('GL_MAX_FRAGMENT_ATOMIC_COUNTERS',0x92D6),
+        ('GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS',0x92D0),
+        ('GL_MAX_FRAGMENT_IMAGE_UNIFORMS',0x90CE),
+        ('GL_MAX_GEOMETRY_ATOMIC_COUNTERS',0x92D5),
+        ('GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS',0x92CF),
+        ('GL_MAX_GEOMETRY_IMAGE_UNIFORMS',0x90CD),
+        ('GL_MAX_IMAGE_SAMPLES',0x906D),
+        ('GL_MAX_IMAGE_UNITS',0x8F38),
+        ('GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS',0x92D3),
+        ('GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS',0x92CD),
+        ('GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS',0x90CB),
+        ('GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS',0x92D4),
+        ('GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS',0x92CE),
+        ('GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS',0x90CC),
+        ('GL_MAX_VERTEX_ATOMIC_COUNTERS',0x92D2),
+        ('GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS',0x92CC),
+        ('GL_MAX_VERTEX_IMAGE_UNIFORMS',0x90CA),
+        ('GL_MIN_MAP_BUFFER_ALIGNMENT',0x90BC),
+        ('GL_PACK_COMPRESSED_BLOCK_DEPTH',0x912D),
+        ('GL_PACK_COMPRESSED_BLOCK_HEIGHT',0x912C),
+        ('GL_PACK_COMPRESSED_BLOCK_SIZE',0x912E),
+        ('GL_PACK_COMPRESSED_BLOCK_WIDTH',0x912B),
+        ('GL_PIXEL_BUFFER_BARRIER_BIT',0x80),
+        ('GL_SHADER_IMAGE_ACCESS_BARRIER_BIT',0x20),
+        ('GL_TEXTURE_FETCH_BARRIER_BIT',0x8),
+        ('GL_TEXTURE_IMMUTABLE_FORMAT',0x912F),
+        ('GL_TEXTURE_UPDATE_BARRIER_BIT',0x100),
+        ('GL_TRANSFORM_FEEDBACK_ACTIVE',0x8E24),
+        ('GL_TRANSFORM_FEEDBACK_BARRIER_BIT',0x800),
+        ('GL_TRANSFORM_FEEDBACK_PAUSED',0x8E23),
+        ('GL_UNIFORM_ATOMIC_COUNTER_BUFFER_INDEX',0x92DA),
+        ('GL_UNIFORM_BARRIER_BIT',0x4),
+        ('GL_UNPACK_COMPRESSED_BLOCK_DEPTH',0x9129),
+        ('GL_UNPACK_COMPRESSED_BLOCK_HEIGHT',0x9128),
+        ('GL_UNPACK_COMPRESSED_BLOCK_SIZE',0x912A),
+        ('GL_UNPACK_COMPRESSED_BLOCK_WIDTH',0x9127),
+        ('GL_UNSIGNED_INT_ATOMIC_COUNTER',0x92DB),
+        ('GL_UNSIGNED_INT_IMAGE_1D',0x9062),
+        ('GL_UNSIGNED_INT_IMAGE_1D_ARRAY',0x9068),
+        ('GL_UNSIGNED_INT_IMAGE_2D',0x9063),
+        ('GL_UNSIGNED_INT_IMAGE_2D_ARRAY',0x9069),
+        ('GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE',0x906B),
+        ('GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE_ARRAY',0x906C),
+        ('GL_UNSIGNED_INT_IMAGE_2D_RECT',0x9065),
+        ('GL_UNSIGNED_INT_IMAGE_3D',0x9064),
+        ('GL_UNSIGNED_INT_IMAGE_BUFFER',0x9067),
+        ('GL_UNSIGNED_INT_IMAGE_CUBE',0x9066),
+        ('GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY',0x906A),
+        ('GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT',0x1),
+    ),
+    'OpenGL.GL.VERSION.GL_4_3': (
+        ('GL_ACTIVE_RESOURCES',0x92F5),
+        ('GL_ACTIVE_VARIABLES',0x9305),
+        ('GL_ANY_SAMPLES_PASSED_CONSERVATIVE',0x8D6A),
+        ('GL_ARRAY_SIZE',0x92FB),
+        ('GL_ARRAY_STRIDE',0x92FE),
+        ('GL_ATOMIC_COUNTER_BUFFER',0x92C0),
+        ('GL_ATOMIC_COUNTER_BUFFER_INDEX',0x9301),
+        ('GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_COMPUTE_SHADER',0x90ED),
+        ('GL_AUTO_GENERATE_MIPMAP',0x8295),
+        ('GL_BLOCK_INDEX',0x92FD),
+        ('GL_BUFFER',0x82E0),
+        ('GL_BUFFER_BINDING',0x9302),
+        ('GL_BUFFER_DATA_SIZE',0x9303),
+        ('GL_BUFFER_KHR',0x82E0),
+        ('GL_BUFFER_VARIABLE',0x92E5),
+        ('GL_CAVEAT_SUPPORT',0x82B8),
+        ('GL_CLEAR_BUFFER',0x82B4),
+        ('GL_COLOR_COMPONENTS',0x8283),
+        ('GL_COLOR_ENCODING',0x8296),
+        ('GL_COLOR_RENDERABLE',0x8286),
+        ('GL_COMPATIBLE_SUBROUTINES',0x8E4B),
+        ('GL_COMPRESSED_R11_EAC',0x9270),
+        ('GL_COMPRESSED_RG11_EAC',0x9272),
+        ('GL_COMPRESSED_RGB8_ETC2',0x9274),
+        ('GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2',0x9276),
+        ('GL_COMPRESSED_RGBA8_ETC2_EAC',0x9278),
+        ('GL_COMPRESSED_SIGNED_R11_EAC',0x9271),
+        ('GL_COMPRESSED_SIGNED_RG11_EAC',0x9273),
+        ('GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC',0x9279),
+        ('GL_COMPRESSED_SRGB8_ETC2',0x9275),
+        ('GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2',0x9277),
+        ('GL_COMPUTE_SHADER',0x91B9),
+        ('GL_COMPUTE_SHADER_BIT',0x20),
+        ('GL_COMPUTE_SUBROUTINE',0x92ED),
+        ('GL_COMPUTE_SUBROUTINE_UNIFORM',0x92F3),
+        ('GL_COMPUTE_TEXTURE',0x82A0),
+        ('GL_COMPUTE_WORK_GROUP_SIZE',0x8267),
+        ('GL_CONTEXT_FLAG_DEBUG_BIT',0x2),
+        ('GL_CONTEXT_FLAG_DEBUG_BIT_KHR',0x2),
+        ('GL_DEBUG_CALLBACK_FUNCTION',0x8244),
+        ('GL_DEBUG_CALLBACK_FUNCTION_KHR',0x8244),
+        ('GL_DEBUG_CALLBACK_USER_PARAM',0x8245),
+        ('GL_DEBUG_CALLBACK_USER_PARAM_KHR',0x8245),
+        ('GL_DEBUG_GROUP_STACK_DEPTH',0x826D),
+        ('GL_DEBUG_GROUP_STACK_DEPTH_KHR',0x826D),
+        ('GL_DEBUG_LOGGED_MESSAGES',0x9145),
+        ('GL_DEBUG_LOGGED_MESSAGES_KHR',0x9145),
+        ('GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH',0x8243),
+        ('GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH_KHR',0x8243),
+        ('GL_DEBUG_OUTPUT',0x92E0),
+        ('GL_DEBUG_OUTPUT_KHR',0x92E0),
+        ('GL_DEBUG_OUTPUT_SYNCHRONOUS',0x8242),
+        ('GL_DEBUG_OUTPUT_SYNCHRONOUS_KHR',0x8242),
+        ('GL_DEBUG_SEVERITY_HIGH',0x9146),
+        ('GL_DEBUG_SEVERITY_HIGH_KHR',0x9146),
+        ('GL_DEBUG_SEVERITY_LOW',0x9148),
+        ('GL_DEBUG_SEVERITY_LOW_KHR',0x9148),
+        ('GL_DEBUG_SEVERITY_MEDIUM',0x9147),
+        ('GL_DEBUG_SEVERITY_MEDIUM_KHR',0x9147),
+        ('GL_DEBUG_SEVERITY_NOTIFICATION',0x826B),
+        ('GL_DEBUG_SEVERITY_NOTIFICATION_KHR',0x826B),
+        ('GL_DEBUG_SOURCE_API',0x8246),
+        ('GL_DEBUG_SOURCE_API_KHR',0x8246),
+        ('GL_DEBUG_SOURCE_APPLICATION',0x824A),
+        ('GL_DEBUG_SOURCE_APPLICATION_KHR',0x824A),
+        ('GL_DEBUG_SOURCE_OTHER',0x824B),
+        ('GL_DEBUG_SOURCE_OTHER_KHR',0x824B),
+        ('GL_DEBUG_SOURCE_SHADER_COMPILER',0x8248),
+        ('GL_DEBUG_SOURCE_SHADER_COMPILER_KHR',0x8248),
+        ('GL_DEBUG_SOURCE_THIRD_PARTY',0x8249),
+        ('GL_DEBUG_SOURCE_THIRD_PARTY_KHR',0x8249),
+        ('GL_DEBUG_SOURCE_WINDOW_SYSTEM',0x8247),
+        ('GL_DEBUG_SOURCE_WINDOW_SYSTEM_KHR',0x8247),
+        ('GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR',0x824D),
+        ('GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR_KHR',0x824D),
+        ('GL_DEBUG_TYPE_ERROR',0x824C),
+        ('GL_DEBUG_TYPE_ERROR_KHR',0x824C),
+        ('GL_DEBUG_TYPE_MARKER',0x8268),
+        ('GL_DEBUG_TYPE_MARKER_KHR',0x8268),
+        ('GL_DEBUG_TYPE_OTHER',0x8251),
+        ('GL_DEBUG_TYPE_OTHER_KHR',0x8251),
+        ('GL_DEBUG_TYPE_PERFORMANCE',0x8250),
+        ('GL_DEBUG_TYPE_PERFORMANCE_KHR',0x8250),
+        ('GL_DEBUG_TYPE_POP_GROUP',0x826A),
+        ('GL_DEBUG_TYPE_POP_GROUP_KHR',0x826A),
+        ('GL_DEBUG_TYPE_PORTABILITY',0x824F),
+        ('GL_DEBUG_TYPE_PORTABILITY_KHR',0x824F),
+        ('GL_DEBUG_TYPE_PUSH_GROUP',0x8269),
+        ('GL_DEBUG_TYPE_PUSH_GROUP_KHR',0x8269),
+        ('GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR',0x824E),
+        ('GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR_KHR',0x824E),
+        ('GL_DEPTH_COMPONENTS',0x8284),
+        ('GL_DEPTH_RENDERABLE',0x8287),
+        ('GL_DEPTH_STENCIL_TEXTURE_MODE',0x90EA),
+        ('GL_DISPATCH_INDIRECT_BUFFER',0x90EE),
+        ('GL_DISPATCH_INDIRECT_BUFFER_BINDING',0x90EF),
+        ('GL_DISPLAY_LIST',0x82E7),
+        ('GL_FILTER',0x829A),
+        ('GL_FRAGMENT_SUBROUTINE',0x92EC),
+        ('GL_FRAGMENT_SUBROUTINE_UNIFORM',0x92F2),
+        ('GL_FRAGMENT_TEXTURE',0x829F),
+        ('GL_FRAMEBUFFER_BLEND',0x828B),
+        ('GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS',0x9314),
+        ('GL_FRAMEBUFFER_DEFAULT_HEIGHT',0x9311),
+        ('GL_FRAMEBUFFER_DEFAULT_LAYERS',0x9312),
+        ('GL_FRAMEBUFFER_DEFAULT_SAMPLES',0x9313),
+        ('GL_FRAMEBUFFER_DEFAULT_WIDTH',0x9310),
+        ('GL_FRAMEBUFFER_RENDERABLE',0x8289),
+        ('GL_FRAMEBUFFER_RENDERABLE_LAYERED',0x828A),
+        ('GL_FULL_SUPPORT',0x82B7),
+        ('GL_GEOMETRY_SUBROUTINE',0x92EB),
+        ('GL_GEOMETRY_SUBROUTINE_UNIFORM',0x92F1),
+        ('GL_GEOMETRY_TEXTURE',0x829E),
+        ('GL_GET_TEXTURE_IMAGE_FORMAT',0x8291),
+        ('GL_GET_TEXTURE_IMAGE_TYPE',0x8292),
+        ('GL_IMAGE_CLASS_10_10_10_2',0x82C3),
+        ('GL_IMAGE_CLASS_11_11_10',0x82C2),
+        ('GL_IMAGE_CLASS_1_X_16',0x82BE),
+        ('GL_IMAGE_CLASS_1_X_32',0x82BB),
+        ('GL_IMAGE_CLASS_1_X_8',0x82C1),
+        ('GL_IMAGE_CLASS_2_X_16',0x82BD),
+        ('GL_IMAGE_CLASS_2_X_32',0x82BA),
+        ('GL_IMAGE_CLASS_2_X_8',0x82C0),
+        ('GL_IMAGE_CLASS_4_X_16',0x82BC),
+        ('GL_IMAGE_CLASS_4_X_32',0x82B9),
+        ('GL_IMAGE_CLASS_4_X_8',0x82BF),
+        ('GL_IMAGE_COMPATIBILITY_CLASS',0x82A8),
+        ('GL_IMAGE_FORMAT_COMPATIBILITY_TYPE',0x90C7),
+        ('GL_IMAGE_PIXEL_FORMAT',0x82A9),
+        ('GL_IMAGE_PIXEL_TYPE',0x82AA),
+        ('GL_IMAGE_TEXEL_SIZE',0x82A7),
+        ('GL_INTERNALFORMAT_ALPHA_SIZE',0x8274),
+        ('GL_INTERNALFORMAT_ALPHA_TYPE',0x827B),
+        ('GL_INTERNALFORMAT_BLUE_SIZE',0x8273),
+        ('GL_INTERNALFORMAT_BLUE_TYPE',0x827A),
+        ('GL_INTERNALFORMAT_DEPTH_SIZE',0x8275),
+        ('GL_INTERNALFORMAT_DEPTH_TYPE',0x827C),
+        ('GL_INTERNALFORMAT_GREEN_SIZE',0x8272),
+        ('GL_INTERNALFORMAT_GREEN_TYPE',0x8279),
+        ('GL_INTERNALFORMAT_PREFERRED',0x8270),
+        ('GL_INTERNALFORMAT_RED_SIZE',0x8271),
+        ('GL_INTERNALFORMAT_RED_TYPE',0x8278),
+        ('GL_INTERNALFORMAT_SHARED_SIZE',0x8277),
+        ('GL_INTERNALFORMAT_STENCIL_SIZE',0x8276),
+        ('GL_INTERNALFORMAT_STENCIL_TYPE',0x827D),
+        ('GL_INTERNALFORMAT_SUPPORTED',0x826F),
+        ('GL_IS_PER_PATCH',0x92E7),
+        ('GL_IS_ROW_MAJOR',0x9300),
+        ('GL_LOCATION',0x930E),
+        ('GL_LOCATION_INDEX',0x930F),
+        ('GL_MANUAL_GENERATE_MIPMAP',0x8294),
+        ('GL_MATRIX_STRIDE',0x92FF),
+        ('GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS',0x8266),
+        ('GL_MAX_COMBINED_DIMENSIONS',0x8282),
+        ('GL_MAX_COMBINED_IMAGE_UNITS_AND_FRAGMENT_OUTPUTS',0x8F39),
+        ('GL_MAX_COMBINED_SHADER_OUTPUT_RESOURCES',0x8F39),
+        ('GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS',0x90DC),
+        ('GL_MAX_COMPUTE_ATOMIC_COUNTERS',0x8265),
+        ('GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS',0x8264),
+        ('GL_MAX_COMPUTE_IMAGE_UNIFORMS',0x91BD),
+        ('GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS',0x90DB),
+        ('GL_MAX_COMPUTE_SHARED_MEMORY_SIZE',0x8262),
+        ('GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS',0x91BC),
+        ('GL_MAX_COMPUTE_UNIFORM_BLOCKS',0x91BB),
+        ('GL_MAX_COMPUTE_UNIFORM_COMPONENTS',0x8263),
+        ('GL_MAX_COMPUTE_WORK_GROUP_COUNT',0x91BE),
+        ('GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS',0x90EB),
+        ('GL_MAX_COMPUTE_WORK_GROUP_SIZE',0x91BF),
+        ('GL_MAX_DEBUG_GROUP_STACK_DEPTH',0x826C),
+        ('GL_MAX_DEBUG_GROUP_STACK_DEPTH_KHR',0x826C),
+        ('GL_MAX_DEBUG_LOGGED_MESSAGES',0x9144),
+        ('GL_MAX_DEBUG_LOGGED_MESSAGES_KHR',0x9144),
+        ('GL_MAX_DEBUG_MESSAGE_LENGTH',0x9143),
+        ('GL_MAX_DEBUG_MESSAGE_LENGTH_KHR',0x9143),
+        ('GL_MAX_DEPTH',0x8280),
+        ('GL_MAX_ELEMENT_INDEX',0x8D6B),
+        ('GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS',0x90DA),
+        ('GL_MAX_FRAMEBUFFER_HEIGHT',0x9316),
+        ('GL_MAX_FRAMEBUFFER_LAYERS',0x9317),
+        ('GL_MAX_FRAMEBUFFER_SAMPLES',0x9318),
+        ('GL_MAX_FRAMEBUFFER_WIDTH',0x9315),
+        ('GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS',0x90D7),
+        ('GL_MAX_HEIGHT',0x827F),
+        ('GL_MAX_LABEL_LENGTH',0x82E8),
+        ('GL_MAX_LABEL_LENGTH_KHR',0x82E8),
+        ('GL_MAX_LAYERS',0x8281),
+        ('GL_MAX_NAME_LENGTH',0x92F6),
+        ('GL_MAX_NUM_ACTIVE_VARIABLES',0x92F7),
+        ('GL_MAX_NUM_COMPATIBLE_SUBROUTINES',0x92F8),
+        ('GL_MAX_SHADER_STORAGE_BLOCK_SIZE',0x90DE),
+        ('GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS',0x90DD),
+        ('GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS',0x90D8),
+        ('GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS',0x90D9),
+        ('GL_MAX_UNIFORM_LOCATIONS',0x826E),
+        ('GL_MAX_VERTEX_ATTRIB_BINDINGS',0x82DA),
+        ('GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET',0x82D9),
+        ('GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS',0x90D6),
+        ('GL_MAX_WIDTH',0x827E),
+        ('GL_MIPMAP',0x8293),
+        ('GL_NAME_LENGTH',0x92F9),
+        ('GL_NUM_ACTIVE_VARIABLES',0x9304),
+        ('GL_NUM_COMPATIBLE_SUBROUTINES',0x8E4A),
+        ('GL_NUM_SAMPLE_COUNTS',0x9380),
+        ('GL_NUM_SHADING_LANGUAGE_VERSIONS',0x82E9),
+        ('GL_OFFSET',0x92FC),
+        ('GL_PRIMITIVE_RESTART_FIXED_INDEX',0x8D69),
+        ('GL_PROGRAM',0x82E2),
+        ('GL_PROGRAM_INPUT',0x92E3),
+        ('GL_PROGRAM_KHR',0x82E2),
+        ('GL_PROGRAM_OUTPUT',0x92E4),
+        ('GL_PROGRAM_PIPELINE',0x82E4),
+        ('GL_PROGRAM_PIPELINE_KHR',0x82E4),
+        ('GL_QUERY',0x82E3),
+        ('GL_QUERY_KHR',0x82E3),
+        ('GL_READ_PIXELS',0x828C),
+        ('GL_READ_PIXELS_FORMAT',0x828D),
+        ('GL_READ_PIXELS_TYPE',0x828E),
+        ('GL_REFERENCED_BY_COMPUTE_SHADER',0x930B),
+        ('GL_REFERENCED_BY_FRAGMENT_SHADER',0x930A),
+        ('GL_REFERENCED_BY_GEOMETRY_SHADER',0x9309),
+        ('GL_REFERENCED_BY_TESS_CONTROL_SHADER',0x9307),
+        ('GL_REFERENCED_BY_TESS_EVALUATION_SHADER',0x9308),
+        ('GL_REFERENCED_BY_VERTEX_SHADER',0x9306),
+        ('GL_RENDERBUFFER',0x8D41),
+        ('GL_SAMPLER',0x82E6),
+        ('GL_SAMPLER_KHR',0x82E6),
+        ('GL_SAMPLES',0x80A9),
+        ('GL_SHADER',0x82E1),
+        ('GL_SHADER_IMAGE_ATOMIC',0x82A6),
+        ('GL_SHADER_IMAGE_LOAD',0x82A4),
+        ('GL_SHADER_IMAGE_STORE',0x82A5),
+        ('GL_SHADER_KHR',0x82E1),
+        ('GL_SHADER_STORAGE_BARRIER_BIT',0x2000),
+        ('GL_SHADER_STORAGE_BLOCK',0x92E6),
+        ('GL_SHADER_STORAGE_BUFFER',0x90D2),
+        ('GL_SHADER_STORAGE_BUFFER_BINDING',0x90D3),
+        ('GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT',0x90DF),
+        ('GL_SHADER_STORAGE_BUFFER_SIZE',0x90D5),
+        ('GL_SHADER_STORAGE_BUFFER_START',0x90D4),
+        ('GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_TEST',0x82AC),
+        ('GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_WRITE',0x82AE),
+        ('GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_TEST',0x82AD),
+        ('GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_WRITE',0x82AF),
+        ('GL_SRGB_DECODE_ARB',0x8299),
+        ('GL_SRGB_READ',0x8297),
+        ('GL_SRGB_WRITE',0x8298),
+        ('GL_STACK_OVERFLOW_KHR',0x503),
+        ('GL_STACK_UNDERFLOW_KHR',0x504),
+        ('GL_STENCIL_COMPONENTS',0x8285),
+        ('GL_STENCIL_RENDERABLE',0x8288),
+        ('GL_TESS_CONTROL_SUBROUTINE',0x92E9),
+        ('GL_TESS_CONTROL_SUBROUTINE_UNIFORM',0x92EF),
+        ('GL_TESS_CONTROL_TEXTURE',0x829C),
+        ('GL_TESS_EVALUATION_SUBROUTINE',0x92EA),
+        ('GL_TESS_EVALUATION_SUBROUTINE_UNIFORM',0x92F0),
+        ('GL_TESS_EVALUATION_TEXTURE',0x829D),
+        ('GL_TEXTURE_1D_ARRAY',0x8C18),
+        ('GL_TEXTURE_2D_ARRAY',0x8C1A),
+        ('GL_TEXTURE_2D_MULTISAMPLE',0x9100),
+        ('GL_TEXTURE_2D_MULTISAMPLE_ARRAY',0x9102),
+        ('GL_TEXTURE_3D',0x806F),
+        ('GL_TEXTURE_BUFFER',0x8C2A),
+        ('GL_TEXTURE_BUFFER_OFFSET',0x919D),
+        ('GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT',0x919F),
+        ('GL_TEXTURE_BUFFER_SIZE',0x919E),
+        ('GL_TEXTURE_COMPRESSED',0x86A1),
+        ('GL_TEXTURE_COMPRESSED_BLOCK_HEIGHT',0x82B2),
+        ('GL_TEXTURE_COMPRESSED_BLOCK_SIZE',0x82B3),
+        ('GL_TEXTURE_COMPRESSED_BLOCK_WIDTH',0x82B1),
+        ('GL_TEXTURE_CUBE_MAP',0x8513),
+        ('GL_TEXTURE_CUBE_MAP_ARRAY',0x9009),
+        ('GL_TEXTURE_GATHER',0x82A2),
+        ('GL_TEXTURE_GATHER_SHADOW',0x82A3),
+        ('GL_TEXTURE_IMAGE_FORMAT',0x828F),
+        ('GL_TEXTURE_IMAGE_TYPE',0x8290),
+        ('GL_TEXTURE_IMMUTABLE_LEVELS',0x82DF),
+        ('GL_TEXTURE_RECTANGLE',0x84F5),
+        ('GL_TEXTURE_SHADOW',0x82A1),
+        ('GL_TEXTURE_VIEW',0x82B5),
+        ('GL_TEXTURE_VIEW_MIN_LAYER',0x82DD),
+        ('GL_TEXTURE_VIEW_MIN_LEVEL',0x82DB),
+        ('GL_TEXTURE_VIEW_NUM_LAYERS',0x82DE),
+        ('GL_TEXTURE_VIEW_NUM_LEVELS',0x82DC),
+        ('GL_TOP_LEVEL_ARRAY_SIZE',0x930C),
+        ('GL_TOP_LEVEL_ARRAY_STRIDE',0x930D),
+        ('GL_TRANSFORM_FEEDBACK_VARYING',0x92F4),
+        ('GL_TYPE',0x92FA),
+        ('GL_UNIFORM',0x92E1),
+        ('GL_UNIFORM_BLOCK',0x92E2),
+        ('GL_UNIFORM_BLOCK_REFERENCED_BY_COMPUTE_SHADER',0x90EC),
+        ('GL_VERTEX_ARRAY_KHR',0x8074),
+        ('GL_VERTEX_ATTRIB_ARRAY_LONG',0x874E),
+        ('GL_VERTEX_ATTRIB_BINDING',0x82D4),
+        ('GL_VERTEX_ATTRIB_RELATIVE_OFFSET',0x82D5),
+        ('GL_VERTEX_BINDING_BUFFER',0x8F4F),
+        ('GL_VERTEX_BINDING_DIVISOR',0x82D6),
+        ('GL_VERTEX_BINDING_OFFSET',0x82D7),
+        ('GL_VERTEX_BINDING_STRIDE',0x82D8),
+        ('GL_VERTEX_SUBROUTINE',0x92E8),
+        ('GL_VERTEX_SUBROUTINE_UNIFORM',0x92EE),
+        ('GL_VERTEX_TEXTURE',0x829B),
+        ('GL_VIEW_CLASS_128_BITS',0x82C4),
+        ('GL_VIEW_CLASS_16_BITS',0x82CA),
+        ('GL_VIEW_CLASS_24_BITS',0x82C9),
+        ('GL_VIEW_CLASS_32_BITS',0x82C8),
+        ('GL_VIEW_CLASS_48_BITS',0x82C7),
+        ('GL_VIEW_CLASS_64_BITS',0x82C6),
+        ('GL_VIEW_CLASS_8_BITS',0x82CB),
+        ('GL_VIEW_CLASS_96_BITS',0x82C5),
+        ('GL_VIEW_CLASS_ASTC_10x10_RGBA',0x9393),
+        ('GL_VIEW_CLASS_ASTC_10x5_RGBA',0x9390),
+        ('GL_VIEW_CLASS_ASTC_10x6_RGBA',0x9391),
+        ('GL_VIEW_CLASS_ASTC_10x8_RGBA',0x9392),
+        ('GL_VIEW_CLASS_ASTC_12x10_RGBA',0x9394),
+        ('GL_VIEW_CLASS_ASTC_12x12_RGBA',0x9395),
+        ('GL_VIEW_CLASS_ASTC_4x4_RGBA',0x9388),
+        ('GL_VIEW_CLASS_ASTC_5x4_RGBA',0x9389),
+        ('GL_VIEW_CLASS_ASTC_5x5_RGBA',0x938A),
+        ('GL_VIEW_CLASS_ASTC_6x5_RGBA',0x938B),
+        ('GL_VIEW_CLASS_ASTC_6x6_RGBA',0x938C),
+        ('GL_VIEW_CLASS_ASTC_8x5_RGBA',0x938D),
+        ('GL_VIEW_CLASS_ASTC_8x6_RGBA',0x938E),
+        ('GL_VIEW_CLASS_ASTC_8x8_RGBA',0x938F),
+        ('GL_VIEW_CLASS_BPTC_FLOAT',0x82D3),
+        ('GL_VIEW_CLASS_BPTC_UNORM',0x82D2),
+        ('GL_VIEW_CLASS_EAC_R11',0x9383),
+        ('GL_VIEW_CLASS_EAC_RG11',0x9384),
+        ('GL_VIEW_CLASS_ETC2_EAC_RGBA',0x9387),
+        ('GL_VIEW_CLASS_ETC2_RGB',0x9385),
+        ('GL_VIEW_CLASS_ETC2_RGBA',0x9386),
+        ('GL_VIEW_CLASS_RGTC1_RED',0x82D0),
+        ('GL_VIEW_CLASS_RGTC2_RG',0x82D1),
+        ('GL_VIEW_CLASS_S3TC_DXT1_RGB',0x82CC),
+        ('GL_VIEW_CLASS_S3TC_DXT1_RGBA',0x82CD),
+        ('GL_VIEW_CLASS_S3TC_DXT3_RGBA',0x82CE),
+        ('GL_VIEW_CLASS_S3TC_DXT5_RGBA',0x82CF),
+        ('GL_VIEW_COMPATIBILITY_CLASS',0x82B6),
+    ),
+    'OpenGL.GL.VERSION.GL_4_4': (
+        ('GL_BUFFER_IMMUTABLE_STORAGE',0x821F),
+        ('GL_BUFFER_STORAGE_FLAGS',0x8220),
+        ('GL_CLEAR_TEXTURE',0x9365),
+        ('GL_CLIENT_MAPPED_BUFFER_BARRIER_BIT',0x4000),
+        ('GL_CLIENT_STORAGE_BIT',0x200),
+        ('GL_DYNAMIC_STORAGE_BIT',0x100),
+        ('GL_LOCATION_COMPONENT',0x934A),
+        ('GL_MAP_COHERENT_BIT',0x80),
+        ('GL_MAP_PERSISTENT_BIT',0x40),
+        ('GL_MAP_READ_BIT',0x1),
+        ('GL_MAP_WRITE_BIT',0x2),
+        ('GL_MAX_VERTEX_ATTRIB_STRIDE',0x82E5),
+        ('GL_MIRROR_CLAMP_TO_EDGE',0x8743),
+        ('GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED',0x8221),
+        ('GL_QUERY_BUFFER',0x9192),
+        ('GL_QUERY_BUFFER_BARRIER_BIT',0x8000),
+        ('GL_QUERY_BUFFER_BINDING',0x9193),
+        ('GL_QUERY_RESULT_NO_WAIT',0x9194),
+        ('GL_STENCIL_INDEX8',0x8D48),
+        ('GL_TEXTURE_BUFFER_BINDING',0x8C2A),
+        ('GL_TRANSFORM_FEEDBACK_BUFFER',0x8C8E),
+        ('GL_TRANSFORM_FEEDBACK_BUFFER_INDEX',0x934B),
+        ('GL_TRANSFORM_FEEDBACK_BUFFER_STRIDE',0x934C),
+        ('GL_UNSIGNED_INT_10F_11F_11F_REV',0x8C3B),
+    ),
+    'OpenGL.GL.VERSION.GL_4_5': (
+        ('GL_CLIP_DEPTH_MODE',0x935D),
+        ('GL_CLIP_ORIGIN',0x935C),
+        ('GL_CONTEXT_FLAG_ROBUST_ACCESS_BIT',0x4),
+        ('GL_CONTEXT_LOST',0x507),
+        ('GL_GUILTY_CONTEXT_RESET',0x8253),
+        ('GL_INNOCENT_CONTEXT_RESET',0x8254),
+        ('GL_LOSE_CONTEXT_ON_RESET',0x8252),
+        ('GL_LOWER_LEFT',0x8CA1),
+        ('GL_MAX_COMBINED_CLIP_AND_CULL_DISTANCES',0x82FA),
+        ('GL_MAX_CULL_DISTANCES',0x82F9),
+        ('GL_NEGATIVE_ONE_TO_ONE',0x935E),
+        ('GL_NO_RESET_NOTIFICATION',0x8261),
+        ('GL_QUERY_BY_REGION_NO_WAIT_INVERTED',0x8E1A),
+        ('GL_QUERY_BY_REGION_WAIT_INVERTED',0x8E19),
+        ('GL_QUERY_NO_WAIT_INVERTED',0x8E18),
+        ('GL_QUERY_TARGET',0x82EA),
+        ('GL_QUERY_WAIT_INVERTED',0x8E17),
+        ('GL_RESET_NOTIFICATION_STRATEGY',0x8256),
+        ('GL_TEXTURE_BINDING_1D_ARRAY',0x8C1C),
+        ('GL_TEXTURE_BINDING_2D_ARRAY',0x8C1D),
+        ('GL_TEXTURE_BINDING_2D_MULTISAMPLE',0x9104),
+        ('GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY',0x9105),
+        ('GL_TEXTURE_BINDING_3D',0x806A),
+        ('GL_TEXTURE_BINDING_BUFFER',0x8C2C),
+        ('GL_TEXTURE_BINDING_CUBE_MAP',0x8514),
+        ('GL_TEXTURE_BINDING_CUBE_MAP_ARRAY',0x900A),
+        ('GL_TEXTURE_BINDING_RECTANGLE',0x84F6),
+        ('GL_TEXTURE_TARGET',0x1006),
+        ('GL_UNKNOWN_CONTEXT_RESET',0x8255),
+        ('GL_UPPER_LEFT',0x8CA2),
+        ('GL_ZERO_TO_ONE',0x935F),
+    ),
+    'OpenGL.GL.VERSION.GL_4_6': (
+        ('GL_CLIPPING_INPUT_PRIMITIVES',0x82F6),
+        ('GL_CLIPPING_OUTPUT_PRIMITIVES',0x82F7),
+        ('GL_COMPUTE_SHADER_INVOCATIONS',0x82F5),
+        ('GL_CONTEXT_FLAG_NO_ERROR_BIT',0x8),
+        ('GL_CONTEXT_RELEASE_BEHAVIOR',0x82FB),
+        ('GL_CONTEXT_RELEASE_BEHAVIOR_FLUSH',0x82FC),
+        ('GL_FRAGMENT_SHADER_INVOCATIONS',0x82F4),
+        ('GL_GEOMETRY_SHADER_INVOCATIONS',0x887F),
+        ('GL_GEOMETRY_SHADER_PRIMITIVES_EMITTED',0x82F3),
+        ('GL_MAX_TEXTURE_MAX_ANISOTROPY',0x84FF),
+        ('GL_NUM_SPIR_V_EXTENSIONS',0x9554),
+        ('GL_PARAMETER_BUFFER',0x80EE),
+        ('GL_PARAMETER_BUFFER_BINDING',0x80EF),
+        ('GL_POLYGON_OFFSET_CLAMP',0x8E1B),
+        ('GL_PRIMITIVES_SUBMITTED',0x82EF),
+        ('GL_SHADER_BINARY_FORMAT_SPIR_V',0x9551),
+        ('GL_SPIR_V_BINARY',0x9552),
+        ('GL_SPIR_V_EXTENSIONS',0x9553),
+        ('GL_TESS_CONTROL_SHADER_PATCHES',0x82F1),
+        ('GL_TESS_EVALUATION_SHADER_INVOCATIONS',0x82F2),
+        ('GL_TEXTURE_MAX_ANISOTROPY',0x84FE),
+        ('GL_TRANSFORM_FEEDBACK_OVERFLOW',0x82EC),
+        ('GL_TRANSFORM_FEEDBACK_STREAM_OVERFLOW',0x82ED),
+        ('GL_VERTEX_SHADER_INVOCATIONS',0x82F0),
+        ('GL_VERTICES_SUBMITTED',0x82EE),
+    ),
+}
+OBJECTS = (
+    ('ArrayDatatype', 'OpenGL.arrays.arraydatatype', 'ArrayDatatype'),
+    ('GLenumArray', 'OpenGL.arrays.arraydatatype', 'GLenumArray'),
+    ('GLintArray', 'OpenGL.arrays.arraydatatype', 'GLintArray'),
+    ('OpenGL', 'OpenGL', None),
+    ('c_char_p', 'ctypes', 'c_char_p'),
+    ('constants', 'OpenGL.constants', None),
+    ('contextdata', 'OpenGL.contextdata', None),
+    ('converters', 'OpenGL.converters', None),
+    ('error', 'OpenGL.error', None),
+    ('glget', 'OpenGL.GL.glget', None),
+    ('images', 'OpenGL.GL.images', None),
+    ('imaging', 'OpenGL.raw.GL.ARB.imaging', None),
+)
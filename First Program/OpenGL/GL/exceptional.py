@@ -149,12 +149,11 @@ def glCallLists( baseFunction, lists, *args ):
                 full.GL_UNSIGNED_BYTE,
                 ctypes.c_void_p(arrays.GLubyteArray.dataPointer( lists )),
             )
-        ptr = arrays.GLuintArray.asArray( lists )
-        size = arrays.GLuintArray.arraySize( ptr )
+        pointer, byteCount, glType, ptr = arrays.GLuintArray.resolve( lists )
         return baseFunction(
-            size,
+            byteCount // ctypes.sizeof( arrays.GLuintArray.baseType ),
             full.GL_UNSIGNED_INT,
-            ctypes.c_void_p( arrays.GLuintArray.dataPointer(ptr))
+            ctypes.c_void_p( pointer )
         )
     return baseFunction( lists, *args )
 
@@ -1,8 +1,30 @@
-"""Utility module to parse a Feedback buffer"""
+"""Utility module to parse a Feedback buffer
+
+With numpy available, feedbackArrays walks the buffer once to find the
+primitives and then gathers every vertex into a structured array in a
+single operation.  parseFeedback (and so glRenderMode) returns those
+arrays as a FeedbackRecords, a list of the same (token, Vertex, ...)
+tuples as parseFeedbackObjects which also keeps the primitives and
+vertices arrays for code which wants to use them directly.
+"""
 from OpenGL import contextdata
 from OpenGL.GL.VERSION import GL_1_1 as _simple
+try:
+    import numpy
+except ImportError as err:
+    numpy = None
 
 def parseFeedback( buffer, entryCount ):
+    """Parse the feedback buffer into Python object records
+
+    Returns a FeedbackRecords, or with no numpy a plain list (see
+    parseFeedbackObjects).
+    """
+    if numpy is None:
+        return parseFeedbackObjects( buffer, entryCount )
+    return FeedbackRecords.fromBuffer( buffer, entryCount )
+
+def parseFeedbackObjects( buffer, entryCount ):
     """Parse the feedback buffer into Python object records"""
     bufferIndex = 0
     result = []
@@ -84,3 +106,172 @@ def createGetVertex( ):
             textureEnd = colorEnd + 4
             return (buffer[bufferIndex:end],buffer[end:colorEnd],buffer[colorEnd:textureEnd]),textureEnd
     return getVertex
+
+def vertexLayout( ):
+    """Sizes of the (vertex, color, texture) parts of a feedback vertex
+
+    Sizes are 0 for parts the current feedback buffer type doesn't have.
+    """
+    mode = contextdata.getValue( "GL_FEEDBACK_BUFFER_TYPE" )
+    if mode == _simple.GL_2D:
+        return 2, 0, 0
+    elif mode == _simple.GL_3D:
+        return 3, 0, 0
+    indexMode = _simple.glGetBooleanv( _simple.GL_INDEX_MODE )
+    colorSize = [ 4,1 ][ int(indexMode) ]
+    if mode == _simple.GL_3D_COLOR:
+        return 3, colorSize, 0
+    elif mode == _simple.GL_3D_COLOR_TEXTURE:
+        return 3, colorSize, 4
+    return 4, colorSize, 4
+
+TOKEN_CONSTANTS = dict( [
+    (int(token),token) for token in (
+        list(SINGLE_VERTEX_TOKENS) + list(DOUBLE_VERTEX_TOKENS) + [
+            _simple.GL_PASS_THROUGH_TOKEN, _simple.GL_POLYGON_TOKEN,
+        ]
+    )
+] )
+
+if numpy is not None:
+    FEEDBACK_PRIMITIVE_DTYPE = numpy.dtype([
+        ('token',numpy.int32),
+        ('first',numpy.intp), # index of the first vertex in FeedbackRecords.vertices
+        ('count',numpy.intp), # number of vertices (0 for pass-through tokens)
+        ('value',numpy.float32), # pass-through value
+    ])
+
+def primitiveLength( token, vertexCount, vertexSize ):
+    """Number of buffer entries a primitive takes, including its token"""
+    if token == _simple.GL_POLYGON_TOKEN:
+        return 2 + vertexCount * vertexSize
+    elif token == _simple.GL_PASS_THROUGH_TOKEN:
+        return 2
+    return 1 + vertexCount * vertexSize
+
+def scanUniform( data, entryCount, vertexSize ):
+    """Primitives and vertex starts if the buffer is one primitive type repeated
+
+    Returns None if the buffer holds mixed primitives (or polygons with
+    differing vertex counts).
+    """
+    if not entryCount:
+        return None
+    token = int( data[0] )
+    if token in SINGLE_VERTEX_TOKENS:
+        count, header = 1, 1
+    elif token in DOUBLE_VERTEX_TOKENS:
+        count, header = 2, 1
+    elif token == _simple.GL_POLYGON_TOKEN and entryCount > 1:
+        count, header = int( data[1] ), 2
+    else:
+        return None
+    length = primitiveLength( token, count, vertexSize )
+    if entryCount % length or not (data[:entryCount:length] == token).all():
+        return None
+    if header == 2 and not (data[1:entryCount:length] == count).all():
+        return None
+    total = entryCount // length
+    primitives = numpy.zeros( (total,), FEEDBACK_PRIMITIVE_DTYPE )
+    primitives['token'] = token
+    primitives['first'] = numpy.arange( total ) * count
+    primitives['count'] = count
+    starts = (
+        numpy.arange( total )[:,None] * length + header +
+        numpy.arange( count )[None,:] * vertexSize
+    ).ravel()
+    return primitives, starts
+
+def scanPrimitives( data, entryCount, vertexSize ):
+    """Walk the tokens, return primitives and the buffer index of each vertex"""
+    tokens = data[:entryCount].tolist()
+    primitives = []
+    starts = []
+    index = 0
+    while index < entryCount:
+        token = int(tokens[index])
+        index += 1
+        if token in SINGLE_VERTEX_TOKENS:
+            count = 1
+        elif token in DOUBLE_VERTEX_TOKENS:
+            count = 2
+        elif token == _simple.GL_PASS_THROUGH_TOKEN:
+            primitives.append( (token, len(starts), 0, tokens[index]) )
+            index += 1
+            continue
+        elif token == _simple.GL_POLYGON_TOKEN:
+            count = int(tokens[index])
+            index += 1
+        else:
+            raise ValueError(
+                """Unrecognised token %r in feedback stream"""%(token,)
+            )
+        primitives.append( (token, len(starts), count, 0.0) )
+        starts.extend( range( index, index + count*vertexSize, vertexSize ) )
+        index += count*vertexSize
+    return (
+        numpy.array( primitives, FEEDBACK_PRIMITIVE_DTYPE ),
+        numpy.array( starts, numpy.intp ),
+    )
+
+def feedbackArrays( buffer, entryCount ):
+    """Parse entryCount floats of a feedback buffer into numpy arrays
+
+    Returns (primitives, vertices) as stored on FeedbackRecords, without
+    creating a Vertex per vertex.  Requires numpy.
+    """
+    size, colorSize, textureSize = vertexLayout()
+    vertexSize = size + colorSize + textureSize
+    data = numpy.asarray( buffer, numpy.float32 ).ravel()[:entryCount]
+    scanned = scanUniform( data, entryCount, vertexSize )
+    if scanned is None:
+        scanned = scanPrimitives( data, entryCount, vertexSize )
+    primitives, starts = scanned
+    fields = [('vertex',numpy.float32,(size,))]
+    if colorSize:
+        fields.append( ('color',numpy.float32,(colorSize,)) )
+    if textureSize:
+        fields.append( ('texture',numpy.float32,(textureSize,)) )
+    vertices = numpy.zeros( (len(starts),), fields )
+    if len( starts ):
+        block = data[ starts[:,None] + numpy.arange( vertexSize )[None,:] ]
+        vertices['vertex'] = block[:,:size]
+        if colorSize:
+            vertices['color'] = block[:,size:size+colorSize]
+        if textureSize:
+            vertices['texture'] = block[:,size+colorSize:]
+    return primitives, vertices
+
+class FeedbackRecords( list ):
+    """List of (token, Vertex, ...) tuples for a feedback buffer, with the parsed arrays
+
+    primitives -- structured array of token, first and count (the
+        primitive's vertices are vertices[first:first+count]) and value
+        (for pass-through tokens)
+    vertices -- structured array with a 'vertex' column, plus 'color'
+        and 'texture' columns if the feedback buffer type has them
+    """
+    def __init__( self, primitives, vertices ):
+        self.primitives = primitives
+        self.vertices = vertices
+        names = vertices.dtype.names
+        # one Vertex per row, sharing (views of) the vertices array
+        columns = [
+            list( vertices[name] ) if name in names else [None] * len( vertices )
+            for name in ('vertex','color','texture')
+        ]
+        objects = [ Vertex( *data ) for data in zip( *columns ) ]
+        super( FeedbackRecords, self ).__init__( [
+            self.createRecord( token, first, count, value, objects )
+            for token, first, count, value in primitives.tolist()
+        ] )
+    def fromBuffer( cls, buffer, entryCount ):
+        """Parse entryCount floats of a feedback buffer"""
+        return cls( *feedbackArrays( buffer, entryCount ) )
+    fromBuffer = classmethod( fromBuffer )
+    def createRecord( self, token, first, count, value, objects ):
+        """Build the (token, ...) tuple for a primitive from the Vertex objects"""
+        token = TOKEN_CONSTANTS.get( token, token )
+        if token == _simple.GL_PASS_THROUGH_TOKEN:
+            return (token, value)
+        return (token,) + tuple( objects[first:first+count] )
@@ -282,7 +282,7 @@ def glRenderMode( newMode ):
         )
     arrayConstant, wrapperFunction = {
         _simple.GL_FEEDBACK: (_simple.GL_FEEDBACK_BUFFER_POINTER,feedback.parseFeedback),
-        _simple.GL_SELECT: (_simple.GL_SELECTION_BUFFER_POINTER, selection.GLSelectRecord.fromArray),
+        _simple.GL_SELECT: (_simple.GL_SELECTION_BUFFER_POINTER, selection.parseSelection),
     }[ currentMode ]
     current = contextdata.getValue( arrayConstant )
     # XXX check to see if it's the *same* array we set currently!
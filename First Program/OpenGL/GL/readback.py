@@ -0,0 +1,263 @@
+"""Asynchronous pixel readback through pixel-pack buffer objects
+
+glReadPixels into client memory has to wait for the GL to finish
+rendering before it can return.  PixelReader instead reads into the
+next of a ring of pixel-pack buffers (GL_PIXEL_PACK_BUFFER), which
+returns at once, and hands back a PendingRead whose data can be
+retrieved a frame or two later without waiting:
+
+    reader = PixelReader( width, height )
+    ...
+    # after drawing each frame
+    reader.read()
+    for pending in reader.ready():
+        video.write( pending.result() )
+    ...
+    # at the end
+    for pending in reader.flush():
+        video.write( pending.result() )
+    reader.delete()
+
+PendingRead.result() copies the pixels into a destination array owned
+by the reader (one per buffer, reused for every read through that
+buffer) or into an array you pass in.  PendingRead.mapped() gives a
+zero-copy view of the buffer's own memory for the length of a with
+statement.
+
+Needs OpenGL 2.1 (or ARB_pixel_buffer_object).  Completion is tracked
+with fences where the GL has them (3.2 or ARB_sync), otherwise a read
+counts as done once a newer read has been issued, and retrieving it
+blocks in glMapBuffer if the GL hasn't finished.
+"""
+from OpenGL.raw.GL.VERSION import GL_1_1, GL_1_5, GL_2_1, GL_3_0, GL_3_2
+from OpenGL import images, error
+from OpenGL.arrays import ArrayDatatype
+from OpenGL.raw.GL import _types
+import contextlib, ctypes
+
+__all__ = ( 'PixelReader', 'PendingRead' )
+
+class PendingRead( object ):
+    """A read into a pixel-pack buffer, which the GL may not have finished
+
+    destination -- the reader's array for this buffer, filled by
+        result(), and overwritten by later reads through the buffer
+        (a read which is retired before it was collected is copied
+        into an array of its own instead)
+    """
+    def __init__( self, reader, buffer, serial, sync, destination ):
+        self.reader = reader
+        self.buffer = buffer
+        self.serial = serial
+        self.sync = sync
+        self.destination = destination
+        self.complete = False # destination holds our pixels
+        self.collected = False # result() or mapped() has been used
+        self.reused = False # the buffer has been read into again
+        self.signalled = False # the GL has finished writing the buffer
+    def done( self ):
+        """Whether result() can return without waiting for the GL"""
+        if self.complete or self.reused or self.signalled:
+            return True
+        if self.sync is None:
+            return self.reader.serial > self.serial
+        status = GL_3_2.glClientWaitSync( self.sync, GL_3_2.GL_SYNC_FLUSH_COMMANDS_BIT, 0 )
+        return status in (GL_3_2.GL_ALREADY_SIGNALED, GL_3_2.GL_CONDITION_SATISFIED)
+    def wait( self ):
+        """Block until the GL has finished writing the buffer"""
+        if self.sync is not None:
+            while GL_3_2.glClientWaitSync(
+                self.sync, GL_3_2.GL_SYNC_FLUSH_COMMANDS_BIT, 1000000000,
+            ) == GL_3_2.GL_TIMEOUT_EXPIRED:
+                pass
+            GL_3_2.glDeleteSync( self.sync )
+            self.sync = None
+        self.signalled = True
+    @contextlib.contextmanager
+    def mapped( self ):
+        """Map the buffer, yield a (numpy, if available) view of the pixels
+
+        The view is only valid inside the with statement, no copy of
+        the data is made.
+        """
+        with self.mappedPointer() as pointer:
+            raw = (ctypes.c_ubyte*self.reader.size).from_address( pointer )
+            if hasattr( self.destination, 'dtype' ):
+                import numpy
+                yield numpy.frombuffer( raw, self.destination.dtype ).reshape(
+                    self.destination.shape
+                )
+            else:
+                yield memoryview( raw )
+    @contextlib.contextmanager
+    def mappedPointer( self ):
+        """Map the buffer for reading (waiting for the GL), yield its address"""
+        if self.reused:
+            raise error.Error( """Pixel buffer has been re-used by a later read""" )
+        self.wait()
+        size = self.reader.size
+        GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, self.buffer )
+        try:
+            if GL_3_0.glMapBufferRange:
+                pointer = GL_3_0.glMapBufferRange(
+                    GL_2_1.GL_PIXEL_PACK_BUFFER, 0, size, GL_3_0.GL_MAP_READ_BIT,
+                )
+            else:
+                pointer = GL_1_5.glMapBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, GL_1_5.GL_READ_ONLY )
+            if not pointer:
+                raise error.Error( """Unable to map pixel buffer %s"""%( self.buffer, ) )
+            try:
+                self.collected = True
+                yield pointer
+            finally:
+                GL_1_5.glUnmapBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER )
+        finally:
+            GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, 0 )
+    def result( self, array=None ):
+        """Get the pixels (waiting for the GL if necessary)
+
+        array -- optional array of the reader's format into which to copy
+            the pixels, by default the reader's destination array for
+            this buffer is filled and returned
+        """
+        if self.complete:
+            if array is None:
+                return self.destination
+            target = array
+            source = ArrayDatatype.dataPointer( self.destination )
+            ctypes.memmove( ArrayDatatype.dataPointer( target ), source, self.reader.size )
+            return target
+        target = self.destination if array is None else array
+        if ArrayDatatype.arrayByteCount( target ) < self.reader.size:
+            raise ValueError(
+                """Need a %s byte array for %sx%s pixels"""%(
+                    self.reader.size, self.reader.width, self.reader.height,
+                )
+            )
+        with self.mappedPointer() as pointer:
+            ctypes.memmove( ArrayDatatype.dataPointer( target ), pointer, self.reader.size )
+        if array is None:
+            self.complete = True
+        return target
+    def retire( self ):
+        """The buffer is about to be read into again, keep our pixels if still wanted"""
+        if not (self.complete or self.collected):
+            # the slot's destination is about to be refilled by the new read
+            self.destination = images.createTargetArray(
+                self.reader.format, (self.reader.width,self.reader.height), self.reader.type,
+            )
+            self.result()
+        elif self.sync is not None:
+            GL_3_2.glDeleteSync( self.sync )
+            self.sync = None
+        self.reused = True
+
+class PixelReader( object ):
+    """Round-robin of pixel-pack buffers for asynchronous glReadPixels
+
+    Reading into a buffer whose previous read hasn't been collected yet
+    first waits for and copies out that read into a private array (so
+    nothing is lost, it is still returned by ready/flush, but issuing
+    more than count reads per retrieval will stall and allocate).
+    """
+    def __init__(
+        self, width, height,
+        format=GL_1_1.GL_RGBA, type=GL_1_1.GL_UNSIGNED_BYTE,
+        count=3,
+    ):
+        """Initialize the reader (buffers are created on the first read)
+
+        width, height -- size of the area read
+        format, type -- as for glReadPixels
+        count -- number of buffers, the latency of reads the caller
+            can absorb before read() has to wait
+        """
+        self.width = width
+        self.height = height
+        self.format = format
+        self.type = type
+        self.count = count
+        self.buffers = []
+        self.destinations = [None] * count
+        self.last = [None] * count # latest PendingRead per buffer
+        self.pending = [] # not yet returned by ready/flush, oldest first
+        self.serial = 0
+        self.destinations[0] = images.createTargetArray( format, (width,height), type )
+        self.size = ArrayDatatype.arrayByteCount( self.destinations[0] )
+    @property
+    def fenced( self ):
+        """Whether completion is tracked with sync objects"""
+        return bool( GL_3_2.glFenceSync )
+    def createBuffers( self ):
+        """Create the pixel-pack buffers and allocate their storage"""
+        assert not self.buffers, """Already created the buffers"""
+        ids = (_types.GLuint * self.count)()
+        GL_1_5.glGenBuffers( self.count, ids )
+        self.buffers = list( ids )
+        for buffer in self.buffers:
+            GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, buffer )
+            GL_1_5.glBufferData( GL_2_1.GL_PIXEL_PACK_BUFFER, self.size, None, GL_1_5.GL_STREAM_READ )
+        GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, 0 )
+        return self.buffers
+    def read( self, x=0, y=0 ):
+        """Start reading the area at x,y into the next buffer, return a PendingRead"""
+        if not self.buffers:
+            self.createBuffers()
+        slot = self.serial % self.count
+        previous = self.last[ slot ]
+        if previous is not None:
+            previous.retire()
+        destination = self.destinations[ slot ]
+        if destination is None:
+            destination = self.destinations[ slot ] = images.createTargetArray(
+                self.format, (self.width,self.height), self.type,
+            )
+        images.setupDefaultTransferMode()
+        images.rankPacking( 3 )
+        GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, self.buffers[slot] )
+        try:
+            GL_1_1.glReadPixels(
+                x, y, self.width, self.height,
+                self.format, self.type,
+                ctypes.c_void_p( 0 ),
+            )
+        finally:
+            GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, 0 )
+        sync = None
+        if self.fenced:
+            sync = GL_3_2.glFenceSync( GL_3_2.GL_SYNC_GPU_COMMANDS_COMPLETE, 0 )
+        self.serial += 1
+        pending = PendingRead( self, self.buffers[slot], self.serial, sync, destination )
+        self.last[ slot ] = pending
+        self.pending.append( pending )
+        return pending
+    def ready( self ):
+        """Yield the reads which have completed, oldest first
+
+        Each read is returned by ready() or flush() once.
+        """
+        while self.pending and self.pending[0].done():
+            yield self.pending.pop( 0 )
+    def flush( self ):
+        """Yield all outstanding reads, oldest first (they may still need to wait)"""
+        while self.pending:
+            yield self.pending.pop( 0 )
+    def delete( self ):
+        """Delete the buffers and fences explicitly"""
+        for pending in self.last:
+            if pending is not None and pending.sync is not None:
+                try:
+                    GL_3_2.glDeleteSync( pending.sync )
+                except (AttributeError,error.NullFunctionError) as err:
+                    pass
+                pending.sync = None
+        self.last = [None] * self.count
+        self.pending = []
+        if self.buffers:
+            try:
+                GL_1_5.glDeleteBuffers(
+                    len( self.buffers ), (_types.GLuint * len( self.buffers ))( *self.buffers ),
+                )
+            except (AttributeError,error.NullFunctionError) as err:
+                pass
+            self.buffers = []
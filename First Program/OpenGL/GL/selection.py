@@ -3,8 +3,21 @@
 This code is resonsible for turning gluint *
 arrays into structured representations for use
 by Python-level code.
+
+With numpy available, glRenderMode parses the buffer in bulk (see
+selectionArrays) and returns a SelectionRecords, a list of
+GLSelectRecord which also keeps the parsed arrays.  Picking code can
+work on those directly instead of the records:
+
+    hits = glRenderMode( GL_RENDER )
+    if hits:
+        closest = hits.names( hits.nearest() )
 """
 from OpenGL._bytes import integer_types
+try:
+    import numpy
+except ImportError as err:
+    numpy = None
 
 def uintToLong( value ):
     if value < 0:
@@ -42,7 +55,15 @@ class GLSelectRecord( object ):
             index += 3+count
         return result
     fromArray = classmethod( fromArray )
-    
+    def fromConverted( cls, near, far, names ):
+        """Create a record from distances already converted to floats"""
+        record = cls.__new__( cls )
+        record.near = near
+        record.far = far
+        record.names = names
+        return record
+    fromConverted = classmethod( fromConverted )
+
     def __init__( self, near, far, names ):
         """Initialise/store the values"""
         self.near = self.convertDistance( near )
@@ -62,3 +83,90 @@ class GLSelectRecord( object ):
                 raise KeyError( """Don't have an index/key %r for %s instant"""%(
                     key, self.__class__,
                 ))
+
+if numpy is not None:
+    SELECTION_RECORD_DTYPE = numpy.dtype([
+        ('near',numpy.float64),
+        ('far',numpy.float64),
+        ('offset',numpy.intp), # index of the first name in SelectionRecords.nameArray
+        ('count',numpy.intp),
+    ])
+
+def asUintArray( array ):
+    """Flat numpy uint32 copy of a selection buffer (however it was typed)"""
+    data = numpy.asarray( array ).ravel()
+    if data.dtype.kind in 'iu' and data.dtype.itemsize == 4:
+        return data.view( numpy.uint32 ).copy()
+    return (data.astype( numpy.int64 ) & 0xffffffff).astype( numpy.uint32 )
+
+def recordStarts( data, total ):
+    """Index of each hit record in the buffer (fewer than total if truncated)"""
+    length = len( data )
+    if not total or length < 3:
+        return numpy.zeros( (0,), numpy.intp )
+    stride = 3 + int( data[0] )
+    if stride * total <= length and (data[:stride*total:stride] == data[0]).all():
+        # every hit has the same number of names (the usual glLoadName case)
+        return numpy.arange( 0, stride*total, stride, dtype=numpy.intp )
+    starts = []
+    counts = data.tolist()
+    index = 0
+    for item in range( total ):
+        if index + 2 >= length:
+            break
+        starts.append( index )
+        index += 3 + counts[index]
+    return numpy.array( starts, dtype=numpy.intp )
+
+class SelectionRecords( list ):
+    """List of GLSelectRecord for a selection buffer, with the parsed arrays
+
+    records -- structured array with near, far (0.0-1.0 floats), offset
+        and count (the hit's names are nameArray[offset:offset+count])
+    nameArray -- uint32 copy of the buffer, indexed by the offsets
+    """
+    def __init__( self, records, nameArray ):
+        self.records = records
+        self.nameArray = nameArray
+        names = nameArray.tolist()
+        fromConverted = GLSelectRecord.fromConverted
+        super( SelectionRecords, self ).__init__( [
+            fromConverted( near, far, names[offset:offset+count] )
+            for near, far, offset, count in records.tolist()
+        ] )
+    def names( self, index ):
+        """The names of a hit as a list of ints"""
+        offset, count = self.records['offset'][index], self.records['count'][index]
+        return self.nameArray[offset:offset+count].tolist()
+    def nearest( self ):
+        """Index of the hit with the smallest near distance (None if no hits)"""
+        if not len( self ):
+            return None
+        return int( numpy.argmin( self.records['near'] ) )
+
+def selectionArrays( array, total ):
+    """Parse total hit records from a selection buffer into numpy arrays
+
+    Returns (records, nameArray) as stored on SelectionRecords, without
+    creating a GLSelectRecord per hit.  Requires numpy.
+    """
+    data = asUintArray( array )
+    starts = recordStarts( data, total )
+    records = numpy.zeros( (len(starts),), SELECTION_RECORD_DTYPE )
+    if len( starts ):
+        records['near'] = data[starts+1] / GLSelectRecord.DISTANCE_DIVISOR
+        records['far'] = data[starts+2] / GLSelectRecord.DISTANCE_DIVISOR
+        records['offset'] = starts + 3
+        # names cut off by the end of the buffer are dropped, as in fromArray
+        records['count'] = numpy.minimum( data[starts], len( data ) - (starts+3) )
+    return records, data
+
+def parseSelection( array, total ):
+    """Parse total hit records from a selection buffer
+
+    Returns a SelectionRecords, or with no numpy a plain list of
+    GLSelectRecord (see GLSelectRecord.fromArray).
+    """
+    if numpy is None:
+        return GLSelectRecord.fromArray( array, total )
+    return SelectionRecords( *selectionArrays( array, total ) )
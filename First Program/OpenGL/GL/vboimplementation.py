@@ -1,9 +1,9 @@
 from OpenGL.arrays import vbo
-from OpenGL.GL.VERSION import GL_1_5, GL_3_0, GL_3_1
 
 class Implementation( vbo.Implementation ):
     """OpenGL-based implementation of VBO interfaces"""
     def __init__( self ):
+        from OpenGL.GL.VERSION import GL_1_5, GL_3_0, GL_3_1, GL_3_2
         for name in self.EXPORTED_NAMES:
             found = False
             for source in (GL_1_5,GL_3_0, GL_3_1):
@@ -15,6 +15,8 @@ class Implementation( vbo.Implementation ):
                     found = True 
                     break 
             assert found, name
+        for name in self.OPTIONAL_NAMES:
+            setattr( self, name, getattr( GL_3_0, name, None ) or getattr( GL_3_2, name, None ))
         if GL_1_5.glBufferData:
             self.available = True
 
@@ -15,6 +15,8 @@ class Implementation( vbo.Implementation ):
                     else:
                         found = True
                 assert found, name
+        for name in self.OPTIONAL_NAMES:
+            setattr( self, name, None )
         if GLES2_2_0.glBufferData:
             self.available = True
 Implementation.register()
@@ -15,6 +15,8 @@ class Implementation( vbo.Implementation ):
                     else:
                         found = True
                 assert found, name
+        for name in self.OPTIONAL_NAMES:
+            setattr( self, name, getattr( GLES3_3_0, name, None ))
         if GLES3_3_0.glBufferData:
             self.available = True
 Implementation.register()
@@ -0,0 +1,294 @@
+"""CPU-side mirror of the fixed-function matrix stacks
+
+gluProject and friends normally read the modelview and projection
+matrices and the viewport back from the GL for every call, and each
+glGet has to wait for the driver.  This module provides replacements
+for the matrix functions which call the GL and also apply the same
+operation to a copy of the stacks kept (per context) in Python:
+
+    from OpenGL.GL import *
+    from OpenGL.GLU import *
+    from OpenGL.GLU.matrixstack import *
+
+after which gluProject, gluUnProject, gluUnProject4 and projectPoints
+take the matrices from the mirror instead of asking the GL.
+
+The mirror starts from the GL's state the first time it is used in a
+context.  Anything which changes the matrices or the viewport without
+going through these functions (calls to the unmirrored functions,
+glutReshapeFunc's default glViewport, glPushAttrib/glPopAttrib of the
+viewport...) leaves it stale, call synchronize() afterwards.  The
+texture matrix is tracked as a single stack, whatever the active
+texture unit.  Matrices are kept in double precision, so results may
+differ from the GL's (usually single precision) ones in the last few
+bits.
+
+Requires numpy.
+"""
+import math
+import numpy
+from OpenGL import GL, contextdata
+from OpenGL.raw import GLU as _simple
+
+CONTEXT_KEY = 'OpenGL.GLU.matrixstack'
+TRACKED_MODES = {
+    GL.GL_MODELVIEW: GL.GL_MODELVIEW_MATRIX,
+    GL.GL_PROJECTION: GL.GL_PROJECTION_MATRIX,
+    GL.GL_TEXTURE: GL.GL_TEXTURE_MATRIX,
+}
+
+def fromGL( matrix ):
+    """4x4 (row-major, for column vectors) array from a GL column-major matrix"""
+    return numpy.array( matrix, dtype=numpy.float64 ).reshape( (4,4) ).T.copy()
+def toGL( matrix ):
+    """GL (column-major) layout of a 4x4 array, as glGetDoublev returns it"""
+    return numpy.ascontiguousarray( matrix.T )
+
+def translationMatrix( x, y, z ):
+    matrix = numpy.identity( 4 )
+    matrix[:3,3] = (x,y,z)
+    return matrix
+def scaleMatrix( x, y, z ):
+    return numpy.diag( (float(x),float(y),float(z),1.0) )
+def rotationMatrix( angle, x, y, z ):
+    """As glRotate: angle in degrees about the axis (x,y,z)"""
+    axis = numpy.array( (x,y,z), dtype=numpy.float64 )
+    length = numpy.sqrt( numpy.dot( axis, axis ) )
+    matrix = numpy.identity( 4 )
+    if not length:
+        return matrix
+    x,y,z = axis / length
+    radians = math.radians( angle )
+    c, s = math.cos( radians ), math.sin( radians )
+    t = 1 - c
+    matrix[:3,:3] = (
+        (x*x*t + c,   x*y*t - z*s, x*z*t + y*s),
+        (y*x*t + z*s, y*y*t + c,   y*z*t - x*s),
+        (z*x*t - y*s, z*y*t + x*s, z*z*t + c),
+    )
+    return matrix
+def orthoMatrix( left, right, bottom, top, near, far ):
+    matrix = numpy.identity( 4 )
+    matrix[0,0] = 2.0 / (right-left)
+    matrix[1,1] = 2.0 / (top-bottom)
+    matrix[2,2] = -2.0 / (far-near)
+    matrix[:3,3] = (
+        -(right+left) / float(right-left),
+        -(top+bottom) / float(top-bottom),
+        -(far+near) / float(far-near),
+    )
+    return matrix
+def frustumMatrix( left, right, bottom, top, near, far ):
+    matrix = numpy.zeros( (4,4) )
+    matrix[0,0] = 2.0 * near / (right-left)
+    matrix[1,1] = 2.0 * near / (top-bottom)
+    matrix[0,2] = (right+left) / float(right-left)
+    matrix[1,2] = (top+bottom) / float(top-bottom)
+    matrix[2,2] = -(far+near) / float(far-near)
+    matrix[2,3] = -2.0 * far * near / (far-near)
+    matrix[3,2] = -1.0
+    return matrix
+def perspectiveMatrix( fovy, aspect, near, far ):
+    """As gluPerspective (fovy in degrees)"""
+    cotangent = 1.0 / math.tan( math.radians( fovy ) / 2.0 )
+    matrix = numpy.zeros( (4,4) )
+    matrix[0,0] = cotangent / aspect
+    matrix[1,1] = cotangent
+    matrix[2,2] = -(far+near) / float(far-near)
+    matrix[2,3] = -2.0 * near * far / (far-near)
+    matrix[3,2] = -1.0
+    return matrix
+def lookAtMatrix( eyeX, eyeY, eyeZ, centerX, centerY, centerZ, upX, upY, upZ ):
+    """As gluLookAt"""
+    eye = numpy.array( (eyeX,eyeY,eyeZ), dtype=numpy.float64 )
+    forward = numpy.array( (centerX,centerY,centerZ), dtype=numpy.float64 ) - eye
+    forward /= numpy.sqrt( numpy.dot( forward, forward ) ) or 1.0
+    side = numpy.cross( forward, (upX,upY,upZ) )
+    side /= numpy.sqrt( numpy.dot( side, side ) ) or 1.0
+    up = numpy.cross( side, forward )
+    matrix = numpy.identity( 4 )
+    matrix[0,:3] = side
+    matrix[1,:3] = up
+    matrix[2,:3] = -forward
+    return numpy.dot( matrix, translationMatrix( *(-eye) ) )
+
+class MatrixStacks( object ):
+    """Matrix stacks, current matrix mode and viewport of one context"""
+    def __init__( self ):
+        self.mode = GL.GL_MODELVIEW
+        self.stacks = dict([
+            (mode,[numpy.identity( 4 )]) for mode in TRACKED_MODES
+        ])
+        self.viewport = (0,0,0,0)
+    def synchronize( self ):
+        """Read the current matrices (not whole stacks), mode and viewport from the GL"""
+        for mode, query in TRACKED_MODES.items():
+            stack = self.stacks[ mode ]
+            stack[-1] = fromGL( GL.glGetDoublev( query ) )
+        self.mode = int( numpy.ravel( GL.glGetIntegerv( GL.GL_MATRIX_MODE ) )[0] )
+        self.viewport = tuple( [int(x) for x in numpy.ravel( GL.glGetIntegerv( GL.GL_VIEWPORT ) )] )
+    def stack( self, mode=None ):
+        """The stack for mode (default the current mode)"""
+        if mode is None:
+            mode = self.mode
+        stack = self.stacks.get( mode )
+        if stack is None:
+            stack = self.stacks[ mode ] = [numpy.identity( 4 )]
+        return stack
+    def matrix( self, mode=None ):
+        """Top of the stack for mode (default the current mode) as a 4x4 array"""
+        return self.stack( mode )[-1]
+    def glMatrix( self, mode=None ):
+        """Top of the stack for mode in GL (column-major) layout"""
+        return toGL( self.matrix( mode ) )
+    def load( self, matrix ):
+        self.stack()[-1] = matrix
+    def multiply( self, matrix ):
+        stack = self.stack()
+        stack[-1] = numpy.dot( stack[-1], matrix )
+    def translate( self, x, y, z ):
+        """Multiply by translationMatrix( x, y, z ), in place"""
+        matrix = self.stack()[-1]
+        matrix[:,3] += numpy.dot( matrix[:,:3], (x,y,z) )
+    def scale( self, x, y, z ):
+        """Multiply by scaleMatrix( x, y, z ), in place"""
+        self.stack()[-1][:,:3] *= (x,y,z)
+    def push( self ):
+        stack = self.stack()
+        stack.append( stack[-1].copy() )
+    def pop( self ):
+        stack = self.stack()
+        if len( stack ) > 1:
+            stack.pop()
+
+def currentStacks( create=True ):
+    """The mirror for the current context
+
+    create -- if there is no mirror yet, create one from the GL's state,
+        otherwise return None
+    """
+    stacks = contextdata.getValue( CONTEXT_KEY )
+    if stacks is None and create:
+        stacks = MatrixStacks()
+        stacks.synchronize()
+        contextdata.setValue( CONTEXT_KEY, stacks, weak=False )
+    return stacks
+def synchronize( ):
+    """Re-read the current context's matrices and viewport from the GL"""
+    stacks = currentStacks( create=False )
+    if stacks is None:
+        return currentStacks()
+    stacks.synchronize()
+    return stacks
+def getMatrix( mode=None ):
+    """Current matrix for mode (default the current mode) in GL layout"""
+    return currentStacks().glMatrix( mode )
+def getViewport( ):
+    """Current viewport as (x,y,width,height)"""
+    return currentStacks().viewport
+
+def glMatrixMode( mode ):
+    stacks = currentStacks()
+    GL.glMatrixMode( mode )
+    stacks.mode = int( mode )
+def glLoadIdentity( ):
+    stacks = currentStacks()
+    GL.glLoadIdentity()
+    stacks.load( numpy.identity( 4 ) )
+def glPushMatrix( ):
+    stacks = currentStacks()
+    GL.glPushMatrix()
+    stacks.push()
+def glPopMatrix( ):
+    stacks = currentStacks()
+    GL.glPopMatrix()
+    stacks.pop()
+def glLoadMatrixf( matrix ):
+    stacks = currentStacks()
+    GL.glLoadMatrixf( matrix )
+    stacks.load( fromGL( matrix ) )
+def glLoadMatrixd( matrix ):
+    stacks = currentStacks()
+    GL.glLoadMatrixd( matrix )
+    stacks.load( fromGL( matrix ) )
+def glMultMatrixf( matrix ):
+    stacks = currentStacks()
+    GL.glMultMatrixf( matrix )
+    stacks.multiply( fromGL( matrix ) )
+def glMultMatrixd( matrix ):
+    stacks = currentStacks()
+    GL.glMultMatrixd( matrix )
+    stacks.multiply( fromGL( matrix ) )
+def glTranslatef( x, y, z ):
+    stacks = currentStacks()
+    GL.glTranslatef( x, y, z )
+    stacks.translate( x, y, z )
+def glTranslated( x, y, z ):
+    stacks = currentStacks()
+    GL.glTranslated( x, y, z )
+    stacks.translate( x, y, z )
+def glRotatef( angle, x, y, z ):
+    stacks = currentStacks()
+    GL.glRotatef( angle, x, y, z )
+    stacks.multiply( rotationMatrix( angle, x, y, z ) )
+def glRotated( angle, x, y, z ):
+    stacks = currentStacks()
+    GL.glRotated( angle, x, y, z )
+    stacks.multiply( rotationMatrix( angle, x, y, z ) )
+def glScalef( x, y, z ):
+    stacks = currentStacks()
+    GL.glScalef( x, y, z )
+    stacks.scale( x, y, z )
+def glScaled( x, y, z ):
+    stacks = currentStacks()
+    GL.glScaled( x, y, z )
+    stacks.scale( x, y, z )
+def glOrtho( left, right, bottom, top, near, far ):
+    stacks = currentStacks()
+    GL.glOrtho( left, right, bottom, top, near, far )
+    stacks.multiply( orthoMatrix( left, right, bottom, top, near, far ) )
+def glFrustum( left, right, bottom, top, near, far ):
+    stacks = currentStacks()
+    GL.glFrustum( left, right, bottom, top, near, far )
+    stacks.multiply( frustumMatrix( left, right, bottom, top, near, far ) )
+def glViewport( x, y, width, height ):
+    stacks = currentStacks()
+    GL.glViewport( x, y, width, height )
+    stacks.viewport = (int(x),int(y),int(width),int(height))
+def gluOrtho2D( left, right, bottom, top ):
+    stacks = currentStacks()
+    _simple.gluOrtho2D( left, right, bottom, top )
+    stacks.multiply( orthoMatrix( left, right, bottom, top, -1, 1 ) )
+def gluPerspective( fovy, aspect, near, far ):
+    stacks = currentStacks()
+    _simple.gluPerspective( fovy, aspect, near, far )
+    stacks.multiply( perspectiveMatrix( fovy, aspect, near, far ) )
+def gluLookAt( eyeX, eyeY, eyeZ, centerX, centerY, centerZ, upX, upY, upZ ):
+    stacks = currentStacks()
+    _simple.gluLookAt( eyeX, eyeY, eyeZ, centerX, centerY, centerZ, upX, upY, upZ )
+    stacks.multiply( lookAtMatrix(
+        eyeX, eyeY, eyeZ, centerX, centerY, centerZ, upX, upY, upZ,
+    ) )
+
+__all__ = (
+    'glMatrixMode',
+    'glLoadIdentity',
+    'glPushMatrix',
+    'glPopMatrix',
+    'glLoadMatrixf',
+    'glLoadMatrixd',
+    'glMultMatrixf',
+    'glMultMatrixd',
+    'glTranslatef',
+    'glTranslated',
+    'glRotatef',
+    'glRotated',
+    'glScalef',
+    'glScaled',
+    'glOrtho',
+    'glFrustum',
+    'glViewport',
+    'gluOrtho2D',
+    'gluPerspective',
+    'gluLookAt',
+)
@@ -1,9 +1,45 @@
-"""glu[Un]Project[4] convenience wrappers"""
+"""glu[Un]Project[4] convenience wrappers
+
+Matrices which aren't passed in are read from the GL, or from the
+CPU-side mirror if the program uses OpenGL.GLU.matrixstack's matrix
+functions.  projectPoints and unProjectPoints do the same calculation
+as gluProject/gluUnProject for a whole array of points at once (they
+need numpy).
+"""
 from OpenGL.raw import GLU as _simple
 from OpenGL import GL
 from OpenGL.lazywrapper import lazy as _lazy
 import ctypes 
 POINTER = ctypes.POINTER
+try:
+    from OpenGL.GLU import matrixstack
+except ImportError as err:
+    matrixstack = None
+
+def currentMatrices( model=None, proj=None, view=None ):
+    """Fill in the modelview, projection and viewport not provided
+
+    Uses the matrixstack mirror if the current context has one,
+    otherwise queries the GL.
+    """
+    stacks = None
+    if matrixstack is not None and (model is None or proj is None or view is None):
+        stacks = matrixstack.currentStacks( create=False )
+    if stacks is not None:
+        if model is None:
+            model = stacks.glMatrix( GL.GL_MODELVIEW )
+        if proj is None:
+            proj = stacks.glMatrix( GL.GL_PROJECTION )
+        if view is None:
+            view = stacks.viewport
+        return model, proj, view
+    if model is None:
+        model = GL.glGetDoublev( GL.GL_MODELVIEW_MATRIX )
+    if proj is None:
+        proj = GL.glGetDoublev( GL.GL_PROJECTION_MATRIX )
+    if view is None:
+        view = GL.glGetIntegerv( GL.GL_VIEWPORT )
+    return model, proj, view
 
 @_lazy( _simple.gluProject )
 def gluProject( baseFunction, objX, objY, objZ, model=None, proj=None, view=None ):
@@ -14,12 +50,7 @@ def gluProject( baseFunction, objX, objY, objZ, model=None, proj=None, view=None
     
     returns (winX,winY,winZ) doubles
     """
-    if model is None:
-        model = GL.glGetDoublev( GL.GL_MODELVIEW_MATRIX )
-    if proj is None:
-        proj = GL.glGetDoublev( GL.GL_PROJECTION_MATRIX )
-    if view is None:
-        view = GL.glGetIntegerv( GL.GL_VIEWPORT )
+    model, proj, view = currentMatrices( model, proj, view )
     winX = _simple.GLdouble( 0.0 )
     winY = _simple.GLdouble( 0.0 )
     winZ = _simple.GLdouble( 0.0 )
@@ -43,12 +74,7 @@ def gluUnProject( baseFunction, winX, winY, winZ, model=None, proj=None, view=No
     
     returns (objX,objY,objZ) doubles
     """
-    if model is None:
-        model = GL.glGetDoublev( GL.GL_MODELVIEW_MATRIX )
-    if proj is None:
-        proj = GL.glGetDoublev( GL.GL_PROJECTION_MATRIX )
-    if view is None:
-        view = GL.glGetIntegerv( GL.GL_VIEWPORT )
+    model, proj, view = currentMatrices( model, proj, view )
     objX = _simple.GLdouble( 0.0 )
     objY = _simple.GLdouble( 0.0 )
     objZ = _simple.GLdouble( 0.0 )
@@ -74,27 +100,86 @@ def gluUnProject4(
     
     returns (objX,objY,objZ) doubles
     """
-    if model is None:
-        model = GL.glGetDoublev( GL.GL_MODELVIEW_MATRIX )
-    if proj is None:
-        proj = GL.glGetDoublev( GL.GL_PROJECTION_MATRIX )
-    if view is None:
-        view = GL.glGetIntegerv( GL.GL_VIEWPORT )
+    model, proj, view = currentMatrices( model, proj, view )
     objX = _simple.GLdouble( 0.0 )
     objY = _simple.GLdouble( 0.0 )
     objZ = _simple.GLdouble( 0.0 )
     objW = _simple.GLdouble( 0.0 )
     result = baseFunction( 
-        winX,winY,winZ,
+        winX,winY,winZ,clipW,
         model,proj,view,
+        near,far,
         ctypes.byref(objX),ctypes.byref(objY),ctypes.byref(objZ),ctypes.byref(objW)
     )
     if not result:
         raise ValueError( """Projection failed!""" )
     return objX.value, objY.value, objZ.value, objW.value
 
+def projectionMatrix( model, proj ):
+    """Combined projection * modelview as a 4x4 array (for column vectors)"""
+    import numpy
+    model = numpy.asarray( model, dtype=numpy.float64 ).reshape( (4,4) ).T
+    proj = numpy.asarray( proj, dtype=numpy.float64 ).reshape( (4,4) ).T
+    return numpy.dot( proj, model )
+
+def projectPoints( points, model=None, proj=None, view=None ):
+    """gluProject for an array of points
+
+    points -- (N,3) array-like of object coordinates (or a single point)
+    model, proj, view -- as for gluProject
+
+    returns (N,3) array of window coordinates (shaped like points), with
+    NaN for points which can't be projected (clip w of 0)
+    """
+    import numpy
+    model, proj, view = currentMatrices( model, proj, view )
+    points = numpy.asarray( points, dtype=numpy.float64 )
+    flat = points.reshape( (-1,3) )
+    x, y, width, height = [float(v) for v in numpy.asarray( view ).ravel()[:4]]
+    matrix = projectionMatrix( model, proj )
+    clip = numpy.dot( flat, matrix[:,:3].T ) + matrix[:,3]
+    w = clip[:,3:]
+    with numpy.errstate( divide='ignore', invalid='ignore' ):
+        ndc = numpy.where( w != 0, clip[:,:3] / w, numpy.nan )
+    result = numpy.empty_like( ndc )
+    result[:,0] = x + width * (ndc[:,0] + 1) / 2
+    result[:,1] = y + height * (ndc[:,1] + 1) / 2
+    result[:,2] = (ndc[:,2] + 1) / 2
+    return result.reshape( points.shape )
+
+def unProjectPoints( points, model=None, proj=None, view=None ):
+    """gluUnProject for an array of points
+
+    points -- (N,3) array-like of window coordinates (or a single point)
+    model, proj, view -- as for gluUnProject
+
+    returns (N,3) array of object coordinates (shaped like points), with
+    NaN for points which can't be unprojected, raises ValueError if the
+    matrices can't be inverted
+    """
+    import numpy
+    model, proj, view = currentMatrices( model, proj, view )
+    points = numpy.asarray( points, dtype=numpy.float64 )
+    flat = points.reshape( (-1,3) )
+    x, y, width, height = [float(v) for v in numpy.asarray( view ).ravel()[:4]]
+    try:
+        inverse = numpy.linalg.inv( projectionMatrix( model, proj ) )
+    except numpy.linalg.LinAlgError as err:
+        raise ValueError( """Projection failed!""" )
+    ndc = numpy.empty_like( flat )
+    ndc[:,0] = (flat[:,0] - x) * 2 / width - 1
+    ndc[:,1] = (flat[:,1] - y) * 2 / height - 1
+    ndc[:,2] = flat[:,2] * 2 - 1
+    objects = numpy.dot( ndc, inverse[:,:3].T ) + inverse[:,3]
+    w = objects[:,3:]
+    with numpy.errstate( divide='ignore', invalid='ignore' ):
+        result = numpy.where( w != 0, objects[:,:3] / w, numpy.nan )
+    return result.reshape( points.shape )
+
 __all__ = (
     'gluProject',
     'gluUnProject',
     'gluUnProject4',
+    'projectPoints',
+    'unProjectPoints',
 )
@@ -1,14 +1,24 @@
-"""Wrapper/Implementation of the GLU tessellator objects for PyOpenGL"""
+"""Wrapper/Implementation of the GLU tessellator objects for PyOpenGL
+
+tessellate() is a higher-level interface for the common case of turning
+polygon outlines into triangles to draw: it drives the tessellator with
+raw callbacks which only record vertex indices, and caches the results,
+so a static shape is tessellated once however often it is asked for:
+
+    shape = tessellate( [outline, hole], GLU_TESS_WINDING_ODD )
+    glVertexPointerd( shape.vertices )
+    glDrawElementsui( GL_TRIANGLES, shape.indices )
+"""
 from OpenGL.raw import GLU as _simple
 from OpenGL.raw.GL.VERSION import GL_1_1
 from OpenGL.platform import createBaseFunction
 from OpenGL.GLU import glustruct
-from OpenGL import arrays, wrapper
+from OpenGL import arrays, error, wrapper
 from OpenGL.platform import PLATFORM
 
 GLU = PLATFORM.GLU
 from OpenGL.lazywrapper import lazy as _lazy
-import ctypes
+import array, collections, ctypes, hashlib
 
 
 class GLUtesselator(glustruct.GLUStruct, _simple.GLUtesselator):
@@ -258,10 +268,188 @@ gluTessVertexBase = wrapper.wrapper(_simple.gluTessVertex).setInputArraySize(
     3,
 )
 
+# gluTessVertex taking plain addresses (no array conversion), for tessellate()
+gluTessVertexAddress = GLUtesselator.FUNCTION_TYPE(
+    None, ctypes.POINTER(GLUtesselator), ctypes.c_void_p, ctypes.c_void_p
+)(('gluTessVertex', GLU))
+
+TESSELLATION_CACHE_SIZE = 256
+_tessellationCache = collections.OrderedDict()
+
+
+class Tessellation(object):
+    """Triangles produced by tessellate()
+
+    vertices -- (N,3) float64 array, the input points in order, followed
+        by any intersection points the tessellator had to add
+    indices -- uint32 array, three vertex indices per triangle
+
+    Both arrays are read-only, as results are shared through the cache.
+    """
+
+    __slots__ = ('vertices', 'indices')
+
+    def __init__(self, vertices, indices):
+        self.vertices = vertices
+        self.indices = indices
+
+    def __len__(self):
+        """Number of triangles"""
+        return len(self.indices) // 3
+
+    @property
+    def triangles(self):
+        """(T,3,3) array of triangle corner positions"""
+        return self.vertices[self.indices].reshape((-1, 3, 3))
+
+
+def tessellationKey(points, counts, windingRule, normal, tolerance):
+    """Cache key for a tessellation: digest of the points and settings"""
+    digest = hashlib.sha1(
+        repr((int(windingRule), normal, float(tolerance), counts)).encode('utf-8')
+    )
+    digest.update(points.tobytes())
+    return digest.digest()
+
+
+def tessellate(
+    polygons,
+    windingRule=_simple.GLU_TESS_WINDING_ODD,
+    normal=None,
+    tolerance=0.0,
+    cache=True,
+):
+    """Tessellate contours into indexed triangles, returns a Tessellation
+
+    polygons -- sequence of contours, each a sequence of (x,y) or (x,y,z)
+        points, all forming one polygon (holes, overlaps... are resolved
+        by windingRule)
+    windingRule -- GLU_TESS_WINDING_* constant
+    normal -- polygon normal, by default (0,0,1) for 2D contours,
+        otherwise computed by the tessellator
+    tolerance -- GLU_TESS_TOLERANCE for merging nearby vertices
+    cache -- reuse the result of an earlier call with the same points
+        and settings (the last TESSELLATION_CACHE_SIZE are kept)
+
+    Raises GLUError if the tessellator reports an error.
+    """
+    import numpy
+
+    contours = [numpy.asarray(contour, dtype=numpy.float64) for contour in polygons]
+    counts = tuple([len(contour) for contour in contours])
+    points = numpy.zeros((sum(counts), 3), dtype=numpy.float64)
+    start = 0
+    flat = True
+    for contour in contours:
+        if len(contour):
+            if contour.ndim != 2 or contour.shape[1] not in (2, 3):
+                raise ValueError(
+                    """Require (x,y) or (x,y,z) points, got shape %s""" % (contour.shape,)
+                )
+            points[start : start + len(contour), : contour.shape[1]] = contour
+            flat = flat and contour.shape[1] == 2
+        start += len(contour)
+    if normal is None and flat:
+        normal = (0.0, 0.0, 1.0)
+    if normal is not None:
+        normal = tuple([float(x) for x in normal])
+
+    key = None
+    if cache:
+        key = tessellationKey(points, counts, windingRule, normal, tolerance)
+        result = _tessellationCache.get(key)
+        if result is not None:
+            _tessellationCache.move_to_end(key)
+            return result
+    result = tessellatePoints(points, counts, windingRule, normal, tolerance)
+    if key is not None:
+        _tessellationCache[key] = result
+        while len(_tessellationCache) > TESSELLATION_CACHE_SIZE:
+            _tessellationCache.popitem(last=False)
+    return result
+
+
+def tessellatePoints(points, counts, windingRule, normal, tolerance):
+    """Run the tessellator over points (contours of counts points each)
+
+    Vertex data pointers are vertex indices + 1 (so none is NULL), the
+    callbacks only append them to an array, and the combine callback
+    appends the new point to the vertex list.
+    """
+    import numpy
+
+    indices = array.array('I')
+    added = []
+    errors = []
+    addIndex = indices.append
+    firstAdded = len(points) + 1
+
+    def vertex(data):
+        addIndex(data - 1)
+
+    def combine(coords, vertexData, weight, outData):
+        added.append((coords[0], coords[1], coords[2]))
+        outData[0] = firstAdded + len(added) - 1
+
+    def ignore(*args):
+        pass
+
+    def tessError(code):
+        errors.append(code)
+
+    types = GLUtesselator.CALLBACK_TYPES
+    callbacks = [
+        # an edge flag callback makes the tessellator produce only GL_TRIANGLES
+        (_simple.GLU_TESS_BEGIN, ignore),
+        (_simple.GLU_TESS_EDGE_FLAG, ignore),
+        (_simple.GLU_TESS_VERTEX, vertex),
+        (_simple.GLU_TESS_END, ignore),
+        (_simple.GLU_TESS_COMBINE, combine),
+        (_simple.GLU_TESS_ERROR, tessError),
+    ]
+    tess = gluNewTess()
+    try:
+        # keep the ctypes callbacks alive until the tessellator is deleted
+        callbacks = [(which, types[which](function)) for which, function in callbacks]
+        for which, callback in callbacks:
+            GLUtesselator.CALLBACK_FUNCTION_REGISTRARS[which](tess, which, callback)
+        _simple.gluTessProperty(tess, _simple.GLU_TESS_WINDING_RULE, windingRule)
+        if tolerance:
+            _simple.gluTessProperty(tess, _simple.GLU_TESS_TOLERANCE, tolerance)
+        if normal is not None:
+            _simple.gluTessNormal(tess, *normal)
+        base = points.ctypes.data
+        stride = points.strides[0]
+        _simple.gluTessBeginPolygon(tess, None)
+        start = 0
+        for count in counts:
+            _simple.gluTessBeginContour(tess)
+            for index in range(start, start + count):
+                gluTessVertexAddress(tess, base + index * stride, index + 1)
+            _simple.gluTessEndContour(tess)
+            start += count
+        _simple.gluTessEndPolygon(tess)
+    finally:
+        _simple.gluDeleteTess(tess)
+    if errors:
+        raise error.GLUError(
+            """Tessellation failed: %s"""
+            % (ctypes.cast(_simple.gluErrorString(errors[0]), ctypes.c_char_p).value,)
+        )
+    if added:
+        points = numpy.concatenate((points, numpy.array(added, dtype=numpy.float64)))
+    indices = numpy.frombuffer(indices, dtype=numpy.uint32).copy()
+    points.flags.writeable = False
+    indices.flags.writeable = False
+    return Tessellation(points, indices)
+
+
 __all__ = (
     'gluNewTess',
     'gluGetTessProperty',
     'gluTessBeginPolygon',
     'gluTessCallback',
     'gluTessVertex',
+    'tessellate',
+    'Tessellation',
 )
@@ -22,7 +22,7 @@ platform module *not* in the module here!
 """
 from OpenGL.platform import CurrentContextIsValid, GLUT_GUARD_CALLBACKS, PLATFORM
 GLUT = PLATFORM.GLUT
-from OpenGL import contextdata, error, platform, logs
+from OpenGL import contextdata, error, platform, logs, _configflags
 from OpenGL.raw import GLUT as _simple
 from OpenGL._bytes import bytes, unicode,as_8_bit
 import ctypes, os, sys, traceback
@@ -350,3 +350,10 @@ def glutDestroyWindow( window ):
         _log.error( """Error attempting to clean up context data for GLUT window %s: %s""", window, result )
     return _base_glutDestroyWindow( window )
 glutDestroyWindow.wrappedOperation = _simple.glutDestroyWindow
+
+if _configflags.ERROR_CHECKING and _configflags.ERROR_CHECKING_DEFERRED:
+    def glutSwapBuffers( ):
+        """Check for GL errors from the frame (deferred error checking), then swap"""
+        error.checkpoint( 'glutSwapBuffers' )
+        return _simple.glutSwapBuffers( )
+    glutSwapBuffers.wrappedOperation = _simple.glutSwapBuffers
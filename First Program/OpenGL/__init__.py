@@ -35,6 +35,53 @@ import occurs the flags should no longer be changed.
 
         Default: True
 
+    ERROR_CHECKING_DEFERRED -- if set to a True value before
+        importing any OpenGL.* libraries, errors are not checked
+        after every call, instead they are polled at checkpoints:
+        every few hundred calls, at glutSwapBuffers, and wherever
+        the application calls OpenGL.error.checkpoint() (or leaves
+        an OpenGL.error.checkedScope() block).  The raised GLError
+        lists the calls made since the previous checkpoint, one of
+        which caused the error.
+
+        This is a middle ground between full error checking (one
+        glGetError per call) and none at all.
+
+        Only triggers if ERROR_CHECKING is True
+
+        Default: False
+
+    LAZY_IMPORT -- if set to a True value before importing any
+        OpenGL.* libraries, OpenGL.GL only loads the VERSION modules
+        above 1.1 when one of their names is first used, which makes
+        "import OpenGL.GL" several times faster.  Star-imports still
+        see every name: functions are bound to stand-ins that load
+        their module on first call, constants are created from a
+        pre-generated index (see OpenGL.lazymodule).
+
+        A star-importing module keeps the stand-ins, so every later
+        call to a GL 1.2+ function costs an extra Python call (about
+        1us).  Use it for short-lived or import-bound programs, not
+        for per-frame rendering code.
+
+        Default: False
+
+    RESOLUTION_CACHE -- if set to a True value before importing
+        any OpenGL.* libraries, remember which functions and
+        extensions resolved in a small JSON file so that the next
+        start can skip failed lookups and extension queries, and
+        resolve known-good core functions directly.  The file is
+        keyed by platform, GL library and renderer, so it never
+        gives stale answers for a different driver.
+
+        The file goes in $PYOPENGL_RESOLUTION_CACHE_DIR, or else
+        under $XDG_CACHE_HOME/pyopengl.  Setting OpenGL.RESOLUTION_CACHE
+        to a directory name in code uses that directory instead; the
+        PYOPENGL_RESOLUTION_CACHE environment variable is only read
+        as on ("1" or "true") or off.
+
+        Default: False
+
     ERROR_LOGGING -- If True, then wrap array-handler
         functions with  error-logging operations so that all exceptions
         will be reported to log objects in OpenGL.logs, note that
@@ -78,6 +125,20 @@ import occurs the flags should no longer be changed.
 
         Default: False
 
+    CACHE_CURRENT_CONTEXT -- if set to True, OpenGL.contextdata
+        (which keeps arrays passed to pointer functions alive)
+        remembers the current context for each thread instead
+        of asking the platform on every store.  The cached value
+        is dropped whenever a make-current function (eglMakeCurrent,
+        glXMakeCurrent, wglMakeCurrent, OSMesaMakeCurrent,
+        glutSetWindow, glutCreateWindow...) is called through
+        PyOpenGL.  Only enable this if all context switches go
+        through PyOpenGL (e.g. a single-window GLUT program), or call
+        OpenGL.contextdata.contextChanged() after switching contexts
+        yourself.
+
+        Default: False
+
     STORE_POINTERS -- if set to True, PyOpenGL array operations
         will attempt to store references to pointers which are
         being passed in order to prevent memory-access failures
@@ -194,7 +255,10 @@ def environ_key(name, default):
 
 
 ERROR_CHECKING = environ_key("ERROR_CHECKING", True)
+ERROR_CHECKING_DEFERRED = environ_key("ERROR_CHECKING_DEFERRED", False)
 ERROR_LOGGING = environ_key("ERROR_LOGGING", False)
+LAZY_IMPORT = environ_key("LAZY_IMPORT", False)
+RESOLUTION_CACHE = environ_key("RESOLUTION_CACHE", False)
 ERROR_ON_COPY = environ_key("ERROR_ON_COPY", False)
 ARRAY_SIZE_CHECKING = environ_key("ARRAY_SIZE_CHECKING", True)
 STORE_POINTERS = environ_key("STORE_POINTERS", True)
@@ -203,6 +267,7 @@ FORWARD_COMPATIBLE_ONLY = False
 SIZE_1_ARRAY_UNPACK = True
 USE_ACCELERATE = environ_key("USE_ACCELERATE", True)
 CONTEXT_CHECKING = environ_key("CONTEXT_CHECKING", False)
+CACHE_CURRENT_CONTEXT = environ_key("CACHE_CURRENT_CONTEXT", False)
 
 FULL_LOGGING = environ_key("FULL_LOGGING", False)
 ALLOW_NUMPY_SCALARS = environ_key("ALLOW_NUMPY_SCALARS", False)
@@ -358,6 +423,8 @@ FormatHandler(
         "OpenGL.arrays._buffers.Py_buffer",
         _bi + ".memoryview",
         _bi + ".bytearray",
+        "array.array",
+        "mmap.mmap",
     ],
     isOutput=True,
 )
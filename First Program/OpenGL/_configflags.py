@@ -1,7 +1,10 @@
 """Holds the import-time constants for various configuration flags"""
 from OpenGL import (
     ERROR_CHECKING,
+    ERROR_CHECKING_DEFERRED,
     ERROR_LOGGING,
+    LAZY_IMPORT,
+    RESOLUTION_CACHE,
     ERROR_ON_COPY,
     ARRAY_SIZE_CHECKING,
     STORE_POINTERS,
@@ -10,6 +13,7 @@ from OpenGL import (
     SIZE_1_ARRAY_UNPACK,
     USE_ACCELERATE,
     CONTEXT_CHECKING,
+    CACHE_CURRENT_CONTEXT,
 
     FULL_LOGGING,
     ALLOW_NUMPY_SCALARS,
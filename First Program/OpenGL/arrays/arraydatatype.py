@@ -55,7 +55,6 @@ if ADT is None:
                             if hasattr(handler, "registerEquivalent"):
                                 handler.registerEquivalent(typ, base)
                             return handler
-                print(self.keys())
                 raise TypeError(
                     """No array-type handler for type %s.%s (value: %s) registered"""
                     % (typ.__module__, typ.__name__, repr(value)[:50])
@@ -111,6 +110,32 @@ if ADT is None:
     GLOBAL_REGISTRY = HandlerRegistry(plugins.FormatHandler.match)
     formathandler.FormatHandler.TYPE_REGISTRY = GLOBAL_REGISTRY
 
+    class HandlerCache(object):
+        """Handler lookup for a single call site, remembering the last type seen
+
+        A given converter nearly always sees the same kind of value (say,
+        float32 numpy arrays), so checking the value's type against the
+        last one skips the registry lookup (and its __mro__ walk on a miss).
+        """
+
+        __slots__ = ("registry", "last")
+
+        def __init__(self, registry=None):
+            self.registry = registry if registry is not None else GLOBAL_REGISTRY
+            # (type, handler) set in one assignment, so threads sharing a
+            # call site never see one type's handler paired with another
+            self.last = (None, None)
+
+        def __call__(self, value):
+            """Lookup of handler for given value"""
+            typ = value.__class__
+            last = self.last
+            if typ is last[0]:
+                return last[1]
+            handler = self.registry(value)
+            self.last = (typ, handler)
+            return handler
+
     class ArrayDatatype(object):
         """Mix-in for array datatype classes
 
@@ -124,6 +149,9 @@ if ADT is None:
         getHandler = GLOBAL_REGISTRY.__call__
         returnHandler = GLOBAL_REGISTRY.get_output_handler
         isAccelerated = False
+        # resolve()'s lookups for the incoming value and the converted array
+        resolveValueHandler = HandlerCache()
+        resolveArrayHandler = HandlerCache()
 
         @classmethod
         def getRegistry(cls):
@@ -218,6 +246,32 @@ if ADT is None:
 
         arrayByteCount = classmethod(logs.logOnFail(arrayByteCount, _log))
 
+        def resolve(cls, value, typeCode=None):
+            """Convert value to an array once, returning everything a call needs
+
+            Returns (pointer, byteCount, glType, array), looking the handler up
+            once (twice if conversion changed the value's type) instead of once
+            per asArray/dataPointer/arrayByteCount call, through HandlerCaches
+            so that a repeated type of value skips the registry.  array is the
+            converted value, which has to be kept alive as long as pointer is
+            in use.
+            """
+            typeCode = typeCode or cls.typeConstant
+            handler = cls.resolveValueHandler(value)
+            array = handler.asArray(value, typeCode)
+            if array.__class__ is not value.__class__:
+                handler = cls.resolveArrayHandler(array)
+            if typeCode is None:
+                typeCode = handler.arrayToGLType(array)
+            return (
+                handler.dataPointer(array),
+                handler.arrayByteCount(array),
+                typeCode,
+                array,
+            )
+
+        resolve = classmethod(logs.logOnFail(resolve, _log))
+
     # the final array data-type classes...
     class GLclampdArray(ArrayDatatype, ctypes.POINTER(_types.GLclampd)):
         """Array datatype for GLclampd types"""
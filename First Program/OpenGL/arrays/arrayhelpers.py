@@ -46,11 +46,12 @@ if AsArrayTypedSizeChecked is None:
         def __init__( self, arrayName='pointer', typeName='type' ):
             self.arrayName = arrayName
             self.typeName = typeName 
+            self.getHandler = arraydatatype.HandlerCache()
         def __call__( self, arg, wrappedOperation, args):
             """Get the arg as an array of the appropriate type"""
             type = args[ self.typeIndex ]
             arrayType = arraydatatype.GL_CONSTANT_TO_ARRAY_TYPE[ type ]
-            return arrayType.asArray( arg )
+            return self.getHandler( arg ).asArray( arg, arrayType.typeConstant )
     class AsArrayTyped( converters.PyConverter ):
         """Given arrayName and arrayType, convert arrayName to array of type
         
@@ -65,9 +66,10 @@ if AsArrayTypedSizeChecked is None:
         def __init__( self, arrayName='pointer', arrayType=None ):
             self.arrayName = arrayName
             self.arrayType = arrayType
+            self.getHandler = arraydatatype.HandlerCache()
         def __call__( self, arg, wrappedOperation, args):
             """Get the arg as an array of the appropriate type"""
-            return self.arrayType.asArray( arg )
+            return self.getHandler( arg ).asArray( arg, self.arrayType.typeConstant )
     class AsArrayTypedSize( converters.CConverter ):
         """Given arrayName and arrayType, determine size of arrayName
         """
@@ -78,16 +80,30 @@ if AsArrayTypedSizeChecked is None:
         def __init__( self, arrayName='pointer', arrayType=None ):
             self.arrayName = arrayName
             self.arrayType = arrayType
+            self.getHandler = arraydatatype.HandlerCache()
         def __call__( self, pyArgs, index, wrappedOperation ):
             """Get the arg as an array of the appropriate type"""
-            return self.arrayType.arraySize( pyArgs[self.arrayIndex ] )
+            array = pyArgs[self.arrayIndex ]
+            return self.getHandler( array ).arraySize( array, self.arrayType.typeConstant )
 else:
     returnPointer = returnPyArgumentIndex( 0 )
 
 if not _configflags.ERROR_ON_COPY:
-    def asArrayType( typ, size=None ):
-        """Create PyConverter to get first argument as array of type"""
-        return converters.CallFuncPyConverter( typ.asArray )
+    if AsArrayTypedSizeChecked is None:
+        def asArrayType( typ, size=None ):
+            """Create PyConverter function to get first argument as array of type
+            
+            Produces a raw function, not a PyConverter instance
+            """
+            getHandler = arraydatatype.HandlerCache( typ.getRegistry() )
+            dataType = typ.typeConstant
+            def asArray( incoming, function, args ):
+                return getHandler( incoming ).asArray( incoming, dataType )
+            return asArray
+    else:
+        def asArrayType( typ, size=None ):
+            """Create PyConverter to get first argument as array of type"""
+            return converters.CallFuncPyConverter( typ.asArray )
 else:
     def asArrayType( typ, size=None ):
         """No converter required"""
@@ -104,12 +120,11 @@ else:
             
             Produces a raw function, not a PyConverter instance
             """
-            asArray = typ.asArray
+            getHandler = arraydatatype.HandlerCache( typ.getRegistry() )
             dataType = typ.typeConstant
-            arraySize = typ.arraySize
             expectedBytes = ctypes.sizeof( typ.baseType ) * size
             def asArraySize( incoming, function, args ):
-                handler = typ.getHandler( incoming )
+                handler = getHandler( incoming )
                 result = handler.asArray( incoming, dataType )
                 # check that the number of bytes expected is present...
                 byteSize = handler.arrayByteCount( result )
@@ -145,15 +160,16 @@ class storePointerType( object ):
     to ignore this storage operation.
     
     Stores the pyArgs (i.e. result of pyConverters) for the named
-    pointer argument...
+    pointer argument in the constant's contextdata slot...
     """
     def __init__( self, pointerName, constant ):
         self.pointerName = pointerName
         self.constant = constant 
+        self.slot = contextdata.slotFor( constant )
     def finalise( self, wrapper ):
         self.pointerIndex = wrapper.pyArgIndex( self.pointerName )
     def __call__( self, result, baseOperation, pyArgs, cArgs ):
-        contextdata.setValue( self.constant, pyArgs[self.pointerIndex] )
+        contextdata.setSlot( self.slot, pyArgs[self.pointerIndex] )
 
 
 def setInputArraySizeType( baseOperation, size, type, argName=0 ):
@@ -171,7 +187,13 @@ def setInputArraySizeType( baseOperation, size, type, argName=0 ):
     return wrapper.wrapper( baseOperation ).setInputArraySize( argName, size )
 
 def arraySizeOfFirstType( typ, default ):
-    unitSize = typ.unitSize
+    if AsArrayTypedSizeChecked is None:
+        getHandler = arraydatatype.HandlerCache( typ.getRegistry() )
+        dataType = typ.typeConstant
+        def unitSize( array ):
+            return getHandler( array ).unitSize( array, dataType )
+    else:
+        unitSize = typ.unitSize
     def arraySizeOfFirst( pyArgs, index, baseOperation ):
         """Return the array size of the first argument"""
         array = pyArgs[0]
@@ -4,12 +4,16 @@
 Will *only* work for Python 2.6+, and pretty much just works for strings
 under 2.6 (in terms of the common object types).
 """
-import sys,operator,logging,traceback
+import sys,operator,logging,traceback,array
 from OpenGL.arrays import _buffers
 from OpenGL.raw.GL import _types
 #from OpenGL.raw.GL.VERSION import GL_1_1
 from OpenGL.arrays import formathandler
-from OpenGL import _configflags
+from OpenGL.arrays._arrayconstants import (
+    GL_BYTE, GL_UNSIGNED_BYTE, GL_SHORT, GL_UNSIGNED_SHORT, GL_INT,
+    GL_UNSIGNED_INT, GL_UNSIGNED_INT64, GL_HALF_FLOAT, GL_FLOAT, GL_DOUBLE,
+)
+from OpenGL import _configflags, error
 from OpenGL import acceleratesupport
 _log = logging.getLogger( __name__ )
 try:
@@ -33,7 +37,18 @@ if sys.version_info[:2] > (2,6):
             BufferHandler = MemoryviewHandler
 if not BufferHandler:
     class BufferHandler( formathandler.FormatHandler ):
-        """Buffer-protocol data-type handler for OpenGL"""
+        """Buffer-protocol data-type handler for OpenGL
+
+        Handles any PEP 3118 buffer exporter (memoryview, bytearray,
+        array.array, mmap.mmap, ...) by passing the exporter's own memory
+        to OpenGL, the GL type is taken from the buffer's format string.
+
+        Untyped byte buffers (format B, b or c, e.g. bytearray or mmap)
+        are reinterpreted as whatever type the GL call wants, so vertex
+        data can be mapped straight from a file.  Typed buffers of the
+        wrong type, and non-contiguous buffers, have to be copied, which
+        raises CopyError if ERROR_ON_COPY is set.
+        """
         isOutput=False
         ERROR_ON_COPY = _configflags.ERROR_ON_COPY
         if sys.version_info[0] >= 3:
@@ -69,30 +84,155 @@ if not BufferHandler:
         @classmethod
         def arrayToGLType( cls, value ):
             """Given a value, guess OpenGL type of the corresponding pointer"""
-            format = value.format 
-            if format in ARRAY_TO_GL_TYPE_MAPPING:
-                return ARRAY_TO_GL_TYPE_MAPPING[format]
-            raise TypeError( 'Unknown format: %r'%(format,))
+            buf = asBuffer( value )
+            return formatToGLType( buf.format, buf.itemsize )
         @classmethod
         def arraySize( cls, value, typeCode = None ):
             """Given a data-value, calculate ravelled size for the array"""
-            return value.len // value.itemsize
+            buf = asBuffer( value )
+            if typeCode is not None and typeCode in BYTE_SIZES:
+                if formatToGLType( buf.format, buf.itemsize ) in UNTYPED_GL_TYPES:
+                    return buf.len // BYTE_SIZES[typeCode]
+            return buf.len // buf.itemsize
         @classmethod
         def arrayByteCount( cls, value, typeCode = None ):
             """Given a data-value, calculate number of bytes required to represent"""
-            return value.len
+            return asBuffer( value ).len
         @classmethod 
         def unitSize( cls, value, default=None ):
-            return value.dims[-1]
+            return asBuffer( value ).dims[-1]
         @classmethod
         def asArray( cls, value, typeCode=None ):
-            """Convert given value to an array value of given typeCode"""
-            buf = _buffers.Py_buffer.from_object( value )
-            return buf
+            """Convert given value to an array value of given typeCode
+
+            Returns a Py_buffer referencing the memory of value itself
+            unless value holds a different type than typeCode (or is not
+            contiguous), in which case the data is copied.
+            """
+            if isinstance( value, _buffers.Py_buffer ):
+                buf = value
+            else:
+                try:
+                    buf = _buffers.Py_buffer.from_object( value )
+                except BufferError as err:
+                    return cls.asArray( cls.contiguousCopy( value ), typeCode )
+            if typeCode is None:
+                return buf
+            glType = formatToGLType( buf.format, buf.itemsize )
+            if glType == typeCode:
+                return buf
+            if glType in UNTYPED_GL_TYPES:
+                return cls.reinterpret( value, buf, typeCode )
+            return cls.convert( value, buf, typeCode )
+        @classmethod
+        def contiguousCopy( cls, value ):
+            """Copy a non-contiguous buffer into a new C-contiguous one"""
+            if cls.ERROR_ON_COPY:
+                raise error.CopyError(
+                    """Non-contiguous %s buffer would have to be copied"""%(
+                        type(value).__name__,
+                    )
+                )
+            view = memoryview( value )
+            copy = memoryview( bytearray( view.tobytes() ) )
+            return copy.cast( 'B' ).cast( view.format, view.shape )
+        @classmethod
+        def reinterpret( cls, value, buf, typeCode ):
+            """View an untyped (byte) buffer as an array of typeCode, without copying"""
+            code = GL_TYPE_TO_FORMAT.get( typeCode )
+            if code is None or buf.len % BYTE_SIZES[typeCode]:
+                raise TypeError(
+                    """Can't view %s byte buffer as %s"""%( buf.len, typeCode, )
+                )
+            if isinstance( value, _buffers.Py_buffer ):
+                return buf
+            return _buffers.Py_buffer.from_object(
+                memoryview( value ).cast( 'B' ).cast( code )
+            )
+        @classmethod
+        def convert( cls, value, buf, typeCode ):
+            """Copy a typed buffer into a new array of typeCode"""
+            if cls.ERROR_ON_COPY:
+                raise error.CopyError(
+                    """%s buffer of format %r would have to be copied to %s"""%(
+                        type(value).__name__, buf.format, typeCode,
+                    )
+                )
+            code = GL_TYPE_TO_FORMAT.get( typeCode )
+            if code not in array.typecodes or isinstance( value, _buffers.Py_buffer ):
+                raise TypeError(
+                    """Can't convert buffer of format %r to %s"""%( buf.format, typeCode )
+                )
+            view = memoryview( value )
+            flat = view.cast( 'B' ).cast( view.format )
+            copy = array.array( code, flat )
+            if view.ndim > 1:
+                copy = memoryview( copy ).cast( 'B' ).cast( code, view.shape )
+            return _buffers.Py_buffer.from_object( copy )
         @classmethod
         def dimensions( cls, value, typeCode=None ):
             """Determine dimensions of the passed array value (if possible)"""
-            return value.dims
+            return asBuffer( value ).dims
 
 ARRAY_TO_GL_TYPE_MAPPING = _buffers.ARRAY_TO_GL_TYPE_MAPPING
 BYTE_SIZES = _buffers.BYTE_SIZES
+
+def asBuffer( value ):
+    """Return value as a Py_buffer (without copying), if it isn't one already"""
+    if isinstance( value, _buffers.Py_buffer ):
+        return value
+    return _buffers.Py_buffer.from_object( value )
+
+def _formatTable():
+    """Map (format character, itemsize) to the matching OpenGL type"""
+    table = {}
+    for kind, types in (
+        ('bhilq', (GL_BYTE,GL_SHORT,GL_INT)),
+        ('BHILQ', (GL_UNSIGNED_BYTE,GL_UNSIGNED_SHORT,GL_UNSIGNED_INT,GL_UNSIGNED_INT64)),
+        ('efd', (GL_HALF_FLOAT,GL_FLOAT,GL_DOUBLE)),
+        ('c?', (GL_UNSIGNED_BYTE,)),
+    ):
+        for glType in types:
+            for character in kind:
+                table[(character,BYTE_SIZES[glType])] = glType
+    return table
+_FORMAT_TABLE = _formatTable()
+_FORMAT_CACHE = {}
+
+def formatToGLType( format, itemsize ):
+    """Given a buffer format string and item size, return the OpenGL type
+
+    Byte-order and native-alignment prefixes are ignored, the format
+    character is checked against the item size, as 'l' and 'L' are
+    8 bytes wide on most 64-bit platforms.
+    """
+    key = (format,itemsize)
+    try:
+        return _FORMAT_CACHE[key]
+    except KeyError:
+        pass
+    character = format
+    if isinstance( character, bytes ):
+        character = character.decode( 'latin-1' )
+    character = (character or 'B').lstrip( '@=<>!' )
+    try:
+        glType = _FORMAT_TABLE[(character,itemsize)]
+    except KeyError:
+        raise TypeError( 'Unknown format: %r'%(format,))
+    _FORMAT_CACHE[key] = glType
+    return glType
+
+# Byte buffers carry no type information of their own...
+UNTYPED_GL_TYPES = (GL_UNSIGNED_BYTE,GL_BYTE)
+GL_TYPE_TO_FORMAT = {
+    GL_BYTE: 'b',
+    GL_UNSIGNED_BYTE: 'B',
+    GL_SHORT: 'h',
+    GL_UNSIGNED_SHORT: 'H',
+    GL_INT: 'i',
+    GL_UNSIGNED_INT: 'I',
+    GL_UNSIGNED_INT64: 'Q',
+    GL_HALF_FLOAT: 'e',
+    GL_FLOAT: 'f',
+    GL_DOUBLE: 'd',
+}
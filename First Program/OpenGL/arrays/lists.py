@@ -8,6 +8,7 @@ Note:
 """
 REGISTRY_NAME = 'lists'
 import ctypes, _ctypes
+import array, itertools
 # Note: these are the same definitions as for GLES, so we are not cross-polluting
 from OpenGL.raw.GL import _types 
 from OpenGL.arrays import _arrayconstants as GL_1_1
@@ -142,6 +143,9 @@ class ListHandler( formathandler.FormatHandler ):
             raise NotImplementedError( """Haven't implemented type-inference for lists yet""" )
         arrayType = GL_TYPE_TO_ARRAY_MAPPING[ typeCode ]
         if isinstance( value, (list,tuple)):
+            result = cls.bulkArray( value, typeCode )
+            if result is not None:
+                return result
             subItems = [
                 cls.asArray( item, typeCode )
                 for item in value
@@ -155,6 +159,55 @@ class ListHandler( formathandler.FormatHandler ):
                 return result
         else:
             return arrayType( value )
+    @classmethod
+    def bulkArray( cls, value, typeCode ):
+        """Convert a uniform nested list of numbers in a single pass
+
+        The shape is taken from the first element at each level, every
+        sub-sequence is checked against it with C-level len() calls, and
+        the flattened numbers are packed by array.array, then copied into
+        the ctypes array in one go.
+
+        Returns None for anything this can't handle (ragged or empty
+        lists, non-numeric items, types array.array doesn't have), the
+        caller then falls back to the element-by-element conversion.
+        """
+        code = GL_TYPE_TO_ARRAY_CODE.get( typeCode )
+        if code is None:
+            return None
+        dims = []
+        level = value
+        while isinstance( level, HANDLED_TYPES ):
+            if not level:
+                return None
+            dims.append( len(level) )
+            level = level[0]
+        items = value
+        try:
+            last = len(dims) - 1
+            for depth in range( 1, len(dims) ):
+                if set( map( len, items ) ) != set( (dims[depth],) ):
+                    return None
+                items = itertools.chain.from_iterable( items )
+                if depth < last:
+                    items = list( items )
+            data = array.array( code, items )
+        except (TypeError,ValueError,OverflowError) as err:
+            return None
+        return cls.arrayType( typeCode, dims ).from_buffer_copy( data )
+    @classmethod
+    def arrayType( cls, typeCode, dims ):
+        """Return (cached) ctypes array type of typeCode with given dims"""
+        key = (typeCode,tuple(dims))
+        arrayType = _ARRAY_TYPE_CACHE.get( key )
+        if arrayType is None:
+            if len(_ARRAY_TYPE_CACHE) >= MAX_CACHED_ARRAY_TYPES:
+                _ARRAY_TYPE_CACHE.clear()
+            arrayType = GL_TYPE_TO_ARRAY_MAPPING[ typeCode ]
+            for dim in dims[::-1]:
+                arrayType *= dim
+            _ARRAY_TYPE_CACHE[key] = arrayType
+        return arrayType
     @err_on_copy
     @classmethod
     def unitSize( cls, value, typeCode=None ):
@@ -204,3 +257,27 @@ GL_TYPE_TO_ARRAY_MAPPING = {
     'B': _types.GLubyte,
     's': _types.GLchar,
 }
+
+# array.array type codes matching the ctypes types above, for bulkArray
+GL_TYPE_TO_ARRAY_CODE = {
+    GL_1_1.GL_DOUBLE: 'd',
+    GL_1_1.GL_FLOAT: 'f',
+    GL_1_1.GL_INT: 'i',
+    GL_1_1.GL_UNSIGNED_INT: 'I',
+    GL_1_1.GL_SHORT: 'h',
+    GL_1_1.GL_UNSIGNED_SHORT: 'H',
+    GL_1_1.GL_BYTE: 'b',
+    GL_1_1.GL_UNSIGNED_BYTE: 'B',
+    'f': 'f',
+    'd': 'd',
+    'i': 'i',
+    'I': 'I',
+    'h': 'h',
+    'H': 'H',
+    'b': 'b',
+    'B': 'B',
+}
+
+# ctypes array types built by bulkArray, keyed by (typeCode,dims)
+_ARRAY_TYPE_CACHE = {}
+MAX_CACHED_ARRAY_TYPES = 256
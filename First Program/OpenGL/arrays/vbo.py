@@ -29,18 +29,30 @@ usage of VBO objects:
 
 This implementation will choose either the ARB or Core (OpenGL 1.5) 
 implementation of the VBO functions.
+
+For geometry which is rebuilt every frame, StreamingVBO writes each
+frame's data into the next free region of a single large buffer
+instead of re-uploading a whole buffer:
+
+    stream = vbo.StreamingVBO( 4*1024*1024 )
+    ...
+    offset = stream.write( my_data )
+    glVertexPointer( 3, GL_FLOAT, 0, stream + offset )
+    glDrawArrays( GL_TRIANGLES, 0, len(my_data) )
+    ...
+    stream.fence() # once per frame, after the draws
 """
 from OpenGL.arrays.arraydatatype import ArrayDatatype
 from OpenGL.arrays.formathandler import FormatHandler
 from OpenGL.raw.GL import _types 
 from OpenGL import error
 from OpenGL._bytes import bytes,unicode,as_8_bit
-import ctypes,logging
+import ctypes,logging,operator
 _log = logging.getLogger( 'OpenGL.arrays.vbo' )
 from OpenGL._bytes import long, integer_types
 
 import weakref
-__all__ = ('VBO','VBOHandler','mapVBO')
+__all__ = ('VBO','VBOHandler','StreamingVBO','mapVBO')
 
 class Implementation( object ):
     """Abstraction point for the various implementations that can be used
@@ -82,6 +94,18 @@ class Implementation( object ):
     GL_UNIFORM_BUFFER
     GL_TEXTURE_BUFFER
     GL_TRANSFORM_FEEDBACK_BUFFER'''.split()
+    # only available on some GL versions, None if missing
+    OPTIONAL_NAMES = '''glMapBufferRange
+    GL_MAP_WRITE_BIT
+    GL_MAP_INVALIDATE_RANGE_BIT
+    GL_MAP_UNSYNCHRONIZED_BIT
+    glFenceSync
+    glClientWaitSync
+    glDeleteSync
+    GL_SYNC_GPU_COMMANDS_COMPLETE
+    GL_SYNC_FLUSH_COMMANDS_BIT
+    GL_TIMEOUT_EXPIRED
+    GL_WAIT_FAILED'''.split()
     available = False
     def _arbname( self, name ):
         return (
@@ -151,6 +175,12 @@ if VBO is None:
         """
         copied = False
         _no_cache_ = True # do not cache in context data arrays
+        # dirty ranges closer than this many bytes are uploaded as one
+        coalesce_gap = 256
+        # more than this fraction of the buffer dirty re-uploads all of it
+        full_upload_ratio = 0.5
+        # more than this many separate dirty ranges re-uploads all of it
+        max_segments = 32
         def __init__(
             self, data, usage='GL_DYNAMIC_DRAW',
             target='GL_ARRAY_BUFFER', size=None,
@@ -197,6 +227,8 @@ if VBO is None:
             self.target = target
             self.buffers = []
             self._copy_segments = []
+            self.uploaded_bytes = 0
+            self.upload_calls = 0
         _I_ = None
         implementation = property( get_implementation, )
         def resolve( self, value ):
@@ -214,6 +246,7 @@ if VBO is None:
             """
             self.data = data
             self.copied = False
+            self._copy_segments = []
             if size is not None:
                 self.size = size
             elif self.data is not None:
@@ -221,59 +254,104 @@ if VBO is None:
         def __setitem__( self, slice, array):
             """Set slice of data on the array and vbo (if copied already)
 
-            slice -- the Python slice object determining how the data should
-                be copied into the vbo/array
+            slice -- the Python slice object (or index, or tuple starting
+                with one) determining how the data should be copied into
+                the vbo/array, stepped slices are supported
             array -- something array-compatible that will be used as the
                 source of the data, note that the data-format will have to
                 be the same as the internal data-array to work properly, if
                 not, the amount of data copied will be wrong.
 
-            This is a reasonably complex operation, it has to have all sorts
-            of state-aware changes to correctly map the source into the low-level
-            OpenGL view of the buffer (which is just bytes as far as the GL
-            is concerned).
+            The array is updated immediately, the rows touched are
+            recorded as dirty byte ranges which copy_data uploads
+            (merged, see coalesce_segments) at the next bind.
             """
-            if slice.step and not slice.step == 1:
-                raise NotImplemented( """Don't know how to map stepped arrays yet""" )
-            # TODO: handle e.g. mapping character data into an integer data-set
             data = ArrayDatatype.asArray( array )
-            data_length = ArrayDatatype.arrayByteCount( array )
-            start = (slice.start or 0)
-            stop = (slice.stop or len(self.data))
-            if start < 0:
-                start += len(self.data)
-                start = max((start,0))
-            if stop < 0:
-                stop += len(self.data)
-                stop = max((stop,0))
             self.data[ slice ] = data
             if self.copied and self.buffers:
-                if start-stop == len(self.data):
+                rows = self.dirty_rows( slice )
+                if rows is None:
                     # re-copy the whole data-set
                     self.copied = False
-                elif len(data):
-                    # now the fun part, we need to make the array match the
-                    # structure of the array we're going to copy into and make
-                    # the "size" parameter match the value we're going to copy in,
-                    # note that a 2D array (rather than a 1D array) may require
-                    # multiple mappings to copy into the memory area...
-
-                    # find the step size from the dimensions and base size...
-                    size = ArrayDatatype.arrayByteCount( self.data[0] )
-                    #baseSize = ArrayDatatype.unitSize( data )
-                    # now create the start and distance values...
-                    start *= size
-                    stop *= size
-                    # wait until the last moment (bind) to copy the data...
-                    self._copy_segments.append(
-                        (start,(stop-start), data)
+                    return
+                start,stop,step = rows
+                if start >= stop:
+                    return
+                # the GL's view of the buffer is just bytes...
+                size = ArrayDatatype.arrayByteCount( self.data ) // len( self.data )
+                if step == 1 or (step-1)*size <= self.coalesce_gap:
+                    self._copy_segments.append( (start*size, (stop-1-(stop-1-start)%step+1)*size) )
+                elif (stop-start)//step > self.max_segments:
+                    self.copied = False
+                else:
+                    self._copy_segments.extend(
+                        (row*size, (row+1)*size)
+                        for row in range( start, stop, step )
                     )
+        def dirty_rows( self, key ):
+            """Rows of our data touched by data[key]
+
+            returns (start,stop,step) with step > 0, or None if key is not
+            a slice/index (e.g. a mask) so all rows must be assumed dirty
+            """
+            if isinstance( key, tuple ):
+                key = key[0] if key else None
+            length = len( self.data )
+            try:
+                index = operator.index( key )
+            except TypeError as err:
+                pass
+            else:
+                if index < 0:
+                    index += length
+                return index, index+1, 1
+            if not hasattr( key, 'indices' ):
+                return None
+            start,stop,step = key.indices( length )
+            if step < 0:
+                rows = range( start, stop, step )
+                if not len( rows ):
+                    return 0,0,1
+                start,stop,step = rows[-1], rows[0]+1, -step
+            return start,stop,step
+        def coalesce_segments( self ):
+            """Merge our dirty byte ranges into as few uploads as reasonable
+
+            Ranges closer than coalesce_gap bytes are merged (re-sending
+            the bytes between them from our data-array).  Returns sorted
+            (start,stop) ranges, or None if a full upload is cheaper (more
+            than full_upload_ratio of the buffer dirty, or more than
+            max_segments ranges).
+            """
+            merged = []
+            for start,stop in sorted( self._copy_segments ):
+                if merged and start <= merged[-1][1] + self.coalesce_gap:
+                    if stop > merged[-1][1]:
+                        merged[-1][1] = stop
+                else:
+                    merged.append( [start,stop] )
+            if len( merged ) > self.max_segments:
+                return None
+            if sum( [stop-start for (start,stop) in merged] ) > self.size * self.full_upload_ratio:
+                return None
+            return merged
+        def reset_statistics( self ):
+            """Return (bytes, calls) uploaded since the last reset and restart counting
+
+            Call once per frame to see what each frame sent to the GL.
+            """
+            result = (self.uploaded_bytes, self.upload_calls)
+            self.uploaded_bytes = self.upload_calls = 0
+            return result
         def __len__( self ):
             """Delegate length/truth checks to our data-array"""
             return len( self.data )
         def __getattr__( self, key ):
             """Delegate failing attribute lookups to our data-array"""
-            if key not in ('data','usage','target','buffers', 'copied','_I_','implementation','_copy_segments' ):
+            if key not in (
+                'data','usage','target','buffers', 'copied','_I_','implementation','_copy_segments',
+                'uploaded_bytes','upload_calls',
+            ):
                 return getattr( self.data, key )
             else:
                 raise AttributeError( key )
@@ -291,16 +369,24 @@ if VBO is None:
             Ensures that the GL's version of the data in the VBO matches our 
             internal view of the data, either by copying the entire data-set 
             over with glBufferData or by updating the already-transferred 
-            data with glBufferSubData.
+            data with glBufferSubData, one call per coalesced dirty range.
             """
             assert self.buffers, """Should do create_buffers before copy_data"""
             if self.copied:
                 if self._copy_segments:
-                    while self._copy_segments:
-                        start,size,data  = self._copy_segments.pop(0)
-                        dataptr = ArrayDatatype.voidDataPointer( data )
-                        self.implementation.glBufferSubData(self.target, start, size, dataptr)
-            else:
+                    segments = self.coalesce_segments()
+                    self._copy_segments = []
+                    if segments is None:
+                        self.copied = False
+                    else:
+                        base = ArrayDatatype.dataPointer( self.data )
+                        for start,stop in segments:
+                            self.implementation.glBufferSubData(
+                                self.target, start, stop-start, ctypes.c_void_p( base+start ),
+                            )
+                            self.uploaded_bytes += stop-start
+                        self.upload_calls += len( segments )
+            if not self.copied:
                 if self.data is not None and self.size is None:
                     self.size = ArrayDatatype.arrayByteCount( self.data )
                 self.implementation.glBufferData(
@@ -310,6 +396,9 @@ if VBO is None:
                     self.usage,
                 )
                 self.copied = True
+                self._copy_segments = []
+                self.uploaded_bytes += self.size or 0
+                self.upload_calls += 1
         def delete( self ):
             """Delete this buffer explicitly"""
             if self.buffers:
@@ -430,6 +519,240 @@ if VBO is None:
             """Returns a c_void_p( instance.offset )"""
             return ctypes.c_void_p( instance.offset )
 
+class StreamingVBO( object ):
+    """Ring buffer for geometry which changes every frame (particles, UI...)
+
+    A single buffer of size bytes is allocated once, each write() or
+    map() takes the next free region of it.  Call fence() at the end of
+    each frame: regions are only written again once the GL has finished
+    drawing from them.  When the GL has sync objects (3.2 or
+    ARB_sync) and glMapBufferRange (3.0 or ARB_map_buffer_range) writes
+    go straight into the buffer through unsynchronized mappings, with a
+    fence per frame.  Otherwise the buffer is orphaned (re-specified
+    with glBufferData) whenever the ring wraps around, and data is
+    uploaded with glBufferSubData.
+
+    write() and map() bind the buffer to target.  Pass stream + offset
+    (a VBOOffset) to the pointer functions to draw from a region.
+    """
+    _no_cache_ = True # do not cache in context data arrays
+    def __init__(
+        self, size, usage='GL_STREAM_DRAW',
+        target='GL_ARRAY_BUFFER', alignment=16,
+    ):
+        """Initialize the stream (the GL buffer is created on first use)
+
+        size -- bytes in the buffer, should hold a few frames of data
+        usage -- OpenGL usage constant, see VBO
+        target -- VBO target to which to bind, see VBO
+        alignment -- regions start at multiples of this many bytes
+        """
+        self.size = size
+        self.usage = usage
+        self.target = target
+        self.alignment = alignment
+        self.buffers = []
+        self.head = 0
+        self.frameStart = 0
+        self.fences = [] # (start,stop,sync) oldest first
+        self.mapped = None
+    implementation = property( get_implementation, )
+    def resolve( self, value ):
+        """Resolve string constant to constant"""
+        if isinstance( value, (bytes,unicode)):
+            return getattr( self.implementation, self.implementation.basename( value ) )
+        return value
+    @property
+    def synchronized( self ):
+        """Whether we write through unsynchronized mappings guarded by fences"""
+        implementation = self.implementation
+        return bool(
+            implementation.glMapBufferRange and implementation.glFenceSync
+        )
+    def create_buffers( self ):
+        """Create the internal buffer and allocate its storage"""
+        assert not self.buffers, """Already created the buffer"""
+        self.buffers = [ long(self.implementation.glGenBuffers(1)) ]
+        self.target = self.resolve( self.target )
+        self.usage = self.resolve( self.usage )
+        self.implementation._DELETERS_[ id(self) ] = weakref.ref( self, self.implementation.deleter( self.buffers, id(self) ))
+        self.implementation.glBindBuffer( self.target, self.buffers[0] )
+        self.orphan()
+        return self.buffers
+    def orphan( self ):
+        """Give the (bound) buffer new storage, the GL keeps the old one while in use"""
+        self.implementation.glBufferData( self.target, self.size, None, self.usage )
+        self.discardFences()
+        self.head = self.frameStart = 0
+    def bind( self ):
+        """Bind the buffer (creating it if necessary)"""
+        if not self.buffers:
+            self.create_buffers()
+        else:
+            self.implementation.glBindBuffer( self.target, self.buffers[0] )
+    def unbind( self ):
+        """Unbind the buffer (make normal array operations active)"""
+        self.implementation.glBindBuffer( self.target, 0 )
+    __enter__ = bind
+    def __exit__( self, exc_type=None, exc_val=None, exc_tb=None ):
+        """Context manager exit"""
+        self.unbind()
+        return False # do not supress exceptions...
+
+    def allocate( self, size ):
+        """Reserve size bytes for writing, return the offset of the region
+
+        Waits for the GL to finish with any fenced region the new one
+        would overwrite (or orphans the buffer when wrapping without
+        fences).  Binds the buffer.
+        """
+        if size > self.size:
+            raise ValueError(
+                """Region of %s bytes does not fit in %s byte StreamingVBO"""%(
+                    size, self.size,
+                )
+            )
+        self.bind()
+        start = -( -self.head//self.alignment ) * self.alignment
+        if start + size > self.size:
+            if not self.synchronized:
+                self.orphan()
+                self.head = size
+                return 0
+            # data written since the last fence must be fenced as well
+            self.fence()
+            start = self.frameStart = 0
+        stop = start + size
+        while self.fences and any(
+            fenceStart < stop and start < fenceStop
+            for (fenceStart,fenceStop,sync) in self.fences
+        ):
+            self.waitFence( self.fences.pop(0)[2] )
+        self.head = stop
+        return start
+    def write( self, data, size=None ):
+        """Copy data into the next free region, return the region's offset
+
+        data -- PyOpenGL-compatible array-data structure
+        size -- if not provided, ArrayDatatype.arrayByteCount( data )
+        """
+        data = ArrayDatatype.asArray( data )
+        if size is None:
+            size = ArrayDatatype.arrayByteCount( data )
+        offset = self.allocate( size )
+        if self.synchronized:
+            pointer = self.mapRange( offset, size )
+            try:
+                ctypes.memmove( pointer, ArrayDatatype.voidDataPointer( data ), size )
+            finally:
+                self.implementation.glUnmapBuffer( self.target )
+        else:
+            self.implementation.glBufferSubData(
+                self.target, offset, size, ArrayDatatype.voidDataPointer( data ),
+            )
+        return offset
+    def map( self, shape, dtype='f' ):
+        """Reserve a region, return (offset, numpy array) to write into in place
+
+        The array must be filled before calling unmap(), and must not be
+        used afterwards.  Without glMapBufferRange the array is a
+        scratch array which unmap() uploads.
+        """
+        import numpy
+        if self.mapped is not None:
+            raise RuntimeError( """StreamingVBO is already mapped""" )
+        dtype = numpy.dtype( dtype )
+        size = int( numpy.prod( shape ) ) * dtype.itemsize
+        offset = self.allocate( size )
+        if self.synchronized:
+            pointer = self.mapRange( offset, size )
+            array = numpy.frombuffer(
+                (ctypes.c_byte*size).from_address( pointer ), dtype,
+            ).reshape( shape )
+        else:
+            array = numpy.empty( shape, dtype )
+        self.mapped = (offset, size, array)
+        return offset, array
+    def unmap( self ):
+        """Finish writing the region returned by map()"""
+        if self.mapped is None:
+            return
+        offset, size, array = self.mapped
+        self.mapped = None
+        self.bind()
+        if self.synchronized:
+            self.implementation.glUnmapBuffer( self.target )
+        else:
+            self.implementation.glBufferSubData( self.target, offset, size, array )
+    def mapRange( self, offset, size ):
+        """Map region for unsynchronized writing, return its address"""
+        implementation = self.implementation
+        pointer = implementation.glMapBufferRange(
+            self.target, offset, size,
+            implementation.GL_MAP_WRITE_BIT | 
+            implementation.GL_MAP_INVALIDATE_RANGE_BIT | 
+            implementation.GL_MAP_UNSYNCHRONIZED_BIT,
+        )
+        if not pointer:
+            raise error.GLError(
+                0, """Unable to map %s bytes at %s of StreamingVBO"""%( size, offset ),
+            )
+        return pointer
+
+    def fence( self ):
+        """Mark the end of a frame's writes (call after the frame's draws)
+
+        The GL signals the fence once it has finished with everything
+        written since the previous fence.
+        """
+        if self.head != self.frameStart and self.synchronized:
+            implementation = self.implementation
+            sync = implementation.glFenceSync(
+                implementation.GL_SYNC_GPU_COMMANDS_COMPLETE, 0,
+            )
+            self.fences.append( (self.frameStart, self.head, sync) )
+        self.frameStart = self.head
+    def waitFence( self, sync ):
+        """Block until the GL signals sync, then delete it"""
+        implementation = self.implementation
+        while implementation.glClientWaitSync(
+            sync, implementation.GL_SYNC_FLUSH_COMMANDS_BIT, 1000000000,
+        ) == implementation.GL_TIMEOUT_EXPIRED:
+            pass
+        implementation.glDeleteSync( sync )
+    def discardFences( self ):
+        """Delete all outstanding fences without waiting for them"""
+        while self.fences:
+            self.implementation.glDeleteSync( self.fences.pop()[2] )
+    def delete( self ):
+        """Delete the buffer and any fences explicitly"""
+        if self.mapped is not None:
+            self.unmap()
+        try:
+            self.discardFences()
+        except (AttributeError,error.NullFunctionError) as err:
+            pass
+        while self.buffers:
+            try:
+                self.implementation.glDeleteBuffers(1, self.buffers.pop(0))
+            except (AttributeError,error.NullFunctionError) as err:
+                pass
+        # nothing left for the weakref deleter to do (at exit, without a context)
+        self.implementation._DELETERS_.pop( id(self), None )
+        self.head = self.frameStart = 0
+
+    def __int__( self ):
+        """Get our VBO id"""
+        if not self.buffers:
+            self.create_buffers()
+        return self.buffers[0]
+    def __add__( self, other ):
+        """Add an integer to this stream (create a VBOOffset)"""
+        if hasattr( other, 'offset' ):
+            other = other.offset
+        assert isinstance( other, integer_types ), """Only know how to add integer/long offsets"""
+        return VBOOffset( self, other )
+
 _cleaners = {}
 def _cleaner( vbo ):
     """Construct a mapped-array cleaner function to unmap vbo.target"""
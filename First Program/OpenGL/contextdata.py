@@ -17,8 +17,20 @@ setting:
     OpenGL.STORE_POINTERS = False 
         
 before importing OpenGL functionality.
+
+Values for the pointer constants stored on every pointer-setting call
+(glVertexPointer and friends) are kept in per-context lists, indexed
+by a slot number allocated once per constant (see slotFor), rather
+than in the per-context dictionaries.
+
+With OpenGL.CACHE_CURRENT_CONTEXT set, the current context is only
+queried from the platform once per thread, and is then re-used until
+a make-current operation (eglMakeCurrent, glXMakeCurrent, glutSetWindow
+...) is called through PyOpenGL.  Code which switches contexts some
+other way (e.g. through a GUI library) must call contextChanged().
 """
-from OpenGL import platform
+from OpenGL import platform, _configflags
+import threading
 import weakref
 storedPointers = {
     # map from contextID: { constant: value }
@@ -27,6 +39,22 @@ storedWeakPointers = {
     # map from contextID: WeakValueDictionary({ constant: value })
 }
 STORAGES = [ storedPointers, storedWeakPointers ]
+storedSlots = {
+    # map from contextID: [ value, ... ] indexed by SLOTS[constant]
+}
+SLOTS = {
+    # map from constant: slot index
+}
+_current = threading.local()
+
+def contextChanged( ):
+    """Forget the current context cached for this thread
+
+    Called after every make-current operation when
+    OpenGL.CACHE_CURRENT_CONTEXT is set, call it yourself if you
+    change the current context without going through PyOpenGL.
+    """
+    _current.context = None
 
 def getContext( context = None ):
     """Get the context (if passed, just return)
@@ -34,7 +62,14 @@ def getContext( context = None ):
     context -- the context ID, if None, the current context
     """
     if context is None:
-        context = platform.GetCurrentContext()
+        if _configflags.CACHE_CURRENT_CONTEXT:
+            context = getattr( _current, 'context', None )
+            if context is None:
+                context = platform.GetCurrentContext()
+                if context:
+                    _current.context = context
+        else:
+            context = platform.GetCurrentContext()
         if context == 0:
             from OpenGL import error
             raise error.Error(
@@ -55,6 +90,10 @@ def setValue( constant, value, context=None, weak=False ):
     """
     if getattr( value, '_no_cache_', False ):
         return 
+    if not weak:
+        slot = SLOTS.get( constant )
+        if slot is not None:
+            return setSlot( slot, value, context )
     context = getContext( context )
     if weak:
         storage = storedWeakPointers
@@ -76,6 +115,41 @@ def setValue( constant, value, context=None, weak=False ):
         # is being stored with weak == True
         current[ constant ] = value 
     return previous
+
+def slotFor( constant ):
+    """Get the slot index used to store values for constant
+
+    Allocates a new slot the first time a constant is seen, from then
+    on setValue, getValue and delValue use the slot as well, so
+    existing code needn't know which constants are slotted.
+    """
+    slot = SLOTS.get( constant )
+    if slot is None:
+        slot = SLOTS[ constant ] = len( SLOTS )
+    return slot
+def setSlot( slot, value, context=None ):
+    """Set the stored value for a slot (see slotFor) in the given context
+
+    Returns the previous value, a value of None clears the slot.
+    """
+    if getattr( value, '_no_cache_', False ):
+        return 
+    context = getContext( context )
+    current = storedSlots.get( context )
+    if current is None:
+        current = storedSlots[ context ] = [None] * len( SLOTS )
+    elif slot >= len( current ):
+        current.extend( [None] * ( len( SLOTS ) - len( current ) ) )
+    previous = current[ slot ]
+    current[ slot ] = value
+    return previous
+def getSlot( slot, context=None ):
+    """Get the stored value for a slot (see slotFor) in the given context"""
+    current = storedSlots.get( getContext( context ) )
+    if current is None or slot >= len( current ):
+        return None
+    return current[ slot ]
+
 def delValue( constant, context=None ):
     """Delete the specified value for the given context
     
@@ -84,6 +158,9 @@ def delValue( constant, context=None ):
     """
     context = getContext( context )
     found = False
+    slot = SLOTS.get( constant )
+    if slot is not None:
+        found = setSlot( slot, None, context ) is not None
     for storage in STORAGES:
         contextStorage = storage.get( context  )
         if contextStorage:
@@ -101,6 +178,11 @@ def getValue( constant, context = None ):
     context -- the context ID, if None, the current context
     """
     context = getContext( context )
+    slot = SLOTS.get( constant )
+    if slot is not None:
+        value = getSlot( slot, context )
+        if value is not None:
+            return value
     for storage in STORAGES:
         contextStorage = storage.get( context  )
         if contextStorage:
@@ -122,10 +204,12 @@ def cleanupContext( context=None ):
     """
     if context is None:
         context = platform.GetCurrentContext()
-    for storage in STORAGES:
+    found = False
+    for storage in STORAGES + [ storedSlots ]:
         try:
-            del storedPointers[ context ]
+            del storage[ context ]
         except KeyError as err:
-            return False
+            pass
         else:
-            return True
+            found = True
+    return found
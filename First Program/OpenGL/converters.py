@@ -190,10 +190,24 @@ if CallFuncPyConverter is None:
         indexLookups = [
             ('outIndex','name', 'cArgIndex' ),
         ]
-        __slots__ = ('index','size','arrayType','outIndex','inIndex')
+        __slots__ = ('index','size','arrayType','outIndex','inIndex','getHandler')
         def __call__( self, pyArgs, index, baseOperation ):
             """Return pyArgs[ self.index ]"""
             return self.arrayType.zeros( self.getSize(pyArgs) )
+        def asInputArray( self, value ):
+            """Convert a passed-in value (instead of an output) to our arrayType
+            
+            Uses a HandlerCache for this converter, so a repeated type of 
+            value skips the handler registry.
+            """
+            try:
+                getHandler = self.getHandler
+            except AttributeError:
+                from OpenGL.arrays import arraydatatype
+                getHandler = self.getHandler = arraydatatype.HandlerCache(
+                    self.arrayType.getRegistry()
+                )
+            return getHandler( value ).asArray( value, self.arrayType.typeConstant )
         def getSize( self, pyArgs ):
             """Retrieve the array size for this argument"""
             return self.size
@@ -217,7 +231,7 @@ if CallFuncPyConverter is None:
             for do_output in self.DO_OUTPUT:
                 if pyArgs[index] is do_output:
                     return super( OutputOrInput,self ).__call__( pyArgs, index, baseOperation )
-            return self.arrayType.asArray( pyArgs[index] )
+            return self.asInputArray( pyArgs[index] )
 
     class SizedOutput( Output ):
         """Output generating dynamically-sized typed output arrays
@@ -249,7 +263,7 @@ if CallFuncPyConverter is None:
             for do_output in self.DO_OUTPUT:
                 if pyArgs[index] is do_output:
                     return super( SizedOutputOrInput,self ).__call__( pyArgs, index, baseOperation )
-            return self.arrayType.asArray( pyArgs[index] )
+            return self.asInputArray( pyArgs[index] )
     class returnCArgument( ReturnValues ):
         """ReturnValues returning the named cArgs value"""
         argNames = ('name',)
@@ -6,7 +6,14 @@ such as TypeError or ValueError when appropriate.
 ErrorChecker is an _ErrorChecker instance that allows you
 to register a new error-checking function for use 
 throughout the system.
+
+With OpenGL.ERROR_CHECKING_DEFERRED set, error checkers do 
+not call glGetError after every call, instead they remember 
+the last few calls and poll for errors at checkpoints: every 
+_ErrorChecker.checkInterval calls, at glutSwapBuffers, on 
+calling checkpoint() or on leaving a checkedScope() block.
 """
+import collections, contextlib
 import logging
 _log = logging.getLogger( 'OpenGL.error' )
 from OpenGL import platform, _configflags
@@ -14,6 +21,7 @@ from ctypes import ArgumentError
 __all__ = (
     "Error",'GLError','GLUError','GLUTError',
     'GLerror','GLUerror','GLUTerror','ArgumentError',
+    'checkpoint','checkedScope',
 )
 
 class Error( Exception ):
@@ -57,6 +65,11 @@ class GLError( Error ):
         cArguments -- ctypes-level arguments to the operation,
             often raw integers for pointers and the like
         description -- OpenGL description of the error (textual)
+        checkpoint -- name of the checkpoint which found the error 
+            (deferred error checking only)
+        recentCalls -- (baseOperation, cArguments) for the calls 
+            made since the previous checkpoint, oldest first, the 
+            offending call is one of these (deferred error checking only)
     """
     def __init__( 
         self, 
@@ -67,16 +80,18 @@ class GLError( Error ):
         pyArgs=None, 
         cArgs=None,
         description=None,
+        checkpoint=None,
+        recentCalls=None,
     ):
         """Initialise the GLError, storing metadata for later display"""
         (
             self.err, self.result, self.cArguments, 
             self.baseOperation, self.pyArgs, self.cArgs,
-            self.description
+            self.description, self.checkpoint, self.recentCalls
         ) = (
             err, result, cArguments,
             baseOperation, pyArgs, cArgs,
-            description
+            description, checkpoint, recentCalls
         )
     DISPLAY_ORDER = (
         'err', 
@@ -86,6 +101,8 @@ class GLError( Error ):
         'cArgs',
         'cArguments',
         'result', 
+        'checkpoint',
+        'recentCalls',
     )
     def __str__( self ):
         """Create a fully formatted representation of the error"""
@@ -151,6 +168,18 @@ class GLError( Error ):
             return '%s = %s'%( property, value.__name__ )
         else:
             return '%s = %r'%( property, value )
+    def format_recentCalls( self, property, value ):
+        """Format the calls leading up to a deferred check, most recent last"""
+        calls = []
+        for baseOperation, cArguments in value:
+            arguments = repr( tuple(cArguments or ()) )
+            if len(arguments) >= 80:
+                arguments = arguments[:76] + '...)'
+            calls.append( '%s%s'%(
+                getattr( baseOperation, '__name__', baseOperation ),
+                arguments,
+            ))
+        return '%s = [\n\t\t%s\n\t]'%( property, ',\n\t\t'.join( calls ) )
 
 class GLUError( Error ):
     """GLU error implementation class"""
@@ -160,10 +189,16 @@ class GLUTError( Error ):
 class EGLError( GLError ):
     """EGL error implementation class"""
 
+# Error checkers running in deferred mode, polled by checkpoint()
+_deferredCheckers = []
+# Calls each deferred checker remembers since its last checkpoint; as 
+# long as the check interval is no larger the offending call is in there
+DEFERRED_HISTORY = 256
+
 if _configflags.ERROR_CHECKING:
     from OpenGL import acceleratesupport
     _ErrorChecker = None
-    if acceleratesupport.ACCELERATE_AVAILABLE:
+    if acceleratesupport.ACCELERATE_AVAILABLE and not _configflags.ERROR_CHECKING_DEFERRED:
         try:
             from OpenGL_accelerate.errorchecker import _ErrorChecker
         except ImportError as err:
@@ -176,8 +211,14 @@ if _configflags.ERROR_CHECKING:
                 _registeredChecker -- the checking function enabled when 
                     not doing onBegin/onEnd processing
                 _currentChecker -- currently active checking function
+                checkInterval -- in deferred mode, number of calls 
+                    after which errors are polled even without an 
+                    explicit checkpoint
+                _recentCalls -- in deferred mode, (baseOperation, 
+                    cArguments) of the calls since the last checkpoint
             """
             _getErrors = None
+            checkInterval = DEFERRED_HISTORY
             def __init__( self, platform, baseOperation=None, noErrorResult=0, errorClass=GLError ):
                 """Initialize from a platform module/reference"""
                 self._isValid = platform.CurrentContextIsValid
@@ -192,6 +233,13 @@ if _configflags.ERROR_CHECKING:
                 else:
                     self._registeredChecker = self.nullGetError
                 self._currentChecker = self._registeredChecker
+                self._callCount = 0
+                if _configflags.ERROR_CHECKING_DEFERRED and self._getErrors:
+                    # errcheck hooks are bound to glCheckError, so swap 
+                    # in the deferred version before any are installed
+                    self.glCheckError = self.deferredCheckError
+                    self._recentCalls = collections.deque( maxlen=DEFERRED_HISTORY )
+                    _deferredCheckers.append( self )
             def __bool__( self ):
                 """We are "true" if we actually do anything"""
                 if self._registeredChecker is self.nullGetError:
@@ -234,6 +282,46 @@ if _configflags.ERROR_CHECKING:
                         baseOperation = baseOperation,
                     )
                 return result
+            def deferredCheckError( 
+                self,
+                result,
+                baseOperation=None,
+                cArguments=None,
+                *args
+            ):
+                """Deferred-mode replacement for glCheckError
+                
+                Only records the call, errors are polled by checkpoint, 
+                which runs automatically every checkInterval calls.
+                """
+                self._recentCalls.append( (baseOperation, cArguments) )
+                self._callCount += 1
+                if self._callCount >= self.checkInterval:
+                    self.checkpoint( 'every %d calls'%(self.checkInterval,) )
+                return result
+            def checkpoint( self, name=None ):
+                """Poll for errors raised by the calls since the last checkpoint
+                
+                Raises our errorClass listing the calls since the last 
+                checkpoint as recentCalls (any of them may have raised 
+                the error, so no baseOperation is given).  Returns False 
+                without checking between glBegin and glEnd, True if 
+                there were no errors.
+                """
+                if self._currentChecker is self.nullGetError:
+                    return False
+                self._callCount = 0
+                err = self._currentChecker()
+                calls = list( self._recentCalls )
+                self._recentCalls.clear()
+                if err is not None and err != self._noErrorResult:
+                    raise self._errorClass(
+                        err,
+                        None,
+                        checkpoint = name,
+                        recentCalls = calls,
+                    )
+                return True
             def onBegin( self ):
                 """Called by glBegin to record the fact that glGetError won't work"""
                 self._currentChecker = self.nullGetError
@@ -242,6 +330,24 @@ if _configflags.ERROR_CHECKING:
                 self._currentChecker = self._registeredChecker
 else:
     _ErrorChecker = None
+
+def checkpoint( name=None ):
+    """Poll for errors now when using deferred error checking
+    
+    name -- description of the checkpoint, reported on the raised 
+        error (e.g. 'frame 12' or 'draw_scene')
+    
+    Does nothing unless OpenGL.ERROR_CHECKING_DEFERRED is set.
+    """
+    for checker in _deferredCheckers:
+        checker.checkpoint( name )
+
+@contextlib.contextmanager
+def checkedScope( name ):
+    """Context manager which calls checkpoint( name ) on leaving the block"""
+    yield
+    checkpoint( name )
+
 # Compatibility with PyOpenGL 2.x series
 GLUerror = GLUError
 GLerror = GLError 
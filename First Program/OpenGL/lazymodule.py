@@ -0,0 +1,203 @@
+"""On-demand loading of the names a package would otherwise star-import
+
+OpenGL.GL star-imports every core VERSION module, which builds a few
+thousand function wrappers and constants that most programs never use.
+Instead, the package can install() a pre-generated name index:
+
+    * constants are created straight from the index (they are cheap)
+    * functions are bound to LazyFunction stand-ins, which import their
+      real module on first call (or attribute access) and then replace
+      themselves in the package namespace
+    * other objects (modules, classes...) are bound if their source
+      module is already loaded, otherwise they are left for the module
+      __getattr__ (PEP 562) returned by install()
+
+Since every indexed name ends up as a module global, "from package
+import *" keeps working without touching the lazy modules.  The
+importer's copies stay stand-ins though (only the package namespace is
+updated), so each of their calls goes through LateBind.__call__; that is
+why OpenGL.GL only does this when OpenGL.LAZY_IMPORT is set.  Names the
+index doesn't know about are looked up by importing the lazy modules in
+order, so a stale index costs time, never correctness.
+
+Regenerate OpenGL/GL/_lazynames.py after changing the GL modules with:
+
+    python -m OpenGL.lazymodule
+"""
+import importlib, importlib.util, sys, types
+from OpenGL import constant
+from OpenGL.latebind import LateBind
+
+class LazyFunction( LateBind ):
+    """Stand-in for a function defined in a not-yet-imported module"""
+    def __init__( self, namespace, moduleName, name ):
+        self._namespace = namespace
+        self._moduleName = moduleName
+        self.__name__ = name
+    def finalise( self ):
+        """Import our module, bind the real function in its place"""
+        function = getattr( importlib.import_module( self._moduleName ), self.__name__ )
+        if self._namespace.get( self.__name__ ) is self:
+            self._namespace[ self.__name__ ] = function
+        return function
+    def __bool__( self ):
+        """Whether the real function is available"""
+        return bool( self.getFinalCall() )
+    __nonzero__ = __bool__
+    def __getattr__( self, key ):
+        """Forward attribute access (load, wrappedOperation, ...) to the real function"""
+        if key.startswith( '__' ):
+            raise AttributeError( key )
+        return getattr( self.getFinalCall(), key )
+    def __repr__( self ):
+        return '<%s %s from %s>'%( self.__class__.__name__, self.__name__, self._moduleName )
+
+def exportedNames( module ):
+    """Names "from module import *" would bind"""
+    names = getattr( module, '__all__', None )
+    if names is None:
+        names = [ name for name in vars( module ) if not name.startswith( '_' ) ]
+    return names
+
+def install( namespace, index ):
+    """Bind the names in index into namespace, return a module __getattr__
+
+    namespace -- the package's globals()
+    index -- module (or other object) with MODULES, FUNCTIONS, CONSTANTS
+        and OBJECTS attributes, see buildIndex
+    """
+    for moduleName, names in index.FUNCTIONS.items():
+        for name in names:
+            namespace[ name ] = LazyFunction( namespace, moduleName, name )
+    for moduleName, values in index.CONSTANTS.items():
+        for name, value in values:
+            namespace[ name ] = constant.Constant( name, value )
+    for name, sourceName, attribute in index.OBJECTS:
+        source = sys.modules.get( sourceName )
+        if source is not None:
+            namespace[ name ] = getattr( source, attribute ) if attribute else source
+    loaded = []
+    packageName = namespace[ '__name__' ]
+    def __getattr__( name ):
+        """Look for name in the lazy modules (PEP 562 hook)"""
+        if name.startswith( '__' ):
+            # star-imports ask for __all__, we leave them to use the globals
+            raise AttributeError( name )
+        if importlib.util.find_spec( '%s.%s'%( packageName, name ) ) is not None:
+            # a submodule, not one of the lazy names
+            return importlib.import_module( '%s.%s'%( packageName, name ) )
+        if not loaded:
+            loaded.append( True )
+            for moduleName in index.MODULES:
+                module = importlib.import_module( moduleName )
+                for exported in exportedNames( module ):
+                    if exported not in namespace:
+                        namespace[ exported ] = getattr( module, exported )
+        try:
+            return namespace[ name ]
+        except KeyError:
+            raise AttributeError(
+                """module %r has no attribute %r"""%( packageName, name )
+            )
+    return __getattr__
+
+def buildIndex( eagerModules, lazyModules ):
+    """Work out what a package gets from star-importing lazyModules
+
+    eagerModules -- modules star-imported before the lazy ones
+    lazyModules -- modules to be indexed, in star-import order
+
+    Names which end up bound to the same object (or an equal constant)
+    as the eager modules already provide are left out.
+    """
+    eager = {}
+    for moduleName in eagerModules:
+        module = importlib.import_module( moduleName )
+        for name in exportedNames( module ):
+            eager[ name ] = getattr( module, name )
+    final = {}
+    for moduleName in lazyModules:
+        module = importlib.import_module( moduleName )
+        for name in exportedNames( module ):
+            final[ name ] = (moduleName, getattr( module, name ))
+    functions, constants, objects = {}, {}, []
+    for name in sorted( final ):
+        moduleName, value = final[ name ]
+        current = eager.get( name )
+        if current is value:
+            continue
+        if isinstance( value, constant.Constant ):
+            if isinstance( current, constant.Constant ) and current == value:
+                continue
+            if isinstance( value, constant.NumericConstant ):
+                constants.setdefault( moduleName, [] ).append( (name, value) )
+        elif isinstance( value, types.ModuleType ):
+            objects.append( (name, value.__name__, None) )
+        elif isinstance( value, type ) and getattr( value, '__module__', None ):
+            objects.append( (name, value.__module__, value.__name__) )
+        elif callable( value ) and name.startswith( 'gl' ):
+            functions.setdefault( moduleName, [] ).append( name )
+    return {
+        'MODULES': tuple( lazyModules ),
+        'FUNCTIONS': functions,
+        'CONSTANTS': constants,
+        'OBJECTS': objects,
+    }
+
+def writeIndex( filename, index, description ):
+    """Write index as a Python module (see buildIndex)"""
+    lines = [
+        '"""%s\n\nGenerated by OpenGL.lazymodule, do not edit!\n"""'%( description, ),
+        'MODULES = (',
+    ]
+    lines.extend( '    %r,'%( name, ) for name in index['MODULES'] )
+    lines.append( ')' )
+    lines.append( 'FUNCTIONS = {' )
+    for moduleName in index['MODULES']:
+        names = index['FUNCTIONS'].get( moduleName )
+        if names:
+            lines.append( '    %r: ('%( moduleName, ) )
+            lines.extend( '        %r,'%( name, ) for name in names )
+            lines.append( '    ),' )
+    lines.append( '}' )
+    lines.append( 'CONSTANTS = {' )
+    for moduleName in index['MODULES']:
+        values = index['CONSTANTS'].get( moduleName )
+        if values:
+            lines.append( '    %r: ('%( moduleName, ) )
+            for name, value in values:
+                if isinstance( value, float ):
+                    lines.append( '        (%r,%r),'%( name, float( value ) ) )
+                elif value < 0:
+                    lines.append( '        (%r,-0x%X),'%( name, -int( value ) ) )
+                else:
+                    lines.append( '        (%r,0x%X),'%( name, int( value ) ) )
+            lines.append( '    ),' )
+    lines.append( '}' )
+    lines.append( 'OBJECTS = (' )
+    lines.extend( '    %r,'%( entry, ) for entry in index['OBJECTS'] )
+    lines.append( ')' )
+    with open( filename, 'w' ) as output:
+        output.write( '\n'.join( lines ) + '\n' )
+
+GL_EAGER_MODULES = (
+    'OpenGL.GL.VERSION.GL_1_1',
+    'OpenGL.GL.pointers',
+    'OpenGL.GL.images',
+    'OpenGL.GL.exceptional',
+    'OpenGL.GL.glget',
+)
+
+def main():
+    """Regenerate the OpenGL.GL name index"""
+    import os
+    import OpenGL.GL
+    index = buildIndex( GL_EAGER_MODULES, OpenGL.GL._LAZY_MODULES )
+    writeIndex(
+        os.path.join( os.path.dirname( OpenGL.GL.__file__ ), '_lazynames.py' ),
+        index,
+        'Names OpenGL.GL loads on demand from the core VERSION modules',
+    )
+
+if __name__ == "__main__":
+    main()
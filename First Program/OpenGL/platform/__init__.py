@@ -54,6 +54,9 @@ def _load( ):
     return plugin
 
 _load()
+if _configflags.RESOLUTION_CACHE:
+    from OpenGL.platform import resolutioncache as _resolutioncache
+    _resolutioncache.install( PLATFORM, _configflags.RESOLUTION_CACHE )
 
 def types(resultType,*argTypes):
     """Decorator to add returnType, argTypes and argNames to a function"""
@@ -83,7 +86,16 @@ def unpack_constants( constants, namespace ):
             namespace[name] = Constant( name, int(value,16) )
 
 def createFunction( function, dll,extension, deprecated=False, error_checker=None, force_extension=False ):
-    """Allows the more compact declaration format to use the old-style constructor"""
+    """Allows the more compact declaration format to use the old-style constructor
+
+    With a resolution cache, functions found by symbol lookup on a
+    previous run are resolved immediately rather than on first call.
+    """
+    cache = PLATFORM.resolutionCache
+    if cache is not None and not deprecated:
+        resolved = createCachedFunction( cache, function, dll or PLATFORM.GL, extension, error_checker, force_extension )
+        if resolved is not None:
+            return resolved
     return nullFunction(
         function.__name__,
         dll or PLATFORM.GL,
@@ -96,3 +108,24 @@ def createFunction( function, dll,extension, deprecated=False, error_checker=Non
         error_checker = error_checker,
         force_extension = force_extension or getattr(function,'force_extension',force_extension),
     )
+
+def createCachedFunction( cache, function, dll, extension, error_checker, force_extension ):
+    """Resolve function now if the cache says it resolved last time, else None"""
+    force_extension = force_extension or getattr(function,'force_extension',force_extension)
+    if not PLATFORM.usesSymbolLookup( extension, force_extension ):
+        return None
+    if not cache.libraryTable( dll ).get( function.__name__ ):
+        return None
+    try:
+        return PLATFORM.constructFunction(
+            function.__name__,
+            dll,
+            resultType = function.resultType,
+            argTypes = function.argTypes,
+            doc = None, argNames = function.argNames,
+            extension = extension,
+            module = function.__module__,
+            error_checker = error_checker,
+        )
+    except AttributeError as err:
+        return None
@@ -73,6 +73,14 @@ class BasePlatform( object ):
         EXTENSIONS_USE_BASE_FUNCTIONS -- if True, uses regular
             dll attribute-based lookup to retrieve extension 
             function pointers.
+
+        MAKE_CURRENT_FUNCTIONS -- names of functions which change the
+            current context, with OpenGL.CACHE_CURRENT_CONTEXT set
+            these make contextdata forget its cached current context
+
+        resolutionCache -- resolutioncache.ResolutionCache remembering
+            which functions/extensions resolved on previous runs, set
+            when OpenGL.RESOLUTION_CACHE is enabled
     """
     
     EXPORTED_NAMES = [
@@ -90,6 +98,15 @@ class BasePlatform( object ):
     DEFAULT_FUNCTION_TYPE = None
     GLUT_GUARD_CALLBACKS = False
     EXTENSIONS_USE_BASE_FUNCTIONS = False
+    MAKE_CURRENT_FUNCTIONS = frozenset([
+        'eglMakeCurrent',
+        'glXMakeCurrent', 'glXMakeContextCurrent',
+        'wglMakeCurrent', 'wglMakeContextCurrentARB', 'wglMakeContextCurrentEXT',
+        'OSMesaMakeCurrent',
+        'glutSetWindow', 'glutCreateWindow', 'glutCreateSubWindow',
+        'glutDestroyWindow', 'glutEnterGameMode', 'glutLeaveGameMode',
+    ])
+    resolutionCache = None
     
     def install( self, namespace ):
         """Install this platform instance into the platform module"""
@@ -114,6 +131,25 @@ class BasePlatform( object ):
             # geometry, but that's all basically "maybe" stuff...
             func.errcheck = error_checker.glCheckError
         return func
+    def contextChangeChecking( self, func ):
+        """Make func reset contextdata's cached current context if appropriate"""
+        if not (
+            _configflags.CACHE_CURRENT_CONTEXT and 
+            func.__name__ in self.MAKE_CURRENT_FUNCTIONS
+        ):
+            return func
+        from OpenGL import contextdata
+        errcheck = func.errcheck
+        if errcheck is None:
+            def contextChanged( result, function, arguments ):
+                contextdata.contextChanged()
+                return result
+        else:
+            def contextChanged( result, function, arguments ):
+                contextdata.contextChanged()
+                return errcheck( result, function, arguments )
+        func.errcheck = contextChanged
+        return func
     def wrapContextCheck( self, func, dll ):
         """Wrap function with context-checking if appropriate"""
         if _configflags.CONTEXT_CHECKING and dll is self.GL and func.__name__ not in (
@@ -154,7 +190,7 @@ class BasePlatform( object ):
             raise AttributeError( """Extension not available""" )
         argTypes = [ self.finalArgType( t ) for t in argTypes ]
             
-        if force_extension or ((not is_core) and (not self.EXTENSIONS_USE_BASE_FUNCTIONS)):
+        if not self.usesSymbolLookup( extension, force_extension ):
             # what about the VERSION values???
             pointer = self.getExtensionProcedure( as_8_bit(functionName) )
             if pointer:
@@ -183,7 +219,9 @@ class BasePlatform( object ):
         func.deprecated = deprecated
         func = self.wrapLogging( 
             self.wrapContextCheck(
-                self.errorChecking( func, dll, error_checker=error_checker ),
+                self.contextChangeChecking(
+                    self.errorChecking( func, dll, error_checker=error_checker ),
+                ),
                 dll,
             )
         )
@@ -194,6 +232,17 @@ class BasePlatform( object ):
                 func.__module__ = module
         return func
 
+    def usesSymbolLookup( self, extension, force_extension=False ):
+        """Whether constructFunction finds this function by symbol lookup in the dll
+
+        Such lookups don't depend on the current context, others go
+        through checkExtension and getExtensionProcedure.
+        """
+        if force_extension:
+            return False
+        is_core = (not extension) or extension.split('_')[1] == 'VERSION'
+        return is_core or self.EXTENSIONS_USE_BASE_FUNCTIONS
+
     def createBaseFunction( 
         self,
         functionName, dll, 
@@ -271,8 +320,15 @@ class BasePlatform( object ):
                 )
             current = set.get( name )
             if current is None:
-                from OpenGL import extensions
-                result = extensions.ExtensionQuerier.hasExtension( name )
+                cache = self.resolutionCache
+                result = None
+                if cache is not None:
+                    result = cache.hasExtension( name )
+                if result is None:
+                    from OpenGL import extensions
+                    result = extensions.ExtensionQuerier.hasExtension( name )
+                    if cache is not None:
+                        cache.recordExtension( name, result )
                 set[name] = result 
                 return result
             return current
@@ -391,6 +447,9 @@ class _NullFunctionPointer( object ):
             if log:
                 log.info('Platform import failed (likely during shutdown)')
             return None
+        cache = platform.PLATFORM.resolutionCache
+        if cache is not None and cache.lookup( self ) is False:
+            return None
         try:
             func = platform.PLATFORM.constructFunction(
                 self.__name__, self.DLL, 
@@ -403,8 +462,12 @@ class _NullFunctionPointer( object ):
                 force_extension = self.force_extension,
             )
         except AttributeError as err:
+            if cache is not None:
+                cache.record( self, False )
             return None 
         else:
+            if cache is not None:
+                cache.record( self, True )
             # now short-circuit so that we don't need to check again...
             self.__class__.__call__ = staticmethod( func.__call__ )
             self.resolved = True
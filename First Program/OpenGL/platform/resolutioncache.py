@@ -0,0 +1,208 @@
+"""Persistent record of which entry points and extensions resolved
+
+Every GL function starts out as a _NullFunctionPointer and is resolved
+on first use, by symbol lookup in the library (core functions) or by
+checking the extension and asking the platform's GetProcAddress (all
+others).  The answers only change when the library or the driver
+changes, so with OpenGL.RESOLUTION_CACHE set they are stored in a small
+JSON file and reused on the next start:
+
+    * core functions which resolved last time are resolved straight
+      away by createFunction, instead of creating a null pointer first
+    * functions which failed to resolve are not looked up again
+    * extension availability is answered without querying the driver
+
+The file is named after the platform and the GL library (path and
+modification time), symbol results are stored per library (again by
+path and modification time) and extension/procedure results per
+renderer (vendor, renderer and version strings), so a driver update
+simply starts a new record.  The file is
+written at exit, and only if something new was learned.
+"""
+import atexit, ctypes, hashlib, json, logging, os, sys
+_log = logging.getLogger( __name__ )
+
+CACHE_VERSION = 1
+
+def cacheDirectory( setting ):
+    """Directory for cache files, setting is OpenGL.RESOLUTION_CACHE
+
+    A string setting names the directory, otherwise it is taken from
+    $PYOPENGL_RESOLUTION_CACHE_DIR, or a pyopengl directory in the
+    user's cache directory.
+    """
+    if isinstance( setting, str ) and setting:
+        return setting
+    if os.environ.get( 'PYOPENGL_RESOLUTION_CACHE_DIR' ):
+        return os.environ[ 'PYOPENGL_RESOLUTION_CACHE_DIR' ]
+    base = os.environ.get( 'XDG_CACHE_HOME' ) or os.path.join(
+        os.path.expanduser( '~' ), '.cache'
+    )
+    return os.path.join( base, 'pyopengl' )
+
+def libraryFile( name ):
+    """Best guess at the file a library name was loaded from (or None)"""
+    if not name:
+        return None
+    if os.path.isabs( name ):
+        return name
+    try:
+        with open( '/proc/self/maps' ) as maps:
+            for line in maps:
+                path = line.split( None, 5 )[-1].strip()
+                if os.path.basename( path ).startswith( name ):
+                    return path
+    except (IOError,OSError) as err:
+        pass
+    return None
+
+def libraryKey( dll ):
+    """Name, file and modification time of a ctypes library"""
+    name = getattr( dll, '_name', None )
+    path = libraryFile( name )
+    mtime = None
+    if path:
+        try:
+            mtime = os.stat( path ).st_mtime
+        except OSError as err:
+            path = None
+    return [name, path, mtime]
+
+class ResolutionCache( object ):
+    """Resolution results for one platform and GL library, loaded from disk"""
+    def __init__( self, platform, directory ):
+        self.platform = platform
+        key = [
+            type( platform ).__name__,
+            sys.platform,
+            libraryKey( platform.GL ),
+        ]
+        digest = hashlib.sha1( json.dumps( key ).encode( 'utf-8' ) ).hexdigest()[:16]
+        self.filename = os.path.join(
+            directory, '%s-%s.json'%( type( platform ).__name__, digest ),
+        )
+        self.key = key
+        self.symbols = {}
+        self.renderers = {}
+        self.libraryNames = {}
+        self.dirty = False
+        self.load()
+    def load( self ):
+        """Read the cache file, if there is a usable one"""
+        try:
+            with open( self.filename ) as cacheFile:
+                data = json.load( cacheFile )
+        except (IOError,OSError,ValueError) as err:
+            return False
+        if data.get( 'version' ) != CACHE_VERSION or data.get( 'key' ) != self.key:
+            return False
+        self.symbols = data.get( 'symbols', {} )
+        self.renderers = data.get( 'renderers', {} )
+        return True
+    def save( self ):
+        """Write the cache file if anything changed"""
+        if not self.dirty:
+            return False
+        data = {
+            'version': CACHE_VERSION,
+            'key': self.key,
+            'symbols': self.symbols,
+            'renderers': self.renderers,
+        }
+        try:
+            directory = os.path.dirname( self.filename )
+            if not os.path.isdir( directory ):
+                os.makedirs( directory )
+            temporary = '%s.%s'%( self.filename, os.getpid() )
+            with open( temporary, 'w' ) as cacheFile:
+                json.dump( data, cacheFile )
+            os.replace( temporary, self.filename )
+        except (IOError,OSError) as err:
+            _log.info( 'Unable to write resolution cache %s: %s', self.filename, err )
+            return False
+        self.dirty = False
+        return True
+
+    def libraryTable( self, dll ):
+        """Symbol results for dll (keyed by its file and mtime), by function name"""
+        name = getattr( dll, '_name', None )
+        key = self.libraryNames.get( name )
+        if key is None:
+            key = self.libraryNames[ name ] = json.dumps( libraryKey( dll ) )
+        table = self.symbols.get( key )
+        if table is None:
+            table = self.symbols[ key ] = {}
+        return table
+    def rendererTable( self ):
+        """Extension and procedure results for the current context (or None)"""
+        context = self.platform.GetCurrentContext()
+        if not context:
+            return None
+        from OpenGL import contextdata
+        table = contextdata.getValue( 'resolutioncache', context=context )
+        if table is None:
+            try:
+                from OpenGL.raw.GL.VERSION.GL_1_0 import (
+                    glGetString, GL_VENDOR, GL_RENDERER, GL_VERSION,
+                )
+                key = '|'.join([
+                    asText( glGetString( constant ) )
+                    for constant in (GL_VENDOR, GL_RENDERER, GL_VERSION)
+                ])
+            except Exception as err:
+                return None
+            table = self.renderers.setdefault( key, {'extensions':{},'procedures':{}} )
+            contextdata.setValue( 'resolutioncache', table, context=context, weak=False )
+        return table
+
+    def lookup( self, function ):
+        """Whether function resolved last time (None if not known)"""
+        if self.platform.usesSymbolLookup( function.extension, getattr( function, 'force_extension', False ) ):
+            return self.libraryTable( function.DLL ).get( function.__name__ )
+        table = self.rendererTable()
+        if table is None:
+            return None
+        return table['procedures'].get( function.__name__ )
+    def record( self, function, resolved ):
+        """Note whether function resolved"""
+        if self.platform.usesSymbolLookup( function.extension, getattr( function, 'force_extension', False ) ):
+            table = self.libraryTable( function.DLL )
+        else:
+            table = self.rendererTable()
+            if table is None:
+                return
+            table = table['procedures']
+        if table.get( function.__name__ ) != resolved:
+            table[ function.__name__ ] = resolved
+            self.dirty = True
+    def hasExtension( self, name ):
+        """Whether extension name was available last time (None if not known)"""
+        table = self.rendererTable()
+        if table is None:
+            return None
+        return table['extensions'].get( name )
+    def recordExtension( self, name, available ):
+        """Note whether extension name is available"""
+        table = self.rendererTable()
+        if table is not None and table['extensions'].get( name ) != available:
+            table['extensions'][ name ] = bool( available )
+            self.dirty = True
+
+def asText( value ):
+    """Raw glGetString results are char pointers, produce text"""
+    if not value:
+        return ''
+    if not isinstance( value, bytes ):
+        value = ctypes.cast( value, ctypes.c_char_p ).value or b''
+    return value.decode( 'latin-1' )
+
+def install( platform, setting ):
+    """Attach a ResolutionCache to platform and save it at exit"""
+    try:
+        cache = ResolutionCache( platform, cacheDirectory( setting ) )
+    except Exception as err:
+        _log.info( 'Resolution cache disabled: %s', err )
+        return None
+    platform.resolutionCache = cache
+    atexit.register( cache.save )
+    return cache
@@ -1,5 +1,5 @@
 """The wrapping code for providing natural ctypes-based OpenGL interface"""
-import ctypes, logging
+import ctypes, linecache, logging
 from OpenGL import platform, error
 assert platform
 from OpenGL._configflags import STORE_POINTERS, ERROR_ON_COPY, SIZE_1_ARRAY_UNPACK
@@ -411,8 +411,9 @@ class Wrapper( LateBind ):
         This returns a version of __call__ that only does that work which is
         required by the particular wrapper object
 
-        This is essentially a huge set of expanded nested functions, very
-        inelegant...
+        With OpenGL_accelerate the work is done by its compiled calculators,
+        otherwise a straight-line Python function is generated for the
+        wrapper's shape (see _callFactory).
         """
         pyConverters = getattr( self, 'pyConverters', None )
         cConverters = getattr( self, 'cConverters', None )
@@ -420,84 +421,21 @@ class Wrapper( LateBind ):
         wrappedOperation = self.wrappedOperation
         storeValues = getattr( self, 'storeValues', None )
         returnValues = getattr( self, 'returnValues', None )
-        if pyConverters:
-            if cWrapper:
+        if cWrapper:
+            if pyConverters:
                 calculate_pyArgs = PyArgCalculator(
                     self,pyConverters,
                 )
             else:
-                pyConverters_mapped = [
-                    (i,converter,(converter is None))
-                    for (i,converter) in enumerate( pyConverters )
-                ]
-                pyConverters_length = len([p for p in pyConverters if not getattr( p, 'optional', False)])
-                def calculate_pyArgs( args ):
-                    if pyConverters_length > len(args):
-                        raise ValueError(
-                            """%s requires %r arguments (%s), received %s: %r"""%(
-                                wrappedOperation.__name__,
-                                pyConverters_length,
-                                ", ".join( self.pyConverterNames ),
-                                len(args),
-                                args
-                            )
-                        )
-                    for index,converter,isNone in pyConverters_mapped:
-                        if isNone:
-                            yield args[index]
-                        else:
-                            try:
-                                yield converter(args[index], self, args)
-                            except IndexError as err:
-                                yield NULL
-                            except Exception as err:
-                                if hasattr( err, 'args' ):
-                                    err.args += ( converter, )
-                                raise
-        else:
-            calculate_pyArgs = None
-        if cConverters:
-            if cWrapper:
+                calculate_pyArgs = None
+            if cConverters:
                 calculate_cArgs = CArgCalculator( self, cConverters )
             else:
-                cConverters_mapped = [
-                    (i,converter,hasattr(converter,'__call__'))
-                    for (i,converter) in enumerate( cConverters )
-                ]
-                def calculate_cArgs( pyArgs ):
-                    for index,converter,canCall in cConverters_mapped:
-                        if canCall:
-                            try:
-                                yield converter( pyArgs, index, self )
-                            except Exception as err:
-                                if hasattr( err, 'args' ):
-                                    err.args += (
-                                        """Failure in cConverter %r"""%(converter),
-                                        pyArgs, index, self,
-                                    )
-                                raise
-                        else:
-                            yield converter
-        else:
-            calculate_cArgs = None
-        if cResolvers:
-            if cWrapper:
+                calculate_cArgs = None
+            if cResolvers:
                 calculate_cArguments = CArgumentCalculator( cResolvers )
             else:
-                cResolvers_mapped = list(enumerate(cResolvers))
-                def calculate_cArguments( cArgs ):
-                    for i,converter in cResolvers_mapped:
-                        if converter is None:
-                            yield cArgs[i]
-                        else:
-                            try:
-                                yield converter( cArgs[i] )
-                            except Exception as err:
-                                err.args += (converter,)
-                                raise
-        else:
-            calculate_cArguments = None
-        if cWrapper:
+                calculate_cArguments = None
             return cWrapper(
                 wrappedOperation,
                 calculate_pyArgs=calculate_pyArgs,
@@ -506,892 +444,15 @@ class Wrapper( LateBind ):
                 storeValues=storeValues,
                 returnValues=returnValues,
             )
-        if pyConverters:
-            if cConverters:
-                # create a map of index,converter, callable
-                if cResolvers:
-                    if storeValues:
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all possible operations"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = tuple(calculate_cArgs( pyArgs ))
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = tuple(calculate_cArgs( pyArgs ))
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return result
-                            return wrapperCall
-                    else: # null storeValues
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save storeValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = tuple(calculate_cArgs( pyArgs ))
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues and storeValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = tuple(calculate_cArgs( pyArgs ))
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return result
-                            return wrapperCall
-                else:
-                    # null cResolvers
-                    if storeValues:
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all possible operations"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = tuple(calculate_cArgs( pyArgs ))
-                                cArguments = cArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = tuple(calculate_cArgs( pyArgs ))
-                                cArguments = cArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return result
-                            return wrapperCall
-                    else: # null storeValues
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save storeValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = tuple(calculate_cArgs( pyArgs ))
-                                cArguments = cArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues and storeValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = tuple(calculate_cArgs( pyArgs ))
-                                cArguments = cArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return result
-                            return wrapperCall
-            else:
-                # null cConverters
-                if cResolvers:
-                    if storeValues:
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all possible operations"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = pyArgs
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = pyArgs
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return result
-                            return wrapperCall
-                    else: # null storeValues
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save storeValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = pyArgs
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues and storeValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArgs = pyArgs
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return result
-                            return wrapperCall
-                else:
-                    # null cResolvers
-                    if storeValues:
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all possible operations"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArguments = pyArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArguments
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArguments,
-                                )
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArguments,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArguments = pyArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArguments
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArguments,
-                                )
-                                return result
-                            return wrapperCall
-                    else: # null storeValues
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save storeValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArguments = pyArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArguments
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArguments,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues and storeValues"""
-                                pyArgs = tuple( calculate_pyArgs( args ))
-                                cArguments = pyArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArguments
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return result
-                            return wrapperCall
-        else:
-            # null pyConverters
-            if cConverters:
-                if cResolvers:
-                    if storeValues:
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all possible operations"""
-                                pyArgs = args
-                                cArgs = []
-                                for (index,converter) in enumerate( cConverters ):
-                                    # move enumerate out...
-                                    if not hasattr(converter,'__call__'):
-                                        cArgs.append( converter )
-                                    else:
-                                        try:
-                                            cArgs.append(
-                                                converter( pyArgs, index, self )
-                                            )
-                                        except Exception as err:
-                                            if hasattr( err, 'args' ):
-                                                err.args += (
-                                                    """Failure in cConverter %r"""%(converter),
-                                                    pyArgs, index,
-                                                )
-                                            raise
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues"""
-                                pyArgs = args
-                                cArgs = []
-                                for (index,converter) in enumerate( cConverters ):
-                                    # move enumerate out...
-                                    if not hasattr(converter,'__call__'):
-                                        cArgs.append( converter )
-                                    else:
-                                        try:
-                                            cArgs.append(
-                                                converter( pyArgs, index, self )
-                                            )
-                                        except Exception as err:
-                                            if hasattr( err, 'args' ):
-                                                err.args += (
-                                                    """Failure in cConverter %r"""%(converter),
-                                                    pyArgs, index,
-                                                )
-                                            raise
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return result
-                            return wrapperCall
-                    else: # null storeValues
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save storeValues"""
-                                pyArgs = args
-                                cArgs = []
-                                for (index,converter) in enumerate( cConverters ):
-                                    # move enumerate out...
-                                    if not hasattr(converter,'__call__'):
-                                        cArgs.append( converter )
-                                    else:
-                                        try:
-                                            cArgs.append(
-                                                converter( pyArgs, index, self )
-                                            )
-                                        except Exception as err:
-                                            if hasattr( err, 'args' ):
-                                                err.args += (
-                                                    """Failure in cConverter %r"""%(converter),
-                                                    pyArgs, index,
-                                                )
-                                            raise
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues and storeValues"""
-                                pyArgs = args
-                                cArgs = []
-                                for (index,converter) in enumerate( cConverters ):
-                                    # move enumerate out...
-                                    if not hasattr(converter,'__call__'):
-                                        cArgs.append( converter )
-                                    else:
-                                        try:
-                                            cArgs.append(
-                                                converter( pyArgs, index, self )
-                                            )
-                                        except Exception as err:
-                                            if hasattr( err, 'args' ):
-                                                err.args += (
-                                                    """Failure in cConverter %r"""%(converter),
-                                                    pyArgs, index,
-                                                )
-                                            raise
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return result
-                            return wrapperCall
-                else:
-                    # null cResolvers
-                    if storeValues:
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all possible operations"""
-                                pyArgs = args
-                                cArgs = []
-                                for (index,converter) in enumerate( cConverters ):
-                                    # move enumerate out...
-                                    if not hasattr(converter,'__call__'):
-                                        cArgs.append( converter )
-                                    else:
-                                        try:
-                                            cArgs.append(
-                                                converter( pyArgs, index, self )
-                                            )
-                                        except Exception as err:
-                                            if hasattr( err, 'args' ):
-                                                err.args += (
-                                                    """Failure in cConverter %r"""%(converter),
-                                                    pyArgs, index,
-                                                )
-                                            raise
-                                cArguments = cArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues"""
-                                pyArgs = args
-                                cArgs = []
-                                for (index,converter) in enumerate( cConverters ):
-                                    # move enumerate out...
-                                    if not hasattr(converter,'__call__'):
-                                        cArgs.append( converter )
-                                    else:
-                                        try:
-                                            cArgs.append(
-                                                converter( pyArgs, index, self )
-                                            )
-                                        except Exception as err:
-                                            if hasattr( err, 'args' ):
-                                                err.args += (
-                                                    """Failure in cConverter %r"""%(converter),
-                                                    pyArgs, index,
-                                                )
-                                            raise
-                                cArguments = cArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                                return result
-                            return wrapperCall
-                    else: # null storeValues
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save storeValues"""
-                                pyArgs = args
-                                cArgs = []
-                                for (index,converter) in enumerate( cConverters ):
-                                    # move enumerate out...
-                                    if not hasattr(converter,'__call__'):
-                                        cArgs.append( converter )
-                                    else:
-                                        try:
-                                            cArgs.append(
-                                                converter( pyArgs, index, self )
-                                            )
-                                        except Exception as err:
-                                            if hasattr( err, 'args' ):
-                                                err.args += (
-                                                    """Failure in cConverter %r"""%(converter),
-                                                    pyArgs, index,
-                                                )
-                                            raise
-                                cArguments = cArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return returnValues(
-                                    result,
-                                    self,
-                                    pyArgs,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues and storeValues"""
-                                pyArgs = args
-                                cArgs = []
-                                for (index,converter) in enumerate( cConverters ):
-                                    # move enumerate out...
-                                    if not hasattr(converter,'__call__'):
-                                        cArgs.append( converter )
-                                    else:
-                                        try:
-                                            cArgs.append(
-                                                converter( pyArgs, index, self )
-                                            )
-                                        except Exception as err:
-                                            if hasattr( err, 'args' ):
-                                                err.args += (
-                                                    """Failure in cConverter %r"""%(converter),
-                                                    pyArgs, index,
-                                                )
-                                            raise
-                                cArguments = cArgs
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = pyArgs
-                                    raise err
-                                return result
-                            return wrapperCall
-            else:
-                # null cConverters
-                if cResolvers:
-                    if storeValues:
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all possible operations"""
-                                cArgs = args
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = args
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    args,
-                                    cArgs,
-                                )
-                                return returnValues(
-                                    result,
-                                    self,
-                                    args,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues"""
-                                cArgs = args
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = args
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    args,
-                                    cArgs,
-                                )
-                                return result
-                            return wrapperCall
-                    else: # null storeValues
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save storeValues"""
-                                cArgs = args
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = args
-                                    raise err
-                                return returnValues(
-                                    result,
-                                    self,
-                                    args,
-                                    cArgs,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues and storeValues"""
-                                cArgs = args
-                                cArguments = tuple(calculate_cArguments( cArgs ))
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArgs
-                                    err.pyArgs = args
-                                    raise err
-                                return result
-                            return wrapperCall
-                else:
-                    # null cResolvers
-                    if storeValues:
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all possible operations"""
-                                cArguments = args
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArguments
-                                    err.pyArgs = args
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    args,
-                                    cArguments,
-                                )
-                                return returnValues(
-                                    result,
-                                    self,
-                                    args,
-                                    cArguments,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues"""
-                                cArguments = args
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArguments
-                                    err.pyArgs = args
-                                    raise err
-                                # handle storage of persistent argument values...
-                                storeValues(
-                                    result,
-                                    self,
-                                    args,
-                                    cArguments,
-                                )
-                                return result
-                            return wrapperCall
-                    else: # null storeValues
-                        if returnValues:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save storeValues"""
-                                cArguments = args
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArguments
-                                    err.pyArgs = args
-                                    raise err
-                                return returnValues(
-                                    result,
-                                    self,
-                                    args,
-                                    cArguments,
-                                )
-                            return wrapperCall
-                        else:
-                            def wrapperCall( *args ):
-                                """Wrapper with all save returnValues and storeValues"""
-                                cArguments = args
-                                try:
-                                    result = wrappedOperation( *cArguments )
-                                except ctypes.ArgumentError as err:
-                                    err.args = err.args + (cArguments,)
-                                    raise err
-                                except error.GLError as err:
-                                    err.cArgs = cArguments
-                                    err.pyArgs = args
-                                    raise err
-                                return result
-                            return wrapperCall
+        signature = _callSignature(
+            pyConverters, cConverters, cResolvers, storeValues, returnValues,
+        )
+        return _callFactory( signature )(
+            self, wrappedOperation,
+            pyConverters, cConverters, cResolvers,
+            storeValues, returnValues,
+        )
+
 #    def __call__( self, *args, **named ):
 #        """Finalise the wrapper before calling it"""
 #        try:
@@ -1495,6 +556,216 @@ class MultiReturn(object):
                 raise
         return result
 
+def _argumentCountError( self, required, args ):
+    """Build the error raised when a wrapper gets too few arguments"""
+    return ValueError(
+        """%s requires %r arguments (%s), received %s: %r"""%(
+            self.wrappedOperation.__name__,
+            required,
+            ", ".join( self.pyConverterNames ),
+            len(args),
+            args
+        )
+    )
+
+def _callSignature( pyConverters, cConverters, cResolvers, storeValues, returnValues ):
+    """Describe the shape of a wrapper's call, independent of the converters themselves
+
+    Wrappers with the same signature share generated code (see _callFactory):
+
+        pyConverters -- None or (required count, ('pass'|'call',...))
+        cConverters -- None or ( ('pyArg',index)|'call'|'value', ...)
+            where ('pyArg',index) is a DefaultCConverter we can inline
+        cResolvers -- None or ('pass'|'call', ...)
+        storeValues, returnValues -- whether they are set
+    """
+    if pyConverters:
+        pySignature = (
+            len([p for p in pyConverters if not getattr( p, 'optional', False)]),
+            tuple([
+                'pass' if converter is None else 'call'
+                for converter in pyConverters
+            ]),
+        )
+    else:
+        pySignature = None
+    if cConverters:
+        cSignature = []
+        for converter in cConverters:
+            if (
+                pyConverters and
+                type(converter) is DefaultCConverter and
+                0 <= converter.index < len(pyConverters)
+            ):
+                cSignature.append( ('pyArg',converter.index) )
+            elif hasattr( converter, '__call__' ):
+                cSignature.append( 'call' )
+            else:
+                cSignature.append( 'value' )
+        cSignature = tuple( cSignature )
+    else:
+        cSignature = None
+    if cResolvers:
+        rSignature = tuple([
+            'pass' if converter is None else 'call'
+            for converter in cResolvers
+        ])
+    else:
+        rSignature = None
+    return (
+        pySignature, cSignature, rSignature,
+        storeValues is not None, returnValues is not None,
+    )
+
+def _callSource( signature ):
+    """Generate the source of a call factory for the given _callSignature
+
+    The factory binds one wrapper's converters to local names and returns
+    a wrapperCall which applies them one after the other, without the
+    generators and intermediate tuples of a generic implementation.
+    """
+    pySignature, cSignature, rSignature, store, ret = signature
+    factory = [
+        'def factory( self, wrappedOperation, pyConverters, cConverters, cResolvers, storeValues, returnValues ):',
+    ]
+    body = []
+    needPyArgs = store or ret or (cSignature and 'call' in cSignature)
+    needCArgs = store or ret
+
+    # Python arguments
+    if pySignature:
+        required, kinds = pySignature
+        body.append( 'if len(args) < %d:'%(required,) )
+        body.append( '    raise _argumentCountError( self, %d, args )'%(required,) )
+        for i,kind in enumerate( kinds ):
+            if kind == 'pass':
+                body.append( 'py_%d = args[%d]'%(i,i) )
+            else:
+                factory.append( '    pyConverter_%d = pyConverters[%d]'%(i,i) )
+                body.extend([
+                    'try:',
+                    '    py_%d = pyConverter_%d( args[%d], self, args )'%(i,i,i),
+                    'except IndexError:',
+                    '    py_%d = NULL'%(i,),
+                    'except Exception as err:',
+                    '    if hasattr( err, "args" ):',
+                    '        err.args += ( pyConverter_%d, )'%(i,),
+                    '    raise',
+                ])
+        pyValues = ['py_%d'%(i,) for i in range(len(kinds))]
+        pyArgs = '(%s)'%( ''.join([ v+', ' for v in pyValues ]), )
+        if needPyArgs:
+            body.append( 'pyArgs = %s'%(pyArgs,) )
+            pyArgs = 'pyArgs'
+    else:
+        pyValues = None
+        pyArgs = 'args'
+
+    # C arguments
+    if cSignature:
+        for i,kind in enumerate( cSignature ):
+            if kind == 'value':
+                factory.append( '    c_%d = cConverters[%d]'%(i,i) )
+            elif kind == 'call':
+                factory.append( '    cConverter_%d = cConverters[%d]'%(i,i) )
+                body.extend([
+                    'try:',
+                    '    c_%d = cConverter_%d( %s, %d, self )'%(i,i,pyArgs,i),
+                    'except Exception as err:',
+                    '    if hasattr( err, "args" ):',
+                    '        err.args += (',
+                    '            """Failure in cConverter %%r"""%%(cConverter_%d),'%(i,),
+                    '            %s, %d, self,'%(pyArgs,i),
+                    '        )',
+                    '    raise',
+                ])
+        cValues = []
+        for i,kind in enumerate( cSignature ):
+            if isinstance( kind, tuple ):
+                cValues.append( pyValues[kind[1]] )
+            else:
+                cValues.append( 'c_%d'%(i,) )
+        cArgs = '(%s)'%( ''.join([ v+', ' for v in cValues ]), )
+        if needCArgs:
+            body.append( 'cArgs = %s'%(cArgs,) )
+            cArgs = 'cArgs'
+    else:
+        cValues = pyValues
+        cArgs = pyArgs
+
+    # ctypes-level arguments
+    if rSignature:
+        arguments = []
+        for i,kind in enumerate( rSignature ):
+            if cValues is not None and i < len(cValues):
+                value = cValues[i]
+            else:
+                value = '%s[%d]'%(cArgs,i)
+            if kind == 'pass':
+                arguments.append( value )
+            else:
+                factory.append( '    cResolver_%d = cResolvers[%d]'%(i,i) )
+                body.extend([
+                    'try:',
+                    '    r_%d = cResolver_%d( %s )'%(i,i,value),
+                    'except Exception as err:',
+                    '    err.args += ( cResolver_%d, )'%(i,),
+                    '    raise',
+                ])
+                arguments.append( 'r_%d'%(i,) )
+        callArguments = ', '.join( arguments )
+        cArguments = '(%s)'%( ''.join([ v+', ' for v in arguments ]), )
+    elif cValues is not None:
+        callArguments = ', '.join( cValues )
+        cArguments = cArgs
+    else:
+        callArguments = '*args'
+        cArguments = 'args'
+
+    body.extend([
+        'try:',
+        '    result = wrappedOperation( %s )'%(callArguments,),
+        'except ctypes.ArgumentError as err:',
+        '    err.args = err.args + (%s,)'%(cArguments,),
+        '    raise err',
+        'except error.GLError as err:',
+        '    err.cArgs = %s'%(cArgs,),
+        '    err.pyArgs = %s'%(pyArgs,),
+        '    raise err',
+    ])
+    if store:
+        body.append( 'storeValues( result, self, %s, %s )'%(pyArgs,cArgs) )
+    if ret:
+        body.append( 'return returnValues( result, self, %s, %s )'%(pyArgs,cArgs) )
+    else:
+        body.append( 'return result' )
+
+    factory.append( '    def wrapperCall( *args ):' )
+    factory.extend([ '        '+line for line in body ])
+    factory.append( '    return wrapperCall' )
+    return '\n'.join( factory ) + '\n'
+
+_callFactories = {}
+def _callFactory( signature ):
+    """Compile (once per signature) the factory producing wrapperCall functions"""
+    factory = _callFactories.get( signature )
+    if factory is None:
+        source = _callSource( signature )
+        filename = '<OpenGL.wrapper call %d>'%( len(_callFactories), )
+        # make tracebacks through generated code show its source
+        linecache.cache[ filename ] = (
+            len(source), None, source.splitlines( True ), filename,
+        )
+        namespace = {
+            'ctypes': ctypes,
+            'error': error,
+            'NULL': NULL,
+            '_argumentCountError': _argumentCountError,
+        }
+        exec( compile( source, filename, 'exec' ), namespace )
+        factory = _callFactories[ signature ] = namespace['factory']
+    return factory
+
 def wrapper( wrappedOperation ):
     """Create a Wrapper sub-class instance for the given wrappedOperation
 
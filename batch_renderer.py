@@ -0,0 +1,120 @@
+"""Batched drawing for Super 3D Pong Deluxe
+
+Instead of one glColor/glVertex call per point, whole arrays of positions
+and colors are handed to OpenGL with glVertexPointer/glColorPointer and
+drawn with a single glDrawArrays call.
+
+The arrays change every frame, so they are written into the next free
+part of one large streaming buffer (OpenGL.arrays.vbo.StreamingVBO)
+rather than re-uploaded into a fresh buffer each time. end_frame() must
+be called once per frame, after the frame's draws, so the buffer knows
+which parts OpenGL may still be reading.
+
+StreamingVBO is part of the PyOpenGL copy in "First Program". With a
+PyOpenGL that doesn't have it, or a GL without buffer objects, the arrays
+are passed straight from client memory instead.
+"""
+
+from OpenGL.GL import *
+from OpenGL.arrays import vbo
+import numpy
+
+
+# Bytes of vertex data kept in flight (2048 particles take 48 KB a frame)
+STREAM_SIZE = 1024 * 1024
+
+stream = None
+stream_available = hasattr(vbo, "StreamingVBO")
+
+
+def get_stream():
+    """The streaming buffer for per-frame arrays (created on first use), or None without one"""
+
+    global stream, stream_available
+    if stream is None and stream_available:
+        if vbo.get_implementation():
+            stream = vbo.StreamingVBO(STREAM_SIZE)
+        else:
+            stream_available = False
+    return stream
+
+
+def draw_arrays(mode, positions, colors):
+    """Draw a set of vertices (N x 3) with their colors (N x 3 or N x 4) in one call"""
+
+    count = len(positions)
+    if count == 0:
+        return
+
+    positions = numpy.ascontiguousarray(positions, dtype=numpy.float32)
+    colors = numpy.ascontiguousarray(colors, dtype=numpy.float32)
+
+    buffer = get_stream()
+
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_COLOR_ARRAY)
+
+    if buffer is not None:
+        position_offset = buffer.write(positions)
+        color_offset = buffer.write(colors)
+        glVertexPointer(3, GL_FLOAT, 0, buffer + position_offset)
+        glColorPointer(colors.shape[1], GL_FLOAT, 0, buffer + color_offset)
+    else:
+        glVertexPointer(3, GL_FLOAT, 0, positions)
+        glColorPointer(colors.shape[1], GL_FLOAT, 0, colors)
+    glDrawArrays(mode, 0, count)
+
+    glDisableClientState(GL_COLOR_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    if buffer is not None:
+        buffer.unbind()
+
+
+def end_frame():
+    """Let the streaming buffer reuse what this frame wrote once OpenGL is done with it"""
+
+    if stream is not None:
+        stream.fence()
+
+
+def release():
+    """Delete the streaming buffer (call while its OpenGL context is still current)"""
+
+    global stream
+    if stream is not None:
+        stream.delete()
+        stream = None
+
+
+def build_trail_lines(trails, colors):
+    """Turn several trails into one list of line segments (for GL_LINES)
+
+    Each trail is a list of (x, y, z) points, oldest first, drawn in the
+    matching RGB color and fading in from transparent at its tail.
+    Returns (positions, colors) arrays ready for draw_arrays.
+    """
+
+    all_positions = []
+    all_colors = []
+
+    for trail, color in zip(trails, colors):
+        length = len(trail)
+        if length < 2:
+            continue
+
+        points = numpy.asarray(trail, dtype=numpy.float32)
+
+        rgba = numpy.empty((length, 4), dtype=numpy.float32)
+        rgba[:, :3] = color
+        rgba[:, 3] = numpy.arange(length, dtype=numpy.float32) / length
+
+        # Strip 0-1-2-3 becomes segments 0-1, 1-2, 2-3
+        order = numpy.repeat(numpy.arange(length), 2)[1:-1]
+        all_positions.append(points[order])
+        all_colors.append(rgba[order])
+
+    if len(all_positions) == 0:
+        empty = numpy.zeros((0, 3), dtype=numpy.float32)
+        return empty, numpy.zeros((0, 4), dtype=numpy.float32)
+
+    return numpy.concatenate(all_positions), numpy.concatenate(all_colors)
@@ -0,0 +1,243 @@
+"""Frame-time profiler for Super 3D Pong Deluxe
+
+Opt-in (run the game with --profile). Keeps the last few hundred frames in
+a ring buffer, each with:
+
+  - how long each phase took (input, physics, effects, every draw_*
+    function and glutSwapBuffers), in milliseconds
+  - the time since the previous frame and the time spent working
+  - how many gl*/glu*/glut* calls were made
+
+and can report p50/p95/p99 frame times, or dump every frame to a CSV or
+JSON file. Draw functions and GL calls are found by wrapping the names
+in a module's namespace (see instrument), so nothing is added to the
+game's code paths while the profiler is off. Timings of nested draw
+functions include their children.
+"""
+
+import collections
+import csv
+import json
+import time
+
+
+class _Phase:
+    """Context manager that adds its running time to a phase"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        profiler = self.profiler
+        profiler.add_time(self.name, time.perf_counter() - self.start,
+                          outermost=profiler.depth == 0)
+        return False
+
+
+class FrameProfiler:
+    """Per-phase frame timings and GL call counts for the last N frames"""
+
+    def __init__(self, frames=600, hud_refresh=30):
+        self.frames = collections.deque(maxlen=frames)
+        self.frame_number = 0
+        self.last_frame_end = None
+
+        # Totals for the frame in progress
+        self.phase_seconds = {}
+        self.busy_seconds = 0.0
+        self.gl_calls = 0
+
+        # How many timed draw functions are running (they call each other)
+        self.depth = 0
+
+        # The overlay only works out percentiles every hud_refresh frames
+        self.hud_refresh = hud_refresh
+        self.hud_text = []
+        self.hud_frame = None
+
+    # --------------------------------------------------------
+    #   Collecting
+    # --------------------------------------------------------
+
+    def phase(self, name):
+        """Time a block of code: with profiler.phase("physics"): ..."""
+        return _Phase(self, name)
+
+    def add_time(self, name, seconds, outermost=False):
+        """Add time to a phase of the current frame
+
+        outermost means no other phase was running, so the time also
+        counts towards the frame's busy time.
+        """
+
+        self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+        if outermost:
+            self.busy_seconds += seconds
+
+    def end_frame(self):
+        """Finish the current frame and store it in the ring buffer"""
+
+        now = time.perf_counter()
+        if self.last_frame_end is None:
+            frame_ms = 0.0
+        else:
+            frame_ms = (now - self.last_frame_end) * 1000
+        self.last_frame_end = now
+
+        self.frames.append({
+            "frame": self.frame_number,
+            "frame_ms": frame_ms,
+            "busy_ms": self.busy_seconds * 1000,
+            "gl_calls": self.gl_calls,
+            "phases": {name: seconds * 1000 for name, seconds in self.phase_seconds.items()},
+        })
+
+        self.frame_number += 1
+        self.phase_seconds = {}
+        self.busy_seconds = 0.0
+        self.gl_calls = 0
+
+    # --------------------------------------------------------
+    #   Hooking into a module
+    # --------------------------------------------------------
+
+    def instrument(self, namespace):
+        """Wrap the functions in a module's namespace (e.g. globals())
+
+        Every draw_* function is timed as a phase of its own name,
+        glutSwapBuffers is timed as "swap", and every gl*/glu*/glut*
+        function is counted.
+        """
+
+        for name, value in list(namespace.items()):
+            if not callable(value) or getattr(value, "_profiled", False):
+                continue
+
+            if name.startswith("draw_"):
+                namespace[name] = self._timed(value, name)
+            elif name == "glutSwapBuffers":
+                namespace[name] = self._timed(self._counted(value), "swap")
+            elif name.startswith("gl") and not name.startswith("GL"):
+                namespace[name] = self._counted(value)
+
+    def _timed(self, function, phase_name):
+        """Wrap a function so its running time goes to a phase"""
+
+        profiler = self
+
+        def timed(*args, **kwargs):
+            profiler.depth += 1
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.depth -= 1
+                profiler.add_time(phase_name, time.perf_counter() - start,
+                                  outermost=profiler.depth == 0)
+
+        timed._profiled = True
+        timed.__name__ = getattr(function, "__name__", phase_name)
+        timed.__doc__ = getattr(function, "__doc__", None)
+        return timed
+
+    def _counted(self, function):
+        """Wrap a GL function so each call is counted"""
+
+        profiler = self
+
+        def counted(*args, **kwargs):
+            profiler.gl_calls += 1
+            return function(*args, **kwargs)
+
+        counted._profiled = True
+        counted.__name__ = getattr(function, "__name__", "gl_function")
+        return counted
+
+    # --------------------------------------------------------
+    #   Reporting
+    # --------------------------------------------------------
+
+    def summary(self):
+        """Percentiles of frame time, busy time and GL calls, plus mean phase times"""
+
+        frames = list(self.frames)[1:] if len(self.frames) > 1 else list(self.frames)
+        if len(frames) == 0:
+            return None
+
+        phase_totals = {}
+        for frame in frames:
+            for name, ms in frame["phases"].items():
+                phase_totals[name] = phase_totals.get(name, 0.0) + ms
+
+        count = len(frames)
+        return {
+            "frames": count,
+            "frame_ms": percentiles([frame["frame_ms"] for frame in frames]),
+            "busy_ms": percentiles([frame["busy_ms"] for frame in frames]),
+            "gl_calls": percentiles([frame["gl_calls"] for frame in frames]),
+            "phase_mean_ms": {name: total / count for name, total in
+                              sorted(phase_totals.items(), key=lambda item: -item[1])},
+        }
+
+    def hud_lines(self, max_phases=6):
+        """A few short lines of text for an on-screen overlay"""
+
+        if self.hud_frame is not None and self.frame_number - self.hud_frame < self.hud_refresh:
+            return self.hud_text
+
+        summary = self.summary()
+        if summary is None:
+            return []
+
+        frame_ms = summary["frame_ms"]
+        busy_ms = summary["busy_ms"]
+        lines = [
+            "frame ms  p50 %.1f  p95 %.1f  p99 %.1f" % (frame_ms["p50"], frame_ms["p95"], frame_ms["p99"]),
+            "busy ms   p50 %.1f  p95 %.1f  p99 %.1f" % (busy_ms["p50"], busy_ms["p95"], busy_ms["p99"]),
+            "GL calls  p50 %d  p99 %d" % (summary["gl_calls"]["p50"], summary["gl_calls"]["p99"]),
+        ]
+
+        for name, ms in list(summary["phase_mean_ms"].items())[:max_phases]:
+            lines.append("  %-20s %.2f ms" % (name, ms))
+
+        self.hud_text = lines
+        self.hud_frame = self.frame_number
+        return lines
+
+    def dump(self, path):
+        """Write every stored frame to a .csv or .json file"""
+
+        frames = list(self.frames)
+
+        if path.endswith(".json"):
+            with open(path, "w") as trace_file:
+                json.dump({"summary": self.summary(), "frames": frames}, trace_file, indent=1)
+            return
+
+        phase_names = sorted({name for frame in frames for name in frame["phases"]})
+        with open(path, "w", newline="") as trace_file:
+            writer = csv.writer(trace_file)
+            writer.writerow(["frame", "frame_ms", "busy_ms", "gl_calls"] + phase_names)
+            for frame in frames:
+                writer.writerow([frame["frame"], "%.3f" % frame["frame_ms"],
+                                 "%.3f" % frame["busy_ms"], frame["gl_calls"]] +
+                                ["%.3f" % frame["phases"].get(name, 0.0) for name in phase_names])
+
+
+def percentiles(values):
+    """p50, p95 and p99 of a list of numbers (nearest rank)"""
+
+    ordered = sorted(values)
+    last = len(ordered) - 1
+
+    def rank(fraction):
+        return ordered[min(last, int(round(fraction * last)))]
+
+    return {"p50": rank(0.50), "p95": rank(0.95), "p99": rank(0.99)}
@@ -0,0 +1,105 @@
+"""Geometry cache for Super 3D Pong Deluxe
+
+Shapes that look the same every frame (the floor grid, cubes, spheres) are
+compiled once into OpenGL display lists and replayed with glCallList.
+Each shape is stored under a key such as ("sphere", 12, 12) together with
+the parameters it was built from; if a shape is asked for with different
+parameters it is rebuilt, otherwise the compiled list is reused. Sizes
+are not part of the key: cubes and spheres are compiled at unit size and
+scaled with glScalef, so any number of sizes share one list.
+
+Cubes and spheres are built with GLUT by default. GLUT needs a window,
+so headless runs switch to solid_cube/solid_sphere, which only use GL
+and GLU.
+"""
+
+from OpenGL.GL import *
+from OpenGL.GLU import *
+from OpenGL.GLUT import *
+
+
+# Corners and outward normal of each face of a cube centred on the origin
+CUBE_FACES = [
+    ((1, 0, 0), [(1, -1, -1), (1, 1, -1), (1, 1, 1), (1, -1, 1)]),
+    ((0, 1, 0), [(1, 1, 1), (1, 1, -1), (-1, 1, -1), (-1, 1, 1)]),
+    ((0, 0, 1), [(1, 1, 1), (-1, 1, 1), (-1, -1, 1), (1, -1, 1)]),
+    ((-1, 0, 0), [(-1, -1, 1), (-1, 1, 1), (-1, 1, -1), (-1, -1, -1)]),
+    ((0, -1, 0), [(-1, -1, 1), (-1, -1, -1), (1, -1, -1), (1, -1, 1)]),
+    ((0, 0, -1), [(-1, -1, -1), (-1, 1, -1), (1, 1, -1), (1, -1, -1)]),
+]
+
+
+def solid_cube(size):
+    """Draw a cube like glutSolidCube, without GLUT"""
+
+    half = size / 2
+    glBegin(GL_QUADS)
+    for normal, corners in CUBE_FACES:
+        glNormal3f(*normal)
+        for x, y, z in corners:
+            glVertex3f(x * half, y * half, z * half)
+    glEnd()
+
+
+def solid_sphere(radius, slices, stacks):
+    """Draw a sphere like glutSolidSphere, without GLUT"""
+
+    quadric = gluNewQuadric()
+    gluSphere(quadric, radius, slices, stacks)
+    gluDeleteQuadric(quadric)
+
+
+class GeometryCache:
+    """Display lists keyed by shape, rebuilt only when their parameters change"""
+
+    def __init__(self):
+        self.entries = {}    # key -> (params, display list id)
+        self.build_cube = glutSolidCube
+        self.build_sphere = glutSolidSphere
+
+    def draw(self, key, params, build):
+        """Draw a cached shape, compiling it with build(*params) if needed"""
+
+        entry = self.entries.get(key)
+
+        if entry is None or entry[0] != params:
+            if entry is not None:
+                glDeleteLists(entry[1], 1)
+
+            list_id = glGenLists(1)
+            glNewList(list_id, GL_COMPILE)
+            build(*params)
+            glEndList()
+
+            entry = (params, list_id)
+            self.entries[key] = entry
+
+        glCallList(entry[1])
+
+    def forget(self, key):
+        """Throw away one cached shape"""
+
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            glDeleteLists(entry[1], 1)
+
+    def clear(self):
+        """Throw away every cached shape"""
+
+        for key in list(self.entries):
+            self.forget(key)
+
+    # --------------------------------------------------------
+    #   Common shapes
+    # --------------------------------------------------------
+
+    def cube(self):
+        """Draw a 1 x 1 x 1 cube (scale it with glScalef for boxes)"""
+        self.draw(("cube",), (1.0,), self.build_cube)
+
+    def sphere(self, radius, slices, stacks):
+        """Draw a sphere: a unit sphere compiled once per (slices, stacks), scaled to radius"""
+        glPushMatrix()
+        glScalef(radius, radius, radius)
+        self.draw(("sphere", slices, stacks), (1.0, slices, stacks), self.build_sphere)
+        glPopMatrix()
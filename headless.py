@@ -0,0 +1,364 @@
+"""Headless rendering and frame capture for Super 3D Pong Deluxe
+
+Run the game with PYOPENGL_PLATFORM=egl (EGL_PLATFORM=surfaceless for
+machines without a display) or PYOPENGL_PLATFORM=osmesa and it draws
+into an offscreen context instead of a GLUT window, one simulation step
+per frame, as fast as the renderer allows:
+
+    PYOPENGL_PLATFORM=egl EGL_PLATFORM=surfaceless \\
+        python super_3d_pong_deluxe.py --seed 1 --capture - | \\
+        ffmpeg -f rawvideo -pixel_format rgb24 -video_size 800x600 \\
+               -framerate 60 -i - match.mp4
+
+Frames are read back asynchronously (OpenGL.GL.readback, synchronously
+with glReadPixels on a PyOpenGL without it) and written by
+a FrameWriter thread with a bounded queue, so encoding and disk writes
+overlap with rendering but can't fall arbitrarily far behind it. Frames
+go out as raw RGB (top row first) to a file or stdout, and/or as a
+numbered PNG sequence.
+
+GLUT can't be initialised without a window, so its solid shapes and
+bitmap fonts are replaced: shapes by geometry_cache.solid_cube and
+solid_sphere, characters by GlutFontData, which draws them with
+glBitmap from the font tables freeglut exports.
+"""
+
+import ctypes
+import os
+import queue
+import struct
+import sys
+import threading
+import zlib
+
+import numpy
+import OpenGL.GLUT
+from OpenGL import platform
+from OpenGL.GL import *
+
+import geometry_cache
+
+try:
+    from OpenGL.GL.readback import PixelReader
+except ImportError:
+    # Only the PyOpenGL copy in "First Program" has it: read frames
+    # back with a plain (waiting) glReadPixels instead
+    PixelReader = None
+
+# Frames waiting to be written before the renderer has to wait
+FRAME_QUEUE_SIZE = 8
+
+# zlib level for PNG frames (fast, the writer has to keep up with rendering)
+PNG_COMPRESSION = 1
+
+# freeglut's font tables, by the GLUT font constant they belong to
+FONT_TABLES = {
+    "GLUT_BITMAP_8_BY_13": "fgFontFixed8x13",
+    "GLUT_BITMAP_9_BY_15": "fgFontFixed9x15",
+    "GLUT_BITMAP_HELVETICA_10": "fgFontHelvetica10",
+    "GLUT_BITMAP_HELVETICA_12": "fgFontHelvetica12",
+    "GLUT_BITMAP_HELVETICA_18": "fgFontHelvetica18",
+    "GLUT_BITMAP_TIMES_ROMAN_10": "fgFontTimesRoman10",
+    "GLUT_BITMAP_TIMES_ROMAN_24": "fgFontTimesRoman24",
+}
+
+
+# ============================================================
+#                     OFFSCREEN CONTEXTS
+# ============================================================
+
+class EGLContext:
+    """An OpenGL (not ES) context on an EGL pbuffer"""
+
+    def __init__(self, width, height):
+        from OpenGL import EGL
+
+        self.egl = EGL
+        self.display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        if not EGL.eglInitialize(self.display, None, None):
+            raise RuntimeError("Unable to initialise EGL")
+
+        attributes = (EGL.EGLint * 13)(
+            EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+            EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8,
+            EGL.EGL_DEPTH_SIZE, 24,
+            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+            EGL.EGL_NONE,
+        )
+        config = EGL.EGLConfig()
+        count = EGL.EGLint()
+        EGL.eglChooseConfig(self.display, attributes, ctypes.pointer(config), 1,
+                            ctypes.pointer(count))
+        if count.value < 1:
+            raise RuntimeError("No EGL config with an RGB8 pbuffer and a depth buffer")
+
+        size = (EGL.EGLint * 5)(EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE)
+        self.surface = EGL.eglCreatePbufferSurface(self.display, config, size)
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        self.context = EGL.eglCreateContext(self.display, config, EGL.EGL_NO_CONTEXT, None)
+        if not EGL.eglMakeCurrent(self.display, self.surface, self.surface, self.context):
+            raise RuntimeError("Unable to make the EGL context current")
+
+    def close(self):
+        EGL = self.egl
+        EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE,
+                           EGL.EGL_NO_CONTEXT)
+        EGL.eglDestroySurface(self.display, self.surface)
+        EGL.eglDestroyContext(self.display, self.context)
+        EGL.eglTerminate(self.display)
+
+
+class OSMesaContext:
+    """A Mesa software context rendering into a buffer we own"""
+
+    def __init__(self, width, height):
+        from OpenGL import osmesa
+
+        self.osmesa = osmesa
+        self.context = osmesa.OSMesaCreateContextExt(osmesa.OSMESA_RGBA, 24, 0, 0, None)
+        if not self.context:
+            raise RuntimeError("Unable to create an OSMesa context")
+        self.buffer = numpy.zeros((height, width, 4), numpy.uint8)
+        if not osmesa.OSMesaMakeCurrent(self.context, self.buffer, GL_UNSIGNED_BYTE,
+                                        width, height):
+            raise RuntimeError("Unable to make the OSMesa context current")
+
+    def close(self):
+        self.osmesa.OSMesaDestroyContext(self.context)
+
+
+def create_context(width, height):
+    """Create and make current an offscreen context for the chosen platform"""
+
+    if os.environ.get("PYOPENGL_PLATFORM", "").lower() == "osmesa":
+        return OSMesaContext(width, height)
+    return EGLContext(width, height)
+
+
+# ============================================================
+#                     GLUT REPLACEMENTS
+# ============================================================
+
+class _BitmapFont(ctypes.Structure):
+    """freeglut's SFG_Font"""
+
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("quantity", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("characters", ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte))),
+        ("xorig", ctypes.c_float),
+        ("yorig", ctypes.c_float),
+    ]
+
+
+class GlutFontData:
+    """glutBitmapCharacter without GLUT: glBitmap from freeglut's font tables
+
+    Each character is its width in pixels followed by one row of bits per
+    line of the font, bottom line first. Fonts whose tables can't be found
+    (not freeglut, or no GLUT at all) draw nothing.
+    """
+
+    def __init__(self):
+        self.fonts = {}      # font key -> _BitmapFont, or None if not found
+
+    def find_font(self, font):
+        key = getattr(font, "value", font)
+        if key not in self.fonts:
+            self.fonts[key] = None
+            for name, table in FONT_TABLES.items():
+                constant = getattr(OpenGL.GLUT, name, None)
+                if getattr(constant, "value", constant) != key:
+                    continue
+                try:
+                    self.fonts[key] = _BitmapFont.in_dll(platform.PLATFORM.GLUT, table)
+                except (AttributeError, ValueError, TypeError):
+                    pass
+                break
+        return self.fonts[key]
+
+    def __call__(self, font, code):
+        """Draw one character at the raster position and advance it"""
+
+        data = self.find_font(font)
+        if data is None or not 0 <= code < data.quantity:
+            return
+        face = data.characters[code]
+        if not face:
+            return
+        width = face[0]
+
+        glPushClientAttrib(GL_CLIENT_PIXEL_STORE_BIT)
+        glPixelStorei(GL_UNPACK_SWAP_BYTES, GL_FALSE)
+        glPixelStorei(GL_UNPACK_LSB_FIRST, GL_FALSE)
+        glPixelStorei(GL_UNPACK_ROW_LENGTH, 0)
+        glPixelStorei(GL_UNPACK_SKIP_ROWS, 0)
+        glPixelStorei(GL_UNPACK_SKIP_PIXELS, 0)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        bits = ctypes.cast(ctypes.addressof(face.contents) + 1, ctypes.c_void_p)
+        glBitmap(width, data.height, data.xorig, data.yorig, width, 0, bits)
+        glPopClientAttrib()
+
+
+def replace_glut(geometry, fonts):
+    """Draw a GeometryCache's shapes and a TextRenderer's text without GLUT"""
+
+    geometry.build_cube = geometry_cache.solid_cube
+    geometry.build_sphere = geometry_cache.solid_sphere
+    fonts.draw_character = GlutFontData()
+
+
+# ============================================================
+#                     FRAME OUTPUT
+# ============================================================
+
+class RawVideoOutput:
+    """Frames as raw 8-bit RGB, one after the other, to a file or stdout ("-")"""
+
+    def __init__(self, path):
+        if path == "-":
+            self.file = sys.stdout.buffer
+            self.owned = False
+        else:
+            self.file = open(path, "wb")
+            self.owned = True
+
+    def write(self, frame):
+        self.file.write(frame.tobytes())
+
+    def close(self):
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+def png_chunk(tag, data):
+    """One PNG chunk: length, tag, data and CRC"""
+    return (struct.pack(">I", len(data)) + tag + data +
+            struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+
+def encode_png(frame):
+    """PNG file contents for a height x width x 3 array of bytes (top row first)"""
+
+    height, width = frame.shape[:2]
+    rows = numpy.zeros((height, width * 3 + 1), numpy.uint8)    # filter byte 0 per row
+    rows[:, 1:] = frame.reshape(height, width * 3)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" +
+            png_chunk(b"IHDR", header) +
+            png_chunk(b"IDAT", zlib.compress(rows.tobytes(), PNG_COMPRESSION)) +
+            png_chunk(b"IEND", b""))
+
+
+class PngSequenceOutput:
+    """Frames as frame_000000.png, frame_000001.png... in a directory"""
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.count = 0
+
+    def write(self, frame):
+        path = os.path.join(self.directory, "frame_%06d.png" % self.count)
+        with open(path, "wb") as file:
+            file.write(encode_png(frame))
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+class FrameWriter:
+    """Hands frames to the outputs on a thread, through a bounded queue
+
+    put() blocks while the queue is full, so a slow output slows the
+    renderer down instead of piling up frames in memory. An error in an
+    output (a closed pipe, a full disk) stops the writer and is raised
+    by the next put() or by close().
+    """
+
+    def __init__(self, outputs, queue_size=FRAME_QUEUE_SIZE):
+        self.outputs = outputs
+        self.frames = queue.Queue(queue_size)
+        self.error = None
+        self.thread = threading.Thread(target=self.run, name="FrameWriter", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                return
+            if self.error is not None:
+                continue
+            try:
+                # glReadPixels rows start at the bottom of the image
+                frame = numpy.ascontiguousarray(frame[::-1])
+                for output in self.outputs:
+                    output.write(frame)
+            except Exception as error:
+                self.error = error
+
+    def put(self, frame):
+        if self.error is not None:
+            raise self.error
+        self.frames.put(frame)
+
+    def close(self):
+        """Write the remaining frames, close the outputs"""
+
+        self.frames.put(None)
+        self.thread.join()
+        for output in self.outputs:
+            try:
+                output.close()
+            except Exception as error:
+                if self.error is None:
+                    self.error = error
+        if self.error is not None:
+            raise self.error
+
+
+class FrameCapture:
+    """Reads each rendered frame back and queues it on a FrameWriter"""
+
+    def __init__(self, width, height, outputs):
+        self.width = width
+        self.height = height
+        self.reader = None
+        if PixelReader is not None:
+            self.reader = PixelReader(width, height, GL_RGB, GL_UNSIGNED_BYTE)
+        self.writer = FrameWriter(outputs)
+        self.frame_count = 0
+
+    def capture(self):
+        """Start reading the frame just drawn, pass on any earlier ones now ready"""
+
+        if self.reader is None:
+            pixels = glReadPixels(0, 0, self.width, self.height, GL_RGB, GL_UNSIGNED_BYTE)
+            self.writer.put(numpy.frombuffer(pixels, numpy.uint8).reshape(self.height, self.width, 3))
+            self.frame_count += 1
+            return
+
+        self.reader.read()
+        self.write(self.reader.ready())
+
+    def write(self, reads):
+        for pending in reads:
+            # A fresh array per frame, the writer may still be using the last one
+            frame = numpy.empty((self.height, self.width, 3), numpy.uint8)
+            self.writer.put(pending.result(frame))
+            self.frame_count += 1
+
+    def close(self):
+        """Write the frames still being read, then finish writing"""
+
+        try:
+            if self.reader is not None:
+                self.write(self.reader.flush())
+                self.reader.delete()
+        finally:
+            self.writer.close()
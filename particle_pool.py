@@ -0,0 +1,114 @@
+"""Particle pool for Super 3D Pong Deluxe
+
+Every spark lives in a row of a few NumPy columns (position, speed, color,
+life) instead of being its own dictionary. The pool never grows: live
+particles are packed at the front, dead ones are swapped out from the back,
+and when the pool is full new sparks reuse the oldest slots in turn.
+"""
+
+import numpy
+
+
+class ParticlePool:
+    """A fixed-size set of particles that all move in one step"""
+
+    def __init__(self, capacity, gravity=0.5):
+        self.capacity = capacity
+        self.gravity = gravity
+
+        self.positions = numpy.zeros((capacity, 3), dtype=numpy.float32)
+        self.speeds = numpy.zeros((capacity, 3), dtype=numpy.float32)
+        self.colors = numpy.zeros((capacity, 3), dtype=numpy.float32)
+        self.life = numpy.zeros(capacity, dtype=numpy.int32)
+
+        self.count = 0           # Live particles are rows [0, count)
+        self.reuse_slot = 0      # Next slot to overwrite when full
+        self.random = numpy.random.default_rng()
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+        self.reuse_slot = 0
+
+    def live_positions(self):
+        """Positions of the live particles (a view, not a copy)"""
+        return self.positions[:self.count]
+
+    def live_colors(self):
+        """Colors of the live particles (a view, not a copy)"""
+        return self.colors[:self.count]
+
+    def spawn_burst(self, x, y, z, color, count,
+                    spread=8.0, lift=(2.0, 7.0), life=(20, 50)):
+        """Add a burst of sparks flying out from one point"""
+
+        count = min(count, self.capacity)
+        slots = self._take_slots(count)
+
+        self.positions[slots] = (x, y, z)
+        self.colors[slots] = color
+
+        speeds = self.speeds
+        speeds[slots, 0] = (self.random.random(count) - 0.5) * spread
+        speeds[slots, 1] = self.random.uniform(lift[0], lift[1], count)
+        speeds[slots, 2] = (self.random.random(count) - 0.5) * spread
+
+        self.life[slots] = self.random.integers(life[0], life[1] + 1, count)
+
+    def update(self):
+        """Move every particle, apply gravity and drop the dead ones"""
+
+        if self.count == 0:
+            return
+
+        n = self.count
+        self.positions[:n] += self.speeds[:n]
+        self.speeds[:n, 1] -= self.gravity
+        self.life[:n] -= 1
+
+        self._remove_dead()
+
+    def _take_slots(self, count):
+        """Get row indices for new particles, reusing old ones when full"""
+
+        free = self.capacity - self.count
+        fresh = min(count, free)
+        slots = numpy.arange(self.count, self.count + fresh)
+        self.count += fresh
+
+        # Pool is full: overwrite live particles, going round in a ring
+        reused = count - fresh
+        if reused > 0:
+            ring = (self.reuse_slot + numpy.arange(reused)) % self.capacity
+            self.reuse_slot = int(ring[-1] + 1) % self.capacity
+            slots = numpy.concatenate((slots, ring))
+
+        return slots
+
+    def _remove_dead(self):
+        """Fill holes left by dead particles with live ones from the end"""
+
+        n = self.count
+        dead = self.life[:n] <= 0
+        dead_count = int(numpy.count_nonzero(dead))
+        if dead_count == 0:
+            return
+
+        new_count = n - dead_count
+
+        # Holes in the part we keep, and survivors past the end of it
+        holes = numpy.flatnonzero(dead[:new_count])
+        movers = numpy.flatnonzero(~dead[new_count:]) + new_count
+
+        if len(holes) > 0:
+            self.positions[holes] = self.positions[movers]
+            self.speeds[holes] = self.speeds[movers]
+            self.colors[holes] = self.colors[movers]
+            self.life[holes] = self.life[movers]
+
+        self.count = new_count
+        if self.reuse_slot >= new_count:
+            self.reuse_slot = 0
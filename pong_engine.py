@@ -0,0 +1,956 @@
+"""Game simulation for Super 3D Pong Deluxe
+
+All the rules of the game - paddles, balls, scoring, powerups and the AI -
+live here, with no OpenGL at all. A PongEngine has its own random number
+generator, so a match started with the same seed and fed the same inputs
+always plays out exactly the same way, and it can be stepped as fast as
+the CPU allows.
+
+The engine does not draw anything or make sparks. Instead every step
+returns a list of events (paddle hits, points, powerups...) that the game
+turns into particles, floating text and screen shake.
+
+Balls are kept in a BallSet - one NumPy column per property - and are all
+moved and collided together, so a match with dozens of balls costs about
+the same Python work as a match with one. A handful of balls (the usual
+case) are moved one at a time with plain floats instead, which is quicker
+than NumPy for so few and gives exactly the same results.
+"""
+
+import math
+import random
+
+import numpy
+
+
+# ============================================================
+#                     GAME SETTINGS
+# ============================================================
+
+# Playing field size
+FIELD_WIDTH = 400
+FIELD_DEPTH = 800
+
+# Paddle settings
+PADDLE_WIDTH = 80
+PADDLE_HEIGHT = 15
+PADDLE_DEPTH = 15
+
+# Ball settings
+BALL_SIZE = 8
+TRAIL_LENGTH = 12        # Positions remembered for the motion trail
+
+# Game rules
+POINTS_TO_WIN = 11
+DASH_COOLDOWN_TIME = 120
+
+# Movement speeds
+NORMAL_SPEED = 6
+DASH_SPEED = 50
+
+# AI settings
+AI_SPEED_FACTOR = 0.8    # AI moves slightly slower than a human
+AI_ERROR = 40            # How far off the AI aims (so it isn't perfect)
+
+# Input actions (one bit each, so a frame's input fits in one number)
+P1_LEFT = 1
+P1_RIGHT = 2
+P1_DASH = 4
+P2_LEFT = 8
+P2_RIGHT = 16
+P2_DASH = 32
+
+# Event types returned by PongEngine.step
+EVENT_DASH = "DASH"                  # player, x, z
+EVENT_WALL_BOUNCE = "WALL_BOUNCE"    # x, z
+EVENT_PADDLE_HIT = "PADDLE_HIT"      # player, x, z
+EVENT_POINT = "POINT"                # player (who scored)
+EVENT_ON_FIRE = "ON_FIRE"            # player
+EVENT_POWERUP = "POWERUP"            # player, kind, x, z
+EVENT_MAYHEM = "MAYHEM"
+EVENT_GAME_OVER = "GAME_OVER"        # player (who won)
+
+
+# ============================================================
+#                     CREATE FUNCTIONS
+# ============================================================
+
+def create_player(player_number):
+    """Create a new player dictionary"""
+
+    # Player 1 starts at near end, Player 2 at far end
+    if player_number == 1:
+        z_position = -FIELD_DEPTH / 2 + 40
+    else:
+        z_position = FIELD_DEPTH / 2 - 40
+
+    return {
+        "number": player_number,
+        "x": 0,
+        "z": z_position,
+        "width":  PADDLE_WIDTH,
+        "score": 0,
+        "win_streak": 0,
+        "dash_cooldown": 0,
+        "is_giant": False,
+        "giant_time_left": 0,
+        "dash_time_left": 0,
+
+        # Position at the previous step (for smooth drawing)
+        "prev_x": 0,
+        "prev_width": PADDLE_WIDTH,
+    }
+
+
+def create_ball(balls, serving_player, rng):
+    """Add a new ball to a BallSet, served by serving_player"""
+
+    # Ball starts near the serving player
+    if serving_player == 1:
+        z_position = -FIELD_DEPTH / 2 + 100
+        direction = 1    # Move towards Player 2
+    else:
+        z_position = FIELD_DEPTH / 2 - 100
+        direction = -1   # Move towards Player 1
+
+    balls.add(x=0,
+              y=BALL_SIZE,
+              z=z_position,
+              speed_x=(rng.random() - 0.5) * 6,
+              speed_z=direction * 9.0)
+
+
+def create_powerup(rng):
+    """Create a powerup at a random position"""
+
+    # Random position in middle of field
+    x = (rng.random() - 0.5) * FIELD_WIDTH * 0.8
+    z = (rng.random() - 0.5) * FIELD_DEPTH * 0.5
+
+    # Random type
+    if rng.random() > 0.5:
+        powerup_type = "GIANT"
+    else:
+        powerup_type = "MULTIBALL"
+
+    return {
+        "x": x,
+        "z": z,
+        "type": powerup_type,
+        "rotation": 0,
+    }
+
+
+# ============================================================
+#                     PLAYER FUNCTIONS
+# ============================================================
+
+def move_player(player, direction, speed):
+    """Move paddle along x (direction is -1 for left, +1 for right)"""
+    player["x"] += direction * speed
+    keep_player_in_bounds(player)
+
+
+def move_player_towards(player, target_x, speed):
+    """Move paddle towards a target x position (for AI)"""
+    if player["x"] < target_x - 10:
+        player["x"] += speed
+    elif player["x"] > target_x + 10:
+        player["x"] -= speed
+    keep_player_in_bounds(player)
+
+
+def keep_player_in_bounds(player):
+    """Make sure player doesn't go outside the field"""
+
+    left_limit = -FIELD_WIDTH / 2 + player["width"] / 2
+    right_limit = FIELD_WIDTH / 2 - player["width"] / 2
+
+    if player["x"] < left_limit:
+        player["x"] = left_limit
+
+    if player["x"] > right_limit:
+        player["x"] = right_limit
+
+
+def try_player_dash(player):
+    """Try to use dash.  Returns True if successful."""
+
+    if player["dash_cooldown"] == 0:
+        player["dash_cooldown"] = DASH_COOLDOWN_TIME
+        player["dash_time_left"] = 30
+        return True
+
+    return False
+
+
+def update_player(player):
+    """Update player state each frame"""
+
+    # Count down dash cooldown
+    if player["dash_cooldown"] > 0:
+        player["dash_cooldown"] -= 1
+
+    # Count down dash active time
+    if player["dash_time_left"] > 0:
+        player["dash_time_left"] -= 1
+
+    # Count down giant powerup
+    if player["is_giant"]:
+        player["giant_time_left"] -= 1
+        if player["giant_time_left"] <= 0:
+            player["is_giant"] = False
+
+    # Smoothly change paddle width
+    if player["is_giant"]:
+        target_width = PADDLE_WIDTH * 1.5
+    else:
+        target_width = PADDLE_WIDTH
+
+    # Gradual size change (10% per frame)
+    player["width"] = player["width"] + (target_width - player["width"]) * 0.1
+
+
+def make_player_giant(player):
+    """Give player the giant paddle powerup"""
+    player["is_giant"] = True
+    player["giant_time_left"] = 600  # About 10 seconds
+
+
+# ============================================================
+#                     BALL FUNCTIONS
+# ============================================================
+
+# Where a ball's center touches a side wall (in x) or the front of a paddle (in z)
+WALL_X = FIELD_WIDTH / 2 - BALL_SIZE
+PADDLE_FACE_Z = FIELD_DEPTH / 2 - 40 - PADDLE_DEPTH - BALL_SIZE
+
+# How far (x, y, z) a ball must reach before it might bounce this step
+BOUNCE_LIMITS = numpy.array([WALL_X, numpy.inf, PADDLE_FACE_Z])
+
+# Most bounces worked out for one ball in one step
+MAX_BOUNCES_PER_STEP = 4
+
+# A ball this far from the center (in z) has gone past a player
+OUT_Z = FIELD_DEPTH / 2 + 50
+
+# Up to this many balls, moving them one at a time with plain floats is
+# quicker than setting up the NumPy arrays
+FEW_BALLS = 4
+
+
+class BallSet:
+    """Every ball in play, stored as NumPy arrays with one row per ball
+
+    position, velocity and prev_position are (capacity x 3) arrays; x, z,
+    speed_x, speed_z, prev_x and prev_z are views of their columns. Only
+    the first count rows are in use.
+    """
+
+    def __init__(self, capacity=8):
+        self.count = 0
+        self.capacity = 0
+
+        # The trail is a ring shared by all balls (they all move together):
+        # trail_head is the slot the next position goes into, trail_saves
+        # counts the positions saved so far
+        self.trail_head = 0
+        self.trail_saves = 0
+
+        self._resize(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _resize(self, capacity):
+        """Move everything into bigger arrays"""
+
+        n = self.count
+
+        position = numpy.zeros((capacity, 3))
+        velocity = numpy.zeros((capacity, 3))
+        prev_position = numpy.zeros((capacity, 3))
+        trail = numpy.zeros((capacity, TRAIL_LENGTH, 3))
+        trail_start = numpy.zeros(capacity, dtype=numpy.int64)
+
+        if n > 0:
+            position[:n] = self.position[:n]
+            velocity[:n] = self.velocity[:n]
+            prev_position[:n] = self.prev_position[:n]
+            trail[:n] = self.trail[:n]
+            trail_start[:n] = self.trail_start[:n]
+
+        self.position = position
+        self.velocity = velocity
+        self.prev_position = prev_position
+        self.trail = trail
+        self.trail_start = trail_start    # trail_saves when each ball was added
+
+        # Handy names for single columns
+        self.x = position[:, 0]
+        self.y = position[:, 1]
+        self.z = position[:, 2]
+        self.speed_x = velocity[:, 0]
+        self.speed_z = velocity[:, 2]
+        self.prev_x = prev_position[:, 0]
+        self.prev_z = prev_position[:, 2]
+
+        self.capacity = capacity
+
+    def add(self, x, y, z, speed_x, speed_z):
+        """Add a ball at the end"""
+
+        if self.count == self.capacity:
+            self._resize(self.capacity * 2)
+
+        i = self.count
+        self.position[i] = (x, y, z)
+        self.velocity[i] = (speed_x, 0, speed_z)
+        self.prev_position[i] = (x, y, z)
+        self.trail_start[i] = self.trail_saves
+
+        self.count += 1
+
+    def remove(self, indices):
+        """Remove some balls, keeping the rest in the same order"""
+
+        n = self.count
+        keep = numpy.ones(n, dtype=bool)
+        keep[indices] = False
+        kept = int(numpy.count_nonzero(keep))
+
+        for array in (self.position, self.velocity, self.prev_position,
+                      self.trail, self.trail_start):
+            array[:kept] = array[:n][keep]
+
+        self.count = kept
+
+    def save_previous_positions(self):
+        """Remember where the balls are before a step (for smooth drawing)"""
+        self.prev_position[:self.count] = self.position[:self.count]
+
+    def save_trail(self):
+        """Add every ball's position to its trail (overwrites the oldest one)"""
+
+        n = self.count
+        self.trail[:n, self.trail_head] = self.position[:n]
+        self.trail_head = (self.trail_head + 1) % TRAIL_LENGTH
+        self.trail_saves += 1
+
+    def trail_points(self, i):
+        """The trail of ball i as (x, y, z) rows, oldest first"""
+
+        length = min(self.trail_saves - int(self.trail_start[i]), TRAIL_LENGTH)
+        slots = (self.trail_head - length + numpy.arange(length)) % TRAIL_LENGTH
+        return self.trail[i, slots]
+
+
+def wall_impact_times(x, speed_x):
+    """When (in steps from now) each ball reaches the side wall it is heading for"""
+
+    target = numpy.copysign(WALL_X, speed_x)
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        times = (target - x) / speed_x
+
+    # Already past the wall and still going out: bounce straight away
+    times = numpy.maximum(times, 0.0)
+    return numpy.where(speed_x != 0, times, numpy.inf)
+
+
+def paddle_impact_times(x, z, speed_x, speed_z, player):
+    """When (in steps from now) each ball reaches a player's paddle, or inf if it misses
+
+    The ball is treated as a point and the paddle as a box grown by
+    BALL_SIZE, so only its front face (the one facing the table) can be hit.
+    """
+
+    # Player 1 is at negative z, Player 2 at positive z
+    if player["number"] == 1:
+        side = -1
+    else:
+        side = 1
+
+    reach_z = PADDLE_DEPTH + BALL_SIZE
+    face_z = player["z"] - side * reach_z
+
+    closing_speed = speed_z * side      # > 0 when heading for the paddle
+    gap = (face_z - z) * side           # < 0 once past the front face
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        times = gap / closing_speed
+
+    # Already inside the paddle (e.g. it just grew): hit straight away
+    inside = (gap <= 0) & ((z - player["z"]) * side < reach_z)
+    times = numpy.where(inside, 0.0, times)
+
+    # Where the ball will be across the paddle when it gets there
+    x_at_impact = x + speed_x * times
+    on_paddle = numpy.abs(x_at_impact - player["x"]) < player["width"] / 2 + BALL_SIZE
+
+    hit = (closing_speed > 0) & (times >= 0) & on_paddle
+    return numpy.where(hit, times, numpy.inf)
+
+
+def wall_impact_time(x, speed_x):
+    """wall_impact_times for one ball, with plain floats"""
+
+    if speed_x == 0:
+        return math.inf
+
+    time = (math.copysign(WALL_X, speed_x) - x) / speed_x
+    return max(time, 0.0)
+
+
+def paddle_impact_time(x, z, speed_x, speed_z, player):
+    """paddle_impact_times for one ball, with plain floats"""
+
+    if player["number"] == 1:
+        side = -1
+    else:
+        side = 1
+
+    reach_z = PADDLE_DEPTH + BALL_SIZE
+    face_z = player["z"] - side * reach_z
+
+    closing_speed = speed_z * side
+    if closing_speed <= 0:
+        return math.inf
+
+    gap = (face_z - z) * side
+    if gap <= 0 and (z - player["z"]) * side < reach_z:
+        time = 0.0
+    else:
+        time = gap / closing_speed
+        if time < 0:
+            return math.inf
+
+    x_at_impact = x + speed_x * time
+    if abs(x_at_impact - player["x"]) < player["width"] / 2 + BALL_SIZE:
+        return time
+    return math.inf
+
+
+def bounce_off_paddle(balls, indices, player):
+    """Send balls back from a paddle, faster and with spin"""
+
+    speed_z = numpy.abs(balls.speed_z[indices]) * 1.05
+
+    # Hit by Player 1: send towards Player 2, and the other way round
+    if player["number"] == 1:
+        balls.speed_z[indices] = speed_z
+    else:
+        balls.speed_z[indices] = -speed_z
+
+    # Add spin based on where it hit the paddle
+    half_width = player["width"] / 2
+    hit_offset = (balls.x[indices] - player["x"]) / half_width
+    balls.speed_x[indices] += hit_offset * 4
+
+
+def sweep_balls(balls, player_1, player_2):
+    """Move every ball one step, bouncing off walls and paddles on the way
+
+    Collisions are found by time of impact along each ball's path, so a
+    fast ball can't jump over a paddle between two frames. A ball can
+    bounce several times in one step (wall, then paddle...).
+
+    Returns a list of (ball index, event type, player number, x, z) for
+    every bounce, in order for each ball.
+    """
+
+    n = balls.count
+    collisions = []
+
+    # Save position for trail effect
+    balls.save_trail()
+
+    # Balls that can't reach a wall or a paddle this step just move
+    reach = numpy.abs(balls.position[:n]) + numpy.abs(balls.velocity[:n])
+    near_something = reach > BOUNCE_LIMITS
+
+    if numpy.count_nonzero(near_something) == 0:
+        balls.position[:n] += balls.velocity[:n]
+        return collisions
+
+    can_bounce = near_something[:, 0] | near_something[:, 2]
+    quiet = ~can_bounce
+    balls.position[:n][quiet] += balls.velocity[:n][quiet]
+
+    moving = numpy.flatnonzero(can_bounce)
+    time_left = numpy.ones(len(moving))
+
+    for bounce in range(MAX_BOUNCES_PER_STEP):
+        position = balls.position[moving]
+        velocity = balls.velocity[moving]
+        x, z = position[:, 0], position[:, 2]
+        speed_x, speed_z = velocity[:, 0], velocity[:, 2]
+
+        wall_times = wall_impact_times(x, speed_x)
+        paddle_1_times = paddle_impact_times(x, z, speed_x, speed_z, player_1)
+        paddle_2_times = paddle_impact_times(x, z, speed_x, speed_z, player_2)
+        first_time = numpy.minimum(numpy.minimum(wall_times, paddle_1_times), paddle_2_times)
+
+        # Balls that hit nothing finish their move
+        hits = first_time <= time_left
+        free = ~hits
+        balls.position[moving[free]] = (position[free] +
+                                        velocity[free] * time_left[free, numpy.newaxis])
+
+        if numpy.count_nonzero(hits) == 0:
+            break
+
+        # Move the others up to the point of impact
+        first_time = first_time[hits]
+        moving = moving[hits]
+        time_left = time_left[hits] - first_time
+        balls.position[moving] = position[hits] + velocity[hits] * first_time[:, numpy.newaxis]
+
+        # Bounce off whatever they hit first (walls win a tie)
+        hit_wall = wall_times[hits] == first_time
+        hit_paddle_1 = ~hit_wall & (paddle_1_times[hits] == first_time)
+        hit_paddle_2 = ~hit_wall & ~hit_paddle_1
+
+        balls.speed_x[moving[hit_wall]] *= -1
+        bounce_off_paddle(balls, moving[hit_paddle_1], player_1)
+        bounce_off_paddle(balls, moving[hit_paddle_2], player_2)
+
+        for i, wall, paddle_1 in zip(moving.tolist(), hit_wall.tolist(), hit_paddle_1.tolist()):
+            if wall:
+                collision = (i, EVENT_WALL_BOUNCE, None)
+            elif paddle_1:
+                collision = (i, EVENT_PADDLE_HIT, 1)
+            else:
+                collision = (i, EVENT_PADDLE_HIT, 2)
+            collisions.append(collision + (float(balls.x[i]), float(balls.z[i])))
+
+    else:
+        # Out of bounces for this step: let the rest just move
+        balls.position[moving] += balls.velocity[moving] * time_left[:, numpy.newaxis]
+
+    # Group by ball, keeping each ball's bounces in time order
+    collisions.sort(key=lambda collision: collision[0])
+    return collisions
+
+
+def sweep_few_balls(balls, player_1, player_2):
+    """sweep_balls for a handful of balls, moved one at a time with plain floats
+
+    Does exactly the same arithmetic as sweep_balls, so a match plays out
+    the same whichever one moves its balls.
+    """
+
+    n = balls.count
+    collisions = []
+
+    balls.save_trail()
+
+    positions = balls.position[:n].tolist()
+    velocities = balls.velocity[:n].tolist()
+
+    for i in range(n):
+        position = positions[i]
+        x, y, z = position
+        speed_x, speed_y, speed_z = velocities[i]
+
+        # Can't reach a wall or a paddle this step: just move
+        if (abs(x) + abs(speed_x) <= WALL_X and
+                abs(z) + abs(speed_z) <= PADDLE_FACE_Z):
+            position[0] = x + speed_x
+            position[1] = y + speed_y
+            position[2] = z + speed_z
+            continue
+
+        time_left = 1.0
+        bounced = False
+
+        for bounce in range(MAX_BOUNCES_PER_STEP):
+            wall_time = wall_impact_time(x, speed_x)
+            paddle_1_time = paddle_impact_time(x, z, speed_x, speed_z, player_1)
+            paddle_2_time = paddle_impact_time(x, z, speed_x, speed_z, player_2)
+            first_time = min(min(wall_time, paddle_1_time), paddle_2_time)
+
+            if not first_time <= time_left:
+                break
+
+            bounced = True
+
+            time_left = time_left - first_time
+            x = x + speed_x * first_time
+            y = y + speed_y * first_time
+            z = z + speed_z * first_time
+
+            if wall_time == first_time:
+                speed_x *= -1
+                collision = (i, EVENT_WALL_BOUNCE, None)
+            else:
+                if paddle_1_time == first_time:
+                    player = player_1
+                else:
+                    player = player_2
+
+                # Same as bounce_off_paddle
+                if player["number"] == 1:
+                    speed_z = abs(speed_z) * 1.05
+                else:
+                    speed_z = -(abs(speed_z) * 1.05)
+                hit_offset = (x - player["x"]) / (player["width"] / 2)
+                speed_x += hit_offset * 4
+                collision = (i, EVENT_PADDLE_HIT, player["number"])
+
+            collisions.append(collision + (x, z))
+
+        # Finish the move (also when out of bounces for this step)
+        position[0] = x + speed_x * time_left
+        position[1] = y + speed_y * time_left
+        position[2] = z + speed_z * time_left
+
+        if bounced:
+            balls.speed_x[i] = speed_x
+            balls.speed_z[i] = speed_z
+
+    balls.position[:n] = positions
+    return collisions
+
+
+def closest_incoming_ball(balls, player):
+    """Index of the nearest ball heading towards a player, or None"""
+
+    n = balls.count
+    if n == 0:
+        return None
+
+    # Player 1 is at negative z, Player 2 at positive z
+    if player["number"] == 1:
+        towards_player = -1
+    else:
+        towards_player = 1
+
+    # Just one ball (the usual case): no need for arrays
+    if n == 1:
+        if float(balls.speed_z[0]) * towards_player > 0:
+            return 0
+        return None
+
+    incoming = balls.speed_z[:n] * towards_player > 0
+
+    if numpy.count_nonzero(incoming) == 0:
+        return None
+
+    distances = numpy.abs(balls.z[:n] - player["z"])
+    distances[~incoming] = numpy.inf
+    return int(distances.argmin())
+
+
+# ============================================================
+#                     POWERUP FUNCTIONS
+# ============================================================
+
+def update_powerup(powerup):
+    """Make the powerup spin"""
+    powerup["rotation"] += 2
+
+
+def first_ball_touching_powerup(balls, powerup):
+    """Index of the first ball touching the powerup, or None"""
+
+    n = balls.count
+
+    # A few balls: no need for arrays
+    if n <= FEW_BALLS:
+        reach = 25 + BALL_SIZE
+        for i, (x, y, z) in enumerate(balls.position[:n].tolist()):
+            dx = x - powerup["x"]
+            dz = z - powerup["z"]
+            if dx * dx + dz * dz < reach * reach:
+                return i
+        return None
+
+    dx = balls.x[:n] - powerup["x"]
+    dz = balls.z[:n] - powerup["z"]
+
+    # Compare squared distances (no square root needed)
+    reach = 25 + BALL_SIZE
+    touching = dx * dx + dz * dz < reach * reach
+
+    if numpy.count_nonzero(touching) == 0:
+        return None
+    return int(touching.argmax())
+
+
+# ============================================================
+#                     THE ENGINE
+# ============================================================
+
+class PongEngine:
+    """One match of Pong, stepped one frame at a time without any graphics"""
+
+    def __init__(self, seed=None, ai_players=(2,),
+                 ai_speed_factor=AI_SPEED_FACTOR, ai_error=AI_ERROR):
+
+        # Pick a seed if we weren't given one, so the match can be replayed
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+
+        self.seed = seed
+        self.random = random.Random(seed)
+
+        # Which players the computer controls, and how well
+        self.ai_players = tuple(ai_players)
+        self.ai_speed_factor = ai_speed_factor
+        self.ai_error = ai_error
+
+        self.player_1 = create_player(1)
+        self.player_2 = create_player(2)
+        self.balls = BallSet()
+        self.powerup = None
+
+        self.rally_count = 0
+        self.frame_count = 0
+        self.winner = None
+        self.events = []
+
+        self.spawn_ball(1)  # Player 1 serves first
+
+    def get_player(self, player_number):
+        """Get a player by number (1 or 2)"""
+        if player_number == 1:
+            return self.player_1
+        return self.player_2
+
+    def emit(self, event_type, **details):
+        """Record something that happened this step"""
+        details["type"] = event_type
+        self.events.append(details)
+
+    # --------------------------------------------------------
+    #   Main step
+    # --------------------------------------------------------
+
+    def step(self, actions=0):
+        """Advance the match one frame. Returns the list of events."""
+
+        self.events = []
+
+        # Nothing moves once the match is won
+        if self.winner is not None:
+            return self.events
+
+        self.frame_count += 1
+
+        # Update players
+        self.handle_player(self.player_1, actions, P1_LEFT, P1_RIGHT, P1_DASH)
+        self.handle_player(self.player_2, actions, P2_LEFT, P2_RIGHT, P2_DASH)
+        update_player(self.player_1)
+        update_player(self.player_2)
+
+        # Update balls
+        self.update_all_balls()
+
+        # Update powerups
+        self.maybe_spawn_powerup()
+        self.update_powerup_collision()
+
+        # Multiball mayhem at 5 hits!
+        self.check_mayhem_trigger()
+
+        return self.events
+
+    def run(self, frames, actions=0):
+        """Step several frames with the same input (stops early on a win)"""
+
+        for i in range(frames):
+            if self.winner is not None:
+                break
+            self.step(actions)
+
+    # --------------------------------------------------------
+    #   Players
+    # --------------------------------------------------------
+
+    def handle_player(self, player, actions, left_bit, right_bit, dash_bit):
+        """Move a player from its input bits, or let the AI move it"""
+
+        if player["number"] in self.ai_players:
+            self.handle_ai(player, NORMAL_SPEED)
+            return
+
+        speed = NORMAL_SPEED
+
+        # Check for dash
+        if actions & dash_bit:
+            if try_player_dash(player):
+                speed = DASH_SPEED
+                self.emit(EVENT_DASH, player=player["number"],
+                          x=player["x"], z=player["z"])
+
+        if actions & left_bit:
+            move_player(player, -1, speed)
+
+        if actions & right_bit:
+            move_player(player, 1, speed)
+
+    def handle_ai(self, player, speed):
+        """AI Logic that tries to hit the ball"""
+
+        # Default: go to center
+        target_x = 0
+
+        closest_ball = closest_incoming_ball(self.balls, player)
+
+        # Track the closest incoming ball
+        if closest_ball is not None:
+            # Add some error so AI isn't perfect
+            error = math.sin(self.frame_count * 0.05) * self.ai_error
+            target_x = float(self.balls.x[closest_ball]) + error
+
+        move_player_towards(player, target_x, speed * self.ai_speed_factor)
+
+    # --------------------------------------------------------
+    #   Balls and scoring
+    # --------------------------------------------------------
+
+    def spawn_ball(self, serving_player):
+        """Add a new ball to the game"""
+        create_ball(self.balls, serving_player, self.random)
+
+    def update_all_balls(self):
+        """Update all balls in the game"""
+
+        balls = self.balls
+        n = balls.count
+        if n == 0:
+            return
+
+        if n <= FEW_BALLS:
+            collisions = sweep_few_balls(balls, self.player_1, self.player_2)
+            went_past = [abs(z) > OUT_Z for z in balls.z[:n].tolist()]
+            past = [i for i in range(n) if went_past[i]]
+        else:
+            # Move and collide every ball at once
+            collisions = sweep_balls(balls, self.player_1, self.player_2)
+            went_past = numpy.abs(balls.z[:n]) > OUT_Z
+            past = numpy.flatnonzero(went_past).tolist()
+
+        if len(collisions) == 0 and len(past) == 0:
+            return
+
+        # Report what happened, one ball at a time and in order
+        bounces = {}
+        for collision in collisions:
+            bounces.setdefault(collision[0], []).append(collision)
+
+        busy = sorted(set(bounces) | set(past))
+
+        went_out = []
+        for i in busy:
+            for ball, event_type, player_number, x, z in bounces.get(i, ()):
+                if event_type == EVENT_WALL_BOUNCE:
+                    self.emit(EVENT_WALL_BOUNCE, x=x, z=z)
+                else:
+                    self.rally_count += 1
+                    self.emit(EVENT_PADDLE_HIT, player=player_number, x=x, z=z)
+
+            # Check scoring
+            if went_past[i]:
+                went_out.append(i)
+                balls_left = n - len(went_out)
+
+                if balls.z[i] < 0:
+                    self.score_point(2, balls_left)  # Player 2 scores
+                else:
+                    self.score_point(1, balls_left)  # Player 1 scores
+
+        # Remove the balls that went out
+        if len(went_out) > 0:
+            balls.remove(went_out)
+
+    def score_point(self, winner_number, balls_left):
+        """Handle when a player scores a point (balls_left: balls still in play)"""
+
+        winner = self.get_player(winner_number)
+        loser = self.get_player(3 - winner_number)
+
+        # Update scores
+        winner["score"] += 1
+        winner["win_streak"] += 1
+        loser["win_streak"] = 0
+        self.emit(EVENT_POINT, player=winner_number)
+
+        # Hot streak
+        if winner["win_streak"] == 3:
+            self.emit(EVENT_ON_FIRE, player=winner_number)
+
+        # Check for winner
+        for player in (self.player_1, self.player_2):
+            if player["score"] >= POINTS_TO_WIN:
+                if self.winner is None:
+                    self.emit(EVENT_GAME_OVER, player=player["number"])
+                self.winner = player["number"]
+                return
+
+        # Spawn new ball if no balls left (loser serves)
+        if balls_left == 0:
+            self.rally_count = 0
+            self.spawn_ball(loser["number"])
+
+    def check_mayhem_trigger(self):
+        """Trigger multiball mayhem at 5 rally hits"""
+
+        if self.rally_count == 5 and len(self.balls) == 1:
+            # Spawn ball going same direction
+            if self.balls.speed_z[0] > 0:
+                self.spawn_ball(1)
+            else:
+                self.spawn_ball(2)
+
+            self.emit(EVENT_MAYHEM)
+
+            # Prevent triggering again
+            self.rally_count += 1
+
+    # --------------------------------------------------------
+    #   Powerups
+    # --------------------------------------------------------
+
+    def maybe_spawn_powerup(self):
+        """Maybe spawn a powerup (small random chance)"""
+
+        # Only spawn if there isn't one already
+        if self.powerup is not None:
+            return
+
+        # 0.2% chance per frame
+        if self.random.random() < 0.002:
+            self.powerup = create_powerup(self.random)
+
+    def update_powerup_collision(self):
+        """Check if any ball touched the powerup"""
+
+        if self.powerup is None:
+            return
+
+        update_powerup(self.powerup)
+
+        i = first_ball_touching_powerup(self.balls, self.powerup)
+        if i is None:
+            return
+
+        # Who gets it?  Whoever hit the ball last
+        if self.balls.speed_z[i] > 0:
+            owner = self.player_1
+        else:
+            owner = self.player_2
+
+        # Apply the powerup
+        powerup = self.powerup
+
+        if powerup["type"] == "GIANT":
+            make_player_giant(owner)
+        else:
+            # Multiball:  spawn another ball
+            self.spawn_ball(owner["number"])
+
+        self.emit(EVENT_POWERUP, player=owner["number"],
+                  kind=powerup["type"], x=powerup["x"], z=powerup["z"])
+        self.powerup = None
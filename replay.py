@@ -0,0 +1,282 @@
+"""Recording and replaying matches for Super 3D Pong Deluxe
+
+A PongEngine match is completely decided by its seed and the action bits
+it is given each frame, so that is all a recording stores. Files are
+append-only and made of small records, each starting with a one-byte tag:
+
+    header   b"PONGREC" + version (1 byte)
+    b"M"     match start: seed (uint64), AI players (uint8, bit 0 = P1, bit 1 = P2)
+    b"I"     input: action bits (uint8), repeated for N frames (uint16)
+    b"E"     match end: frames (uint32), Player 1 score, Player 2 score (uint8 each)
+
+Inputs are run-length encoded, so a player holding a key (or nobody
+touching anything) costs 4 bytes no matter how long it lasts.
+
+Play back recordings headless, as fast as the CPU allows:
+
+    python replay.py match.rec            # print each match's result
+    python replay.py match.rec --check    # fail if a result doesn't match the recording
+"""
+
+import argparse
+import struct
+import sys
+
+from pong_engine import PongEngine
+
+
+MAGIC = b"PONGREC"
+VERSION = 1
+
+MATCH_RECORD = struct.Struct("<QB")
+INPUT_RECORD = struct.Struct("<BH")
+END_RECORD = struct.Struct("<IBB")
+
+# Longest run of one input that fits in an input record
+MAX_RUN = 0xFFFF
+
+
+class ReplayError(Exception):
+    """A recording is damaged or not a recording at all"""
+
+
+def ai_players_to_bits(ai_players):
+    """(1, 2) -> 0b11"""
+    bits = 0
+    for player_number in ai_players:
+        bits |= 1 << (player_number - 1)
+    return bits
+
+
+def bits_to_ai_players(bits):
+    """0b11 -> (1, 2)"""
+    return tuple(number for number in (1, 2) if bits & (1 << (number - 1)))
+
+
+# ============================================================
+#                     RECORDING
+# ============================================================
+
+class ReplayWriter:
+    """Appends matches and their inputs to a recording file"""
+
+    def __init__(self, path):
+        self.file = open(path, "ab")
+
+        # New file: write the header first
+        if self.file.tell() == 0:
+            self.file.write(MAGIC + bytes([VERSION]))
+
+        self.run_actions = None
+        self.run_length = 0
+
+    def start_match(self, engine):
+        """Begin recording a new match (ends the previous one, if any)"""
+
+        self._flush_run()
+        self.file.write(b"M" + MATCH_RECORD.pack(engine.seed, ai_players_to_bits(engine.ai_players)))
+        self.file.flush()
+
+    def record(self, actions):
+        """Add one frame's input"""
+
+        if actions == self.run_actions and self.run_length < MAX_RUN:
+            self.run_length += 1
+            return
+
+        self._flush_run()
+        self.run_actions = actions
+        self.run_length = 1
+
+    def end_match(self, engine):
+        """Note how the match ended, so playback can be checked against it"""
+
+        self._flush_run()
+        self.file.write(b"E" + END_RECORD.pack(engine.frame_count,
+                                               engine.player_1["score"],
+                                               engine.player_2["score"]))
+        self.file.flush()
+
+    def close(self):
+        """Write anything still waiting and close the file"""
+
+        if self.file.closed:
+            return
+        self._flush_run()
+        self.file.close()
+
+    def _flush_run(self):
+        """Write out the current run of identical inputs"""
+
+        if self.run_length > 0:
+            self.file.write(b"I" + INPUT_RECORD.pack(self.run_actions, self.run_length))
+            self.file.flush()
+
+        self.run_actions = None
+        self.run_length = 0
+
+
+# ============================================================
+#                     READING
+# ============================================================
+
+def unpack_record(record, data, offset, path):
+    """Unpack a record's fields at offset, or raise ReplayError if the file ends first"""
+
+    if offset + record.size > len(data):
+        raise ReplayError("%s is cut off in a record at byte %d" % (path, offset - 1))
+    return record.unpack_from(data, offset)
+
+
+def read_replay(path):
+    """Read a recording. Returns a list of matches.
+
+    Each match is a dictionary with "seed", "ai_players", "actions" (a
+    bytearray with one entry per frame) and "result" (frames and scores
+    from the end record, or None if the recording stopped mid-match).
+    """
+
+    with open(path, "rb") as replay_file:
+        data = replay_file.read()
+
+    if data[:len(MAGIC)] != MAGIC:
+        raise ReplayError("%s is not a match recording" % path)
+
+    if len(data) == len(MAGIC):
+        raise ReplayError("%s is cut off before its version" % path)
+
+    version = data[len(MAGIC)]
+    if version != VERSION:
+        raise ReplayError("%s has unsupported version %d" % (path, version))
+
+    matches = []
+    match = None
+    offset = len(MAGIC) + 1
+
+    while offset < len(data):
+        tag = data[offset:offset + 1]
+        offset += 1
+
+        if tag == b"M":
+            seed, ai_bits = unpack_record(MATCH_RECORD, data, offset, path)
+            offset += MATCH_RECORD.size
+            match = {
+                "seed": seed,
+                "ai_players": bits_to_ai_players(ai_bits),
+                "actions": bytearray(),
+                "result": None,
+            }
+            matches.append(match)
+
+        elif tag == b"I":
+            if match is None:
+                raise ReplayError("%s: input before any match" % path)
+            actions, frames = unpack_record(INPUT_RECORD, data, offset, path)
+            offset += INPUT_RECORD.size
+            match["actions"] += bytes([actions]) * frames
+
+        elif tag == b"E":
+            if match is None:
+                raise ReplayError("%s: match end before any match" % path)
+            frames, score_1, score_2 = unpack_record(END_RECORD, data, offset, path)
+            offset += END_RECORD.size
+            match["result"] = {"frames": frames, "score_1": score_1, "score_2": score_2}
+
+        else:
+            raise ReplayError("%s: unknown record %r at byte %d" % (path, tag, offset - 1))
+
+    return matches
+
+
+# ============================================================
+#                     PLAYBACK
+# ============================================================
+
+def create_engine(match):
+    """A fresh engine set up the way a recorded match started"""
+    return PongEngine(seed=match["seed"], ai_players=match["ai_players"])
+
+
+def play_back(match, on_step=None):
+    """Replay a whole match headless. Returns the engine at the end.
+
+    on_step(engine, events) is called after every frame, if given.
+    """
+
+    engine = create_engine(match)
+
+    for actions in match["actions"]:
+        events = engine.step(actions)
+        if on_step is not None:
+            on_step(engine, events)
+
+    return engine
+
+
+def check_result(match, engine):
+    """True if the engine finished the same way as the recording said"""
+
+    result = match["result"]
+    if result is None:
+        return True
+
+    return (engine.frame_count == result["frames"] and
+            engine.player_1["score"] == result["score_1"] and
+            engine.player_2["score"] == result["score_2"])
+
+
+class ReplayPlayer:
+    """Feeds recorded inputs to the game, one frame at a time"""
+
+    def __init__(self, matches):
+        self.matches = matches
+        self.match_index = -1
+        self.frame = 0
+
+    def next_match(self):
+        """Move on to the next match. Returns it, or None when all are done."""
+
+        self.match_index += 1
+        self.frame = 0
+
+        if self.match_index >= len(self.matches):
+            return None
+        return self.matches[self.match_index]
+
+    def next_actions(self):
+        """The next frame's input, or None when this match's input runs out"""
+
+        actions = self.matches[self.match_index]["actions"]
+        if self.frame >= len(actions):
+            return None
+
+        self.frame += 1
+        return actions[self.frame - 1]
+
+
+def main():
+    """Command line entry point: play recordings back headless"""
+
+    parser = argparse.ArgumentParser(description="Play match recordings back headless")
+    parser.add_argument("path")
+    parser.add_argument("--check", action="store_true",
+                        help="exit with an error if a match ends differently than recorded")
+    args = parser.parse_args()
+
+    all_match = True
+    for number, match in enumerate(read_replay(args.path), 1):
+        engine = play_back(match)
+        same = check_result(match, engine)
+        all_match = all_match and same
+
+        print("match %d: seed %d, %d frames, %d - %d%s" % (
+            number, match["seed"], engine.frame_count,
+            engine.player_1["score"], engine.player_2["score"],
+            "" if same else "  (DIFFERENT FROM RECORDING)"))
+
+    if args.check and not all_match:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
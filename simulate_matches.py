@@ -0,0 +1,103 @@
+"""Play lots of AI-vs-AI matches without a window
+
+Used for tuning the AI and game balance. Every match gets its own seed
+(base seed + match number), so any interesting match can be played again
+exactly with PongEngine(seed=...).
+
+    python simulate_matches.py --matches 10000 --seed 1
+"""
+
+import argparse
+import multiprocessing
+import time
+
+from pong_engine import PongEngine, AI_SPEED_FACTOR, AI_ERROR
+
+
+# Give up on a match that goes on for too long (about 15 minutes of play)
+MAX_FRAMES_PER_MATCH = 60 * 60 * 15
+
+
+def play_match(seed, ai_speed_factor=AI_SPEED_FACTOR, ai_error=AI_ERROR,
+               max_frames=MAX_FRAMES_PER_MATCH):
+    """Play one AI-vs-AI match to the end. Returns a result dictionary."""
+
+    engine = PongEngine(seed=seed, ai_players=(1, 2),
+                        ai_speed_factor=ai_speed_factor, ai_error=ai_error)
+
+    longest_rally = 0
+    while engine.winner is None and engine.frame_count < max_frames:
+        engine.step()
+        if engine.rally_count > longest_rally:
+            longest_rally = engine.rally_count
+
+    return {
+        "seed": seed,
+        "winner": engine.winner,
+        "score_1": engine.player_1["score"],
+        "score_2": engine.player_2["score"],
+        "frames": engine.frame_count,
+        "longest_rally": longest_rally,
+    }
+
+
+def _play_match_with_settings(job):
+    """Unpack (seed, settings) for Pool.imap_unordered"""
+    seed, settings = job
+    return play_match(seed, **settings)
+
+
+def run_matches(count, seed=0, processes=None, **settings):
+    """Play count matches across a pool of processes. Returns all results."""
+
+    jobs = [(seed + i, settings) for i in range(count)]
+
+    # Big chunks keep the pool busy instead of passing messages
+    chunk_size = max(1, count // ((processes or multiprocessing.cpu_count()) * 8))
+
+    with multiprocessing.Pool(processes) as pool:
+        results = list(pool.imap_unordered(_play_match_with_settings, jobs, chunk_size))
+
+    results.sort(key=lambda result: result["seed"])
+    return results
+
+
+def summarize(results):
+    """Work out win rates and averages for a list of match results"""
+
+    count = len(results)
+    finished = [result for result in results if result["winner"] is not None]
+
+    return {
+        "matches": count,
+        "unfinished": count - len(finished),
+        "player_1_wins": sum(1 for result in finished if result["winner"] == 1),
+        "player_2_wins": sum(1 for result in finished if result["winner"] == 2),
+        "average_frames": sum(result["frames"] for result in results) / max(1, count),
+        "longest_rally": max((result["longest_rally"] for result in results), default=0),
+    }
+
+
+def main():
+    """Command line entry point"""
+
+    parser = argparse.ArgumentParser(description="Play AI-vs-AI matches headless")
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--ai-speed", type=float, default=AI_SPEED_FACTOR)
+    parser.add_argument("--ai-error", type=float, default=AI_ERROR)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_matches(args.matches, args.seed, args.processes,
+                          ai_speed_factor=args.ai_speed, ai_error=args.ai_error)
+    seconds = time.perf_counter() - start
+
+    for name, value in summarize(results).items():
+        print(f"{name:>16}: {value}")
+    print(f"{'matches/minute':>16}: {args.matches / seconds * 60:.0f}")
+
+
+if __name__ == "__main__":
+    main()
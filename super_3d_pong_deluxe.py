@@ -1,11 +1,42 @@
+import OpenGL
+# A single GLUT window (or offscreen context): the context only changes
+# through make-current calls PyOpenGL sees, so it may cache the current
+# context (see OpenGL.contextdata)
+OpenGL.CACHE_CURRENT_CONTEXT = True
+
 from OpenGL.GL import *
 from OpenGL. GLUT import *
 from OpenGL.GLU import *
-import math
+import argparse
+import atexit
+import contextlib
+import os
 import random
 import sys
 import time
 
+import numpy
+
+import batch_renderer
+import geometry_cache
+import text_renderer
+from batch_renderer import build_trail_lines, draw_arrays
+from frame_profiler import FrameProfiler
+from geometry_cache import GeometryCache
+from particle_pool import ParticlePool
+from pong_engine import (
+    PongEngine,
+    FIELD_WIDTH, FIELD_DEPTH,
+    PADDLE_HEIGHT, PADDLE_DEPTH,
+    BALL_SIZE,
+    POINTS_TO_WIN, DASH_COOLDOWN_TIME,
+    P1_LEFT, P1_RIGHT, P1_DASH, P2_LEFT, P2_RIGHT, P2_DASH,
+    EVENT_DASH, EVENT_WALL_BOUNCE, EVENT_PADDLE_HIT, EVENT_POINT,
+    EVENT_ON_FIRE, EVENT_POWERUP, EVENT_MAYHEM,
+)
+from replay import ReplayPlayer, ReplayWriter, create_engine, read_replay
+from text_renderer import TextRenderer
+
 
 # ============================================================
 #                     GAME SETTINGS
@@ -15,25 +46,13 @@ import time
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 
-# Playing field size
-FIELD_WIDTH = 400
-FIELD_DEPTH = 800
-
-# Paddle settings
-PADDLE_WIDTH = 80
-PADDLE_HEIGHT = 15
-PADDLE_DEPTH = 15
+# PYOPENGL_PLATFORM values that draw offscreen (see headless.py)
+HEADLESS_PLATFORMS = ("egl", "osmesa")
 
-# Ball settings
-BALL_SIZE = 8
+# (Field, paddle, ball and rule settings live in pong_engine.py)
 
-# Game rules
-POINTS_TO_WIN = 11
-DASH_COOLDOWN_TIME = 120
-
-# Movement speeds
-NORMAL_SPEED = 6
-DASH_SPEED = 50
+# Effects
+MAX_PARTICLES = 2048
 
 # Colors (Red, Green, Blue)
 COLOR_PLAYER_1 = [0.0, 1.0, 1.0]      # Cyan
@@ -43,10 +62,15 @@ COLOR_GRID = [0.1, 0.1, 0.2]          # Dark blue
 COLOR_GIANT_POWERUP = [1.0, 0.84, 0.0] # Gold
 COLOR_MULTI_POWERUP = [0.0, 1.0, 0.0]  # Green
 COLOR_ON_FIRE = [1.0, 0.6, 0.0]       # Orange
+COLOR_MAYHEM = [1.0, 0.0, 1.0]        # Magenta
 
 # Timer 
-last_frame_time = time. time()
-FRAME_TIME = 16 / 1000  # 16ms in seconds
+FRAME_TIME = 16 / 1000         # Fixed simulation step (16ms in seconds)
+MAX_STEPS_PER_FRAME = 5        # Catch-up limit after a slow frame
+last_frame_time = time.perf_counter()
+time_accumulator = 0.0         # Real time not yet simulated
+render_alpha = 1.0             # How far we are between the last two steps (0..1)
+game_speed = 1.0               # Simulated seconds per real second (replays can go faster)
 
 # ============================================================
 #                     GAME DATA
@@ -57,7 +81,17 @@ game = {
     "state": "MENU",           # MENU, PLAYING, or GAME_OVER
     "is_two_player":  False,
     "is_paused": False,
-    "winner": None,
+    
+    # The match itself (players, balls, powerup, score - see pong_engine.py)
+    "engine": None,
+    
+    # Recording and playback (see replay.py)
+    "recorder": None,          # ReplayWriter when recording
+    "replay": None,            # ReplayPlayer when watching a recording
+    
+    # Frame timings (see frame_profiler.py)
+    "profiler": None,          # FrameProfiler when run with --profile
+    "profile_output": None,    # File to save the timings to on exit
     
     # Input
     "keys_pressed": set(),
@@ -66,207 +100,16 @@ game = {
     "camera_mode": 0,          # 0=Side, 1=Top, 2=FirstPerson
     "screen_shake": 0,
     
-    # Players (will be set by create_player)
-    "player_1": None,
-    "player_2":  None,
-    
-    # Game objects (lists)
-    "balls": [],
-    "particles": [],
+    # Visual effects
+    "particles": ParticlePool(MAX_PARTICLES),
     "floating_texts": [],
-    "powerup": None,
-    
-    # Stats
-    "rally_count": 0,
-    "frame_count": 0,
 }
 
 
 # ============================================================
-#                     CREATE FUNCTIONS
-# ============================================================
-
-def create_player(player_number):
-    """Create a new player dictionary"""
-    
-    # Player 1 starts at near end, Player 2 at far end
-    if player_number == 1:
-        z_position = -FIELD_DEPTH / 2 + 40
-    else:
-        z_position = FIELD_DEPTH / 2 - 40
-    
-    return {
-        "number": player_number,
-        "x": 0,
-        "z": z_position,
-        "width":  PADDLE_WIDTH,
-        "score": 0,
-        "win_streak": 0,
-        "dash_cooldown": 0,
-        "is_giant": False,
-        "giant_time_left": 0,
-        "dash_time_left": 0,
-    }
-
-
-def create_ball(serving_player):
-    """Create a new ball dictionary"""
-    
-    # Ball starts near the serving player
-    if serving_player == 1:
-        z_position = -FIELD_DEPTH / 2 + 100
-        direction = 1    # Move towards Player 2
-    else:
-        z_position = FIELD_DEPTH / 2 - 100
-        direction = -1   # Move towards Player 1
-    
-    return {
-        "x": 0,
-        "y":  BALL_SIZE,
-        "z": z_position,
-        "speed_x": (random.random() - 0.5) * 6,
-        "speed_z": direction * 9.0,
-        "color": COLOR_BALL,
-        "trail": [],
-    }
-
-
-def create_particle(x, z, color):
-    """Create a single particle for visual effects"""
-    return {
-        "x": x,
-        "y": 10,
-        "z": z,
-        "speed_x": (random.random() - 0.5) * 8,
-        "speed_y": random.random() * 5 + 2,
-        "speed_z": (random.random() - 0.5) * 8,
-        "color": color,
-        "life": random.randint(20, 50),
-    }
-
-
-def create_floating_text(text, x, z, color, size=1.0):
-    """Create floating text that rises and fades"""
-    return {
-        "text": text,
-        "x":  x,
-        "y": 20,
-        "z": z,
-        "color": color,
-        "size": size,
-        "life": 60,
-    }
-
-
-def create_powerup():
-    """Create a powerup at a random position"""
-    
-    # Random position in middle of field
-    x = (random.random() - 0.5) * FIELD_WIDTH * 0.8
-    z = (random.random() - 0.5) * FIELD_DEPTH * 0.5
-    
-    # Random type
-    if random.random() > 0.5:
-        powerup_type = "GIANT"
-    else:
-        powerup_type = "MULTIBALL"
-    
-    return {
-        "x": x,
-        "z": z,
-        "type": powerup_type,
-        "rotation": 0,
-    }
-
-
-# ============================================================
-#                     PLAYER FUNCTIONS
+#                     COLOR FUNCTIONS
 # ============================================================
 
-def move_player_left(player, speed):
-    """Move paddle left visually (affected by camera)"""
-    if game["camera_mode"] == 2:
-        player["x"] += speed
-    else:
-        player["x"] -= speed
-    keep_player_in_bounds(player)
-
-
-def move_player_right(player, speed):
-    """Move paddle right visually (affected by camera)"""
-    if game["camera_mode"] == 2:
-        player["x"] -= speed
-    else:
-        player["x"] += speed
-    keep_player_in_bounds(player)
-
-
-def move_player_towards(player, target_x, speed):
-    """Move paddle towards a target x position (for AI)"""
-    if player["x"] < target_x - 10:
-        player["x"] += speed
-    elif player["x"] > target_x + 10:
-        player["x"] -= speed
-    keep_player_in_bounds(player)
-
-
-def keep_player_in_bounds(player):
-    """Make sure player doesn't go outside the field"""
-    
-    left_limit = -FIELD_WIDTH / 2 + player["width"] / 2
-    right_limit = FIELD_WIDTH / 2 - player["width"] / 2
-    
-    if player["x"] < left_limit: 
-        player["x"] = left_limit
-    
-    if player["x"] > right_limit:
-        player["x"] = right_limit
-
-
-def try_player_dash(player):
-    """Try to use dash.  Returns True if successful."""
-    
-    if player["dash_cooldown"] == 0:
-        player["dash_cooldown"] = DASH_COOLDOWN_TIME
-        player["dash_time_left"] = 30
-        return True
-    
-    return False
-
-
-def update_player(player):
-    """Update player state each frame"""
-    
-    # Count down dash cooldown
-    if player["dash_cooldown"] > 0:
-        player["dash_cooldown"] -= 1
-
-    # Count down dash active time
-    if player["dash_time_left"] > 0:
-        player["dash_time_left"] -= 1
-    
-    # Count down giant powerup
-    if player["is_giant"]:
-        player["giant_time_left"] -= 1
-        if player["giant_time_left"] <= 0:
-            player["is_giant"] = False
-    
-    # Smoothly change paddle width
-    if player["is_giant"]:
-        target_width = PADDLE_WIDTH * 1.5
-    else:
-        target_width = PADDLE_WIDTH
-    
-    # Gradual size change (10% per frame)
-    player["width"] = player["width"] + (target_width - player["width"]) * 0.1
-
-
-def make_player_giant(player):
-    """Give player the giant paddle powerup"""
-    player["is_giant"] = True
-    player["giant_time_left"] = 600  # About 10 seconds
-
-
 def get_player_color(player):
     """Get the color for a player's paddle"""
     
@@ -275,97 +118,16 @@ def get_player_color(player):
         return COLOR_ON_FIRE
     
     # Otherwise, their normal color
-    if player["number"] == 1:
-        return COLOR_PLAYER_1
-    else:
-        return COLOR_PLAYER_2
+    return get_player_color_by_number(player["number"])
 
 
-# ============================================================
-#                     BALL FUNCTIONS
-# ============================================================
-
-def move_ball(ball):
-    """Move the ball one step"""
-    
-    # Save position for trail effect
-    ball["trail"].append((ball["x"], ball["y"], ball["z"]))
-    
-    # Keep trail short (max 12 positions)
-    if len(ball["trail"]) > 12:
-        ball["trail"].pop(0)
-    
-    # Move ball by its speed
-    ball["x"] += ball["speed_x"]
-    ball["z"] += ball["speed_z"]
-
-
-def check_ball_wall_bounce(ball):
-    """Check if ball hit a side wall.  Returns True if it bounced."""
-    
-    left_wall = -FIELD_WIDTH / 2 + BALL_SIZE
-    right_wall = FIELD_WIDTH / 2 - BALL_SIZE
-    
-    if ball["x"] < left_wall or ball["x"] > right_wall:
-        ball["speed_x"] *= -1  # Reverse direction
-        return True
-    
-    return False
-
-
-def check_ball_paddle_hit(ball, player):
-    """Check if ball hit a player's paddle. Returns True if hit."""
-    
-    # Check if ball is at the paddle's depth (z position)
-    ball_front = ball["z"] - BALL_SIZE
-    ball_back = ball["z"] + BALL_SIZE
-    paddle_front = player["z"] - PADDLE_DEPTH
-    paddle_back = player["z"] + PADDLE_DEPTH
-    
-    at_paddle_depth = (ball_front < paddle_back) and (ball_back > paddle_front)
-    
-    # Check if ball is within paddle width (x position)
-    distance_from_center = abs(ball["x"] - player["x"])
-    hit_range = player["width"] / 2 + BALL_SIZE
-    within_paddle = distance_from_center < hit_range
+def get_player_color_by_number(player_number):
+    """Get a player's normal color (1 or 2)"""
     
-    # Did it hit? 
-    if at_paddle_depth and within_paddle:
-        
-        # Bounce the ball
-        if player["number"] == 1:
-            # Hit by Player 1: send towards Player 2
-            ball["speed_z"] = abs(ball["speed_z"]) * 1.05
-        else:
-            # Hit by Player 2: send towards Player 1
-            ball["speed_z"] = -abs(ball["speed_z"]) * 1.05
-        
-        # Add spin based on where it hit the paddle
-        hit_offset = (ball["x"] - player["x"]) / (player["width"] / 2)
-        ball["speed_x"] += hit_offset * 4
-        
-        return True
-    
-    return False
-
-
-def is_ball_past_player_1(ball):
-    """Check if ball went past Player 1 (Player 2 scores)"""
-    return ball["z"] < -FIELD_DEPTH / 2 - 50
-
-
-def is_ball_past_player_2(ball):
-    """Check if ball went past Player 2 (Player 1 scores)"""
-    return ball["z"] > FIELD_DEPTH / 2 + 50
-
-
-# ============================================================
-#                     POWERUP FUNCTIONS
-# ============================================================
-
-def update_powerup(powerup):
-    """Make the powerup spin"""
-    powerup["rotation"] += 2
+    if player_number == 1:
+        return COLOR_PLAYER_1
+    else:
+        return COLOR_PLAYER_2
 
 
 def get_powerup_color(powerup):
@@ -377,38 +139,21 @@ def get_powerup_color(powerup):
         return COLOR_MULTI_POWERUP
 
 
-def is_ball_touching_powerup(ball, powerup):
-    """Check if a ball is touching the powerup"""
-    
-    # Calculate distance between ball and powerup
-    dx = ball["x"] - powerup["x"]
-    dz = ball["z"] - powerup["z"]
-    distance = math. sqrt(dx * dx + dz * dz)
-    
-    return distance < 25 + BALL_SIZE
-
-
 # ============================================================
-#                     PARTICLE & TEXT FUNCTIONS
+#                     FLOATING TEXT FUNCTIONS
 # ============================================================
 
-def update_particle(particle):
-    """Move a particle and apply gravity"""
-    
-    particle["x"] += particle["speed_x"]
-    particle["y"] += particle["speed_y"]
-    particle["z"] += particle["speed_z"]
-    
-    # Gravity pulls it down
-    particle["speed_y"] -= 0.5
-    
-    # Reduce life
-    particle["life"] -= 1
-
-
-def is_particle_dead(particle):
-    """Check if particle should disappear"""
-    return particle["life"] <= 0
+def create_floating_text(text, x, z, color, size=1.0):
+    """Create floating text that rises and fades"""
+    return {
+        "text": text,
+        "x":  x,
+        "y": 20,
+        "z": z,
+        "color": color,
+        "size": size,
+        "life": 60,
+    }
 
 
 def update_floating_text(text):
@@ -423,15 +168,13 @@ def is_text_dead(text):
 
 
 # ============================================================
-#                     HELPER FUNCTIONS
+#                     EFFECT FUNCTIONS
 # ============================================================
 
 def add_particles_at(x, z, color, count=10):
     """Create a burst of particles at a position"""
     
-    for i in range(count):
-        particle = create_particle(x, z, color)
-        game["particles"].append(particle)
+    game["particles"].spawn_burst(x, 10, z, color, count)
 
 
 def add_floating_text_at(text, x, z, color, size=1.0):
@@ -441,23 +184,44 @@ def add_floating_text_at(text, x, z, color, size=1.0):
     game["floating_texts"].append(floating_text)
 
 
-def spawn_ball(serving_player):
-    """Add a new ball to the game"""
-    
-    ball = create_ball(serving_player)
-    game["balls"].append(ball)
-
-
-def maybe_spawn_powerup():
-    """Maybe spawn a powerup (small random chance)"""
+def show_events(events):
+    """Turn what happened in the match into sparks, text and screen shake"""
     
-    # Only spawn if there isn't one already
-    if game["powerup"] is not None:
-        return
-    
-    # 0.2% chance per frame
-    if random.random() < 0.002:
-        game["powerup"] = create_powerup()
+    for event in events:
+        kind = event["type"]
+        
+        if kind == EVENT_DASH:
+            player_color = get_player_color_by_number(event["player"])
+            add_floating_text_at("DASH!", event["x"], event["z"], player_color, 0.8)
+        
+        elif kind == EVENT_WALL_BOUNCE:
+            game["screen_shake"] = 5
+        
+        elif kind == EVENT_PADDLE_HIT:
+            player_color = get_player_color_by_number(event["player"])
+            game["screen_shake"] = 10
+            add_particles_at(event["x"], event["z"], player_color)
+            add_floating_text_at("SMASH!", event["x"], event["z"], player_color)
+        
+        elif kind == EVENT_POINT:
+            game["screen_shake"] = 30
+        
+        elif kind == EVENT_ON_FIRE:
+            # Show "on fire" message for hot streak
+            if event["player"] == 1:
+                add_floating_text_at("P1 FIRE!", 0, -200, COLOR_PLAYER_1, 2.0)
+            else:
+                add_floating_text_at("P2 FIRE!", 0, 200, COLOR_PLAYER_2, 2.0)
+        
+        elif kind == EVENT_POWERUP:
+            if event["kind"] == "GIANT":
+                add_floating_text_at("GIANT!", event["x"], event["z"], COLOR_GIANT_POWERUP, 1.5)
+            else:
+                add_floating_text_at("MULTIBALL!", event["x"], event["z"], COLOR_MULTI_POWERUP, 1.5)
+            game["screen_shake"] = 20
+        
+        elif kind == EVENT_MAYHEM:
+            add_floating_text_at("MAYHEM!", 0, 0, COLOR_MAYHEM, 2.0)
 
 
 # ============================================================
@@ -470,18 +234,12 @@ def reset_game():
     game["state"] = "MENU"
     game["is_two_player"] = False
     game["is_paused"] = False
-    game["winner"] = None
+    game["engine"] = PongEngine()
     game["keys_pressed"] = set()
     game["camera_mode"] = 0
     game["screen_shake"] = 0
-    game["player_1"] = create_player(1)
-    game["player_2"] = create_player(2)
-    game["balls"] = []
-    game["particles"] = []
+    game["particles"].clear()
     game["floating_texts"] = []
-    game["powerup"] = None
-    game["rally_count"] = 0
-    game["frame_count"] = 0
 
 
 def start_game(two_player_mode):
@@ -490,152 +248,114 @@ def start_game(two_player_mode):
     reset_game()
     game["is_two_player"] = two_player_mode
     game["state"] = "PLAYING"
-    spawn_ball(1)  # Player 1 serves first
+    
+    # Player 2 is the computer unless two people are playing
+    if two_player_mode:
+        game["engine"] = PongEngine(ai_players=())
+    else:
+        game["engine"] = PongEngine(ai_players=(2,))
+    
+    if game["recorder"] is not None:
+        game["recorder"].start_match(game["engine"])
 
 
-def score_point(winner_number, ball):
-    """Handle when a player scores a point"""
+def start_demo_match(seed=None):
+    """Start a computer vs computer match (headless runs without a replay)"""
     
-    # Remove the ball that went out
-    if ball in game["balls"]:
-        game["balls"].remove(ball)
+    reset_game()
+    game["state"] = "PLAYING"
+    game["engine"] = PongEngine(seed=seed, ai_players=(1, 2))
     
-    # Screen shake! 
-    game["screen_shake"] = 30
+    if game["recorder"] is not None:
+        game["recorder"].start_match(game["engine"])
+
+
+def start_replay_match():
+    """Start the next recorded match, or go back to the menu after the last one"""
     
-    # Update scores
-    if winner_number == 1:
-        game["player_1"]["score"] += 1
-        game["player_1"]["win_streak"] += 1
-        game["player_2"]["win_streak"] = 0
-        
-        # Show "on fire" message for hot streak
-        if game["player_1"]["win_streak"] == 3:
-            add_floating_text_at("P1 FIRE!", 0, -200, COLOR_PLAYER_1, 2.0)
-    else:
-        game["player_2"]["score"] += 1
-        game["player_2"]["win_streak"] += 1
-        game["player_1"]["win_streak"] = 0
-        
-        if game["player_2"]["win_streak"] == 3:
-            add_floating_text_at("P2 FIRE!", 0, 200, COLOR_PLAYER_2, 2.0)
+    match = game["replay"].next_match()
     
-    # Check for winner
-    if game["player_1"]["score"] >= POINTS_TO_WIN:
-        game["state"] = "GAME_OVER"
-        game["winner"] = 1
-        return
+    reset_game()
     
-    if game["player_2"]["score"] >= POINTS_TO_WIN:
-        game["state"] = "GAME_OVER"
-        game["winner"] = 2
+    if match is None:
+        game["replay"] = None
         return
     
-    # Spawn new ball if no balls left (loser serves)
-    if len(game["balls"]) == 0:
-        game["rally_count"] = 0
-        
-        if winner_number == 1:
-            spawn_ball(2)  # Player 2 serves
-        else:
-            spawn_ball(1)  # Player 1 serves
+    game["is_two_player"] = len(match["ai_players"]) == 0
+    game["state"] = "PLAYING"
+    game["engine"] = create_engine(match)
+    
+    # Recording while watching copies the replayed matches
+    if game["recorder"] is not None:
+        game["recorder"].start_match(game["engine"])
 
 
 # ============================================================
 #                     INPUT HANDLING
 # ============================================================
 
-def handle_player_1_input():
-    """Move Player 1 based on keyboard input"""
-    
-    player = game["player_1"]
-    speed = NORMAL_SPEED
-    
-    # Check for dash (Q key)
-    if "q" in game["keys_pressed"]:
-        if try_player_dash(player):
-            speed = DASH_SPEED
-            add_floating_text_at("DASH!", player["x"], player["z"], COLOR_PLAYER_1, 0.8)
-    
-    # Move left (A key)
-    if "a" in game["keys_pressed"]:
-        move_player_left(player, speed)
-    
-    # Move right (D key)
-    if "d" in game["keys_pressed"]:
-        move_player_right(player, speed)
-
-
-def handle_player_2_input():
-    """Move Player 2 (human or AI)"""
+def read_input_actions():
+    """Turn the keys being held into the engine's action bits"""
     
-    player = game["player_2"]
-    speed = NORMAL_SPEED
-    
-    if game["is_two_player"]:
-        # Human controls
-        handle_player_2_human(player, speed)
-    else:
-        # AI controls
-        handle_player_2_ai(player, speed)
-
-
-def handle_player_2_human(player, speed):
-    """Handle human input for Player 2"""
-    
-    # Check for dash (Enter key)
-    if "\r" in game["keys_pressed"]:
-        if try_player_dash(player):
-            speed = DASH_SPEED
-            add_floating_text_at("DASH!", player["x"], player["z"], COLOR_PLAYER_2, 0.8)
+    keys = game["keys_pressed"]
     
     # Arrow keys (stored as numbers)
     LEFT_ARROW = 100
     RIGHT_ARROW = 102
     
-    if LEFT_ARROW in game["keys_pressed"]:
-        move_player_left(player, speed)
-    
-    if RIGHT_ARROW in game["keys_pressed"]:
-        move_player_right(player, speed)
-
-
-def handle_player_2_ai(player, speed):
-    """AI Logic that tries to hit the ball"""
-    
-    # Default: go to center
-    target_x = 0
-    
-    # Find balls coming towards Player 2
-    incoming_balls = []
-    for ball in game["balls"]:
-        if ball["speed_z"] > 0:  # Moving towards Player 2
-            incoming_balls.append(ball)
+    # Player 1: A/D to move, Q to dash
+    p1_left = "a" in keys
+    p1_right = "d" in keys
     
-    # Track the closest incoming ball
-    if len(incoming_balls) > 0:
-        # Find closest ball
-        closest_ball = incoming_balls[0]
-        for ball in incoming_balls:
-            if abs(ball["z"] - player["z"]) < abs(closest_ball["z"] - player["z"]):
-                closest_ball = ball
-        
-        # Add some error so AI isn't perfect
-        error = math.sin(game["frame_count"] * 0.05) * 40
-        target_x = closest_ball["x"] + error
+    # Player 2: arrows to move, Enter to dash
+    p2_left = LEFT_ARROW in keys
+    p2_right = RIGHT_ARROW in keys
     
-    # Move towards target (slightly slower than human)
-    ai_speed = speed * 0.8
-    
-    move_player_towards(player, target_x, ai_speed)
+    # First-person camera looks down the other way, so left is right
+    if game["camera_mode"] == 2:
+        p1_left, p1_right = p1_right, p1_left
+        p2_left, p2_right = p2_right, p2_left
+    
+    actions = 0
+    if p1_left:
+        actions |= P1_LEFT
+    if p1_right:
+        actions |= P1_RIGHT
+    if "q" in keys:
+        actions |= P1_DASH
+    if p2_left:
+        actions |= P2_LEFT
+    if p2_right:
+        actions |= P2_RIGHT
+    if "\r" in keys:
+        actions |= P2_DASH
+    
+    return actions
+
 
 # ============================================================
 #                     MAIN UPDATE FUNCTION
 # ============================================================
 
+# Stands in for a profiler phase when the profiler is off
+NOT_PROFILED = contextlib.nullcontext()
+
+
+def profile_phase(name):
+    """Time a block of code as part of the frame (only with --profile)"""
+    
+    if game["profiler"] is None:
+        return NOT_PROFILED
+    return game["profiler"].phase(name)
+
+
 def update_game():
     """Update everything (called every frame)"""
     
+    # Replays go straight on to the next recorded match
+    if game["replay"] is not None and game["state"] == "GAME_OVER":
+        start_replay_match()
+    
     # Only update when playing and not paused
     if game["state"] != "PLAYING": 
         return
@@ -643,111 +363,46 @@ def update_game():
     if game["is_paused"]: 
         return
     
-    game["frame_count"] += 1
-    
-    # Update players
-    handle_player_1_input()
-    handle_player_2_input()
-    update_player(game["player_1"])
-    update_player(game["player_2"])
+    # Input comes from the keyboard, or from a recording
+    with profile_phase("input"):
+        if game["replay"] is not None:
+            actions = game["replay"].next_actions()
+        else:
+            actions = read_input_actions()
+        
+        if actions is not None and game["recorder"] is not None:
+            game["recorder"].record(actions)
     
-    # Update balls
-    update_all_balls()
+    if actions is None:
+        start_replay_match()
+        return
     
-    # Update powerups
-    maybe_spawn_powerup()
-    update_powerup_collision()
+    # Step the match
+    engine = game["engine"]
+    with profile_phase("physics"):
+        events = engine.step(actions)
     
-    # Multiball mayhem at 5 hits! 
-    check_mayhem_trigger()
+    if engine.winner is not None:
+        game["state"] = "GAME_OVER"
+        if game["recorder"] is not None:
+            game["recorder"].end_match(engine)
     
     # Update visual effects
-    update_all_effects()
+    with profile_phase("effects"):
+        show_events(events)
+        update_all_effects()
 
 
-def update_all_balls():
-    """Update all balls in the game"""
+def save_previous_positions():
+    """Remember where things are before a step, so drawing can blend between steps"""
     
-    # Make a copy of list to safely remove items
-    balls_copy = game["balls"][:]
+    engine = game["engine"]
     
-    for ball in balls_copy:
-        move_ball(ball)
-        
-        # Check wall bounce
-        if check_ball_wall_bounce(ball):
-            game["screen_shake"] = 5
-        
-        # Check paddle hits
-        if check_ball_paddle_hit(ball, game["player_1"]):
-            game["rally_count"] += 1
-            game["screen_shake"] = 10
-            add_particles_at(ball["x"], ball["z"], COLOR_PLAYER_1)
-            add_floating_text_at("SMASH!", ball["x"], ball["z"], COLOR_PLAYER_1)
-        
-        if check_ball_paddle_hit(ball, game["player_2"]):
-            game["rally_count"] += 1
-            game["screen_shake"] = 10
-            add_particles_at(ball["x"], ball["z"], COLOR_PLAYER_2)
-            add_floating_text_at("SMASH!", ball["x"], ball["z"], COLOR_PLAYER_2)
-        
-        # Check scoring
-        if is_ball_past_player_1(ball):
-            score_point(2, ball)  # Player 2 scores
-        elif is_ball_past_player_2(ball):
-            score_point(1, ball)  # Player 1 scores
-
-
-def update_powerup_collision():
-    """Check if any ball touched the powerup"""
+    for player in (engine.player_1, engine.player_2):
+        player["prev_x"] = player["x"]
+        player["prev_width"] = player["width"]
     
-    if game["powerup"] is None: 
-        return
-    
-    update_powerup(game["powerup"])
-    
-    for ball in game["balls"]: 
-        if is_ball_touching_powerup(ball, game["powerup"]):
-            
-            # Who gets it?  Whoever hit the ball last
-            if ball["speed_z"] > 0:
-                owner = game["player_1"]
-            else:
-                owner = game["player_2"]
-            
-            # Apply the powerup
-            powerup = game["powerup"]
-            
-            if powerup["type"] == "GIANT":
-                make_player_giant(owner)
-                add_floating_text_at("GIANT!", powerup["x"], powerup["z"], COLOR_GIANT_POWERUP, 1.5)
-            else:
-                # Multiball:  spawn another ball
-                if ball["speed_z"] > 0:
-                    spawn_ball(1)
-                else:
-                    spawn_ball(2)
-                add_floating_text_at("MULTIBALL!", powerup["x"], powerup["z"], COLOR_MULTI_POWERUP, 1.5)
-            
-            game["screen_shake"] = 20
-            game["powerup"] = None
-            break
-
-
-def check_mayhem_trigger():
-    """Trigger multiball mayhem at 5 rally hits"""
-    
-    if game["rally_count"] == 5 and len(game["balls"]) == 1:
-        # Spawn ball going same direction
-        if game["balls"][0]["speed_z"] > 0:
-            spawn_ball(1)
-        else:
-            spawn_ball(2)
-        
-        add_floating_text_at("MAYHEM!", 0, 0, [1, 0, 1], 2.0)
-        
-        # Prevent triggering again
-        game["rally_count"] += 1
+    engine.balls.save_previous_positions()
 
 
 def update_all_effects():
@@ -756,12 +411,8 @@ def update_all_effects():
     # Reduce screen shake
     game["screen_shake"] *= 0.9
     
-    # Update particles
-    particles_copy = game["particles"][:]
-    for particle in particles_copy: 
-        update_particle(particle)
-        if is_particle_dead(particle):
-            game["particles"].remove(particle)
+    # Update particles (all at once)
+    game["particles"].update()
     
     # Update floating texts
     texts_copy = game["floating_texts"][:]
@@ -775,6 +426,16 @@ def update_all_effects():
 #                     DRAWING FUNCTIONS
 # ============================================================
 
+# Shapes and fonts compiled once and reused every frame
+geometry = GeometryCache()
+fonts = TextRenderer()
+
+
+def interpolate(previous, current):
+    """Blend between the last two simulation steps"""
+    return previous + (current - previous) * render_alpha
+
+
 def draw_box(x, y, z, width, height, depth, color):
     """Draw a 3D box"""
     
@@ -782,7 +443,7 @@ def draw_box(x, y, z, width, height, depth, color):
     glTranslatef(x, y, z)
     glScalef(width, height, depth)
     glColor3fv(color)
-    glutSolidCube(1.0)
+    geometry.cube()
     glPopMatrix()
 
 
@@ -792,7 +453,7 @@ def draw_sphere(x, y, z, radius, color):
     glPushMatrix()
     glTranslatef(x, y, z)
     glColor3fv(color)
-    glutSolidSphere(radius, 12, 12)
+    geometry.sphere(radius, 12, 12)
     glPopMatrix()
 
 
@@ -801,8 +462,7 @@ def draw_text_3d(x, y, z, text, color):
     
     glColor3fv(color)
     glRasterPos3f(x, y, z)
-    for char in text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+    fonts.draw(text, GLUT_BITMAP_HELVETICA_18)
 
 
 def draw_text_2d(x, y, text, color, font=GLUT_BITMAP_HELVETICA_18):
@@ -810,64 +470,67 @@ def draw_text_2d(x, y, text, color, font=GLUT_BITMAP_HELVETICA_18):
     
     glColor3fv(color)
     glRasterPos2f(x, y)
-    for char in text: 
-        glutBitmapCharacter(font, ord(char))
+    fonts.draw(text, font)
 
 
-def draw_floor_grid():
-    """Draw the playing field grid"""
+def build_floor_grid(field_width, field_depth, spacing, color):
+    """Send the grid lines to OpenGL (compiled once by draw_floor_grid)"""
     
     glLineWidth(1)
     glBegin(GL_LINES)
-    glColor3fv(COLOR_GRID)
+    glColor3fv(color)
     
     # Vertical lines
-    for x in range(-FIELD_WIDTH // 2, FIELD_WIDTH // 2 + 1, 50):
-        glVertex3f(x, 0, -FIELD_DEPTH // 2)
-        glVertex3f(x, 0, FIELD_DEPTH // 2)
+    for x in range(-field_width // 2, field_width // 2 + 1, spacing):
+        glVertex3f(x, 0, -field_depth // 2)
+        glVertex3f(x, 0, field_depth // 2)
     
     # Horizontal lines
-    for z in range(-FIELD_DEPTH // 2, FIELD_DEPTH // 2 + 1, 50):
-        glVertex3f(-FIELD_WIDTH // 2, 0, z)
-        glVertex3f(FIELD_WIDTH // 2, 0, z)
+    for z in range(-field_depth // 2, field_depth // 2 + 1, spacing):
+        glVertex3f(-field_width // 2, 0, z)
+        glVertex3f(field_width // 2, 0, z)
     
     glEnd()
 
 
-def draw_ball_with_trail(ball):
-    """Draw a ball with its motion trail"""
+def draw_floor_grid():
+    """Draw the playing field grid"""
+    
+    geometry.draw(("floor_grid",),
+                  (FIELD_WIDTH, FIELD_DEPTH, 50, tuple(COLOR_GRID)),
+                  build_floor_grid)
+
+
+def draw_ball(x, y, z):
+    """Draw a ball and its shadow"""
     
     # Shadow on ground
     glPushMatrix()
-    glTranslatef(ball["x"], 1, ball["z"])
+    glTranslatef(x, 1, z)
     glScalef(1, 0.1, 1)
     glColor3f(0, 0, 0)
-    glutSolidSphere(BALL_SIZE, 8, 8)
+    geometry.sphere(BALL_SIZE, 8, 8)
     glPopMatrix()
     
     # The ball
-    draw_sphere(ball["x"], ball["y"], ball["z"], BALL_SIZE, ball["color"])
+    draw_sphere(x, y, z, BALL_SIZE, COLOR_BALL)
+
+
+def draw_all_trails(balls):
+    """Draw every ball's motion trail in one batch"""
     
-    # Trail
-    if len(ball["trail"]) > 0:
-        glLineWidth(2)
-        glBegin(GL_LINE_STRIP)
-        for i, position in enumerate(ball["trail"]):
-            alpha = i / len(ball["trail"])
-            glColor4f(ball["color"][0], ball["color"][1], ball["color"][2], alpha)
-            glVertex3f(position[0], position[1], position[2])
-        glEnd()
+    trails = [balls.trail_points(i) for i in range(len(balls))]
+    positions, colors = build_trail_lines(trails, [COLOR_BALL] * len(balls))
+    
+    glLineWidth(2)
+    draw_arrays(GL_LINES, positions, colors)
 
 
-def draw_all_particles():
-    """Draw all particles"""
+def draw_all_particles(positions, colors):
+    """Draw all particles in one batch"""
     
     glPointSize(3)
-    glBegin(GL_POINTS)
-    for particle in game["particles"]:
-        glColor3fv(particle["color"])
-        glVertex3f(particle["x"], particle["y"], particle["z"])
-    glEnd()
+    draw_arrays(GL_POINTS, positions, colors)
 
 
 def draw_dash_bar(x, y, player, color):
@@ -911,14 +574,16 @@ def draw_menu_screen():
 def draw_game_over_screen():
     """Draw the game over screen"""
     
+    winner = game["engine"].winner
+    
     # Winner color
-    if game["winner"] == 1:
+    if winner == 1:
         color = COLOR_PLAYER_1
     else:
         color = COLOR_PLAYER_2
     
     draw_text_2d(WINDOW_WIDTH/2 - 80, WINDOW_HEIGHT/2,
-                 "PLAYER " + str(game["winner"]) + " WINS! ",
+                 "PLAYER " + str(winner) + " WINS! ",
                  color, GLUT_BITMAP_TIMES_ROMAN_24)
     
     draw_text_2d(WINDOW_WIDTH/2 - 90, WINDOW_HEIGHT/2 - 40,
@@ -928,35 +593,37 @@ def draw_game_over_screen():
 def draw_playing_ui():
     """Draw the in-game UI"""
     
+    engine = game["engine"]
+    
     # Scores
     draw_text_2d(50, WINDOW_HEIGHT - 50,
-                 str(game["player_1"]["score"]),
+                 str(engine.player_1["score"]),
                  COLOR_PLAYER_1, GLUT_BITMAP_TIMES_ROMAN_24)
     
     draw_text_2d(WINDOW_WIDTH - 80, WINDOW_HEIGHT - 50,
-                 str(game["player_2"]["score"]),
+                 str(engine.player_2["score"]),
                  COLOR_PLAYER_2, GLUT_BITMAP_TIMES_ROMAN_24)
     
     # Dash bars
-    draw_dash_bar(50, WINDOW_HEIGHT - 70, game["player_1"], COLOR_PLAYER_1)
-    draw_dash_bar(WINDOW_WIDTH - 150, WINDOW_HEIGHT - 70, game["player_2"], COLOR_PLAYER_2)
+    draw_dash_bar(50, WINDOW_HEIGHT - 70, engine.player_1, COLOR_PLAYER_1)
+    draw_dash_bar(WINDOW_WIDTH - 150, WINDOW_HEIGHT - 70, engine.player_2, COLOR_PLAYER_2)
 
     # Live Rally Counter (center top)
-    if game["rally_count"] > 0:
+    if engine.rally_count > 0:
         # Color intensifies as rally grows
-        intensity = min(1.0, game["rally_count"] / 10.0)
+        intensity = min(1.0, engine.rally_count / 10.0)
         rally_color = [1.0, 1.0 - intensity * 0.5, 1.0 - intensity]  # White to orange
         
         draw_text_2d(WINDOW_WIDTH/2 - 30, WINDOW_HEIGHT - 50,
-                     "RALLY: " + str(game["rally_count"]),
+                     "RALLY: " + str(engine.rally_count),
                      rally_color)
     
     # Match point warning (blinking)
-    at_match_point = (game["player_1"]["score"] == POINTS_TO_WIN - 1 or
-                      game["player_2"]["score"] == POINTS_TO_WIN - 1)
+    at_match_point = (engine.player_1["score"] == POINTS_TO_WIN - 1 or
+                      engine.player_2["score"] == POINTS_TO_WIN - 1)
     
     if at_match_point:
-        blink_on = (game["frame_count"] // 20) % 2 == 0
+        blink_on = (engine.frame_count // 20) % 2 == 0
         if blink_on:
             draw_text_2d(WINDOW_WIDTH/2 - 60, WINDOW_HEIGHT - 80,
                          "MATCH POINT", [1, 0, 0])
@@ -969,6 +636,16 @@ def draw_playing_ui():
                      "Press ESC to resume", [0.7, 0.7, 0.7])
 
 
+def draw_profiler_hud():
+    """Draw frame timings in the bottom right corner (with --profile)"""
+    
+    lines = game["profiler"].hud_lines()
+    y = 10 + 14 * len(lines)
+    for line in lines:
+        y -= 14
+        draw_text_2d(WINDOW_WIDTH - 260, y, line, [0.7, 0.7, 0.7], GLUT_BITMAP_HELVETICA_10)
+
+
 def draw_ui():
     """Draw all 2D UI elements"""
     
@@ -989,6 +666,9 @@ def draw_ui():
     elif game["state"] == "PLAYING":
         draw_playing_ui()
     
+    if game["profiler"] is not None:
+        draw_profiler_hud()
+    
     # Switch back to 3D mode
     glPopMatrix()
     glMatrixMode(GL_PROJECTION)
@@ -1017,9 +697,10 @@ def setup_camera():
     
     elif game["camera_mode"] == 2:
         # First-person (behind Player 1)
-        p1 = game["player_1"]
-        gluLookAt(p1["x"], 150, p1["z"] - 300,
-                  p1["x"], 50, 400,
+        p1 = game["engine"].player_1
+        p1_x = interpolate(p1["prev_x"], p1["x"])
+        gluLookAt(p1_x, 150, p1["z"] - 300,
+                  p1_x, 50, 400,
                   0, 1, 0)
 
 
@@ -1027,8 +708,8 @@ def setup_camera():
 #                     MAIN DISPLAY FUNCTION
 # ============================================================
 
-def display():
-    """Main drawing function (called every frame)"""
+def render_frame():
+    """Draw the whole frame into the back buffer"""
     
     # Clear screen
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
@@ -1042,31 +723,38 @@ def display():
     
     # Draw game objects (not on menu)
     if game["state"] != "MENU":
+        engine = game["engine"]
         
         # Draw paddles
-        p1 = game["player_1"]
-        draw_box(p1["x"], 10, p1["z"],
-                 p1["width"], PADDLE_HEIGHT, PADDLE_DEPTH,
+        p1 = engine.player_1
+        draw_box(interpolate(p1["prev_x"], p1["x"]), 10, p1["z"],
+                 interpolate(p1["prev_width"], p1["width"]), PADDLE_HEIGHT, PADDLE_DEPTH,
                  get_player_color(p1))
         
-        p2 = game["player_2"]
-        draw_box(p2["x"], 10, p2["z"],
-                 p2["width"], PADDLE_HEIGHT, PADDLE_DEPTH,
+        p2 = engine.player_2
+        draw_box(interpolate(p2["prev_x"], p2["x"]), 10, p2["z"],
+                 interpolate(p2["prev_width"], p2["width"]), PADDLE_HEIGHT, PADDLE_DEPTH,
                  get_player_color(p2))
         
         # Draw powerup
-        if game["powerup"] is not None:
-            pu = game["powerup"]
+        if engine.powerup is not None:
+            pu = engine.powerup
             draw_box(pu["x"], 20, pu["z"],
                      20, 20, 20,
                      get_powerup_color(pu))
         
         # Draw balls
-        for ball in game["balls"]: 
-            draw_ball_with_trail(ball)
+        balls = engine.balls
+        n = len(balls)
+        ball_x = interpolate(balls.prev_x[:n], balls.x[:n])
+        ball_z = interpolate(balls.prev_z[:n], balls.z[:n])
+        for i in range(n): 
+            draw_ball(ball_x[i], balls.y[i], ball_z[i])
+        draw_all_trails(balls)
         
         # Draw particles
-        draw_all_particles()
+        particles = game["particles"]
+        draw_all_particles(particles.live_positions(), particles.live_colors())
         
         # Draw floating texts
         for text in game["floating_texts"]:
@@ -1075,9 +763,19 @@ def display():
     
     # Draw 2D UI on top
     draw_ui()
+    batch_renderer.end_frame()
+
+
+def display():
+    """Main drawing function (called every frame)"""
+    
+    render_frame()
     
     # Show the frame
     glutSwapBuffers()
+    
+    if game["profiler"] is not None:
+        game["profiler"].end_frame()
 
 
 # ============================================================
@@ -1144,33 +842,98 @@ def on_special_key_release(key, x, y):
 #                     GAME LOOP
 # ============================================================
 
-def game_loop():
-    """Main loop - runs about 60 times per second"""
-    global last_frame_time
+def game_loop(value=0):
+    """Main loop - steps the game at a fixed rate, then sleeps until the next step"""
+    global last_frame_time, time_accumulator, render_alpha
     
-    current_time = time.time()
-    delta_time = current_time - last_frame_time
+    current_time = time.perf_counter()
+    time_accumulator += (current_time - last_frame_time) * game_speed
+    last_frame_time = current_time
     
-    if delta_time >= FRAME_TIME:
-        last_frame_time = current_time
+    # Run every step we owe, so game speed doesn't depend on frame rate
+    max_steps = MAX_STEPS_PER_FRAME * max(1, round(game_speed))
+    steps = 0
+    while time_accumulator >= FRAME_TIME and steps < max_steps:
+        save_previous_positions()
         update_game()
-        glutPostRedisplay()
+        time_accumulator -= FRAME_TIME
+        steps += 1
+    
+    # Too far behind (window dragged, slow machine): drop the extra time
+    if time_accumulator >= FRAME_TIME:
+        time_accumulator = time_accumulator % FRAME_TIME
+    
+    render_alpha = time_accumulator / FRAME_TIME
+    glutPostRedisplay()
+    
+    # Sleep until the next step is due instead of spinning
+    wait_ms = int((FRAME_TIME - time_accumulator) * 1000)
+    glutTimerFunc(max(1, wait_ms), game_loop, 0)
 
 # ============================================================
 #                     START THE GAME
 # ============================================================
 
-def main():
-    """Initialize and run the game"""
+def seed_argument(text):
+    """A --seed value: a whole number that fits in a recording (0 to 2**64 - 1)"""
     
-    # Set up initial game state
-    reset_game()
+    seed = int(text)
+    if not 0 <= seed < 2 ** 64:
+        raise argparse.ArgumentTypeError(f"seed must be from 0 to {2 ** 64 - 1}, not {seed}")
+    return seed
+
+
+def parse_arguments():
+    """Read the command line options"""
     
-    # Initialize OpenGL window
-    glutInit()
-    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB | GLUT_DEPTH)
-    glutInitWindowSize(WINDOW_WIDTH, WINDOW_HEIGHT)
-    glutCreateWindow(b"Super 3D Pong Deluxe")
+    parser = argparse.ArgumentParser(description="Super 3D Pong Deluxe")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record every match played to FILE")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="watch the matches recorded in FILE")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed (2 = twice as fast)")
+    parser.add_argument("--profile", action="store_true",
+                        help="time every frame and show the timings on screen")
+    parser.add_argument("--profile-output", metavar="FILE",
+                        help="save frame timings to FILE (.csv or .json) on exit (implies --profile)")
+    
+    # Headless runs (PYOPENGL_PLATFORM=egl or osmesa, see headless.py)
+    parser.add_argument("--capture", metavar="FILE",
+                        help="headless: write frames as raw RGB to FILE (- for stdout)")
+    parser.add_argument("--capture-png", metavar="DIR",
+                        help="headless: write frames as numbered PNGs to DIR")
+    parser.add_argument("--frames", type=int,
+                        help="headless: stop after this many frames")
+    parser.add_argument("--seed", type=seed_argument,
+                        help="headless: seed for the computer vs computer match and the effects")
+    return parser.parse_args()
+
+
+def start_profiler(output_path=None):
+    """Time every frame from now on, and count the OpenGL calls"""
+    
+    profiler = FrameProfiler()
+    profiler.instrument(globals())
+    for module in (batch_renderer, geometry_cache, text_renderer):
+        profiler.instrument(vars(module))
+    game["profiler"] = profiler
+    game["profile_output"] = output_path
+
+
+def save_session():
+    """Finish the recording and save the frame timings (only the first call does anything)"""
+    
+    if game["recorder"] is not None:
+        game["recorder"].close()
+    
+    if game["profile_output"]:
+        game["profiler"].dump(game["profile_output"])
+        game["profile_output"] = None
+
+
+def setup_opengl():
+    """Render state and projection shared by every frame"""
     
     # Enable 3D features
     glEnable(GL_DEPTH_TEST)
@@ -1182,6 +945,113 @@ def main():
     glMatrixMode(GL_PROJECTION)
     gluPerspective(60, WINDOW_WIDTH / WINDOW_HEIGHT, 1, 2000)
     glMatrixMode(GL_MODELVIEW)
+
+
+def is_headless():
+    """Whether PyOpenGL was told to use an offscreen platform"""
+    
+    return os.environ.get("PYOPENGL_PLATFORM", "").lower() in HEADLESS_PLATFORMS
+
+
+def match_finished():
+    """Whether a headless run has nothing left to show"""
+    
+    if game["replay"] is not None:
+        return False
+    return game["state"] != "PLAYING"
+
+
+def run_headless(args):
+    """Draw one simulation step per frame offscreen, as fast as possible"""
+    global render_alpha
+    
+    # Only needed (and only importable everywhere) for offscreen runs
+    import headless
+    
+    context = headless.create_context(WINDOW_WIDTH, WINDOW_HEIGHT)
+    headless.replace_glut(geometry, fonts)
+    setup_opengl()
+    
+    if args.seed is not None:
+        random.seed(args.seed)
+        game["particles"].random = numpy.random.default_rng(args.seed)
+    if game["replay"] is None:
+        start_demo_match(args.seed)
+    
+    outputs = []
+    if args.capture:
+        outputs.append(headless.RawVideoOutput(args.capture))
+    if args.capture_png:
+        outputs.append(headless.PngSequenceOutput(args.capture_png))
+    capture = headless.FrameCapture(WINDOW_WIDTH, WINDOW_HEIGHT, outputs) if outputs else None
+    
+    # Every frame shows a finished step, there is nothing to interpolate
+    render_alpha = 1.0
+    frames = 0
+    try:
+        while args.frames is None or frames < args.frames:
+            save_previous_positions()
+            update_game()
+            
+            render_frame()
+            if capture is not None:
+                capture.capture()
+            else:
+                glFinish()
+            
+            if game["profiler"] is not None:
+                game["profiler"].end_frame()
+            
+            frames += 1
+            if match_finished():
+                break
+    finally:
+        if capture is not None:
+            capture.close()
+        
+        # Free the GL objects while the context is current, not at exit
+        batch_renderer.release()
+        geometry.clear()
+        fonts.clear()
+        context.close()
+    
+    print(f"Rendered {frames} frames", file=sys.stderr)
+
+
+def main():
+    """Initialize and run the game"""
+    global last_frame_time, game_speed
+    
+    args = parse_arguments()
+    
+    # Set up initial game state
+    reset_game()
+    
+    if args.record:
+        game["recorder"] = ReplayWriter(args.record)
+    
+    # Normally done when the main loop returns, this catches anything else
+    atexit.register(save_session)
+    
+    if args.replay:
+        game["replay"] = ReplayPlayer(read_replay(args.replay))
+        game_speed = args.speed
+        start_replay_match()
+    
+    if args.profile or args.profile_output:
+        start_profiler(args.profile_output)
+    
+    if is_headless():
+        run_headless(args)
+        save_session()
+        return
+    
+    # Initialize OpenGL window
+    glutInit()
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB | GLUT_DEPTH)
+    glutInitWindowSize(WINDOW_WIDTH, WINDOW_HEIGHT)
+    glutCreateWindow(b"Super 3D Pong Deluxe")
+    setup_opengl()
     
     # Connect our functions to OpenGL
     glutDisplayFunc(display)
@@ -1189,10 +1059,17 @@ def main():
     glutKeyboardUpFunc(on_key_release)
     glutSpecialFunc(on_special_key_press)
     glutSpecialUpFunc(on_special_key_release)
-    glutIdleFunc(game_loop)
     
     # Start the game! 
+    last_frame_time = time.perf_counter()
+    glutTimerFunc(0, game_loop, 0)
+    
+    # Closing the window would exit() straight from freeglut, skipping
+    # atexit - have glutMainLoop return instead so the files get saved
+    if glutSetOption:
+        glutSetOption(GLUT_ACTION_ON_WINDOW_CLOSE, GLUT_ACTION_GLUTMAINLOOP_RETURNS)
     glutMainLoop()
+    save_session()
 
 
 # Run the game
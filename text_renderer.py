@@ -0,0 +1,82 @@
+"""Text rendering for Super 3D Pong Deluxe
+
+Drawing text with glutBitmapCharacter costs one OpenGL call per letter,
+every frame. Instead, each font's characters are compiled once into a
+block of display lists (one per character code), and a string is drawn
+with a single glCallLists, using the character codes as list numbers
+relative to glListBase.
+
+The bytes passed to glCallLists are cached per (text, font), so labels
+that stay the same from frame to frame (the HUD, floating texts) are
+only encoded once.
+
+Characters are drawn with glutBitmapCharacter unless draw_character is
+replaced (headless runs use headless.GlutFontData, as GLUT can't be
+initialised without a window).
+"""
+
+from OpenGL.GL import *
+from OpenGL.GLUT import *
+
+
+# Characters compiled per font (plain ASCII; anything else draws as "?")
+GLYPH_COUNT = 128
+
+# Forget all cached strings once there are this many (scores, timers...)
+MAX_CACHED_STRINGS = 512
+
+
+def font_key(font):
+    """Something hashable for a GLUT font (they are ctypes pointers on most systems)"""
+    return getattr(font, "value", font)
+
+
+class TextRenderer:
+    """Bitmap fonts compiled into display lists, plus encoded strings"""
+
+    def __init__(self):
+        self.fonts = {}      # font key -> first display list id
+        self.strings = {}    # (text, font key) -> bytes for glCallLists
+        self.draw_character = glutBitmapCharacter
+
+    def font_base(self, font):
+        """First display list of a font, compiling its characters if needed"""
+
+        key = font_key(font)
+        base = self.fonts.get(key)
+        if base is None:
+            base = glGenLists(GLYPH_COUNT)
+            for code in range(GLYPH_COUNT):
+                glNewList(base + code, GL_COMPILE)
+                self.draw_character(font, code)
+                glEndList()
+            self.fonts[key] = base
+        return base
+
+    def layout(self, text, font):
+        """The display list offsets for a string (cached)"""
+
+        key = (text, font_key(font))
+        codes = self.strings.get(key)
+
+        if codes is None:
+            if len(self.strings) >= MAX_CACHED_STRINGS:
+                self.strings.clear()
+            codes = text.encode("ascii", "replace")
+            self.strings[key] = codes
+
+        return codes
+
+    def draw(self, text, font):
+        """Draw a string at the current raster position"""
+
+        glListBase(self.font_base(font))
+        glCallLists(self.layout(text, font))
+
+    def clear(self):
+        """Delete every compiled font and cached string"""
+
+        for base in self.fonts.values():
+            glDeleteLists(base, GLYPH_COUNT)
+        self.fonts.clear()
+        self.strings.clear()